@@ -35,8 +35,15 @@ class ValidationAction:
     and are aware of a Data Context namespace structure.
 
     The Data Context is passed to this class in its constructor.
+
+    When actions are run concurrently by an ActionPipeline, an action waits for the actions listed before it whose
+    class names appear in ``run_after``; notification actions (``is_notification``) are dispatched to a separate
+    queue and retried when they raise.
     """
 
+    run_after = ()
+    is_notification = False
+
     def __init__(self, data_context):
         self.data_context = data_context
 
@@ -106,6 +113,9 @@ class SlackNotificationAction(ValidationAction):
 
     """
 
+    run_after = ("UpdateDataDocsAction",)
+    is_notification = True
+
     def __init__(
         self,
         data_context,
@@ -213,6 +223,8 @@ class PagerdutyAlertAction(ValidationAction):
 
     """
 
+    is_notification = True
+
     def __init__(
         self,
         data_context,
@@ -312,6 +324,9 @@ class MicrosoftTeamsNotificationAction(ValidationAction):
 
     """
 
+    run_after = ("UpdateDataDocsAction",)
+    is_notification = True
+
     def __init__(
         self,
         data_context,
@@ -421,6 +436,8 @@ class OpsgenieAlertAction(ValidationAction):
 
     """
 
+    is_notification = True
+
     def __init__(
         self,
         data_context,
@@ -538,6 +555,9 @@ class EmailAction(ValidationAction):
           use_ssl: True
     """
 
+    run_after = ("UpdateDataDocsAction",)
+    is_notification = True
+
     def __init__(
         self,
         data_context,
@@ -891,6 +911,8 @@ class UpdateDataDocsAction(ValidationAction):
 
     """
 
+    run_after = ("StoreValidationResultAction",)
+
     def __init__(self, data_context, site_names=None, target_site_names=None):
         """
         :param data_context: Data Context
@@ -3,6 +3,8 @@ import datetime
 import json
 import logging
 import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from copy import deepcopy
 from typing import Dict, List, Optional, Union
 
@@ -24,6 +26,8 @@ from great_expectations.validator.validator import Validator
 
 logger = logging.getLogger(__name__)
 
+_VALIDATION_START_POLL_INTERVAL = 0.1
+
 
 class Checkpoint:
     """
@@ -250,53 +254,207 @@ class Checkpoint:
 
         run_id = run_id or RunIdentifier(run_name=run_name, run_time=run_time)
 
-        for idx, validation_dict in enumerate(validations):
-            try:
-                substituted_validation_dict: dict = get_substituted_validation_dict(
+        concurrency: Optional[dict] = (
+            substituted_runtime_config.runtime_configuration or {}
+        ).get("concurrency")
+        if concurrency and concurrency.get("enabled", True) and len(validations) > 1:
+            val_op_run_results: List[
+                ValidationOperatorResult
+            ] = self._run_validations_concurrently(
+                substituted_runtime_config=substituted_runtime_config,
+                validations=validations,
+                run_id=run_id,
+                result_format=result_format,
+                max_workers=concurrency.get("max_workers"),
+                timeout=concurrency.get("timeout"),
+            )
+        else:
+            val_op_run_results = [
+                self._run_validation(
                     substituted_runtime_config=substituted_runtime_config,
                     validation_dict=validation_dict,
+                    idx=idx,
+                    run_id=run_id,
+                    result_format=result_format,
                 )
-                batch_request: BatchRequest = substituted_validation_dict.get(
-                    "batch_request"
-                )
-                expectation_suite_name: str = substituted_validation_dict.get(
-                    "expectation_suite_name"
-                )
-                action_list: list = substituted_validation_dict.get("action_list")
+                for idx, validation_dict in enumerate(validations)
+            ]
+
+        # Results are merged in the order of the validations, however they were run
+        for val_op_run_result in val_op_run_results:
+            run_results.update(val_op_run_result.run_results)
+        return CheckpointResult(
+            run_id=run_id, run_results=run_results, checkpoint_config=self.config
+        )
 
+    def _run_validation(
+        self,
+        substituted_runtime_config: CheckpointConfig,
+        validation_dict: dict,
+        idx: int,
+        run_id: RunIdentifier,
+        result_format: dict,
+        isolate_execution_engine: bool = False,
+    ) -> ValidationOperatorResult:
+        try:
+            substituted_validation_dict: dict = get_substituted_validation_dict(
+                substituted_runtime_config=substituted_runtime_config,
+                validation_dict=validation_dict,
+            )
+            batch_request: BatchRequest = substituted_validation_dict.get(
+                "batch_request"
+            )
+            expectation_suite_name: str = substituted_validation_dict.get(
+                "expectation_suite_name"
+            )
+            action_list: list = substituted_validation_dict.get("action_list")
+
+            if isolate_execution_engine:
+                validator: Validator = self._get_validator_with_own_execution_engine(
+                    batch_request=batch_request,
+                    expectation_suite_name=expectation_suite_name,
+                )
+            else:
                 validator: Validator = self.data_context.get_validator(
                     batch_request=batch_request,
                     expectation_suite_name=expectation_suite_name,
                 )
-                action_list_validation_operator: ActionListValidationOperator = (
-                    ActionListValidationOperator(
-                        data_context=self.data_context,
-                        action_list=action_list,
-                        result_format=result_format,
-                        name=f"{self.name}-checkpoint-validation[{idx}]",
-                    )
+            action_list_validation_operator: ActionListValidationOperator = (
+                ActionListValidationOperator(
+                    data_context=self.data_context,
+                    action_list=action_list,
+                    result_format=result_format,
+                    name=f"{self.name}-checkpoint-validation[{idx}]",
+                    concurrency=(
+                        substituted_runtime_config.runtime_configuration or {}
+                    ).get("action_concurrency"),
                 )
-                val_op_run_result: ValidationOperatorResult = (
-                    action_list_validation_operator.run(
-                        assets_to_validate=[validator],
-                        run_id=run_id,
-                        evaluation_parameters=substituted_validation_dict.get(
-                            "evaluation_parameters"
-                        ),
-                        result_format=result_format,
+            )
+            return action_list_validation_operator.run(
+                assets_to_validate=[validator],
+                run_id=run_id,
+                evaluation_parameters=substituted_validation_dict.get(
+                    "evaluation_parameters"
+                ),
+                result_format=result_format,
+            )
+        except (
+            ge_exceptions.CheckpointError,
+            ge_exceptions.ExecutionEngineError,
+        ) as e:
+            raise ge_exceptions.CheckpointError(
+                f"Exception occurred while running validation[{idx}] of checkpoint '{self.name}': {e.message}."
+            )
+
+    def _get_validator_with_own_execution_engine(
+        self, batch_request: BatchRequest, expectation_suite_name: str
+    ) -> Validator:
+        """Return a validator whose execution engine is a shallow copy of the one of its datasource.
+
+        Validators of the same datasource share its execution engine, which validates the batch loaded last by default.
+        Validations that run concurrently each get a copy of the execution engine, with its own active batch, batch
+        data dictionary and metric cache, so that they do not load batches into, or cache metrics in, each other's
+        engine.
+        """
+        batch = self.data_context.get_batch(batch_request=batch_request)
+        execution_engine = copy.copy(
+            self.data_context.datasources[
+                batch.batch_definition.datasource_name
+            ].execution_engine
+        )
+        return Validator(
+            execution_engine=execution_engine,
+            interactive_evaluation=True,
+            expectation_suite=self.data_context.get_expectation_suite(
+                expectation_suite_name
+            ),
+            data_context=self.data_context,
+            batches=[batch],
+        )
+
+    def _run_validations_concurrently(
+        self,
+        substituted_runtime_config: CheckpointConfig,
+        validations: List[dict],
+        run_id: RunIdentifier,
+        result_format: dict,
+        max_workers: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> List[ValidationOperatorResult]:
+        """Run the validations of the checkpoint in a pool of worker threads.
+
+        Concurrency is driven by the "concurrency" key of the checkpoint's runtime_configuration, e.g.::
+
+            {"concurrency": {"enabled": True, "max_workers": 8, "timeout": 3600}}
+
+        "timeout" is the number of seconds each validation may run for, counted from the moment a worker picks it
+        up. The first validation to fail or time out cancels the validations that have not started yet and its
+        error is raised; validations that are already running cannot be interrupted and finish in the background.
+
+        Returns:
+            the ValidationOperatorResult of each validation, in the order of the validations
+        """
+        if max_workers is not None:
+            max_workers = min(max_workers, len(validations))
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix=f"{self.name}-checkpoint-validation",
+        )
+        futures: Dict[Future, int] = {
+            executor.submit(
+                self._run_validation,
+                substituted_runtime_config=substituted_runtime_config,
+                validation_dict=validation_dict,
+                idx=idx,
+                run_id=run_id,
+                result_format=result_format,
+                isolate_execution_engine=True,
+            ): idx
+            for idx, validation_dict in enumerate(validations)
+        }
+        val_op_run_results: Dict[int, ValidationOperatorResult] = {}
+        start_times: Dict[Future, float] = {}
+        pending = set(futures)
+        try:
+            while pending:
+                wait_timeout = None
+                if timeout is not None:
+                    now = time.monotonic()
+                    for future in pending:
+                        if future.running():
+                            start_times.setdefault(future, now)
+                    deadlines = [
+                        start_times[future] + timeout
+                        for future in pending
+                        if future in start_times
+                    ]
+                    # Futures that have not been picked up yet are checked again shortly
+                    wait_timeout = max(
+                        min(deadlines + [now + _VALIDATION_START_POLL_INTERVAL]) - now,
+                        0,
                     )
+                done, pending = wait(
+                    pending, timeout=wait_timeout, return_when=FIRST_COMPLETED
                 )
-                run_results.update(val_op_run_result.run_results)
-            except (
-                ge_exceptions.CheckpointError,
-                ge_exceptions.ExecutionEngineError,
-            ) as e:
-                raise ge_exceptions.CheckpointError(
-                    f"Exception occurred while running validation[{idx}] of checkpoint '{self.name}': {e.message}."
-                )
-        return CheckpointResult(
-            run_id=run_id, run_results=run_results, checkpoint_config=self.config
-        )
+                for future in sorted(done, key=futures.get):
+                    val_op_run_results[futures[future]] = future.result()
+                if timeout is not None:
+                    now = time.monotonic()
+                    for future in sorted(pending, key=futures.get):
+                        if (
+                            future in start_times
+                            and now - start_times[future] > timeout
+                        ):
+                            raise ge_exceptions.CheckpointError(
+                                f"Validation[{futures[future]}] of checkpoint '{self.name}' did not finish within "
+                                f"{timeout} seconds."
+                            )
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=not pending)
+
+        return [val_op_run_results[idx] for idx in range(len(validations))]
 
     def self_check(self, pretty_print=True) -> dict:
         # Provide visibility into parameters that Checkpoint was instantiated with.
@@ -2,8 +2,11 @@ import copy
 import logging
 import math
 import operator
+import threading
 import traceback
 from collections import namedtuple
+from functools import lru_cache
+from typing import Any, Optional, Tuple
 
 from pyparsing import (
     CaselessKeyword,
@@ -208,6 +211,162 @@ def build_evaluation_parameters(
 
 
 expr = EvaluationParameterParser()
+# Parse actions of the parser push onto its exprStack, so the shared parser must not parse in several threads at once
+_expr_lock = threading.Lock()
+
+
+class CompiledEvaluationParameterExpression:
+    """An evaluation parameter expression parsed once, which can then be evaluated repeatedly against different
+    evaluation parameters (see compile_evaluation_parameter).
+
+    Instances are immutable, so they can be evaluated by several threads at the same time.
+    """
+
+    __slots__ = ("_parameter_expression", "_tokens", "_expr_stack", "_parse_error")
+
+    def __init__(
+        self,
+        parameter_expression: str,
+        tokens: Tuple[Any, ...],
+        expr_stack: Tuple[Any, ...],
+        parse_error: Optional[Tuple[str, str, int]] = None,
+    ):
+        self._parameter_expression = parameter_expression
+        # The top-level tokens of the expression, and its operands and operators in postfix order
+        self._tokens = tokens
+        self._expr_stack = expr_stack
+        # The message, line and column of the parse error, if the expression could not be parsed
+        self._parse_error = parse_error
+
+    @property
+    def parameter_expression(self) -> str:
+        return self._parameter_expression
+
+    @property
+    def expr_stack(self) -> Tuple[Any, ...]:
+        return self._expr_stack
+
+    @property
+    def parse_error(self) -> Optional[Tuple[str, str, int]]:
+        return self._parse_error
+
+    def evaluate(self, evaluation_parameters=None, data_context=None):
+        """Evaluate the expression, substituting the given evaluation_parameters (see parse_evaluation_parameter)."""
+        if evaluation_parameters is None:
+            evaluation_parameters = {}
+
+        if self._parse_error is not None:
+            err_str, err_line, err_col = self._parse_error
+            raise EvaluationParameterError(
+                f"Parse Failure: {err_str}\nStatement: {err_line}\nColumn: {err_col}"
+            )
+
+        L = self._tokens
+        if len(L) == 1 and L[0] not in evaluation_parameters:
+            # In this special case there were no operations to find, so only one value, but we don't have something to
+            # substitute for that value
+            try:
+                res = ge_urn.parseString(L[0])
+                if res["urn_type"] == "stores":
+                    store = data_context.stores.get(res["store_name"])
+                    return store.get_query_result(
+                        res["metric_name"], res.get("metric_kwargs", {})
+                    )
+                else:
+                    logger.error(
+                        "Unrecognized urn_type in ge_urn: must be 'stores' to use a metric store."
+                    )
+                    raise EvaluationParameterError(
+                        "No value found for $PARAMETER " + str(L[0])
+                    )
+            except ParseException as e:
+                logger.debug(
+                    f"Parse exception while parsing evaluation parameter: {str(e)}"
+                )
+                raise EvaluationParameterError(
+                    "No value found for $PARAMETER " + str(L[0])
+                )
+            except AttributeError:
+                logger.warning(
+                    "Unable to get store for store-type valuation parameter."
+                )
+                raise EvaluationParameterError(
+                    "No value found for $PARAMETER " + str(L[0])
+                )
+
+        elif len(L) == 1:
+            # In this case, we *do* have a substitution for a single type. We treat this specially because in this
+            # case, we allow complex type substitutions (i.e. do not coerce to string as part of parsing)
+            # NOTE: 20201023 - JPC - to support MetricDefinition as an evaluation parameter type, we need to handle that
+            # case here; is the evaluation parameter provided here in fact a metric definition?
+            return evaluation_parameters[L[0]]
+
+        # evaluate_stack consumes the stack, so each evaluation substitutes the parameters into its own copy
+        expr_stack = [
+            str(evaluation_parameters[ob])
+            if isinstance(ob, str) and ob in evaluation_parameters
+            else ob
+            for ob in self._expr_stack
+        ]
+        try:
+            result = expr.evaluate_stack(expr_stack)
+        except Exception as e:
+            exception_traceback = traceback.format_exc()
+            exception_message = (
+                f'{type(e).__name__}: "{str(e)}".  Traceback: "{exception_traceback}".'
+            )
+            logger.debug(exception_message, e, exc_info=True)
+            raise EvaluationParameterError(
+                "Error while evaluating evaluation parameter expression: " + str(e)
+            )
+
+        return result
+
+    def __repr__(self) -> str:
+        return (
+            f"CompiledEvaluationParameterExpression({repr(self._parameter_expression)})"
+        )
+
+
+def _compile_evaluation_parameter(
+    parameter_expression: str,
+) -> CompiledEvaluationParameterExpression:
+    with _expr_lock:
+        # Calling get_parser clears the stack
+        parser = expr.get_parser()
+        try:
+            L = parser.parseString(parameter_expression, parseAll=True)
+        except ParseException as err:
+            return CompiledEvaluationParameterExpression(
+                parameter_expression=parameter_expression,
+                tokens=(),
+                expr_stack=(),
+                parse_error=(str(err), err.line, err.column),
+            )
+        return CompiledEvaluationParameterExpression(
+            parameter_expression=parameter_expression,
+            tokens=tuple(L),
+            expr_stack=tuple(expr.exprStack),
+        )
+
+
+_compile_evaluation_parameter_cached = lru_cache(maxsize=4096)(
+    _compile_evaluation_parameter
+)
+
+
+def compile_evaluation_parameter(
+    parameter_expression: str,
+) -> CompiledEvaluationParameterExpression:
+    """Parse an evaluation parameter expression into a CompiledEvaluationParameterExpression.
+
+    Compiled expressions are cached by the text of the expression, so that an expression used by many expectations, or
+    evaluated in every validation run, is parsed only once. Expressions that cannot be parsed are compiled too, and
+    raise an EvaluationParameterError when they are evaluated.
+    """
+    if isinstance(parameter_expression, str):
+        return _compile_evaluation_parameter_cached(parameter_expression)
+    return _compile_evaluation_parameter(parameter_expression)
 
 
 def find_evaluation_parameter_dependencies(parameter_expression):
@@ -222,23 +381,20 @@ def find_evaluation_parameter_dependencies(parameter_expression):
           - "other": set of non-GE URN strings that are required to evaluate the parameter expression
 
     """
-    expr = EvaluationParameterParser()
-
     dependencies = {"urns": set(), "other": set()}
-    # Calling get_parser clears the stack
-    parser = expr.get_parser()
     try:
-        _ = parser.parseString(parameter_expression, parseAll=True)
-    except ParseException as err:
-        raise EvaluationParameterError(
-            f"Unable to parse evaluation parameter: {str(err)} at line {err.line}, column {err.column}"
-        )
+        compiled_expression = compile_evaluation_parameter(parameter_expression)
     except AttributeError as err:
         raise EvaluationParameterError(
             f"Unable to parse evaluation parameter: {str(err)}"
         )
+    if compiled_expression.parse_error is not None:
+        err_str, err_line, err_col = compiled_expression.parse_error
+        raise EvaluationParameterError(
+            f"Unable to parse evaluation parameter: {err_str} at line {err_line}, column {err_col}"
+        )
 
-    for word in expr.exprStack:
+    for word in compiled_expression.expr_stack:
         if isinstance(word, (int, float)):
             continue
 
@@ -246,7 +402,11 @@ def find_evaluation_parameter_dependencies(parameter_expression):
             # If we have a function that itself is a tuple (e.g. (trunc, 1))
             continue
 
-        if word in expr.opn or word in expr.fn or word == "unary -":
+        if (
+            word in EvaluationParameterParser.opn
+            or word in EvaluationParameterParser.fn
+            or word == "unary -"
+        ):
             # operations and functions
             continue
 
@@ -288,74 +448,13 @@ def parse_evaluation_parameter(
     Valid variables must begin with an alphabetic character and may contain alphanumeric characters plus '_' and '$',
     EXCEPT if they begin with the string "urn:great_expectations" in which case they may also include additional
     characters to support inclusion of GE URLs (see :ref:`evaluation_parameters` for more information).
-    """
-    if evaluation_parameters is None:
-        evaluation_parameters = {}
-
-    # Calling get_parser clears the stack
-    parser = expr.get_parser()
-    try:
-        L = parser.parseString(parameter_expression, parseAll=True)
-    except ParseException as err:
-        L = ["Parse Failure", parameter_expression, (str(err), err.line, err.column)]
-
-    if len(L) == 1 and L[0] not in evaluation_parameters:
-        # In this special case there were no operations to find, so only one value, but we don't have something to
-        # substitute for that value
-        try:
-            res = ge_urn.parseString(L[0])
-            if res["urn_type"] == "stores":
-                store = data_context.stores.get(res["store_name"])
-                return store.get_query_result(
-                    res["metric_name"], res.get("metric_kwargs", {})
-                )
-            else:
-                logger.error(
-                    "Unrecognized urn_type in ge_urn: must be 'stores' to use a metric store."
-                )
-                raise EvaluationParameterError(
-                    "No value found for $PARAMETER " + str(L[0])
-                )
-        except ParseException as e:
-            logger.debug(
-                f"Parse exception while parsing evaluation parameter: {str(e)}"
-            )
-            raise EvaluationParameterError("No value found for $PARAMETER " + str(L[0]))
-        except AttributeError:
-            logger.warning("Unable to get store for store-type valuation parameter.")
-            raise EvaluationParameterError("No value found for $PARAMETER " + str(L[0]))
-
-    elif len(L) == 1:
-        # In this case, we *do* have a substitution for a single type. We treat this specially because in this
-        # case, we allow complex type substitutions (i.e. do not coerce to string as part of parsing)
-        # NOTE: 20201023 - JPC - to support MetricDefinition as an evaluation parameter type, we need to handle that
-        # case here; is the evaluation parameter provided here in fact a metric definition?
-        return evaluation_parameters[L[0]]
-
-    elif len(L) == 0 or L[0] != "Parse Failure":
-        for i, ob in enumerate(expr.exprStack):
-            if isinstance(ob, str) and ob in evaluation_parameters:
-                expr.exprStack[i] = str(evaluation_parameters[ob])
-
-    else:
-        err_str, err_line, err_col = L[-1]
-        raise EvaluationParameterError(
-            f"Parse Failure: {err_str}\nStatement: {err_line}\nColumn: {err_col}"
-        )
 
-    try:
-        result = expr.evaluate_stack(expr.exprStack)
-    except Exception as e:
-        exception_traceback = traceback.format_exc()
-        exception_message = (
-            f'{type(e).__name__}: "{str(e)}".  Traceback: "{exception_traceback}".'
-        )
-        logger.debug(exception_message, e, exc_info=True)
-        raise EvaluationParameterError(
-            "Error while evaluating evaluation parameter expression: " + str(e)
-        )
-
-    return result
+    The expression is parsed once and cached (see compile_evaluation_parameter), so evaluating the same expression
+    again, with the same or other evaluation_parameters, does not parse it again.
+    """
+    return compile_evaluation_parameter(parameter_expression).evaluate(
+        evaluation_parameters=evaluation_parameters, data_context=data_context
+    )
 
 
 def _deduplicate_evaluation_parameter_dependencies(dependencies):
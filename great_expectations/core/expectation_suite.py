@@ -2,7 +2,7 @@ import datetime
 import json
 import logging
 from copy import deepcopy
-from typing import Any, List, Union
+from typing import Any, Dict, Hashable, List, Optional, Tuple, Union
 
 from great_expectations import __version__ as ge_version
 from great_expectations.core.evaluation_parameters import (
@@ -32,6 +32,77 @@ from great_expectations.types import SerializableDictDot
 
 logger = logging.getLogger(__name__)
 
+# Stands for domain kwarg values that are not indexed by value (see ExpectationSuite._get_expectation_index_key)
+_UNINDEXED_DOMAIN_KWARG_VALUE = "__unindexed_domain_kwarg_value__"
+
+
+class _ExpectationList(list):
+    """A list of expectations that counts its modifications, so that an ExpectationSuite can tell whether its
+    expectations were modified without going through its methods (and so whether its index must be rebuilt)."""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.modification_count = 0
+
+    def __reduce__(self):
+        # Pickled with its items as constructor argument: by default, unpickling appends the items before restoring
+        # modification_count
+        return self.__class__, (list(self),), self.__dict__
+
+    def _modified(self):
+        self.modification_count += 1
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._modified()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._modified()
+
+    def __iadd__(self, other):
+        result = super().__iadd__(other)
+        self._modified()
+        return result
+
+    def __imul__(self, other):
+        result = super().__imul__(other)
+        self._modified()
+        return result
+
+    def append(self, item):
+        super().append(item)
+        self._modified()
+
+    def extend(self, items):
+        super().extend(items)
+        self._modified()
+
+    def insert(self, index, item):
+        super().insert(index, item)
+        self._modified()
+
+    def pop(self, *args):
+        item = super().pop(*args)
+        self._modified()
+        return item
+
+    def remove(self, item):
+        super().remove(item)
+        self._modified()
+
+    def clear(self):
+        super().clear()
+        self._modified()
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._modified()
+
+    def reverse(self):
+        super().reverse()
+        self._modified()
+
 
 class ExpectationSuite(SerializableDictDot):
     """
@@ -40,6 +111,11 @@ class ExpectationSuite(SerializableDictDot):
         -read: self.find_expectation_indexes()
         -update: self.add_expectation() or self.patch_expectation()
         -delete: self.remove_expectation()
+
+    Expectations are looked up through an index keyed by expectation type and domain kwargs, which the methods above
+    keep up to date, so that finding or adding an expectation does not compare it to every expectation of the suite.
+    The index is rebuilt when the list of expectations is replaced or modified directly. Expectations must not be
+    modified in place, other than with patch_expectation, while they belong to the suite.
     """
 
     def __init__(
@@ -76,6 +152,29 @@ class ExpectationSuite(SerializableDictDot):
         ensure_json_serializable(meta)
         self.meta = meta
 
+    @property
+    def expectations(self) -> List[ExpectationConfiguration]:
+        return self._expectations
+
+    @expectations.setter
+    def expectations(self, expectations: List[ExpectationConfiguration]):
+        self._expectations = _ExpectationList(expectations)
+        # Index key of the expectation at each position, and positions of the expectations by index key
+        self._expectation_index_keys: List[Tuple[Hashable, ...]] = []
+        self._expectation_positions_by_index_key: Dict[
+            Tuple[Hashable, ...], List[int]
+        ] = {}
+        # Modification count of the list of expectations when it was indexed; None if it was not
+        self._indexed_modification_count: Optional[int] = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # The index is rebuilt when it is first needed, instead of being copied
+        state["_expectation_index_keys"] = []
+        state["_expectation_positions_by_index_key"] = {}
+        state["_indexed_modification_count"] = None
+        return state
+
     def add_citation(
         self,
         comment,
@@ -220,7 +319,15 @@ class ExpectationSuite(SerializableDictDot):
            Notes:
                May want to add type-checking in the future.
         """
+        self._update_expectation_index()
         self.expectations.append(expectation_config)
+        self._expectation_index_keys.append(
+            self._get_expectation_index_key(expectation_config)
+        )
+        self._expectation_positions_by_index_key.setdefault(
+            self._expectation_index_keys[-1], []
+        ).append(len(self.expectations) - 1)
+        self._indexed_modification_count = self.expectations.modification_count
 
     def remove_expectation(
         self,
@@ -252,10 +359,9 @@ class ExpectationSuite(SerializableDictDot):
 
         elif len(found_expectation_indexes) > 1:
             if remove_multiple_matches:
-                removed_expectations = []
-                for index in sorted(found_expectation_indexes, reverse=True):
-                    removed_expectations.append(self.expectations.pop(index))
-                return removed_expectations
+                return self._remove_expectations_at(
+                    indexes=sorted(found_expectation_indexes, reverse=True)
+                )
             else:
                 raise ValueError(
                     "More than one matching expectation was found. Specify more precise matching criteria,"
@@ -263,7 +369,17 @@ class ExpectationSuite(SerializableDictDot):
                 )
 
         else:
-            return [self.expectations.pop(found_expectation_indexes[0])]
+            return self._remove_expectations_at(indexes=found_expectation_indexes)
+
+    def _remove_expectations_at(
+        self, indexes: List[int]
+    ) -> List[ExpectationConfiguration]:
+        removed_expectations = []
+        for index in indexes:
+            removed_expectations.append(self.expectations.pop(index))
+            self._expectation_index_keys.pop(index)
+        self._index_expectation_positions()
+        return removed_expectations
 
     def remove_all_expectations_of_type(
         self, expectation_types: Union[List[str], str]
@@ -308,13 +424,72 @@ class ExpectationSuite(SerializableDictDot):
             raise InvalidExpectationConfigurationError(
                 "Ensure that expectation configuration is valid."
             )
+        if len(self.expectations) == 0:
+            return []
+        # Expectations that match have the same index key whatever the match type, since matching expectations
+        # always have equal expectation types and domain kwargs
+        self._update_expectation_index()
+        candidate_indexes: List[int] = self._expectation_positions_by_index_key.get(
+            self._get_expectation_index_key(expectation_configuration), []
+        )
         match_indexes = []
-        for idx, expectation in enumerate(self.expectations):
-            if expectation.isEquivalentTo(expectation_configuration, match_type):
+        for idx in candidate_indexes:
+            if self.expectations[idx].isEquivalentTo(
+                expectation_configuration, match_type
+            ):
                 match_indexes.append(idx)
 
         return match_indexes
 
+    @staticmethod
+    def _get_expectation_index_key(
+        expectation_configuration: ExpectationConfiguration,
+    ) -> Tuple[Hashable, ...]:
+        # Only string (and None) values are part of the key: they are hashable and only equal to strings, so equal
+        # domain kwargs always give equal keys. Expectations with equal keys are then compared with isEquivalentTo.
+        return (expectation_configuration.expectation_type,) + tuple(
+            (key, value)
+            if value is None or isinstance(value, str)
+            else (key, _UNINDEXED_DOMAIN_KWARG_VALUE)
+            for key, value in sorted(
+                expectation_configuration.get_domain_kwargs().items()
+            )
+        )
+
+    def _update_expectation_index(self):
+        """Rebuild the index if the list of expectations was modified since it was indexed."""
+        if self._indexed_modification_count == self.expectations.modification_count:
+            return
+        self._expectation_index_keys = [
+            self._get_expectation_index_key(expectation)
+            for expectation in self.expectations
+        ]
+        self._index_expectation_positions()
+
+    def _index_expectation_positions(self):
+        positions_by_index_key: Dict[Tuple[Hashable, ...], List[int]] = {}
+        for position, index_key in enumerate(self._expectation_index_keys):
+            positions_by_index_key.setdefault(index_key, []).append(position)
+        self._expectation_positions_by_index_key = positions_by_index_key
+        self._indexed_modification_count = self.expectations.modification_count
+
+    def _reindex_expectation(self, index: int):
+        """Update the index key of the expectation at index, after it was replaced or patched."""
+        old_index_key = self._expectation_index_keys[index]
+        new_index_key = self._get_expectation_index_key(self.expectations[index])
+        if new_index_key != old_index_key:
+            self._expectation_index_keys[index] = new_index_key
+            positions = self._expectation_positions_by_index_key[old_index_key]
+            positions.remove(index)
+            if len(positions) == 0:
+                del self._expectation_positions_by_index_key[old_index_key]
+            positions = self._expectation_positions_by_index_key.setdefault(
+                new_index_key, []
+            )
+            positions.append(index)
+            positions.sort()
+        self._indexed_modification_count = self.expectations.modification_count
+
     def find_expectations(
         self,
         expectation_configuration: ExpectationConfiguration,
@@ -370,6 +545,7 @@ class ExpectationSuite(SerializableDictDot):
             )
 
         self.expectations[found_expectation_indexes[0]].patch(op, path, value)
+        self._reindex_expectation(index=found_expectation_indexes[0])
         return self.expectations[found_expectation_indexes[0]]
 
     def add_expectation(
@@ -411,6 +587,7 @@ class ExpectationSuite(SerializableDictDot):
                 self.expectations[
                     found_expectation_indexes[0]
                 ] = expectation_configuration
+                self._reindex_expectation(index=found_expectation_indexes[0])
             else:
                 raise DataContextError(
                     "A matching ExpectationConfiguration already exists. If you would like to overwrite this "
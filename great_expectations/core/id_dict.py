@@ -3,9 +3,24 @@ import json
 
 
 class IDDict(dict):
+    """A dict with a stable id derived from its contents.
+
+    The default id (computed without explicit id_keys or id_ignore_keys) is memoized, and the memoized value is
+    discarded whenever the IDDict is modified through the dict interface. Values nested inside an IDDict must not be
+    mutated in place once its id has been taken, since such changes cannot be detected.
+    """
+
     _id_ignore_keys = set()
+    _cached_id = None
 
     def to_id(self, id_keys=None, id_ignore_keys=None):
+        if id_keys is not None or id_ignore_keys is not None:
+            return self._compute_id(id_keys=id_keys, id_ignore_keys=id_ignore_keys)
+        if self._cached_id is None:
+            self._cached_id = self._compute_id()
+        return self._cached_id
+
+    def _compute_id(self, id_keys=None, id_ignore_keys=None):
         if id_keys is None:
             id_keys = self.keys()
         if id_ignore_keys is None:
@@ -22,6 +37,42 @@ class IDDict(dict):
             json.dumps(_id_dict, sort_keys=True).encode("utf-8")
         ).hexdigest()
 
+    def _invalidate_id(self):
+        self._cached_id = None
+
+    def __setitem__(self, key, value):
+        self._invalidate_id()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._invalidate_id()
+        super().__delitem__(key)
+
+    def clear(self):
+        self._invalidate_id()
+        super().clear()
+
+    def pop(self, *args):
+        self._invalidate_id()
+        return super().pop(*args)
+
+    def popitem(self):
+        self._invalidate_id()
+        return super().popitem()
+
+    def setdefault(self, key, default=None):
+        self._invalidate_id()
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs):
+        self._invalidate_id()
+        super().update(*args, **kwargs)
+
+    def __ior__(self, other):
+        # dict implements |= (Python 3.9+) without going through update
+        self.update(other)
+        return self
+
 
 class BatchKwargs(IDDict):
     pass
@@ -14,7 +14,7 @@ import uuid
 import warnings
 import webbrowser
 from collections import OrderedDict
-from typing import Any, Callable, Dict, List, Optional, Union, cast
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union, cast
 
 from dateutil.parser import parse
 from ruamel.yaml import YAML, YAMLError
@@ -65,6 +65,7 @@ from great_expectations.data_context.types.resource_identifiers import (
 from great_expectations.data_context.util import (
     PasswordMasker,
     build_store_from_config,
+    copy_config_containers,
     default_checkpoints_exist,
     file_relative_path,
     instantiate_class_from_config,
@@ -257,6 +258,11 @@ class BaseDataContext:
                 "Your project_config is not valid. Try using the CLI check-config command."
             )
         self._project_config = project_config
+        # The substituted project config, with the inputs it was substituted from (see
+        # project_config_with_variables_substituted)
+        self._config_with_variables_substituted_cache: Optional[
+            Tuple[tuple, dict]
+        ] = None
         self._apply_global_config_overrides()
 
         if context_root_dir is not None:
@@ -721,7 +727,24 @@ class BaseDataContext:
 
     @property
     def project_config_with_variables_substituted(self) -> DataContextConfig:
-        return self.get_config_with_variables_substituted()
+        """The project config, with config variables substituted (see get_config_with_variables_substituted).
+
+        Substitution only runs again once one of its inputs has changed: the project config, the config variables
+        file, the environment variables or runtime_environment. Each access returns a new DataContextConfig, which
+        callers may modify.
+        """
+        substitution_inputs = self._get_config_substitution_inputs()
+        if (
+            self._config_with_variables_substituted_cache is None
+            or self._config_with_variables_substituted_cache[0] != substitution_inputs
+        ):
+            self._config_with_variables_substituted_cache = (
+                substitution_inputs,
+                self._substitute_config_variables(self._project_config),
+            )
+        return DataContextConfig(
+            **copy_config_containers(self._config_with_variables_substituted_cache[1])
+        )
 
     @property
     def anonymous_usage_statistics(self):
@@ -819,22 +842,27 @@ class BaseDataContext:
     #
     #####
 
+    def _get_config_variables_file_path(self) -> Optional[str]:
+        config_variables_file_path = self.get_config().config_variables_file_path
+        if not config_variables_file_path:
+            return None
+        # If the user specifies the config variable path with an environment variable, we want to substitute it
+        defined_path = substitute_config_variable(
+            config_variables_file_path, os.environ
+        )
+        if not os.path.isabs(defined_path):
+            # A BaseDataContext will not have a root directory; in that case use the current directory
+            # for any non-absolute path
+            root_directory = self.root_directory or os.curdir()
+        else:
+            root_directory = ""
+        return os.path.join(root_directory, defined_path)
+
     def _load_config_variables_file(self):
         """Get all config variables from the default location."""
-        config_variables_file_path = self.get_config().config_variables_file_path
-        if config_variables_file_path:
+        var_path = self._get_config_variables_file_path()
+        if var_path:
             try:
-                # If the user specifies the config variable path with an environment variable, we want to substitute it
-                defined_path = substitute_config_variable(
-                    config_variables_file_path, dict(os.environ)
-                )
-                if not os.path.isabs(defined_path):
-                    # A BaseDataContext will not have a root directory; in that case use the current directory
-                    # for any non-absolute path
-                    root_directory = self.root_directory or os.curdir()
-                else:
-                    root_directory = ""
-                var_path = os.path.join(root_directory, defined_path)
                 with open(var_path) as config_variables_file:
                     return yaml.load(config_variables_file) or {}
             except OSError as e:
@@ -845,11 +873,40 @@ class BaseDataContext:
         else:
             return {}
 
+    def _get_config_substitution_inputs(self) -> tuple:
+        """Copy everything that config variable substitution depends on, for comparison with a later copy."""
+        var_path = self._get_config_variables_file_path()
+        var_file_stat = None
+        if var_path:
+            try:
+                stat_result = os.stat(var_path)
+                var_file_stat = (stat_result.st_mtime_ns, stat_result.st_size)
+            except OSError:
+                pass
+        return (
+            copy_config_containers(self._project_config),
+            var_path,
+            var_file_stat,
+            dict(os.environ),
+            dict(self.runtime_environment),
+        )
+
+    def _invalidate_config_with_variables_substituted(self):
+        """Substitute config variables again on the next access to project_config_with_variables_substituted.
+
+        Changes to the inputs of the substitution are detected on each access; this is only needed when they may not be
+        (e.g. the config variables file being rewritten within the resolution of its modification time).
+        """
+        self._config_with_variables_substituted_cache = None
+
     def get_config_with_variables_substituted(self, config=None) -> DataContextConfig:
 
         if not config:
             config = self._project_config
 
+        return DataContextConfig(**self._substitute_config_variables(config))
+
+    def _substitute_config_variables(self, config) -> dict:
         substituted_config_variables = substitute_all_config_variables(
             self.config_variables,
             dict(os.environ),
@@ -862,10 +919,8 @@ class BaseDataContext:
             **self.runtime_environment,
         }
 
-        return DataContextConfig(
-            **substitute_all_config_variables(
-                config, substitutions, self.DOLLAR_SIGN_ESCAPE_STRING
-            )
+        return substitute_all_config_variables(
+            config, substitutions, self.DOLLAR_SIGN_ESCAPE_STRING
         )
 
     def escape_all_config_variables(
@@ -952,6 +1007,7 @@ class BaseDataContext:
 
         with open(config_variables_filepath, "w") as config_variables_file:
             yaml.dump(config_variables, config_variables_file)
+        self._invalidate_config_with_variables_substituted()
 
     def delete_datasource(self, datasource_name: str):
         """Delete a data source
@@ -1568,10 +1624,14 @@ class BaseDataContext:
         sampling_kwargs: Optional[dict] = None,
         splitter_method: Optional[str] = None,
         splitter_kwargs: Optional[dict] = None,
+        batch_metric_store_name: Optional[str] = None,
         **kwargs,
     ) -> Validator:
         """
         This method applies only to the new (V3) Datasource schema.
+
+        If batch_metric_store_name names a configured BatchMetricStore, metrics resolved by the validator are persisted
+        in it and reused when identical data is validated again.
         """
 
         if (
@@ -1624,12 +1684,21 @@ class BaseDataContext:
             batch_definition.datasource_name
         ].execution_engine
 
+        batch_metric_store = None
+        if batch_metric_store_name is not None:
+            if batch_metric_store_name not in self.stores:
+                raise ge_exceptions.StoreConfigurationError(
+                    f'Attempted to access the batch metric store named "{batch_metric_store_name}", which is not a configured store.'
+                )
+            batch_metric_store = self.stores[batch_metric_store_name]
+
         validator = Validator(
             execution_engine=execution_engine,
             interactive_evaluation=True,
             expectation_suite=expectation_suite,
             data_context=self,
             batches=[batch],
+            batch_metric_store=batch_metric_store,
         )
 
         return validator
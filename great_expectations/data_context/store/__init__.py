@@ -16,6 +16,7 @@ from .database_store_backend import DatabaseStoreBackend  # isort:skip
 from .configuration_store import ConfigurationStore  # isort:skip
 from .checkpoint_store import CheckpointStore  # isort:skip
 from .metric_store import (  # isort:skip
+    BatchMetricStore,
     EvaluationParameterStore,
     MetricStore,
 )
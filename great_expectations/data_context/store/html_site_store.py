@@ -1,4 +1,5 @@
 import inspect
+import json
 import logging
 import os
 from mimetypes import guess_type
@@ -13,7 +14,11 @@ from great_expectations.data_context.util import (
     instantiate_class_from_config,
     load_class,
 )
-from great_expectations.exceptions import ClassInstantiationError, DataContextError
+from great_expectations.exceptions import (
+    ClassInstantiationError,
+    DataContextError,
+    InvalidKeyError,
+)
 from great_expectations.util import (
     filter_properties_dict,
     verify_dynamic_loading_support,
@@ -24,6 +29,8 @@ from .tuple_store_backend import TupleStoreBackend
 
 logger = logging.getLogger(__name__)
 
+INDEX_PAGE_FILEPATH_TEMPLATE = "index_page_{0}.html"
+
 
 class HtmlSiteStore:
     """
@@ -177,6 +184,40 @@ class HtmlSiteStore:
                 class_name=store_backend["class_name"],
             )
 
+        filepath_template = INDEX_PAGE_FILEPATH_TEMPLATE
+        index_pages_obj = instantiate_class_from_config(
+            config=store_backend,
+            runtime_environment=runtime_environment,
+            config_defaults={
+                "module_name": module_name,
+                "filepath_template": filepath_template,
+                "suppress_store_backend_id": True,
+            },
+        )
+        if not index_pages_obj:
+            raise ClassInstantiationError(
+                module_name=module_name,
+                package_name=None,
+                class_name=store_backend["class_name"],
+            )
+
+        filepath_template = "data_docs_manifest.json"
+        manifest_obj = instantiate_class_from_config(
+            config=store_backend,
+            runtime_environment=runtime_environment,
+            config_defaults={
+                "module_name": module_name,
+                "filepath_template": filepath_template,
+                "suppress_store_backend_id": True,
+            },
+        )
+        if not manifest_obj:
+            raise ClassInstantiationError(
+                module_name=module_name,
+                package_name=None,
+                class_name=store_backend["class_name"],
+            )
+
         filepath_template = None
         static_assets_obj = instantiate_class_from_config(
             config=store_backend,
@@ -198,6 +239,8 @@ class HtmlSiteStore:
             ExpectationSuiteIdentifier: expectation_suite_identifier_obj,
             ValidationResultIdentifier: validation_result_idendifier_obj,
             "index_page": index_page_obj,
+            "index_pages": index_pages_obj,
+            "manifest": manifest_obj,
             "static_assets": static_assets_obj,
         }
 
@@ -331,15 +374,55 @@ class HtmlSiteStore:
                 pass
         return keys
 
-    def write_index_page(self, page):
-        """This third param_store has a special method, which uses a zero-length tuple as a key."""
-        return self.store_backends["index_page"].set(
-            (),
+    def write_index_page(self, page, page_number=1):
+        """This third param_store has a special method, which uses a zero-length tuple as a key.
+
+        When the index is split into pages, the first page is the index page, and the others are kept in the
+        "index_pages" backend, keyed by their page number (see get_index_page_filepath).
+        """
+        if page_number == 1:
+            store_backend, key = self.store_backends["index_page"], ()
+        else:
+            store_backend, key = self.store_backends["index_pages"], (str(page_number),)
+        return store_backend.set(
+            key,
             page,
             content_encoding="utf-8",
             content_type="text/html; " "charset=utf-8",
         )
 
+    def remove_index_pages(self, first_page_number):
+        """Remove the index pages numbered first_page_number and above, left over from a build of a longer index."""
+        page_number = max(first_page_number, 2)
+        while self.store_backends["index_pages"].has_key((str(page_number),)):
+            self.store_backends["index_pages"].remove_key((str(page_number),))
+            page_number += 1
+
+    @staticmethod
+    def get_index_page_filepath(page_number):
+        """Return the path of an index page, relative to the root of the site."""
+        if page_number == 1:
+            return "index.html"
+        return INDEX_PAGE_FILEPATH_TEMPLATE.format(page_number)
+
+    def get_manifest(self):
+        """Return the manifest of the resources rendered into the site by incremental builds, or None if the site
+        does not have one (see SiteBuilder)."""
+        try:
+            manifest = self.store_backends["manifest"].get(())
+        except InvalidKeyError:
+            return None
+        return json.loads(manifest)
+
+    def write_manifest(self, manifest):
+        """Like the index page, the manifest uses a zero-length tuple as a key."""
+        return self.store_backends["manifest"].set(
+            (),
+            json.dumps(manifest, indent=2, sort_keys=True, default=str),
+            content_encoding="utf-8",
+            content_type="application/json",
+        )
+
     def clean_site(self):
         for _, target_store_backend in self.store_backends.items():
             keys = target_store_backend.list_keys()
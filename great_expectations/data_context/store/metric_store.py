@@ -1,6 +1,9 @@
 import json
 
-from great_expectations.core.metric import ValidationMetricIdentifier
+from great_expectations.core.metric import (
+    BatchMetricIdentifier,
+    ValidationMetricIdentifier,
+)
 from great_expectations.core.util import ensure_json_serializable
 from great_expectations.data_context.store.database_store_backend import (
     DatabaseStoreBackend,
@@ -109,3 +112,51 @@ class EvaluationParameterStore(MetricStore):
     @property
     def config(self) -> dict:
         return self._config
+
+
+class BatchMetricStore(MetricStore):
+    """
+    A BatchMetricStore persists resolved metric values by batch fingerprint, so that validating identical data again
+    does not recompute them.
+    """
+
+    _key_class = BatchMetricIdentifier
+
+    def __init__(self, store_backend=None, store_name=None):
+        if store_backend is not None:
+            store_backend_module_name = store_backend.get(
+                "module_name", "great_expectations.data_context.store"
+            )
+            store_backend_class_name = store_backend.get(
+                "class_name", "InMemoryStoreBackend"
+            )
+            verify_dynamic_loading_support(module_name=store_backend_module_name)
+            store_backend_class = load_class(
+                store_backend_class_name, store_backend_module_name
+            )
+
+            # Store Backend Class was loaded successfully; verify that it is of a correct subclass.
+            if issubclass(store_backend_class, DatabaseStoreBackend):
+                # Provide defaults for this common case
+                store_backend["table_name"] = store_backend.get(
+                    "table_name", "ge_batch_metrics"
+                )
+                store_backend["key_columns"] = store_backend.get(
+                    "key_columns",
+                    ["batch_fingerprint", "metric_name", "metric_kwargs_id"],
+                )
+        super().__init__(store_backend=store_backend, store_name=store_name)
+
+        # Gather the call arguments of the present function (include the "module_name" and add the "class_name"), filter
+        # out the Falsy values, and set the instance "_config" variable equal to the resulting dictionary.
+        self._config = {
+            "store_backend": store_backend,
+            "store_name": store_name,
+            "module_name": self.__class__.__module__,
+            "class_name": self.__class__.__name__,
+        }
+        filter_properties_dict(properties=self._config, inplace=True)
+
+    @property
+    def config(self) -> dict:
+        return self._config
@@ -318,6 +318,7 @@ class DataConnectorConfigSchema(Schema):
     base_directory = fields.String(required=False, allow_none=True)
     glob_directive = fields.String(required=False, allow_none=True)
     default_regex = fields.Dict(required=False, allow_none=True)
+    listing_cache_directory = fields.String(required=False, allow_none=True)
     runtime_keys = fields.List(
         cls_or_instance=fields.Str(), required=False, allow_none=True
     )
@@ -348,7 +349,7 @@ class DataConnectorConfigSchema(Schema):
         # If a class_name begins with the dollar sign ("$"), then it is assumed to be a variable name to be substituted.
         if data["class_name"][0] == "$":
             return
-        if ("default_regex" in data) and not (
+        if ("default_regex" in data or "listing_cache_directory" in data) and not (
             data["class_name"]
             in [
                 "InferredAssetFilesystemDataConnector",
@@ -18,6 +18,7 @@ from great_expectations.data_context.types.base import (
     DataContextConfigDefaults,
     DataContextConfigSchema,
 )
+from great_expectations.types import DictDot
 from great_expectations.util import load_class, verify_dynamic_loading_support
 
 try:
@@ -241,6 +242,33 @@ def substitute_all_config_variables(
     )
 
 
+def copy_config_containers(data):
+    """
+    Copy the dicts and lists of a config, recursively, without copying the values they hold.
+
+    Config objects (such as a DataContextConfig) are copied as their type and a copy of their attributes, so that the
+    copy of a config can be compared with a later copy of it (==) to tell whether the config was modified in between.
+    This is much cheaper than a deepcopy, or than dumping the config with its schema.
+
+    :param data:
+    :return: a copy of data made of new dicts and lists
+    """
+    if isinstance(data, dict):
+        return {k: copy_config_containers(v) for k, v in data.items()}
+    elif isinstance(data, list):
+        return [copy_config_containers(v) for v in data]
+    elif isinstance(data, DictDot):
+        return (
+            type(data),
+            {
+                k: copy_config_containers(v)
+                for k, v in vars(data).items()
+                if k != "_commented_map"
+            },
+        )
+    return data
+
+
 def file_relative_path(dunderfile, relative_path):
     """
     This function is useful when one needs to load a file that is
@@ -0,0 +1,228 @@
+import heapq
+import logging
+from collections.abc import Hashable
+from typing import Callable, Dict, List, Optional
+
+from great_expectations.core.batch import BatchDefinition, BatchRequestBase
+from great_expectations.datasource.data_connector.util import (
+    batch_definition_matches_batch_request,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class BatchDefinitionIndex:
+    """Index over the batch definitions cached by a DataConnector, for looking up the batch definitions that match a
+    batch request without scanning the whole cache.
+
+    Batch definitions are indexed by data asset name and, within each data asset, by the value of each key of their
+    partition definition. Lookups return batch definitions in the order of the cache, as the linear scan with
+    batch_definition_matches_batch_request does. For each data asset, the order given by a sort function is computed
+    once and reused for every request (see get_sorted_batch_definitions).
+
+    Args:
+        batch_definition_list: the batch definitions in the data references cache, in cache order
+    """
+
+    def __init__(self, batch_definition_list: List[BatchDefinition]):
+        self._batch_definition_list = batch_definition_list
+        self._positions_by_data_asset_name: Dict[str, List[int]] = {}
+        self._positions_by_partition_key_value: Dict[
+            str, Dict[str, Dict[Hashable, List[int]]]
+        ] = {}
+        # Ranks of the batch definitions of a data asset in sorted order, by data asset name; None if sorting failed
+        self._sort_ranks_by_data_asset_name: Dict[str, Optional[Dict[int, int]]] = {}
+
+        for position, batch_definition in enumerate(batch_definition_list):
+            data_asset_name: str = batch_definition.data_asset_name
+            self._positions_by_data_asset_name.setdefault(data_asset_name, []).append(
+                position
+            )
+            positions_by_key_value = self._positions_by_partition_key_value.setdefault(
+                data_asset_name, {}
+            )
+            for key, value in batch_definition.partition_definition.items():
+                if isinstance(value, Hashable):
+                    positions_by_key_value.setdefault(key, {}).setdefault(
+                        value, []
+                    ).append(position)
+
+    def __len__(self):
+        return len(self._batch_definition_list)
+
+    def get_batch_definitions(
+        self, batch_request: BatchRequestBase
+    ) -> List[BatchDefinition]:
+        """Return the batch definitions that match batch_request (see batch_definition_matches_batch_request)."""
+        batch_identifiers = None
+        if batch_request.partition_request:
+            batch_identifiers = batch_request.partition_request.get("batch_identifiers")
+        if batch_identifiers:
+            if not isinstance(batch_identifiers, dict):
+                return []
+            if not all(
+                isinstance(value, Hashable) for value in batch_identifiers.values()
+            ):
+                return self._filter_batch_definitions(batch_request=batch_request)
+
+        if batch_request.data_asset_name:
+            data_asset_names: List[str] = [batch_request.data_asset_name]
+        else:
+            data_asset_names = list(self._positions_by_data_asset_name.keys())
+
+        positions: List[int] = []
+        for data_asset_name in data_asset_names:
+            positions += self._get_matching_positions(
+                data_asset_name=data_asset_name, batch_identifiers=batch_identifiers
+            )
+        if len(data_asset_names) > 1:
+            positions.sort()
+
+        return [
+            self._batch_definition_list[position]
+            for position in positions
+            if self._matches_connector(
+                batch_definition=self._batch_definition_list[position],
+                batch_request=batch_request,
+            )
+        ]
+
+    def _get_matching_positions(
+        self, data_asset_name: str, batch_identifiers: Optional[dict]
+    ) -> List[int]:
+        asset_positions: List[int] = self._positions_by_data_asset_name.get(
+            data_asset_name, []
+        )
+        if not batch_identifiers:
+            return asset_positions
+
+        positions_by_key_value = self._positions_by_partition_key_value.get(
+            data_asset_name, {}
+        )
+        candidate_position_lists: List[List[int]] = []
+        for key, value in batch_identifiers.items():
+            candidate_positions = positions_by_key_value.get(key, {}).get(value)
+            if not candidate_positions:
+                return []
+            candidate_position_lists.append(candidate_positions)
+
+        # Intersect, starting from the most selective key; positions are kept in cache order
+        candidate_position_lists.sort(key=len)
+        positions: List[int] = candidate_position_lists[0]
+        for other_positions in candidate_position_lists[1:]:
+            other_position_set = set(other_positions)
+            positions = [
+                position for position in positions if position in other_position_set
+            ]
+        return positions
+
+    @staticmethod
+    def _matches_connector(
+        batch_definition: BatchDefinition, batch_request: BatchRequestBase
+    ) -> bool:
+        if (
+            batch_request.datasource_name
+            and batch_request.datasource_name != batch_definition.datasource_name
+        ):
+            return False
+        if (
+            batch_request.data_connector_name
+            and batch_request.data_connector_name
+            != batch_definition.data_connector_name
+        ):
+            return False
+        return True
+
+    def _filter_batch_definitions(
+        self, batch_request: BatchRequestBase
+    ) -> List[BatchDefinition]:
+        return [
+            batch_definition
+            for batch_definition in self._batch_definition_list
+            if batch_definition_matches_batch_request(
+                batch_definition=batch_definition, batch_request=batch_request
+            )
+        ]
+
+    def get_sorted_batch_definitions(
+        self,
+        batch_definition_list: List[BatchDefinition],
+        data_asset_name: Optional[str],
+        sort_function: Callable[..., List[BatchDefinition]],
+        limit: Optional[int] = None,
+    ) -> List[BatchDefinition]:
+        """Sort batch definitions of the cache with sort_function, which must be a stable sort.
+
+        When all batch definitions belong to data_asset_name, the data asset is sorted once, and later calls only
+        order the given batch definitions by their rank in that order. This gives the same result as sorting them
+        directly, since they are given in cache order, and ties are kept in cache order by a stable sort.
+
+        If limit is given, only the first "limit" batch definitions of the sorted order are returned, and sort_function
+        is called with the limit too. The data asset is then not sorted ahead of time, so that a request for the first
+        few batch definitions does not sort all of them.
+        """
+        if data_asset_name is None or (
+            limit is not None
+            and data_asset_name not in self._sort_ranks_by_data_asset_name
+        ):
+            return self._sort(
+                batch_definition_list=batch_definition_list,
+                sort_function=sort_function,
+                limit=limit,
+            )
+
+        if data_asset_name not in self._sort_ranks_by_data_asset_name:
+            self._sort_ranks_by_data_asset_name[data_asset_name] = self._get_sort_ranks(
+                data_asset_name=data_asset_name, sort_function=sort_function
+            )
+        sort_ranks = self._sort_ranks_by_data_asset_name[data_asset_name]
+        if sort_ranks is None or not all(
+            id(batch_definition) in sort_ranks
+            for batch_definition in batch_definition_list
+        ):
+            # Sorting ahead of time failed, or not all batch definitions come from the cache
+            return self._sort(
+                batch_definition_list=batch_definition_list,
+                sort_function=sort_function,
+                limit=limit,
+            )
+
+        def get_rank(batch_definition: BatchDefinition) -> int:
+            return sort_ranks[id(batch_definition)]
+
+        if limit is not None and limit < len(batch_definition_list):
+            return heapq.nsmallest(limit, batch_definition_list, key=get_rank)
+        return sorted(batch_definition_list, key=get_rank)
+
+    @staticmethod
+    def _sort(
+        batch_definition_list: List[BatchDefinition],
+        sort_function: Callable[..., List[BatchDefinition]],
+        limit: Optional[int] = None,
+    ) -> List[BatchDefinition]:
+        if limit is None:
+            return sort_function(batch_definition_list)
+        return sort_function(batch_definition_list, limit=limit)
+
+    def _get_sort_ranks(
+        self,
+        data_asset_name: str,
+        sort_function: Callable[[List[BatchDefinition]], List[BatchDefinition]],
+    ) -> Optional[Dict[int, int]]:
+        asset_batch_definitions: List[BatchDefinition] = [
+            self._batch_definition_list[position]
+            for position in self._positions_by_data_asset_name.get(data_asset_name, [])
+        ]
+        try:
+            sorted_batch_definitions = sort_function(asset_batch_definitions)
+        except Exception as e:
+            # Some batch definitions of the data asset cannot be sorted; they may not be requested, so batch
+            # definitions are sorted per request instead, which raises if they are.
+            logger.debug(
+                f'Unable to sort the batch definitions of data asset "{data_asset_name}" ahead of time: {e}'
+            )
+            return None
+        return {
+            id(batch_definition): rank
+            for rank, batch_definition in enumerate(sorted_batch_definitions)
+        }
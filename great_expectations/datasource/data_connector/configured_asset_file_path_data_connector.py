@@ -39,6 +39,7 @@ class ConfiguredAssetFilePathDataConnector(FilePathDataConnector):
         execution_engine: Optional[ExecutionEngine] = None,
         default_regex: Optional[dict] = None,
         sorters: Optional[list] = None,
+        listing_cache_directory: Optional[str] = None,
     ):
         """
         Base class for DataConnectors that connect to filesystem-like data by taking in
@@ -52,6 +53,7 @@ class ConfiguredAssetFilePathDataConnector(FilePathDataConnector):
             execution_engine (ExecutionEngine): Execution Engine object to actually read the data
             default_regex (dict): Optional dict the filter and organize the data_references.
             sorters (list): Optional list if you want to sort the data_references
+            listing_cache_directory (str): Optional directory in which listings of data_references are persisted
         """
         logger.debug(f'Constructing ConfiguredAssetFilePathDataConnector "{name}".')
         super().__init__(
@@ -60,6 +62,7 @@ class ConfiguredAssetFilePathDataConnector(FilePathDataConnector):
             execution_engine=execution_engine,
             default_regex=default_regex,
             sorters=sorters,
+            listing_cache_directory=listing_cache_directory,
         )
 
         if assets is None:
@@ -6,6 +6,9 @@ from great_expectations.datasource.data_connector import (
     ConfiguredAssetFilePathDataConnector,
 )
 from great_expectations.datasource.data_connector.asset import Asset
+from great_expectations.datasource.data_connector.listing_cache import (
+    DataReferenceListingCache,
+)
 from great_expectations.datasource.data_connector.util import (
     get_filesystem_one_level_directory_glob_path_list,
     normalize_directory_path,
@@ -37,6 +40,7 @@ class ConfiguredAssetFilesystemDataConnector(ConfiguredAssetFilePathDataConnecto
         default_regex: Optional[dict] = None,
         glob_directive: str = "**/*",
         sorters: Optional[list] = None,
+        listing_cache_directory: Optional[str] = None,
     ):
         """
         Base class for DataConnectors that connect to data on a filesystem. This class supports the configuration of default_regex
@@ -50,6 +54,8 @@ class ConfiguredAssetFilesystemDataConnector(ConfiguredAssetFilePathDataConnecto
             default_regex (dict): Optional dict the filter and organize the data_references.
             glob_directive (str): glob for selecting files in directory (defaults to *)
             sorters (list): Optional list if you want to sort the data_references
+            listing_cache_directory (str): Optional directory in which listings of data_references are persisted, so
+                that directories are only globbed again once they changed (see DataReferenceListingCache)
 
         """
         logger.debug(f'Constructing ConfiguredAssetFilesystemDataConnector "{name}".')
@@ -61,6 +67,7 @@ class ConfiguredAssetFilesystemDataConnector(ConfiguredAssetFilePathDataConnecto
             execution_engine=execution_engine,
             default_regex=default_regex,
             sorters=sorters,
+            listing_cache_directory=listing_cache_directory,
         )
 
         self._base_directory = base_directory
@@ -78,9 +85,16 @@ class ConfiguredAssetFilesystemDataConnector(ConfiguredAssetFilePathDataConnecto
             if asset.glob_directive:
                 glob_directive = asset.glob_directive
 
-        path_list: List[str] = get_filesystem_one_level_directory_glob_path_list(
-            base_directory_path=base_directory, glob_directive=glob_directive
-        )
+        path_list: List[str]
+        listing_cache: Optional[DataReferenceListingCache] = self.listing_cache
+        if listing_cache is not None:
+            path_list = listing_cache.get_filesystem_glob_path_list(
+                base_directory_path=base_directory, glob_directive=glob_directive
+            )
+        else:
+            path_list = get_filesystem_one_level_directory_glob_path_list(
+                base_directory_path=base_directory, glob_directive=glob_directive
+            )
 
         return sorted(path_list)
 
@@ -13,6 +13,9 @@ from great_expectations.datasource.data_connector import (
     ConfiguredAssetFilePathDataConnector,
 )
 from great_expectations.datasource.data_connector.asset import Asset
+from great_expectations.datasource.data_connector.listing_cache import (
+    DataReferenceListingCache,
+)
 from great_expectations.datasource.data_connector.util import list_s3_keys
 from great_expectations.execution_engine import ExecutionEngine
 
@@ -48,6 +51,7 @@ class ConfiguredAssetS3DataConnector(ConfiguredAssetFilePathDataConnector):
         delimiter: Optional[str] = "/",
         max_keys: Optional[int] = 1000,
         boto3_options: Optional[dict] = None,
+        listing_cache_directory: Optional[str] = None,
     ):
         """
         ConfiguredAssetDataConnector for connecting to S3.
@@ -64,6 +68,8 @@ class ConfiguredAssetS3DataConnector(ConfiguredAssetFilePathDataConnector):
             delimiter (str): S3 delimiter
             max_keys (int): S3 max_keys (default is 1000)
             boto3_options (dict): optional boto3 options
+            listing_cache_directory (str): optional directory in which listings of data_references are persisted, so
+                that only the keys added since the previous listing are listed (see DataReferenceListingCache)
         """
         logger.debug(f'Constructing ConfiguredAssetS3DataConnector "{name}".')
 
@@ -74,6 +80,7 @@ class ConfiguredAssetS3DataConnector(ConfiguredAssetFilePathDataConnector):
             assets=assets,
             default_regex=default_regex,
             sorters=sorters,
+            listing_cache_directory=listing_cache_directory,
         )
         self._bucket = bucket
         self._prefix = os.path.join(prefix, "")
@@ -122,6 +129,12 @@ class ConfiguredAssetS3DataConnector(ConfiguredAssetFilePathDataConnector):
             if asset.max_keys:
                 query_options["MaxKeys"] = asset.max_keys
 
+        listing_cache: Optional[DataReferenceListingCache] = self.listing_cache
+        if listing_cache is not None:
+            return listing_cache.list_s3_keys(
+                s3=self._s3, query_options=query_options, recursive=False
+            )
+
         path_list: List[str] = [
             key
             for key in list_s3_keys(
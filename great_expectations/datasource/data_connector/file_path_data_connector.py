@@ -1,5 +1,6 @@
 import logging
-from typing import Iterator, List, Optional, cast
+import re
+from typing import Dict, List, Optional, Pattern, Tuple, cast
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.core.batch import (
@@ -9,17 +10,25 @@ from great_expectations.core.batch import (
     BatchSpec,
 )
 from great_expectations.core.batch_spec import PathBatchSpec
+from great_expectations.datasource.data_connector.batch_definition_index import (
+    BatchDefinitionIndex,
+)
 from great_expectations.datasource.data_connector.data_connector import DataConnector
+from great_expectations.datasource.data_connector.listing_cache import (
+    DataReferenceListingCache,
+)
 from great_expectations.datasource.data_connector.partition_query import (
     PartitionQuery,
     build_partition_query,
 )
-from great_expectations.datasource.data_connector.sorter import Sorter
+from great_expectations.datasource.data_connector.sorter.sorter import (
+    sort_batch_definitions,
+)
 from great_expectations.datasource.data_connector.util import (
-    batch_definition_matches_batch_request,
     build_sorters_from_config,
     map_batch_definition_to_data_reference_string_using_regex,
     map_data_reference_string_to_batch_definition_list_using_regex,
+    normalize_directory_path,
 )
 from great_expectations.execution_engine import ExecutionEngine
 
@@ -43,6 +52,7 @@ class FilePathDataConnector(DataConnector):
         execution_engine: Optional[ExecutionEngine] = None,
         default_regex: Optional[dict] = None,
         sorters: Optional[list] = None,
+        listing_cache_directory: Optional[str] = None,
     ):
         """
         Base class for DataConnectors that connect to filesystem-like data. This class supports the configuration of default_regex
@@ -54,6 +64,9 @@ class FilePathDataConnector(DataConnector):
             execution_engine (ExecutionEngine): Execution Engine object to actually read the data
             default_regex (dict): Optional dict the filter and organize the data_references.
             sorters (list): Optional list if you want to sort the data_references
+            listing_cache_directory (str): Optional directory on local disk in which listings of data_references are
+                persisted, so that refreshing the data references cache only lists the changes since the previous
+                listing (see DataReferenceListingCache); relative paths are relative to the data context root directory
         """
         logger.debug(f'Constructing FilePathDataConnector "{name}".')
 
@@ -70,10 +83,34 @@ class FilePathDataConnector(DataConnector):
         self._sorters = build_sorters_from_config(config_list=sorters)
         self._validate_sorters_configuration()
 
+        self._listing_cache_directory = listing_cache_directory
+
+        # Compiled regex and group names, by data asset name
+        self._compiled_regex_configs: Dict[
+            Optional[str], Tuple[Pattern, List[str]]
+        ] = {}
+        # Index over the batch definitions of the data references cache it was built from
+        self._batch_definition_index: Optional[BatchDefinitionIndex] = None
+        self._indexed_data_references_cache: Optional[dict] = None
+
     @property
     def sorters(self) -> Optional[dict]:
         return self._sorters
 
+    @property
+    def listing_cache(self) -> Optional[DataReferenceListingCache]:
+        """
+        The cache of listings of data_references, if the DataConnector is configured with a listing_cache_directory.
+        """
+        if self._listing_cache_directory is None:
+            return None
+        return DataReferenceListingCache(
+            cache_directory=normalize_directory_path(
+                dir_path=self._listing_cache_directory,
+                root_directory_path=self.data_context_root_directory,
+            )
+        )
+
     def _get_data_reference_list_from_cache_by_data_asset_name(
         self, data_asset_name: str
     ) -> List[str]:
@@ -129,9 +166,35 @@ class FilePathDataConnector(DataConnector):
             batch_request=batch_request_base
         )
 
+    def get_top_batch_definition_list_from_batch_request(
+        self,
+        batch_request: BatchRequest,
+        limit: int,
+    ) -> List[BatchDefinition]:
+        """
+        Retrieve the first "limit" batch_definitions, in the order of the configured sorters, that match batch_request.
+
+        This returns the same batch_definitions as get_batch_definition_list_from_batch_request(batch_request)[:limit]
+        (e.g. the latest N batches, with sorters in descending order), but selects them without sorting all
+        batch_definitions that match batch_request.
+
+        Args:
+            batch_request (BatchRequest): BatchRequest (containing previously validated attributes) to process
+            limit (int): the number of batch_definitions to return
+
+        Returns:
+            A list of at most "limit" BatchDefinition objects that match BatchRequest
+
+        """
+        batch_request_base: BatchRequestBase = cast(BatchRequestBase, batch_request)
+        return self._get_batch_definition_list_from_batch_request(
+            batch_request=batch_request_base, limit=limit
+        )
+
     def _get_batch_definition_list_from_batch_request(
         self,
         batch_request: BatchRequestBase,
+        limit: Optional[int] = None,
     ) -> List[BatchDefinition]:
         """
         Retrieve batch_definitions that match batch_request.
@@ -142,6 +205,7 @@ class FilePathDataConnector(DataConnector):
 
         Args:
             batch_request (BatchRequestBase): BatchRequestBase (BatchRequest without attribute validation) to process
+            limit (int): if given, only the first "limit" batch_definitions are returned
 
         Returns:
             A list of BatchDefinition objects that match BatchRequest
@@ -152,14 +216,12 @@ class FilePathDataConnector(DataConnector):
         if self._data_references_cache is None:
             self._refresh_data_references_cache()
 
-        batch_definition_list: List[BatchDefinition] = list(
-            filter(
-                lambda batch_definition: batch_definition_matches_batch_request(
-                    batch_definition=batch_definition, batch_request=batch_request
-                ),
-                self._get_batch_definition_list_from_cache(),
-            )
+        batch_definition_index: BatchDefinitionIndex = (
+            self._get_batch_definition_index()
         )
+        batch_definition_list: List[
+            BatchDefinition
+        ] = batch_definition_index.get_batch_definitions(batch_request=batch_request)
 
         if batch_request.partition_request is not None:
             partition_query_obj: PartitionQuery = build_partition_query(
@@ -170,39 +232,63 @@ class FilePathDataConnector(DataConnector):
             )
 
         if len(self.sorters) > 0:
-            sorted_batch_definition_list = self._sort_batch_definition_list(
-                batch_definition_list=batch_definition_list
+            sorted_batch_definition_list = (
+                batch_definition_index.get_sorted_batch_definitions(
+                    batch_definition_list=batch_definition_list,
+                    data_asset_name=batch_request.data_asset_name,
+                    sort_function=self._sort_batch_definition_list,
+                    limit=limit,
+                )
             )
             return sorted_batch_definition_list
         else:
-            return batch_definition_list
+            return batch_definition_list[:limit]
+
+    def _get_batch_definition_index(self) -> BatchDefinitionIndex:
+        """
+        Return the index over the batch_definitions in the data references cache, building it again whenever the cache
+        has been refreshed since it was last built.
+        """
+        if (
+            self._batch_definition_index is None
+            or self._indexed_data_references_cache is not self._data_references_cache
+        ):
+            self._batch_definition_index = BatchDefinitionIndex(
+                batch_definition_list=self._get_batch_definition_list_from_cache()
+            )
+            self._indexed_data_references_cache = self._data_references_cache
+        return self._batch_definition_index
 
     def _sort_batch_definition_list(
-        self, batch_definition_list: List[BatchDefinition]
+        self, batch_definition_list: List[BatchDefinition], limit: Optional[int] = None
     ) -> List[BatchDefinition]:
         """
         Use configured sorters to sort batch_definition
 
+        The batch_definitions are sorted once by the keys of all sorters together (see sort_batch_definitions).
+
         Args:
             batch_definition_list (list): list of batch_definitions to sort
+            limit (int): if given, only the first "limit" sorted batch_definitions are selected, without a full sort
 
         Returns:
             sorted list of batch_definitions
 
         """
-        sorters: Iterator[Sorter] = reversed(list(self.sorters.values()))
-        for sorter in sorters:
-            batch_definition_list = sorter.get_sorted_batch_definitions(
-                batch_definitions=batch_definition_list
-            )
-        return batch_definition_list
+        return sort_batch_definitions(
+            batch_definitions=batch_definition_list,
+            sorters=list(self.sorters.values()),
+            limit=limit,
+        )
 
     def _map_data_reference_to_batch_definition_list(
         self, data_reference: str, data_asset_name: str = None
     ) -> Optional[List[BatchDefinition]]:
-        regex_config: dict = self._get_regex_config(data_asset_name=data_asset_name)
-        pattern: str = regex_config["pattern"]
-        group_names: List[str] = regex_config["group_names"]
+        pattern: Pattern
+        group_names: List[str]
+        pattern, group_names = self._get_compiled_regex_config(
+            data_asset_name=data_asset_name
+        )
         return map_data_reference_string_to_batch_definition_list_using_regex(
             datasource_name=self.datasource_name,
             data_connector_name=self.name,
@@ -212,6 +298,21 @@ class FilePathDataConnector(DataConnector):
             group_names=group_names,
         )
 
+    def _get_compiled_regex_config(
+        self, data_asset_name: Optional[str] = None
+    ) -> Tuple[Pattern, List[str]]:
+        """
+        Return the compiled regex pattern and the group names for data_asset_name, so that the regex config is only
+        built and compiled once per data asset, rather than once per data reference.
+        """
+        if data_asset_name not in self._compiled_regex_configs:
+            regex_config: dict = self._get_regex_config(data_asset_name=data_asset_name)
+            self._compiled_regex_configs[data_asset_name] = (
+                re.compile(regex_config["pattern"]),
+                regex_config["group_names"],
+            )
+        return self._compiled_regex_configs[data_asset_name]
+
     def _map_batch_definition_to_data_reference(
         self, batch_definition: BatchDefinition
     ) -> str:
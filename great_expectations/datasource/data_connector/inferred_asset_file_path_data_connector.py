@@ -31,6 +31,7 @@ class InferredAssetFilePathDataConnector(FilePathDataConnector):
         execution_engine: Optional[ExecutionEngine] = None,
         default_regex: Optional[dict] = None,
         sorters: Optional[list] = None,
+        listing_cache_directory: Optional[str] = None,
         batch_spec_passthrough: Optional[dict] = None,
     ):
         """
@@ -43,6 +44,7 @@ class InferredAssetFilePathDataConnector(FilePathDataConnector):
             execution_engine (ExecutionEngine): ExecutionEngine object to actually read the data
             default_regex (dict): Optional dict the filter and organize the data_references.
             sorters (list): Optional list if you want to sort the data_references
+            listing_cache_directory (str): Optional directory in which listings of data_references are persisted
         """
         logger.debug(f'Constructing InferredAssetFilePathDataConnector "{name}".')
 
@@ -52,6 +54,7 @@ class InferredAssetFilePathDataConnector(FilePathDataConnector):
             execution_engine=execution_engine,
             default_regex=default_regex,
             sorters=sorters,
+            listing_cache_directory=listing_cache_directory,
         )
 
         self._batch_spec_passthrough = batch_spec_passthrough or {}
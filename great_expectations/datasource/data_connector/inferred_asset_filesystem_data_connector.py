@@ -5,6 +5,9 @@ from typing import List, Optional
 from great_expectations.datasource.data_connector import (
     InferredAssetFilePathDataConnector,
 )
+from great_expectations.datasource.data_connector.listing_cache import (
+    DataReferenceListingCache,
+)
 from great_expectations.datasource.data_connector.util import (
     get_filesystem_one_level_directory_glob_path_list,
     normalize_directory_path,
@@ -37,6 +40,7 @@ class InferredAssetFilesystemDataConnector(InferredAssetFilePathDataConnector):
         glob_directive: Optional[str] = "*",
         sorters: Optional[list] = None,
         batch_spec_passthrough: Optional[dict] = None,
+        listing_cache_directory: Optional[str] = None,
     ):
         """
         Base class for DataConnectors that connect to filesystem-like data. This class supports the configuration of default_regex
@@ -49,6 +53,8 @@ class InferredAssetFilesystemDataConnector(InferredAssetFilePathDataConnector):
             execution_engine (ExecutionEngine): ExecutionEngine object to actually read the data
             default_regex (dict): Optional dict the filter and organize the data_references.
             sorters (list): Optional list if you want to sort the data_references
+            listing_cache_directory (str): Optional directory in which listings of data_references are persisted, so
+                that directories are only globbed again once they changed (see DataReferenceListingCache)
         """
         logger.debug(f'Constructing InferredAssetFilesystemDataConnector "{name}".')
 
@@ -59,6 +65,7 @@ class InferredAssetFilesystemDataConnector(InferredAssetFilePathDataConnector):
             default_regex=default_regex,
             sorters=sorters,
             batch_spec_passthrough=batch_spec_passthrough,
+            listing_cache_directory=listing_cache_directory,
         )
 
         self._base_directory = base_directory
@@ -72,9 +79,18 @@ class InferredAssetFilesystemDataConnector(InferredAssetFilePathDataConnector):
 
         This method is used to refresh the cache.
         """
-        path_list: List[str] = get_filesystem_one_level_directory_glob_path_list(
-            base_directory_path=self.base_directory, glob_directive=self._glob_directive
-        )
+        path_list: List[str]
+        listing_cache: Optional[DataReferenceListingCache] = self.listing_cache
+        if listing_cache is not None:
+            path_list = listing_cache.get_filesystem_glob_path_list(
+                base_directory_path=self.base_directory,
+                glob_directive=self._glob_directive,
+            )
+        else:
+            path_list = get_filesystem_one_level_directory_glob_path_list(
+                base_directory_path=self.base_directory,
+                glob_directive=self._glob_directive,
+            )
         return sorted(path_list)
 
     def _get_full_file_path(
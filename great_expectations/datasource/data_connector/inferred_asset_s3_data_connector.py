@@ -14,6 +14,9 @@ except ImportError:
 from great_expectations.datasource.data_connector import (
     InferredAssetFilePathDataConnector,
 )
+from great_expectations.datasource.data_connector.listing_cache import (
+    DataReferenceListingCache,
+)
 from great_expectations.datasource.data_connector.util import list_s3_keys
 from great_expectations.execution_engine import ExecutionEngine
 
@@ -48,6 +51,7 @@ class InferredAssetS3DataConnector(InferredAssetFilePathDataConnector):
         max_keys: Optional[int] = 1000,
         boto3_options: Optional[dict] = None,
         batch_spec_passthrough: Optional[dict] = None,
+        listing_cache_directory: Optional[str] = None,
     ):
         """
         InferredAssetS3DataConnector for connecting to S3.
@@ -63,6 +67,8 @@ class InferredAssetS3DataConnector(InferredAssetFilePathDataConnector):
             delimiter (str): S3 delimiter
             max_keys (int): S3 max_keys (default is 1000)
             boto3_options (dict): optional boto3 options
+            listing_cache_directory (str): optional directory in which listings of data_references are persisted, so
+                that only the keys added since the previous listing are listed (see DataReferenceListingCache)
         """
         logger.debug(f'Constructing InferredAssetS3DataConnector "{name}".')
 
@@ -73,6 +79,7 @@ class InferredAssetS3DataConnector(InferredAssetFilePathDataConnector):
             default_regex=default_regex,
             sorters=sorters,
             batch_spec_passthrough=batch_spec_passthrough,
+            listing_cache_directory=listing_cache_directory,
         )
 
         self._bucket = bucket
@@ -120,6 +127,12 @@ class InferredAssetS3DataConnector(InferredAssetFilePathDataConnector):
             "MaxKeys": self._max_keys,
         }
 
+        listing_cache: Optional[DataReferenceListingCache] = self.listing_cache
+        if listing_cache is not None:
+            return listing_cache.list_s3_keys(
+                s3=self._s3, query_options=query_options, recursive=True
+            )
+
         path_list: List[str] = [
             key
             for key in list_s3_keys(
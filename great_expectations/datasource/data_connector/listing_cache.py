@@ -0,0 +1,272 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from typing import Dict, List, Optional, Tuple
+
+from great_expectations.datasource.data_connector.util import (
+    get_filesystem_one_level_directory_glob_path_list,
+    list_s3_keys,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class DataReferenceListingCache:
+    """
+    Persists the listings of data references made by FilePathDataConnectors in a directory on local disk, so that
+    refreshing the data references cache of a connector only lists what changed since the previous listing.
+
+    - S3 listings are refreshed incrementally: only the keys after the greatest key listed so far (the watermark) are
+      listed, using the "StartAfter" option of ListObjectsV2. This suits data that is partitioned by keys that increase
+      over time (e.g. daily partitions named after their date). Recursive listings keep one watermark per "directory"
+      directly under the prefix (e.g. one per data asset under "data/"): the keys and directories directly under the
+      prefix are listed with the delimiter on every refresh, and each directory is then listed without delimiter after
+      its own watermark. Keys added before the watermark of their directory, and deleted keys, are only picked up once
+      the listing is cleared (see clear); the keys of a deleted directory are dropped as soon as it is gone.
+    - Filesystem listings are reused as long as the modification time of every directory under the base directory is
+      unchanged (adding, removing or renaming an entry changes the modification time of its directory); otherwise the
+      directory is globbed again.
+
+    Each listing is kept in its own file, named after a hash of the parameters of the listing.
+
+    Args:
+        cache_directory: the directory the listings are kept in; created if it does not exist
+    """
+
+    def __init__(self, cache_directory: str):
+        self._cache_directory = cache_directory
+
+    @property
+    def cache_directory(self) -> str:
+        return self._cache_directory
+
+    def list_s3_keys(
+        self, s3, query_options: dict, recursive: bool = False
+    ) -> List[str]:
+        """Return the keys listed by list_s3_keys, listing only the keys added after the previous listing."""
+        query_options = dict(query_options)
+        if recursive:
+            return self._list_s3_keys_recursively(s3=s3, query_options=query_options)
+
+        listing_key: dict = {
+            "type": "s3",
+            "bucket": query_options.get("Bucket"),
+            "prefix": query_options.get("Prefix"),
+            "delimiter": query_options.get("Delimiter"),
+        }
+        listing: dict = self._load_listing(listing_key=listing_key) or {
+            "data_references": [],
+            "start_after": None,
+        }
+
+        if listing["start_after"]:
+            query_options["StartAfter"] = listing["start_after"]
+        new_keys: List[str] = list(
+            list_s3_keys(
+                s3=s3,
+                query_options=query_options,
+                iterator_dict={},
+                recursive=False,
+                allow_empty=listing["start_after"] is not None,
+            )
+        )
+        logger.debug(
+            f"Listed {len(new_keys)} new S3 keys after {listing['start_after']} in {query_options}."
+        )
+        if new_keys or listing["start_after"] is None:
+            listing = {
+                "data_references": listing["data_references"] + new_keys,
+                "start_after": max([listing["start_after"] or ""] + new_keys) or None,
+            }
+            self._save_listing(listing_key=listing_key, listing=listing)
+        return listing["data_references"]
+
+    def _list_s3_keys_recursively(self, s3, query_options: dict) -> List[str]:
+        delimiter: str = query_options.get("Delimiter") or "/"
+        listing_key: dict = {
+            "type": "s3",
+            "bucket": query_options.get("Bucket"),
+            "prefix": query_options.get("Prefix"),
+            "delimiter": delimiter,
+            "recursive": True,
+        }
+        cached_listing: Optional[dict] = self._load_listing(listing_key=listing_key)
+        previous_listing: dict = cached_listing or {
+            "data_references": {},
+            "start_after": {},
+        }
+
+        keys, directories = _list_s3_directory(
+            s3=s3,
+            query_options={**query_options, "Delimiter": delimiter},
+            allow_empty=cached_listing is not None,
+        )
+
+        listing: dict = {"data_references": {}, "start_after": {}}
+        for directory in directories:
+            directory_query_options: dict = {
+                key: value for key, value in query_options.items() if key != "Delimiter"
+            }
+            directory_query_options["Prefix"] = directory
+            start_after: Optional[str] = previous_listing["start_after"].get(directory)
+            if start_after:
+                directory_query_options["StartAfter"] = start_after
+            new_keys: List[str] = list(
+                list_s3_keys(
+                    s3=s3,
+                    query_options=directory_query_options,
+                    iterator_dict={},
+                    recursive=False,
+                    allow_empty=True,
+                )
+            )
+            logger.debug(
+                f"Listed {len(new_keys)} new S3 keys after {start_after} in {directory_query_options}."
+            )
+            listing["data_references"][directory] = (
+                previous_listing["data_references"].get(directory, []) + new_keys
+            )
+            listing["start_after"][directory] = (
+                max([start_after or ""] + new_keys) or None
+            )
+
+        if listing != cached_listing:
+            self._save_listing(listing_key=listing_key, listing=listing)
+        return keys + [
+            key
+            for directory in directories
+            for key in listing["data_references"][directory]
+        ]
+
+    def get_filesystem_glob_path_list(
+        self, base_directory_path: str, glob_directive: str
+    ) -> List[str]:
+        """Return the paths listed by get_filesystem_one_level_directory_glob_path_list, globbing base_directory_path
+        again only when a directory under it changed since the previous listing."""
+        listing_key: dict = {
+            "type": "filesystem",
+            "base_directory": os.path.abspath(base_directory_path),
+            "glob_directive": glob_directive,
+        }
+        listing: Optional[dict] = self._load_listing(listing_key=listing_key)
+        if listing is not None and self._directory_mtimes_are_unchanged(
+            base_directory_path=base_directory_path,
+            directory_mtimes=listing["directory_mtimes"],
+        ):
+            return listing["data_references"]
+
+        # Modification times are read before globbing, so that changes made while globbing are seen next time
+        directory_mtimes: Dict[str, int] = self._get_directory_mtimes(
+            base_directory_path=base_directory_path
+        )
+        path_list: List[str] = get_filesystem_one_level_directory_glob_path_list(
+            base_directory_path=base_directory_path, glob_directive=glob_directive
+        )
+        self._save_listing(
+            listing_key=listing_key,
+            listing={
+                "data_references": path_list,
+                "directory_mtimes": directory_mtimes,
+            },
+        )
+        return path_list
+
+    @staticmethod
+    def _get_directory_mtimes(base_directory_path: str) -> Dict[str, int]:
+        directory_mtimes: Dict[str, int] = {}
+        for directory_path, _, _ in os.walk(base_directory_path):
+            directory_mtimes[
+                os.path.relpath(directory_path, base_directory_path)
+            ] = os.stat(directory_path).st_mtime_ns
+        return directory_mtimes
+
+    @staticmethod
+    def _directory_mtimes_are_unchanged(
+        base_directory_path: str, directory_mtimes: Dict[str, int]
+    ) -> bool:
+        for relative_directory_path, mtime in directory_mtimes.items():
+            try:
+                current_mtime: int = os.stat(
+                    os.path.join(base_directory_path, relative_directory_path)
+                ).st_mtime_ns
+            except FileNotFoundError:
+                return False
+            if current_mtime != mtime:
+                return False
+        return True
+
+    def clear(self):
+        """Remove all listings, so that the next refresh of each data connector lists all its data references."""
+        if not os.path.isdir(self._cache_directory):
+            return
+        for file_name in os.listdir(self._cache_directory):
+            if file_name.endswith(".json"):
+                os.remove(os.path.join(self._cache_directory, file_name))
+
+    def _get_listing_path(self, listing_key: dict) -> str:
+        listing_id: str = hashlib.md5(
+            json.dumps(listing_key, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+        return os.path.join(self._cache_directory, f"{listing_id}.json")
+
+    def _load_listing(self, listing_key: dict) -> Optional[dict]:
+        listing_path: str = self._get_listing_path(listing_key=listing_key)
+        try:
+            with open(listing_path) as f:
+                cached_listing: dict = json.load(f)
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            logger.warning(
+                f"Ignoring the data reference listing cache file {listing_path}, which could not be read."
+            )
+            return None
+        if cached_listing.get("listing_key") != listing_key:
+            return None
+        return cached_listing["listing"]
+
+    def _save_listing(self, listing_key: dict, listing: dict):
+        os.makedirs(self._cache_directory, exist_ok=True)
+        listing_path: str = self._get_listing_path(listing_key=listing_key)
+        # Written to a temporary file first, so that concurrent readers never see a partial listing
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            dir=self._cache_directory, suffix=".tmp"
+        )
+        try:
+            with os.fdopen(file_descriptor, "w") as f:
+                json.dump({"listing_key": listing_key, "listing": listing}, f)
+            os.replace(temporary_path, listing_path)
+        except Exception:
+            os.remove(temporary_path)
+            raise
+
+
+def _list_s3_directory(
+    s3, query_options: dict, allow_empty: bool = False
+) -> Tuple[List[str], List[str]]:
+    """Return the keys and the common prefixes ("directories") directly under the prefix of query_options, which are
+    listed with its delimiter."""
+    query_options = dict(query_options)
+    keys: List[str] = []
+    directories: List[str] = []
+    while True:
+        logger.debug(f"Fetching objects from S3 with query options: {query_options}")
+        s3_objects_info: dict = s3.list_objects_v2(**query_options)
+        keys.extend(
+            item["Key"]
+            for item in s3_objects_info.get("Contents", [])
+            if item["Size"] > 0
+        )
+        directories.extend(
+            prefix_info["Prefix"]
+            for prefix_info in s3_objects_info.get("CommonPrefixes", [])
+        )
+        if not s3_objects_info.get("IsTruncated"):
+            break
+        query_options["ContinuationToken"] = s3_objects_info["NextContinuationToken"]
+
+    if not (keys or directories or allow_empty):
+        raise ValueError("S3 query may not have been configured correctly.")
+    return keys, directories
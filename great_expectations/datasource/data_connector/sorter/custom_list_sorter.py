@@ -1,5 +1,5 @@
 import logging
-from typing import Any, List
+from typing import Any, Dict, List
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.core.batch import BatchDefinition
@@ -22,6 +22,10 @@ class CustomListSorter(Sorter):
         self._reference_list = self._validate_reference_list(
             reference_list=reference_list
         )
+        # Position of the first occurrence of each item, as given by list.index
+        self._reference_positions: Dict[str, int] = {}
+        for position, item in enumerate(self._reference_list):
+            self._reference_positions.setdefault(item, position)
 
     @staticmethod
     def _validate_reference_list(reference_list: List[str] = None) -> List[str]:
@@ -39,9 +43,9 @@ class CustomListSorter(Sorter):
     def get_partition_key(self, batch_definition: BatchDefinition) -> Any:
         partition_definition: dict = batch_definition.partition_definition
         partition_value: Any = partition_definition[self.name]
-        if partition_value in self._reference_list:
-            return self._reference_list.index(partition_value)
-        else:
+        try:
+            return self._reference_positions[partition_value]
+        except (KeyError, TypeError):
             raise ge_exceptions.SorterError(
                 f"Source {partition_value} was not found in Reference list.  Try again..."
             )
@@ -1,5 +1,6 @@
 import datetime
 import logging
+from functools import lru_cache
 from typing import Any
 
 import great_expectations.exceptions as ge_exceptions
@@ -10,6 +11,16 @@ from great_expectations.datasource.data_connector.sorter import Sorter
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=65536)
+def _parse_string_to_datetime_int(datetime_string: str, datetime_format: str) -> int:
+    # Partitions often share datetime values (e.g. one file per table and day), which are then parsed only once
+    dt: datetime.date = parse_string_to_datetime(
+        datetime_string=datetime_string,
+        datetime_format_string=datetime_format,
+    )
+    return datetime_to_int(dt=dt)
+
+
 class DateTimeSorter(Sorter):
     def __init__(self, name: str, orderby: str = "asc", datetime_format="%Y%m%d"):
         super().__init__(name=name, orderby=orderby)
@@ -26,6 +37,10 @@ class DateTimeSorter(Sorter):
     def get_partition_key(self, batch_definition: BatchDefinition) -> Any:
         partition_definition: dict = batch_definition.partition_definition
         partition_value: Any = partition_definition[self.name]
+        if isinstance(partition_value, str) and isinstance(self._datetime_format, str):
+            return _parse_string_to_datetime_int(
+                datetime_string=partition_value, datetime_format=self._datetime_format
+            )
         dt: datetime.date = parse_string_to_datetime(
             datetime_string=partition_value,
             datetime_format_string=self._datetime_format,
@@ -1,4 +1,5 @@
 import logging
+from functools import lru_cache
 from typing import Any
 
 import great_expectations.exceptions as ge_exceptions
@@ -9,21 +10,35 @@ from great_expectations.util import is_int, is_numeric
 logger = logging.getLogger(__name__)
 
 
+def _get_numeric_partition_key(name: str, partition_value: Any) -> int:
+    if not is_numeric(value=partition_value):
+        raise ge_exceptions.SorterError(
+            # what is the identifying characteristic of batch_definition?
+            f"""BatchDefinition with PartitionDefinition "{name}" with value "{partition_value}" has value
+"{partition_value}" which cannot be part of numeric sort.
+"""
+        )
+    if is_int(value=partition_value):
+        return int(partition_value)
+    # The case of strings having floating point number format used as references to partitions should be rare.
+    return round(float(partition_value))
+
+
+# Partitions often share numeric values (e.g. one file per table and month), which are then parsed only once
+_get_cached_numeric_partition_key = lru_cache(maxsize=65536)(_get_numeric_partition_key)
+
+
 class NumericSorter(Sorter):
     def get_partition_key(self, batch_definition: BatchDefinition) -> Any:
         partition_definition: dict = batch_definition.partition_definition
         partition_value: Any = partition_definition[self.name]
-        if not is_numeric(value=partition_value):
-            raise ge_exceptions.SorterError(
-                # what is the identifying characteristic of batch_definition?
-                f"""BatchDefinition with PartitionDefinition "{self.name}" with value "{partition_value}" has value
-"{partition_value}" which cannot be part of numeric sort.
-"""
+        if isinstance(partition_value, str):
+            return _get_cached_numeric_partition_key(
+                name=self.name, partition_value=partition_value
             )
-        if is_int(value=partition_value):
-            return int(partition_value)
-        # The case of strings having floating point number format used as references to partitions should be rare.
-        return round(float(partition_value))
+        return _get_numeric_partition_key(
+            name=self.name, partition_value=partition_value
+        )
 
     def __repr__(self) -> str:
         doc_fields_dict: dict = {
@@ -1,5 +1,6 @@
+import heapq
 import logging
-from typing import Any, List
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.core.batch import BatchDefinition
@@ -39,6 +40,14 @@ class Sorter:
             )
         return self.get_partition_key(batch_definition=batch_definition)
 
+    def get_partition_keys(self, batch_definitions: List[BatchDefinition]) -> List[Any]:
+        return [
+            self._verify_sorting_directives_and_get_partition_key(
+                batch_definition=batch_definition
+            )
+            for batch_definition in batch_definitions
+        ]
+
     def get_partition_key(self, batch_definition: BatchDefinition) -> Any:
         raise NotImplementedError
 
@@ -53,3 +62,78 @@ class Sorter:
     def __repr__(self) -> str:
         doc_fields_dict: dict = {"name": self.name, "reverse": self.reverse}
         return str(doc_fields_dict)
+
+
+def sort_batch_definitions(
+    batch_definitions: List[BatchDefinition],
+    sorters: List[Sorter],
+    limit: Optional[int] = None,
+) -> List[BatchDefinition]:
+    """Sort batch definitions by several sorters at once.
+
+    The batch definitions are ordered by the first sorter, ties are ordered by the second one, and so on; remaining
+    ties are kept in the given order. This is the order obtained by applying get_sorted_batch_definitions of each sorter
+    in turn, from the last sorter to the first, but the partition key of each batch definition is computed only once
+    per sorter and the batch definitions are sorted a single time: the partition keys of each sorter are replaced by
+    their rank among the distinct keys (negated for descending sorters), so that each batch definition is compared by
+    one tuple of integers.
+
+    Args:
+        batch_definitions: the batch definitions to sort
+        sorters: the sorters, by decreasing priority
+        limit: if given, only the first "limit" batch definitions of the sorted order are returned, which are selected
+            without sorting all batch definitions
+
+    Returns:
+        the sorted batch definitions
+    """
+    if limit is not None and limit < 0:
+        raise ge_exceptions.SorterError(
+            f'The number of sorted batch definitions to return must not be negative (got "{limit}").'
+        )
+    if not sorters:
+        return list(batch_definitions[:limit])
+
+    rank_columns: List[List[int]] = []
+    for sorter in sorters:
+        partition_keys: List[Any] = sorter.get_partition_keys(
+            batch_definitions=batch_definitions
+        )
+        try:
+            ranks_by_partition_key: Dict[Any, int] = {
+                partition_key: rank
+                for rank, partition_key in enumerate(sorted(set(partition_keys)))
+            }
+        except TypeError:
+            # Partition keys that are not hashable cannot be ranked
+            return _sort_batch_definitions_by_each_sorter(
+                batch_definitions=batch_definitions, sorters=sorters, limit=limit
+            )
+        sign: int = -1 if sorter.reverse else 1
+        rank_columns.append(
+            [
+                sign * ranks_by_partition_key[partition_key]
+                for partition_key in partition_keys
+            ]
+        )
+
+    sort_keys: List[Tuple[int, ...]] = list(zip(*rank_columns))
+    positions: Iterable[int] = range(len(batch_definitions))
+    if limit is not None and limit < len(batch_definitions):
+        # heapq.nsmallest is stable, like sorted
+        positions = heapq.nsmallest(limit, positions, key=sort_keys.__getitem__)
+    else:
+        positions = sorted(positions, key=sort_keys.__getitem__)
+    return [batch_definitions[position] for position in positions]
+
+
+def _sort_batch_definitions_by_each_sorter(
+    batch_definitions: List[BatchDefinition],
+    sorters: List[Sorter],
+    limit: Optional[int] = None,
+) -> List[BatchDefinition]:
+    for sorter in reversed(sorters):
+        batch_definitions = sorter.get_sorted_batch_definitions(
+            batch_definitions=batch_definitions
+        )
+    return list(batch_definitions[:limit])
@@ -6,8 +6,9 @@ import os
 import re
 import sre_constants
 import sre_parse
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Pattern, Tuple, Union
 
 import pandas as pd
 
@@ -83,7 +84,7 @@ def map_data_reference_string_to_batch_definition_list_using_regex(
     datasource_name: str,
     data_connector_name: str,
     data_reference: str,
-    regex_pattern: str,
+    regex_pattern: Union[str, Pattern],
     group_names: List[str],
     data_asset_name: Optional[str] = None,
 ) -> Optional[List[BatchDefinition]]:
@@ -113,11 +114,14 @@ def map_data_reference_string_to_batch_definition_list_using_regex(
 
 def convert_data_reference_string_to_partition_definition_using_regex(
     data_reference: str,
-    regex_pattern: str,
+    regex_pattern: Union[str, Pattern],
     group_names: List[str],
 ) -> Optional[Tuple[str, PartitionDefinitionSubset]]:
+    # Callers matching many data references pass a compiled pattern, to save looking it up in the cache of the re module
+    if isinstance(regex_pattern, str):
+        regex_pattern = re.compile(regex_pattern)
     # noinspection PyUnresolvedReferences
-    matches: Optional[re.Match] = re.match(regex_pattern, data_reference)
+    matches: Optional[re.Match] = regex_pattern.match(data_reference)
     if matches is None:
         return None
     groups: list = list(matches.groups())
@@ -213,6 +217,17 @@ def _invert_regex_to_data_reference_template(
 
     NOTE Abe 20201017: This method is almost certainly still brittle. I haven't exhaustively mapped the OPCODES in sre_constants
     """
+    # Templates are cached, since a data connector inverts the same regex for every batch definition it maps
+    return _invert_regex_to_data_reference_template_cached(
+        regex_pattern=regex_pattern, group_names=tuple(group_names)
+    )
+
+
+@lru_cache(maxsize=128)
+def _invert_regex_to_data_reference_template_cached(
+    regex_pattern: str,
+    group_names: Tuple[str, ...],
+) -> str:
     data_reference_template: str = ""
     group_name_index: int = 0
 
@@ -285,7 +300,11 @@ def get_filesystem_one_level_directory_glob_path_list(
 
 
 def list_s3_keys(
-    s3, query_options: dict, iterator_dict: dict, recursive: bool = False
+    s3,
+    query_options: dict,
+    iterator_dict: dict,
+    recursive: bool = False,
+    allow_empty: bool = False,
 ) -> str:
     """
     For InferredAssetS3DataConnector, we take bucket and prefix and search for files using RegEx at and below the level
@@ -298,6 +317,8 @@ def list_s3_keys(
     :param query_options: s3 query attributes ("Bucket", "Prefix", "Delimiter", "MaxKeys")
     :param iterator_dict: dictionary to manage "NextContinuationToken" (if "IsTruncated" is returned from S3)
     :param recursive: True for InferredAssetS3DataConnector and False for ConfiguredAssetS3DataConnector (see above)
+    :param allow_empty: if False, an empty listing is assumed to be a misconfigured query, and raises a ValueError; an
+    incremental listing ("StartAfter" in query_options) is legitimately empty when no key was added
     :return: string valued key representing file path on S3 (full prefix and leaf file name)
     """
     if iterator_dict is None:
@@ -311,6 +332,8 @@ def list_s3_keys(
     s3_objects_info: dict = s3.list_objects_v2(**query_options)
 
     if not any(key in s3_objects_info for key in ["Contents", "CommonPrefixes"]):
+        if allow_empty:
+            return
         raise ValueError("S3 query may not have been configured correctly.")
 
     if "Contents" in s3_objects_info:
@@ -329,6 +352,7 @@ def list_s3_keys(
                 query_options=query_options_tmp,
                 iterator_dict={},
                 recursive=recursive,
+                allow_empty=allow_empty,
             )
     if s3_objects_info["IsTruncated"]:
         iterator_dict["continuation_token"] = s3_objects_info["NextContinuationToken"]
@@ -338,6 +362,7 @@ def list_s3_keys(
             query_options=query_options,
             iterator_dict=iterator_dict,
             recursive=recursive,
+            allow_empty=allow_empty,
         )
 
     if "continuation_token" in iterator_dict:
@@ -0,0 +1,177 @@
+import logging
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+def estimate_size_bytes(value: Any) -> int:
+    """Estimate the number of bytes held by a cached value.
+
+    DataFrames, Series and numpy arrays report the size of their underlying buffers; containers are estimated from
+    their elements. The estimate is intended for budgeting caches, not for exact accounting.
+    """
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=False).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True, deep=False))
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, (list, tuple, set)):
+        return sys.getsizeof(value) + sum(estimate_size_bytes(item) for item in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            estimate_size_bytes(key) + estimate_size_bytes(item)
+            for key, item in value.items()
+        )
+    return sys.getsizeof(value)
+
+
+class SizeBoundedCache:
+    """A thread-safe cache whose capacity is a budget of bytes rather than a number of entries.
+
+    When the budget is exceeded, entries are evicted according to the eviction policy: "lru" evicts the least recently
+    used entry, "lfu" the least frequently used one (the least recently used among equally used entries). Values
+    larger than the whole budget are not cached. Hits, misses and evictions are counted so that cache effectiveness
+    can be monitored through the statistics property.
+    """
+
+    eviction_policies = ("lru", "lfu")
+
+    def __init__(
+        self,
+        max_bytes: Optional[int],
+        size_estimator: Callable[[Any], int] = estimate_size_bytes,
+        eviction_policy: str = "lru",
+    ):
+        if eviction_policy not in self.eviction_policies:
+            raise ValueError(
+                f'Unknown eviction_policy "{eviction_policy}"; expected one of {", ".join(self.eviction_policies)}.'
+            )
+        self._max_bytes = max_bytes
+        self._size_estimator = size_estimator
+        self._eviction_policy = eviction_policy
+        # key -> [value, size, number of hits]; ordered from least to most recently used
+        self._entries = OrderedDict()
+        self._current_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.RLock()
+
+    def __getstate__(self):
+        # Locks cannot be pickled (e.g. when an execution engine is sent to a process pool worker)
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    def empty_copy(self) -> "SizeBoundedCache":
+        """Return an empty cache with the same budget, size estimator and eviction policy as this one."""
+        return SizeBoundedCache(
+            max_bytes=self._max_bytes,
+            size_estimator=self._size_estimator,
+            eviction_policy=self._eviction_policy,
+        )
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def max_bytes(self) -> Optional[int]:
+        return self._max_bytes
+
+    @property
+    def current_bytes(self) -> int:
+        return self._current_bytes
+
+    @property
+    def eviction_policy(self) -> str:
+        return self._eviction_policy
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return default
+            self._hits += 1
+            entry[2] += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any) -> bool:
+        """Cache the value under key, evicting entries according to the eviction policy as needed.
+
+        Returns:
+            True if the value was cached, False if it exceeds the budget of the cache
+        """
+        size = self._size_estimator(value)
+        with self._lock:
+            self.pop(key)
+            if self._max_bytes is not None and size > self._max_bytes:
+                logger.debug(
+                    f"Not caching value of {size} bytes, which exceeds the cache budget of {self._max_bytes} bytes"
+                )
+                return False
+            self._entries[key] = [value, size, 0]
+            self._current_bytes += size
+            while self._max_bytes is not None and self._current_bytes > self._max_bytes:
+                self._evict(protected_key=key)
+            return True
+
+    def _evict(self, protected_key: Hashable) -> None:
+        if self._eviction_policy == "lfu":
+            # min() returns the first of equally used entries, i.e. the least recently used one
+            evicted_key = min(
+                (key for key in self._entries if key != protected_key),
+                key=lambda key: self._entries[key][2],
+            )
+        else:
+            evicted_key = next(iter(self._entries))
+        self.pop(evicted_key)
+        self._evictions += 1
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            if key not in self._entries:
+                return default
+            value, size, _ = self._entries.pop(key)
+            self._current_bytes -= size
+            return value
+
+    def invalidate(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Remove every entry whose key satisfies the predicate, returning the number of removed entries."""
+        with self._lock:
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                self.pop(key)
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+
+    @property
+    def statistics(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "current_bytes": self._current_bytes,
+                "max_bytes": self._max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+            }
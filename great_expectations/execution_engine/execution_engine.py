@@ -1,34 +1,27 @@
 import copy
 import logging
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from enum import Enum
-from typing import Any, Dict, Iterable, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 from ruamel.yaml import YAML
 
 from great_expectations.core.batch import BatchMarkers, BatchSpec
 from great_expectations.exceptions import GreatExpectationsError
+from great_expectations.execution_engine.cache import SizeBoundedCache
 from great_expectations.expectations.registry import get_metric_provider
 from great_expectations.util import filter_properties_dict
 from great_expectations.validator.validation_graph import MetricConfiguration
 
 logger = logging.getLogger(__name__)
+DEFAULT_METRIC_CACHE_MAX_BYTES = 1e9
+_CACHE_MISS = object()
 yaml = YAML()
 yaml.default_flow_style = False
 import pandas as pd
 
 
-class NoOpDict:
-    def __getitem__(self, item):
-        return None
-
-    def __setitem__(self, key, value):
-        return None
-
-    def update(self, value):
-        return None
-
-
 class BatchData:
     def __init__(self, execution_engine):
         self._execution_engine = execution_engine
@@ -44,6 +37,7 @@ class BatchData:
 
 class ExecutionEngine(ABC):
     recognized_batch_spec_defaults = set()
+    supported_concurrency_executors = {"thread"}
 
     def __init__(
         self,
@@ -52,6 +46,8 @@ class ExecutionEngine(ABC):
         batch_spec_defaults=None,
         batch_data_dict=None,
         validator=None,
+        metric_cache_max_bytes=None,
+        metric_cache_eviction_policy=None,
     ):
         self.name = name
         self._validator = validator
@@ -59,11 +55,19 @@ class ExecutionEngine(ABC):
         # NOTE: using caching makes the strong assumption that the user will not modify the core data store
         # (e.g. self.spark_df) over the lifetime of the dataset instance
         self._caching = caching
-        # NOTE: 20200918 - this is a naive cache; update.
-        if self._caching:
-            self._metric_cache = {}
+        # Resolved metric values are cached by (batch_id, metric id) within a memory budget; the entries of a batch
+        # are invalidated when load_batch_data replaces it. A budget of 0 (or caching=False) disables the cache.
+        if metric_cache_max_bytes is None:
+            metric_cache_max_bytes_budget = DEFAULT_METRIC_CACHE_MAX_BYTES
+        else:
+            metric_cache_max_bytes_budget = metric_cache_max_bytes
+        if self._caching and metric_cache_max_bytes_budget:
+            self._metric_cache = SizeBoundedCache(
+                max_bytes=metric_cache_max_bytes_budget,
+                eviction_policy=metric_cache_eviction_policy or "lru",
+            )
         else:
-            self._metric_cache = NoOpDict()
+            self._metric_cache = None
 
         if batch_spec_defaults is None:
             batch_spec_defaults = {}
@@ -94,11 +98,26 @@ class ExecutionEngine(ABC):
             "batch_spec_defaults": batch_spec_defaults,
             "batch_data_dict": batch_data_dict,
             "validator": validator,
+            "metric_cache_max_bytes": metric_cache_max_bytes,
+            "metric_cache_eviction_policy": metric_cache_eviction_policy,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
         filter_properties_dict(properties=self._config, inplace=True)
 
+    def __copy__(self):
+        """Return a shallow copy of the execution engine with its own batch data dictionary and metric cache.
+
+        The copy shares its configuration, connections and the loaded batch data with this engine, but loading or
+        activating a batch on one engine does not affect the other, and metric values are not shared between them.
+        """
+        execution_engine = self.__class__.__new__(self.__class__)
+        execution_engine.__dict__.update(self.__dict__)
+        execution_engine._batch_data_dict = dict(self._batch_data_dict)
+        if self._metric_cache is not None:
+            execution_engine._metric_cache = self._metric_cache.empty_copy()
+        return execution_engine
+
     def configure_validator(self, validator):
         """Optionally configure the validator as appropriate for the execution engine."""
         pass
@@ -163,6 +182,9 @@ class ExecutionEngine(ABC):
         """
         Loads the specified batch_data into the execution engine
         """
+        if self._metric_cache is not None:
+            # Metrics computed on data previously loaded under this batch_id are no longer valid
+            self._metric_cache.invalidate(lambda key: key[0] == batch_id)
         self._batch_data_dict[batch_id] = batch_data
         self._active_batch_data_id = batch_id
 
@@ -182,6 +204,9 @@ class ExecutionEngine(ABC):
         """resolve_metrics is the main entrypoint for an execution engine. The execution engine will compute the value
         of the provided metrics.
 
+        Metrics already in the metric cache are returned from it; the others are computed by _compute_metrics and
+        added to the cache.
+
         Args:
             metrics_to_resolve: the metrics to evaluate
             metrics: already-computed metrics currently available to the engine
@@ -190,12 +215,78 @@ class ExecutionEngine(ABC):
         Returns:
             resolved_metrics (Dict): a dictionary with the values for the metrics that have just been resolved.
         """
+        if self._metric_cache is None:
+            return self._compute_metrics(
+                metrics_to_resolve=metrics_to_resolve,
+                metrics=metrics,
+                runtime_configuration=runtime_configuration,
+            )
+
+        resolved_metrics = dict()
+        metrics_to_compute = []
+        cache_keys = dict()
+        for metric_to_resolve in metrics_to_resolve:
+            batch_id = (
+                metric_to_resolve.metric_domain_kwargs.get("batch_id")
+                or self.active_batch_data_id
+            )
+            if batch_id is not None:
+                cache_key = (batch_id, metric_to_resolve.id)
+                metric_value = self._metric_cache.get(cache_key, _CACHE_MISS)
+                if metric_value is not _CACHE_MISS:
+                    resolved_metrics[metric_to_resolve.id] = metric_value
+                    continue
+                cache_keys[metric_to_resolve.id] = cache_key
+            metrics_to_compute.append(metric_to_resolve)
+
+        computed_metrics = self._compute_metrics(
+            metrics_to_resolve=metrics_to_compute,
+            metrics=metrics,
+            runtime_configuration=runtime_configuration,
+        )
+        for metric_id, metric_value in computed_metrics.items():
+            if metric_id in cache_keys:
+                self._metric_cache.put(cache_keys[metric_id], metric_value)
+        resolved_metrics.update(computed_metrics)
+
+        return resolved_metrics
+
+    @property
+    def metric_cache_statistics(self) -> Optional[dict]:
+        """Hit, miss and eviction counts and memory usage of the metric cache (None if it is disabled)."""
+        if self._metric_cache is None:
+            return None
+        return self._metric_cache.statistics
+
+    def _compute_metrics(
+        self,
+        metrics_to_resolve: Iterable[MetricConfiguration],
+        metrics: Dict[Tuple, Any] = None,
+        runtime_configuration: dict = None,
+        metric_fn_bundle: Optional[list] = None,
+    ) -> dict:
+        """Compute the value of the provided metrics, bypassing the metric cache.
+
+        The metrics to resolve are independent of one another, so when the runtime_configuration enables
+        "concurrency" they are computed in parallel on a pool of workers (see _get_metric_resolution_executor).
+
+        Args:
+            metrics_to_resolve: the metrics to evaluate
+            metrics: already-computed metrics currently available to the engine
+            runtime_configuration: runtime configuration information
+            metric_fn_bundle: metrics already prepared by the engine to be resolved by resolve_metric_bundle, which
+                are resolved together with the metrics to evaluate
+
+        Returns:
+            resolved_metrics (Dict): a dictionary with the values for the metrics that have just been computed.
+        """
         if metrics is None:
             metrics = dict()
 
         resolved_metrics = dict()
 
-        metric_fn_bundle = []
+        metric_computations = []
+        metric_fn_bundle = list(metric_fn_bundle or [])
         for metric_to_resolve in metrics_to_resolve:
             metric_class, metric_fn = get_metric_provider(
                 metric_name=metric_to_resolve.metric_name, execution_engine=self
@@ -239,7 +330,7 @@ class ExecutionEngine(ABC):
             metric_fn_type = getattr(
                 metric_fn, "metric_fn_type", MetricFunctionTypes.VALUE
             )
-            if metric_fn_type in [
+            if metric_fn_type not in [
                 MetricPartialFunctionTypes.MAP_SERIES,
                 MetricPartialFunctionTypes.MAP_FN,
                 MetricPartialFunctionTypes.MAP_CONDITION_FN,
@@ -247,28 +338,130 @@ class ExecutionEngine(ABC):
                 MetricPartialFunctionTypes.WINDOW_FN,
                 MetricPartialFunctionTypes.WINDOW_CONDITION_FN,
                 MetricPartialFunctionTypes.AGGREGATE_FN,
+                MetricFunctionTypes.VALUE,
             ]:
-                # NOTE: 20201026 - JPC - we could use the fact that these metric functions return functions rather
-                # than data to optimize compute in the future
-                resolved_metrics[metric_to_resolve.id] = metric_fn(
-                    **metric_provider_kwargs
-                )
-            elif metric_fn_type == MetricFunctionTypes.VALUE:
-                resolved_metrics[metric_to_resolve.id] = metric_fn(
-                    **metric_provider_kwargs
-                )
-            else:
                 logger.warning(
                     f"Unrecognized metric function type while trying to resolve {str(metric_to_resolve.id)}"
                 )
-                resolved_metrics[metric_to_resolve.id] = metric_fn(
-                    **metric_provider_kwargs
+            # NOTE: 20201026 - JPC - we could use the fact that partial metric functions return functions rather
+            # than data to optimize compute in the future
+            metric_computations.append(
+                (metric_to_resolve.id, metric_fn, metric_provider_kwargs)
+            )
+
+        metric_fn_bundles = (
+            self._split_metric_fn_bundle(metric_fn_bundle)
+            if len(metric_fn_bundle) > 0
+            else []
+        )
+        executor, owns_executor = self._get_metric_resolution_executor(
+            runtime_configuration=runtime_configuration,
+            num_tasks=len(metric_computations) + len(metric_fn_bundles),
+        )
+        if executor is None:
+            for metric_id, metric_fn, metric_provider_kwargs in metric_computations:
+                resolved_metrics[metric_id] = metric_fn(**metric_provider_kwargs)
+            if len(metric_fn_bundle) > 0:
+                resolved_metrics.update(self.resolve_metric_bundle(metric_fn_bundle))
+        else:
+            resolved_metrics.update(
+                self._resolve_metrics_concurrently(
+                    executor=executor,
+                    metric_computations=metric_computations,
+                    metric_fn_bundles=metric_fn_bundles,
+                    shutdown=owns_executor,
                 )
-        if len(metric_fn_bundle) > 0:
-            resolved_metrics.update(self.resolve_metric_bundle(metric_fn_bundle))
+            )
 
         return resolved_metrics
 
+    def _get_metric_resolution_executor(
+        self, runtime_configuration: Optional[dict], num_tasks: int
+    ) -> Tuple[Optional[Executor], bool]:
+        """Build the executor used to resolve independent metrics concurrently, or return None to resolve them
+        sequentially. The second element of the returned tuple indicates whether the engine owns (and must shut
+        down) the executor.
+
+        Concurrency is driven by the "concurrency" key of the runtime_configuration, e.g.::
+
+            {"concurrency": {"enabled": True, "executor": "thread", "max_workers": 8}}
+
+        "executor" may be "thread", "process" (for engines listing it in supported_concurrency_executors), or an
+        instance of concurrent.futures.Executor, which is used as-is and never shut down by the engine.
+        """
+        if not runtime_configuration:
+            return None, False
+        concurrency = runtime_configuration.get("concurrency")
+        if not concurrency or not concurrency.get("enabled", True):
+            return None, False
+        if num_tasks < 2:
+            return None, False
+
+        executor = concurrency.get("executor", "thread")
+        if isinstance(executor, Executor):
+            return executor, False
+
+        if executor not in self.supported_concurrency_executors:
+            logger.warning(
+                f'{self.__class__.__name__} does not support the "{executor}" concurrency executor; '
+                f'using "thread" instead.'
+            )
+            executor = "thread"
+
+        max_workers = concurrency.get("max_workers")
+        if max_workers is not None:
+            max_workers = min(max_workers, num_tasks)
+        if executor == "process":
+            return ProcessPoolExecutor(max_workers=max_workers), True
+        return ThreadPoolExecutor(max_workers=max_workers), True
+
+    def _resolve_metrics_concurrently(
+        self,
+        executor: Executor,
+        metric_computations: List[Tuple[Tuple, Callable, dict]],
+        metric_fn_bundles: List[list],
+        shutdown: bool = True,
+    ) -> dict:
+        """Submit each metric computation (and each metric bundle, as one task) to the executor and gather the
+        results."""
+        resolved_metrics = dict()
+        try:
+            futures = [
+                (metric_id, executor.submit(metric_fn, **metric_provider_kwargs))
+                for metric_id, metric_fn, metric_provider_kwargs in metric_computations
+            ]
+            bundle_futures = [
+                executor.submit(self.resolve_metric_bundle, metric_fn_bundle)
+                for metric_fn_bundle in metric_fn_bundles
+            ]
+            for metric_id, future in futures:
+                resolved_metrics[metric_id] = future.result()
+            for bundle_future in bundle_futures:
+                resolved_metrics.update(bundle_future.result())
+        finally:
+            if shutdown:
+                executor.shutdown(wait=True)
+
+        return resolved_metrics
+
+    def prepare_batch_data_for_metrics(
+        self, metric_configurations: Iterable[MetricConfiguration]
+    ) -> None:
+        """Called by the Validator with the metrics of a validation graph before they are resolved, so that the engine
+        can load only the data they need (e.g. only the columns they use). Does nothing by default."""
+        pass
+
+    def release_batch_data(self, batch_id: str) -> None:
+        """Called once a batch is done being validated (at the end of Validator.validate), so that the engine can
+        release the resources it holds for the batch, such as persisted data. The batch stays loaded. Does nothing by
+        default."""
+        pass
+
+    def _split_metric_fn_bundle(self, metric_fn_bundle: list) -> List[list]:
+        """Split a metric bundle into bundles that can be resolved concurrently, one task each. The whole bundle is a
+        single task by default."""
+        return [metric_fn_bundle]
+
     def resolve_metric_bundle(self, metric_fn_bundle):
         """Resolve a bundle of metrics with the same compute domain as part of a single trip to the compute engine."""
         raise NotImplementedError
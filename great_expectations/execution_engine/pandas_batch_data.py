@@ -1,5 +1,9 @@
+import threading
+from typing import Callable, Iterable, Iterator, List, Optional
+
 import pandas as pd
 
+import great_expectations.exceptions as ge_exceptions
 from great_expectations.execution_engine.execution_engine import BatchData
 
 
@@ -11,3 +15,129 @@ class PandasBatchData(BatchData):
     @property
     def dataframe(self):
         return self._dataframe
+
+
+class ProjectedPandasBatchData(PandasBatchData):
+    """Batch data that is read from its source on first access, reading only the columns that are known to be needed.
+
+    The execution engine narrows the columns to read with project_columns before metrics are computed (see
+    PandasExecutionEngine.prepare_batch_data_for_metrics). Until a projection is set, or once a metric may need the
+    whole table, every column is read. Widening the projection of a batch that was already read drops its data, which
+    is read again on the next access.
+
+    Args:
+        execution_engine: the PandasExecutionEngine that loaded the batch
+        reader: a callable reading the batch from its source, given the columns to read (None for all of them)
+    """
+
+    def __init__(
+        self,
+        execution_engine,
+        reader: Callable[[Optional[List]], pd.DataFrame],
+    ):
+        super().__init__(execution_engine=execution_engine, dataframe=None)
+        self._reader = reader
+        # The columns to read; None for all of them
+        self._columns: Optional[frozenset] = None
+        self._is_projected = False
+        self._lock = threading.RLock()
+
+    @property
+    def projected_columns(self) -> Optional[List]:
+        """The columns that are read from the source, or None if all of them are."""
+        if self._columns is None:
+            return None
+        return sorted(self._columns, key=str)
+
+    @property
+    def dataframe(self):
+        with self._lock:
+            if self._dataframe is None:
+                self._dataframe = self._reader(self.projected_columns)
+            return self._dataframe
+
+    def project_columns(self, columns: Optional[Iterable]) -> bool:
+        """Make sure that the given columns (all of them, if columns is None) are read from the source.
+
+        The first projection set before the batch is read restricts the columns to read; later projections can only
+        widen it.
+
+        Returns:
+            True if data already read from the source was dropped, to be read again with the wider projection
+        """
+        with self._lock:
+            if columns is None:
+                new_columns = None
+            elif self._dataframe is None and not self._is_projected:
+                new_columns = frozenset(columns)
+            elif self._columns is None:
+                new_columns = None
+            else:
+                new_columns = self._columns | frozenset(columns)
+            self._is_projected = True
+            if new_columns == self._columns:
+                return False
+            self._columns = new_columns
+            if self._dataframe is None:
+                return False
+            self._dataframe = None
+            return True
+
+    def __getstate__(self):
+        # Locks cannot be pickled (e.g. when metrics are resolved on a process pool)
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+
+class ChunkedPandasBatchData(BatchData):
+    """Batch data that is read from its source one chunk at a time, so that batches larger than memory can be
+    validated. Only one chunk is held in memory at any time; every pass over the data reads the source again.
+
+    Args:
+        execution_engine: the PandasExecutionEngine that loaded the batch
+        chunk_reader: a callable returning a fresh iterable of DataFrame chunks each time it is called
+        chunk_size: the (maximum) number of rows in each chunk
+    """
+
+    def __init__(
+        self,
+        execution_engine,
+        chunk_reader: Callable[[], Iterable[pd.DataFrame]],
+        chunk_size: int,
+    ):
+        super().__init__(execution_engine=execution_engine)
+        self._chunk_reader = chunk_reader
+        self._chunk_size = chunk_size
+
+    @property
+    def chunk_size(self) -> int:
+        return self._chunk_size
+
+    @property
+    def dataframe(self):
+        raise ge_exceptions.ExecutionEngineError(
+            "ChunkedPandasBatchData is read in chunks and cannot be accessed as a single DataFrame."
+        )
+
+    def iter_chunks(self) -> Iterator[pd.DataFrame]:
+        """Read the batch from its source, yielding one DataFrame per chunk.
+
+        Chunks are indexed by row position in the whole batch, so that indices computed on a chunk identify the
+        same rows as they would on the full batch.
+        """
+        offset = 0
+        chunks = self._chunk_reader()
+        try:
+            for chunk in chunks:
+                chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+                offset += len(chunk)
+                yield chunk
+        finally:
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                close()
@@ -0,0 +1,430 @@
+"""Combine metrics computed on the chunks of a ChunkedPandasBatchData into metrics for the whole batch.
+
+A metric over chunked data is resolved in one of three ways:
+  - row-local partial metrics (map series and map conditions) are deferred: they are recomputed on every chunk
+    whenever a metric that depends on them is aggregated, and never held for the whole batch;
+  - aggregated metrics are computed on every chunk and combined by a ChunkedMetricAggregator;
+  - derived metrics are computed only from the values of their (already combined) dependencies.
+Any other metric cannot be computed over chunked data.
+"""
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+from great_expectations.expectations.registry import get_metric_provider
+from great_expectations.validator.validation_graph import MetricConfiguration
+
+# Metrics whose pandas implementation reads only the values of their metric dependencies
+DERIVED_METRIC_NAMES = {
+    "table.columns",
+    "table.column_count",
+    "column.unique_proportion",
+}
+
+# Conditions computed over the whole column (e.g. duplicates, ordering), which cannot be evaluated chunk by chunk
+WINDOW_CONDITION_METRIC_NAMES = {
+    "column_values.unique",
+    "column_values.increasing",
+    "column_values.decreasing",
+}
+
+# Number of values kept per column to approximate quantiles; quantiles are exact for columns with fewer values
+DEFAULT_QUANTILE_SAMPLE_SIZE = 1000000
+
+
+class DeferredChunkMetric:
+    """Placeholder for a row-local metric over chunked data, which is recomputed on each chunk when needed."""
+
+    def __init__(self, metric_configuration: MetricConfiguration):
+        self._metric_configuration = metric_configuration
+
+    @property
+    def metric_configuration(self) -> MetricConfiguration:
+        return self._metric_configuration
+
+    def __repr__(self):
+        return f"DeferredChunkMetric({self._metric_configuration.id})"
+
+
+class ChunkedMetricAggregator:
+    """Combines the values a metric takes on each chunk of a batch into its value for the whole batch.
+
+    Aggregators with requires_chunk_value set receive the value of the metric computed on each chunk; the others
+    compute what they need from the chunk themselves, using the execution engine the chunk is loaded in.
+    """
+
+    requires_chunk_value = True
+
+    def __init__(self, metric_configuration: MetricConfiguration):
+        self._metric_configuration = metric_configuration
+
+    def add_chunk(self, chunk_value: Any, chunk_engine) -> None:
+        raise NotImplementedError
+
+    def get_value(self) -> Any:
+        raise NotImplementedError
+
+    def _get_domain_column(self, chunk_engine) -> pd.Series:
+        df, _, accessor_domain_kwargs = chunk_engine.get_compute_domain(
+            self._metric_configuration.metric_domain_kwargs, domain_type="column"
+        )
+        return df[accessor_domain_kwargs["column"]]
+
+
+class SumAggregator(ChunkedMetricAggregator):
+    def __init__(self, metric_configuration: MetricConfiguration):
+        super().__init__(metric_configuration)
+        self._total = 0
+
+    def add_chunk(self, chunk_value: Any, chunk_engine) -> None:
+        if not pd.isnull(chunk_value):
+            self._total += chunk_value
+
+    def get_value(self) -> Any:
+        return self._total
+
+
+class MinAggregator(ChunkedMetricAggregator):
+    def __init__(self, metric_configuration: MetricConfiguration):
+        super().__init__(metric_configuration)
+        self._value = None
+
+    def _combine(self, value, chunk_value):
+        return min(value, chunk_value)
+
+    def add_chunk(self, chunk_value: Any, chunk_engine) -> None:
+        if pd.isnull(chunk_value):
+            return
+        if self._value is None:
+            self._value = chunk_value
+        else:
+            self._value = self._combine(self._value, chunk_value)
+
+    def get_value(self) -> Any:
+        return np.nan if self._value is None else self._value
+
+
+class MaxAggregator(MinAggregator):
+    def _combine(self, value, chunk_value):
+        return max(value, chunk_value)
+
+
+class FirstChunkAggregator(ChunkedMetricAggregator):
+    """Takes the value computed on the first chunk, for metrics describing the schema of the batch."""
+
+    def __init__(self, metric_configuration: MetricConfiguration):
+        super().__init__(metric_configuration)
+        self._value = None
+        self._has_value = False
+
+    def add_chunk(self, chunk_value: Any, chunk_engine) -> None:
+        if not self._has_value:
+            self._value = chunk_value
+            self._has_value = True
+
+    def get_value(self) -> Any:
+        return self._value
+
+
+class HeadAggregator(ChunkedMetricAggregator):
+    def __init__(self, metric_configuration: MetricConfiguration):
+        super().__init__(metric_configuration)
+        value_kwargs = metric_configuration.metric_value_kwargs
+        self._n_rows = value_kwargs.get("n_rows", 5)
+        self._fetch_all = value_kwargs.get("fetch_all", False)
+        self._heads = []
+        self._num_rows = 0
+
+    def add_chunk(self, chunk_value: Any, chunk_engine) -> None:
+        if self._fetch_all or self._num_rows < self._n_rows:
+            self._heads.append(chunk_value)
+            self._num_rows += len(chunk_value)
+
+    def get_value(self) -> Any:
+        if not self._heads:
+            return pd.DataFrame()
+        head = pd.concat(self._heads)
+        if self._fetch_all:
+            return head
+        return head.head(self._n_rows)
+
+
+class MeanAggregator(ChunkedMetricAggregator):
+    requires_chunk_value = False
+
+    def __init__(self, metric_configuration: MetricConfiguration):
+        super().__init__(metric_configuration)
+        self._total = 0
+        self._count = 0
+
+    def add_chunk(self, chunk_value: Any, chunk_engine) -> None:
+        column = self._get_domain_column(chunk_engine).dropna()
+        self._total += column.sum()
+        self._count += len(column)
+
+    def get_value(self) -> Any:
+        if self._count == 0:
+            return np.nan
+        return self._total / self._count
+
+
+class StandardDeviationAggregator(ChunkedMetricAggregator):
+    """Combines per-chunk counts, means and sums of squared deviations (Chan et al.) into the sample standard
+    deviation of the whole column."""
+
+    requires_chunk_value = False
+
+    def __init__(self, metric_configuration: MetricConfiguration):
+        super().__init__(metric_configuration)
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def add_chunk(self, chunk_value: Any, chunk_engine) -> None:
+        column = self._get_domain_column(chunk_engine).dropna()
+        chunk_count = len(column)
+        if chunk_count == 0:
+            return
+        chunk_mean = column.mean()
+        chunk_m2 = ((column - chunk_mean) ** 2).sum()
+        count = self._count + chunk_count
+        delta = chunk_mean - self._mean
+        self._mean += delta * chunk_count / count
+        self._m2 += chunk_m2 + delta ** 2 * self._count * chunk_count / count
+        self._count = count
+
+    def get_value(self) -> Any:
+        if self._count < 2:
+            return np.nan
+        return np.sqrt(self._m2 / (self._count - 1))
+
+
+class ColumnSampleAggregator(ChunkedMetricAggregator):
+    """Keeps a uniform random sample (reservoir) of the non-null values of the column, and computes the metric on
+    that sample with its own pandas implementation. The result is exact when the column has no more non-null values
+    than the sample size."""
+
+    requires_chunk_value = False
+
+    def __init__(
+        self,
+        metric_configuration: MetricConfiguration,
+        sample_size: int = DEFAULT_QUANTILE_SAMPLE_SIZE,
+    ):
+        super().__init__(metric_configuration)
+        self._sample_size = sample_size
+        self._sample = []
+        self._num_values = 0
+        self._random = np.random.default_rng(0)
+        self._metric_class = None
+        self._column_bundle_fn = None
+
+    def add_chunk(self, chunk_value: Any, chunk_engine) -> None:
+        if self._column_bundle_fn is None:
+            self._metric_class, metric_fn = get_metric_provider(
+                self._metric_configuration.metric_name, chunk_engine
+            )
+            self._column_bundle_fn = metric_fn.column_bundle_fn
+
+        values = self._get_domain_column(chunk_engine).dropna().tolist()
+        num_free = max(self._sample_size - len(self._sample), 0)
+        self._sample.extend(values[:num_free])
+        remaining_values = values[num_free:]
+        if remaining_values:
+            # Algorithm R: the i-th value seen replaces a random sample element with probability sample_size / i
+            num_seen = (
+                self._num_values + num_free + np.arange(1, len(remaining_values) + 1)
+            )
+            positions = self._random.integers(0, num_seen)
+            for i in np.flatnonzero(positions < self._sample_size):
+                self._sample[positions[i]] = remaining_values[i]
+        self._num_values += len(values)
+
+    def get_value(self) -> Any:
+        if self._column_bundle_fn is None:
+            return None
+        return self._column_bundle_fn(
+            self._metric_class,
+            column=pd.Series(self._sample),
+            metric_value_kwargs=self._metric_configuration.metric_value_kwargs,
+            metrics={},
+            compute_domain_kwargs={},
+            accessor_domain_kwargs={},
+        )
+
+
+class DistinctValuesAggregator(ChunkedMetricAggregator):
+    def __init__(self, metric_configuration: MetricConfiguration):
+        super().__init__(metric_configuration)
+        self._values = set()
+        self._null_value = None
+
+    def add_chunk(self, chunk_value: Any, chunk_engine) -> None:
+        for value in chunk_value:
+            if pd.isnull(value):
+                # keep a single null, as set(column.unique()) would on the whole column
+                if self._null_value is None:
+                    self._null_value = value
+            else:
+                self._values.add(value)
+
+    def get_value(self) -> Any:
+        if self._null_value is None:
+            return set(self._values)
+        return self._values | {self._null_value}
+
+
+class DistinctValuesCountAggregator(ChunkedMetricAggregator):
+    requires_chunk_value = False
+
+    def __init__(self, metric_configuration: MetricConfiguration):
+        super().__init__(metric_configuration)
+        self._values = set()
+
+    def add_chunk(self, chunk_value: Any, chunk_engine) -> None:
+        self._values.update(self._get_domain_column(chunk_engine).dropna().unique())
+
+    def get_value(self) -> Any:
+        return len(self._values)
+
+
+class ValueCountsAggregator(ChunkedMetricAggregator):
+    def __init__(self, metric_configuration: MetricConfiguration):
+        super().__init__(metric_configuration)
+        self._counts = None
+
+    def add_chunk(self, chunk_value: Any, chunk_engine) -> None:
+        if self._counts is None:
+            self._counts = chunk_value
+        else:
+            self._counts = self._counts.add(chunk_value, fill_value=0)
+
+    def get_value(self) -> Any:
+        if self._counts is None:
+            return None
+        counts = self._counts.astype("int64")
+        if self._metric_configuration.metric_value_kwargs.get("sort") == "value":
+            try:
+                counts = counts.sort_index()
+            except TypeError:
+                counts.index = counts.index.astype(str)
+                counts = counts.sort_index()
+        else:
+            counts = counts.sort_values(ascending=False, kind="mergesort")
+        counts.name = "count"
+        counts.index.name = "value"
+        return counts
+
+
+class UnexpectedListAggregator(ChunkedMetricAggregator):
+    """Concatenates the unexpected values (or index, or rows) found in each chunk, up to the number requested by the
+    result_format."""
+
+    def __init__(self, metric_configuration: MetricConfiguration):
+        super().__init__(metric_configuration)
+        result_format = metric_configuration.metric_value_kwargs["result_format"]
+        if result_format["result_format"] == "COMPLETE":
+            self._limit = None
+        else:
+            self._limit = result_format["partial_unexpected_count"]
+        self._values = []
+
+    @property
+    def _is_full(self) -> bool:
+        return self._limit is not None and len(self._values) >= self._limit
+
+    def add_chunk(self, chunk_value: Any, chunk_engine) -> None:
+        if not self._is_full:
+            self._values.extend(chunk_value)
+
+    def get_value(self) -> Any:
+        return self._values[: self._limit]
+
+
+class UnexpectedIndexListAggregator(UnexpectedListAggregator):
+    """Row conditions are applied to each chunk separately and re-index the filtered rows from zero, so indices found
+    in a chunk are shifted by the number of filtered rows in the preceding chunks."""
+
+    def __init__(self, metric_configuration: MetricConfiguration):
+        super().__init__(metric_configuration)
+        self._offset = 0
+
+    def _get_chunk_offset(self, chunk_engine) -> int:
+        offset = self._offset
+        if self._metric_configuration.metric_domain_kwargs.get("row_condition"):
+            df, _, _ = chunk_engine.get_compute_domain(
+                self._metric_configuration.metric_domain_kwargs,
+                domain_type="identity",
+            )
+            self._offset += len(df)
+            return offset
+        return 0
+
+    def add_chunk(self, chunk_value: Any, chunk_engine) -> None:
+        offset = self._get_chunk_offset(chunk_engine)
+        if not self._is_full:
+            self._values.extend(index + offset for index in chunk_value)
+
+
+class UnexpectedRowsAggregator(UnexpectedIndexListAggregator):
+    def add_chunk(self, chunk_value: Any, chunk_engine) -> None:
+        offset = self._get_chunk_offset(chunk_engine)
+        if not self._is_full:
+            rows = chunk_value.copy()
+            rows.index = rows.index + offset
+            self._values.append(rows)
+
+    @property
+    def _is_full(self) -> bool:
+        return self._limit is not None and sum(map(len, self._values)) >= self._limit
+
+    def get_value(self) -> Any:
+        if not self._values:
+            return pd.DataFrame()
+        rows = pd.concat(self._values)
+        if self._limit is None:
+            return rows
+        return rows.head(self._limit)
+
+
+METRIC_AGGREGATORS = {
+    "table.row_count": SumAggregator,
+    "table.column_types": FirstChunkAggregator,
+    "table.head": HeadAggregator,
+    "column.min": MinAggregator,
+    "column.max": MaxAggregator,
+    "column.sum": SumAggregator,
+    "column.mean": MeanAggregator,
+    "column.standard_deviation": StandardDeviationAggregator,
+    "column.median": ColumnSampleAggregator,
+    "column.quantile_values": ColumnSampleAggregator,
+    "column.value_counts": ValueCountsAggregator,
+    "column.distinct_values": DistinctValuesAggregator,
+    "column.distinct_values.count": DistinctValuesCountAggregator,
+}
+
+# Map metric values, keyed by the suffix appended to the name of their condition metric
+MAP_METRIC_AGGREGATORS = {
+    "unexpected_count": SumAggregator,
+    "unexpected_values": UnexpectedListAggregator,
+    "unexpected_index_list": UnexpectedIndexListAggregator,
+    "unexpected_rows": UnexpectedRowsAggregator,
+}
+
+
+def get_chunked_metric_aggregator(
+    metric_configuration: MetricConfiguration,
+) -> Optional[ChunkedMetricAggregator]:
+    """Return a new aggregator for the metric, or None if the metric cannot be aggregated over chunks."""
+    metric_name = metric_configuration.metric_name
+    if metric_name in METRIC_AGGREGATORS:
+        return METRIC_AGGREGATORS[metric_name](metric_configuration)
+
+    condition_metric_name, _, suffix = metric_name.rpartition(".")
+    if (
+        suffix in MAP_METRIC_AGGREGATORS
+        and condition_metric_name not in WINDOW_CONDITION_METRIC_NAMES
+    ):
+        return MAP_METRIC_AGGREGATORS[suffix](metric_configuration)
+    return None
@@ -4,10 +4,23 @@ import hashlib
 import logging
 import pickle
 import random
+import re
 from functools import partial
 from io import BytesIO
-from typing import Any, Callable, Iterable, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
+import numpy as np
 import pandas as pd
 
 import great_expectations.exceptions as ge_exceptions
@@ -18,20 +31,66 @@ from great_expectations.core.batch_spec import (
     RuntimeDataBatchSpec,
     S3BatchSpec,
 )
+from great_expectations.core.id_dict import IDDict
 from great_expectations.core.util import S3Url, sniff_s3_compression
-from great_expectations.execution_engine.pandas_batch_data import PandasBatchData
+from great_expectations.execution_engine.cache import SizeBoundedCache
+from great_expectations.execution_engine.pandas_batch_data import (
+    ChunkedPandasBatchData,
+    PandasBatchData,
+    ProjectedPandasBatchData,
+)
+from great_expectations.execution_engine.pandas_chunked_metrics import (
+    DERIVED_METRIC_NAMES,
+    WINDOW_CONDITION_METRIC_NAMES,
+    DeferredChunkMetric,
+    get_chunked_metric_aggregator,
+)
+from great_expectations.execution_engine.s3_object_file import (
+    DEFAULT_PARQUET_FOOTER_BYTES,
+    DEFAULT_S3_READ_AHEAD_BYTES,
+    open_s3_object,
+)
+from great_expectations.expectations.registry import get_metric_provider
+from great_expectations.validator.validation_graph import (
+    MetricConfiguration,
+    MetricEdge,
+    ValidationGraph,
+)
 
-from .execution_engine import ExecutionEngine, MetricDomainTypes
+from .execution_engine import (
+    ExecutionEngine,
+    MetricDomainTypes,
+    MetricPartialFunctionTypes,
+)
 
 try:
     import boto3
 except ImportError:
     boto3 = None
 
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
+
 
 logger = logging.getLogger(__name__)
 
 HASH_THRESHOLD = 1e9
+DEFAULT_COMPUTE_DOMAIN_CACHE_MAX_BYTES = 1e9
+# pandas reader methods that can return an iterator of DataFrames when given a chunksize
+CHUNKED_READER_METHODS = ("read_csv", "read_table", "read_fwf", "read_json")
+# The option of each pandas reader method that restricts the columns it reads
+COLUMN_PROJECTION_READER_OPTIONS = {
+    "read_csv": "usecols",
+    "read_table": "usecols",
+    "read_parquet": "columns",
+    "read_feather": "columns",
+}
+# strftime directives that only depend on the date (and the time zone), not on the time of day
+DATE_FORMAT_DIRECTIVES = "aAwdbBhmyYCgGjuUVWxDFezZ%"
+# Metrics on the table domain whose value does not depend on the columns of the table
+COLUMN_INDEPENDENT_TABLE_METRIC_NAMES = ("table.row_count",)
 
 
 class PandasExecutionEngine(ExecutionEngine):
@@ -72,6 +131,7 @@ Notes:
         "reader_method",
         "reader_options",
     }
+    supported_concurrency_executors = {"thread", "process"}
 
     def __init__(self, *args, **kwargs):
         self.discard_subset_failing_expectations = kwargs.get(
@@ -85,6 +145,35 @@ Notes:
         except (TypeError, AttributeError):
             self._s3 = None
 
+        # Filtered (row_condition) and projected compute domains are cached per batch, so that metrics sharing a
+        # domain do not re-query the DataFrame. A budget of 0 (or caching=False) disables the cache.
+        compute_domain_cache_max_bytes = kwargs.pop(
+            "compute_domain_cache_max_bytes", None
+        )
+        if compute_domain_cache_max_bytes is None:
+            compute_domain_cache_max_bytes_budget = (
+                DEFAULT_COMPUTE_DOMAIN_CACHE_MAX_BYTES
+            )
+        else:
+            compute_domain_cache_max_bytes_budget = compute_domain_cache_max_bytes
+        if compute_domain_cache_max_bytes_budget and kwargs.get("caching", True):
+            self._compute_domain_cache = SizeBoundedCache(
+                max_bytes=compute_domain_cache_max_bytes_budget
+            )
+        else:
+            self._compute_domain_cache = None
+
+        # When enabled, batches read from files are only read once the Validator has told the engine which columns
+        # its metrics need, and the reader is given that projection and the predicates of the splitter.
+        self._reader_pushdown = kwargs.pop("reader_pushdown", False)
+        # S3 objects are read with ranged GETs of at least this many bytes as they are parsed; 0 downloads each object
+        # into memory as a whole before parsing it
+        s3_read_ahead_bytes = kwargs.pop("s3_read_ahead_bytes", None)
+        if s3_read_ahead_bytes is None:
+            self._s3_read_ahead_bytes = DEFAULT_S3_READ_AHEAD_BYTES
+        else:
+            self._s3_read_ahead_bytes = s3_read_ahead_bytes
+
         super().__init__(*args, **kwargs)
 
         self._config.update(
@@ -93,22 +182,75 @@ Notes:
                 "boto3_options": boto3_options,
             }
         )
+        if compute_domain_cache_max_bytes is not None:
+            self._config[
+                "compute_domain_cache_max_bytes"
+            ] = compute_domain_cache_max_bytes
+        if self._reader_pushdown:
+            self._config["reader_pushdown"] = self._reader_pushdown
+        if s3_read_ahead_bytes is not None:
+            self._config["s3_read_ahead_bytes"] = s3_read_ahead_bytes
+
+    def __getstate__(self):
+        # The boto3 client cannot be pickled (e.g. when metrics are resolved on a process pool); it is only needed to
+        # load new batches, not to compute metrics on batches that are already loaded.
+        state = self.__dict__.copy()
+        state["_s3"] = None
+        return state
 
     def configure_validator(self, validator):
         super().configure_validator(validator)
         validator.expose_dataframe_methods = True
 
+    def __copy__(self):
+        execution_engine = super().__copy__()
+        if self._compute_domain_cache is not None:
+            execution_engine._compute_domain_cache = (
+                self._compute_domain_cache.empty_copy()
+            )
+        return execution_engine
+
     def load_batch_data(self, batch_id: str, batch_data: Any) -> None:
         if isinstance(batch_data, pd.DataFrame):
             batch_data = PandasBatchData(self, batch_data)
-        elif isinstance(batch_data, PandasBatchData):
+        elif isinstance(batch_data, (PandasBatchData, ChunkedPandasBatchData)):
             pass
         else:
             raise ge_exceptions.GreatExpectationsError(
-                "PandasExecutionEngine requires batch data that is either a DataFrame or a PandasBatchData object"
+                "PandasExecutionEngine requires batch data that is either a DataFrame, a PandasBatchData or a "
+                "ChunkedPandasBatchData object"
             )
+        if self._compute_domain_cache is not None:
+            # Domains computed from data previously loaded under this batch_id are no longer valid
+            self._compute_domain_cache.invalidate(lambda key: key[0] == batch_id)
         super().load_batch_data(batch_id=batch_id, batch_data=batch_data)
 
+    @property
+    def compute_domain_cache_statistics(self) -> Optional[dict]:
+        """Hit, miss and eviction counts and memory usage of the compute domain cache (None if it is disabled)."""
+        if self._compute_domain_cache is None:
+            return None
+        return self._compute_domain_cache.statistics
+
+    def _get_cached_compute_domain_data(
+        self, cache_key: tuple, compute_data_fn: Callable[[], pd.DataFrame]
+    ) -> pd.DataFrame:
+        """Return the domain DataFrame for cache_key, computing and caching it with compute_data_fn on a miss.
+
+        Cache keys have the form (batch_id, row_condition, condition_parser, projected_columns).
+
+        Each call returns a shallow copy of the cached DataFrame: adding, dropping or renaming its columns does not
+        affect the cached domain, but its values are shared with every other metric computed on the domain, so they
+        must not be modified in place (copy the DataFrame first).
+        """
+        if self._compute_domain_cache is None:
+            return compute_data_fn()
+        data = self._compute_domain_cache.get(cache_key)
+        if data is None:
+            data = compute_data_fn()
+            self._compute_domain_cache.put(cache_key, data)
+        return data.copy(deep=False)
+
     def get_batch_data_and_markers(
         self, batch_spec: BatchSpec
     ) -> Tuple[Any, BatchMarkers]:  # batch_data
@@ -121,6 +263,19 @@ Notes:
             }
         )
 
+        if batch_spec.get("chunk_size"):
+            return self._get_chunked_batch_data(batch_spec), batch_markers
+
+        if self._reader_pushdown and isinstance(batch_spec, PathBatchSpec):
+            # The batch is only read once the columns it needs are known, so it has no data fingerprint
+            return (
+                ProjectedPandasBatchData(
+                    execution_engine=self,
+                    reader=partial(self._read_projected_batch_data, batch_spec),
+                ),
+                batch_markers,
+            )
+
         batch_data: PandasBatchData
         if isinstance(batch_spec, RuntimeDataBatchSpec):
             # batch_data != None is already checked when RuntimeDataBatchSpec is instantiated
@@ -133,7 +288,26 @@ Notes:
                     "RuntimeDataBatchSpec must provide a Pandas DataFrame or PandasBatchData object."
                 )
             batch_spec.batch_data = "PandasDataFrame"
-        elif isinstance(batch_spec, S3BatchSpec):
+        elif isinstance(batch_spec, PathBatchSpec):
+            df = self._read_path(batch_spec, batch_spec.reader_options)
+        else:
+            raise ge_exceptions.BatchSpecError(
+                f"batch_spec must be of type RuntimeDataBatchSpec, PathBatchSpec, or S3BatchSpec, not {batch_spec.__class__.__name__}"
+            )
+
+        df = self._apply_splitting_and_sampling_methods(batch_spec, df)
+        if df.memory_usage().sum() < HASH_THRESHOLD:
+            batch_markers["pandas_data_fingerprint"] = hash_pandas_dataframe(df)
+
+        typed_batch_data = PandasBatchData(execution_engine=self, dataframe=df)
+
+        return typed_batch_data, batch_markers
+
+    def _read_path(
+        self, batch_spec: PathBatchSpec, reader_options: dict
+    ) -> pd.DataFrame:
+        """Read the file described by a PathBatchSpec (or S3BatchSpec) with the given reader_options."""
+        if isinstance(batch_spec, S3BatchSpec):
             if self._s3 is None:
                 raise ge_exceptions.ExecutionEngineError(
                     f"""PandasExecutionEngine has been passed a S3BatchSpec,
@@ -142,37 +316,282 @@ Notes:
             s3_engine = self._s3
             s3_url = S3Url(batch_spec.path)
             reader_method: str = batch_spec.reader_method
-            reader_options: dict = batch_spec.reader_options or {}
-            if "compression" not in reader_options.keys():
+            reader_fn = self._get_reader_fn(reader_method, s3_url.key)
+            if reader_method is None:
+                reader_method = self.guess_reader_method_from_path(s3_url.key)[
+                    "reader_method"
+                ]
+            reader_options = dict(reader_options)
+            # Parquet and Feather readers do not take a compression argument: their compression is part of the format
+            if "compression" not in reader_options.keys() and reader_method not in (
+                "read_parquet",
+                "read_feather",
+            ):
                 reader_options["compression"] = sniff_s3_compression(s3_url)
+            if self._s3_read_ahead_bytes:
+                with self._open_s3_object(
+                    s3_url=s3_url, random_access=reader_method == "read_parquet"
+                ) as s3_file:
+                    return reader_fn(s3_file, **reader_options)
+
             s3_object = s3_engine.get_object(Bucket=s3_url.bucket, Key=s3_url.key)
             logger.debug(
                 "Fetching s3 object. Bucket: {} Key: {}".format(
                     s3_url.bucket, s3_url.key
                 )
             )
-            reader_fn = self._get_reader_fn(reader_method, s3_url.key)
             buf = BytesIO(s3_object["Body"].read())
             buf.seek(0)
-            df = reader_fn(buf, **reader_options)
-        elif isinstance(batch_spec, PathBatchSpec):
-            reader_method: str = batch_spec.reader_method
-            reader_options: dict = batch_spec.reader_options
-            path: str = batch_spec.path
-            reader_fn: Callable = self._get_reader_fn(reader_method, path)
-            df = reader_fn(path, **reader_options)
+            return reader_fn(buf, **reader_options)
+
+        reader_method: str = batch_spec.reader_method
+        path: str = batch_spec.path
+        reader_fn: Callable = self._get_reader_fn(reader_method, path)
+        return reader_fn(path, **reader_options)
+
+    def _read_projected_batch_data(
+        self, batch_spec: PathBatchSpec, columns: Optional[List]
+    ) -> pd.DataFrame:
+        """Read the batch described by batch_spec, then split and sample it, pushing down to the reader:
+
+        - the projection on the given columns (and those the splitter and sampling methods use), as the "usecols" or
+          "columns" option of the reader (see COLUMN_PROJECTION_READER_OPTIONS);
+        - the predicates of the _split_on_column_value and _split_on_multi_column_values splitters, as the "filters"
+          option of read_parquet.
+
+        Options given in the reader_options of the batch_spec take precedence. The splitter is still applied to the
+        data that was read, so the batch holds the same rows as without pushdown; but when rows are filtered out by
+        the reader, the index of the batch numbers the rows that were read rather than all rows of the file. If the
+        reader does not accept the pushed down options, the file is read again without them.
+        """
+        reader_options: dict = batch_spec.reader_options
+        reader_method: Optional[str] = batch_spec.reader_method
+        if reader_method is None:
+            reader_method = self.guess_reader_method_from_path(batch_spec.path)[
+                "reader_method"
+            ]
+
+        pushdown_options = {}
+        projection_option = COLUMN_PROJECTION_READER_OPTIONS.get(reader_method)
+        if (
+            columns is not None
+            and projection_option is not None
+            and projection_option not in reader_options
+        ):
+            columns_to_read = list(columns)
+            for column in self._get_splitting_and_sampling_columns(batch_spec):
+                if column not in columns_to_read:
+                    columns_to_read.append(column)
+            pushdown_options[projection_option] = columns_to_read
+        if reader_method == "read_parquet" and "filters" not in reader_options:
+            filters = self._get_splitter_filters(batch_spec)
+            if filters:
+                pushdown_options["filters"] = filters
+
+        df = None
+        if pushdown_options:
+            try:
+                df = self._read_path(batch_spec, {**reader_options, **pushdown_options})
+            except Exception as e:
+                logger.debug(
+                    f"Unable to read {batch_spec.path} with the pushed down reader options {pushdown_options}; "
+                    f"reading it without them: {e}"
+                )
+        if df is None:
+            df = self._read_path(batch_spec, reader_options)
+        return self._apply_splitting_and_sampling_methods(batch_spec, df)
+
+    @staticmethod
+    def _get_splitting_and_sampling_columns(batch_spec: BatchSpec) -> List:
+        columns = []
+        for kwargs_key in ("splitter_kwargs", "sampling_kwargs"):
+            method_kwargs: dict = batch_spec.get(kwargs_key) or {}
+            if method_kwargs.get("column_name") is not None:
+                columns.append(method_kwargs["column_name"])
+            columns.extend(method_kwargs.get("column_names") or [])
+        return columns
+
+    @staticmethod
+    def _get_splitter_filters(batch_spec: BatchSpec) -> Optional[List[tuple]]:
+        """Return the read_parquet filters selecting the rows kept by the splitter of batch_spec, if it has any."""
+        splitter_method: Optional[str] = batch_spec.get("splitter_method")
+        splitter_kwargs: dict = batch_spec.get("splitter_kwargs") or {}
+        partition_definition: dict = splitter_kwargs.get("partition_definition") or {}
+        if splitter_method == "_split_on_column_value":
+            column_names = [splitter_kwargs.get("column_name")]
+        elif splitter_method == "_split_on_multi_column_values":
+            column_names = splitter_kwargs.get("column_names") or []
         else:
+            return None
+        if not column_names or not all(
+            column_name in partition_definition for column_name in column_names
+        ):
+            return None
+        return [
+            (column_name, "==", partition_definition[column_name])
+            for column_name in column_names
+        ]
+
+    def prepare_batch_data_for_metrics(
+        self, metric_configurations: Iterable[MetricConfiguration]
+    ) -> None:
+        """Project the batches that are read with reader pushdown on the columns the given metrics need.
+
+        A metric needs the columns named in its domain kwargs. Metrics with a row_condition, and metrics on the table
+        domain other than those in COLUMN_INDEPENDENT_TABLE_METRIC_NAMES, may need every column.
+        """
+        columns_by_batch_id: Dict[str, Optional[set]] = {}
+        for metric_configuration in metric_configurations:
+            batch_id = (
+                metric_configuration.metric_domain_kwargs.get("batch_id")
+                or self.active_batch_data_id
+            )
+            if (
+                batch_id in columns_by_batch_id
+                and columns_by_batch_id[batch_id] is None
+            ):
+                continue
+            columns = _get_metric_domain_columns(metric_configuration)
+            if columns is None:
+                columns_by_batch_id[batch_id] = None
+            else:
+                columns_by_batch_id.setdefault(batch_id, set()).update(columns)
+
+        for batch_id, columns in columns_by_batch_id.items():
+            batch_data = self.loaded_batch_data_dict.get(batch_id)
+            if not isinstance(batch_data, ProjectedPandasBatchData) or columns == set():
+                continue
+            if (
+                batch_data.project_columns(columns)
+                and self._compute_domain_cache is not None
+            ):
+                # Domains computed from the previous projection of the batch may lack the new columns
+                self._compute_domain_cache.invalidate(lambda key: key[0] == batch_id)
+
+    def _get_chunked_batch_data(self, batch_spec: BatchSpec) -> ChunkedPandasBatchData:
+        """Build batch data that reads the file described by batch_spec in chunks of batch_spec["chunk_size"] rows.
+
+        Delimited and line-delimited JSON files are read with the chunksize option of the pandas reader; parquet
+        files are read by row group batches with pyarrow. Splitting and sampling methods are applied to each chunk,
+        so only row-wise methods are supported.
+        """
+        chunk_size = batch_spec["chunk_size"]
+        if not isinstance(batch_spec, PathBatchSpec):
             raise ge_exceptions.BatchSpecError(
-                f"batch_spec must be of type RuntimeDataBatchSpec, PathBatchSpec, or S3BatchSpec, not {batch_spec.__class__.__name__}"
+                f"chunk_size is only supported for batches read from files, not {batch_spec.__class__.__name__}"
+            )
+        if batch_spec.get("sampling_method") == "_sample_using_limit":
+            raise ge_exceptions.BatchSpecError(
+                "The _sample_using_limit sampling method cannot be applied to a batch read in chunks."
             )
 
-        df = self._apply_splitting_and_sampling_methods(batch_spec, df)
-        if df.memory_usage().sum() < HASH_THRESHOLD:
-            batch_markers["pandas_data_fingerprint"] = hash_pandas_dataframe(df)
+        path: str = batch_spec.path
+        reader_method: str = batch_spec.reader_method
+        reader_options: dict = dict(batch_spec.reader_options)
+        if reader_method is None:
+            path_guess = self.guess_reader_method_from_path(path)
+            reader_method = path_guess["reader_method"]
+            reader_options = {**path_guess.get("reader_options", {}), **reader_options}
 
-        typed_batch_data = PandasBatchData(execution_engine=self, dataframe=df)
+        if reader_method == "read_parquet":
+            if pq is None:
+                raise ge_exceptions.BatchSpecError(
+                    "pyarrow is required to read parquet files in chunks."
+                )
+            if isinstance(batch_spec, S3BatchSpec):
+                if self._s3 is None:
+                    raise ge_exceptions.ExecutionEngineError(
+                        "PandasExecutionEngine has been passed a S3BatchSpec, but the ExecutionEngine does not have a "
+                        "boto3 client configured. Please check your config."
+                    )
+                read_chunks = partial(
+                    self._read_s3_parquet_chunks,
+                    s3_url=S3Url(path),
+                    chunk_size=chunk_size,
+                    columns=reader_options.get("columns"),
+                )
+            else:
+                read_chunks = partial(
+                    _read_parquet_chunks,
+                    path=path,
+                    chunk_size=chunk_size,
+                    columns=reader_options.get("columns"),
+                )
+        elif reader_method in CHUNKED_READER_METHODS:
+            reader_fn = getattr(pd, reader_method)
+            if isinstance(batch_spec, S3BatchSpec):
+                if self._s3 is None:
+                    raise ge_exceptions.ExecutionEngineError(
+                        "PandasExecutionEngine has been passed a S3BatchSpec, but the ExecutionEngine does not have a "
+                        "boto3 client configured. Please check your config."
+                    )
+                s3_url = S3Url(path)
+                if "compression" not in reader_options.keys():
+                    reader_options["compression"] = sniff_s3_compression(s3_url)
+                read_chunks = partial(
+                    self._read_s3_chunks,
+                    reader_fn=reader_fn,
+                    s3_url=s3_url,
+                    chunk_size=chunk_size,
+                    reader_options=reader_options,
+                )
+            else:
+                read_chunks = partial(
+                    reader_fn, path, chunksize=chunk_size, **reader_options
+                )
+        else:
+            raise ge_exceptions.BatchSpecError(
+                f'Reading in chunks is not supported for reader_method "{reader_method}"; use one of '
+                f"{', '.join((*CHUNKED_READER_METHODS, 'read_parquet'))}."
+            )
 
-        return typed_batch_data, batch_markers
+        if batch_spec.get("splitter_method") or batch_spec.get("sampling_method"):
+            read_chunks = partial(
+                self._split_and_sample_chunks,
+                batch_spec=batch_spec,
+                read_chunks=read_chunks,
+            )
+
+        return ChunkedPandasBatchData(
+            execution_engine=self, chunk_reader=read_chunks, chunk_size=chunk_size
+        )
+
+    def _read_s3_chunks(
+        self, reader_fn: Callable, s3_url: S3Url, chunk_size: int, reader_options: dict
+    ) -> Iterable[pd.DataFrame]:
+        s3_object = self._s3.get_object(Bucket=s3_url.bucket, Key=s3_url.key)
+        return reader_fn(s3_object["Body"], chunksize=chunk_size, **reader_options)
+
+    def _read_s3_parquet_chunks(
+        self, s3_url: S3Url, chunk_size: int, columns: Optional[List[str]] = None
+    ) -> Iterator[pd.DataFrame]:
+        with self._open_s3_object(s3_url=s3_url, random_access=True) as s3_file:
+            yield from _read_parquet_chunks(
+                path=s3_file, chunk_size=chunk_size, columns=columns
+            )
+
+    def _open_s3_object(self, s3_url: S3Url, random_access: bool = False):
+        if random_access:
+            # Parquet readers fetch the footer and then only the column chunks of the row groups they read
+            return open_s3_object(
+                s3=self._s3,
+                bucket=s3_url.bucket,
+                key=s3_url.key,
+                read_ahead_bytes=0,
+                footer_bytes=DEFAULT_PARQUET_FOOTER_BYTES,
+            )
+        return open_s3_object(
+            s3=self._s3,
+            bucket=s3_url.bucket,
+            key=s3_url.key,
+            read_ahead_bytes=self._s3_read_ahead_bytes or DEFAULT_S3_READ_AHEAD_BYTES,
+        )
+
+    def _split_and_sample_chunks(
+        self, batch_spec: BatchSpec, read_chunks: Callable[[], Iterable[pd.DataFrame]]
+    ) -> Iterable[pd.DataFrame]:
+        for chunk in read_chunks():
+            yield self._apply_splitting_and_sampling_methods(batch_spec, chunk)
 
     def _apply_splitting_and_sampling_methods(self, batch_spec, batch_data):
         if batch_spec.get("splitter_method"):
@@ -268,6 +687,305 @@ Notes:
             f'Unable to determine reader method from path: "{path}".'
         )
 
+    def _compute_metrics(
+        self,
+        metrics_to_resolve: Iterable[MetricConfiguration],
+        metrics: Dict[Tuple, Any] = None,
+        runtime_configuration: dict = None,
+    ) -> dict:
+        """Compute the provided metrics, bundling column metrics that share a compute domain.
+
+        Column metric providers declared with the pandas column decorators (column_aggregate_value,
+        column_function_partial and column_condition_partial) expose a ``column_bundle_fn`` that computes the metric
+        from a single column of the compute domain. Such metrics are grouped by compute domain and resolved by
+        resolve_metric_bundle, which materializes each domain only once; all other metrics are resolved by the
+        base ExecutionEngine.
+
+        Args:
+            metrics_to_resolve: the metrics to evaluate
+            metrics: already-computed metrics currently available to the engine
+            runtime_configuration: runtime configuration information
+
+        Returns:
+            resolved_metrics (Dict): a dictionary with the values for the metrics that have just been resolved.
+        """
+        if metrics is None:
+            metrics = dict()
+
+        resolved_metrics = dict()
+        metrics_to_resolve = list(metrics_to_resolve)
+        chunked_metrics = [
+            metric_to_resolve
+            for metric_to_resolve in metrics_to_resolve
+            if isinstance(
+                self._get_domain_batch_data(metric_to_resolve.metric_domain_kwargs),
+                ChunkedPandasBatchData,
+            )
+        ]
+        if len(chunked_metrics) > 0:
+            resolved_metrics.update(
+                self._compute_chunked_metrics(
+                    chunked_metrics, metrics, runtime_configuration
+                )
+            )
+            metrics_to_resolve = [
+                metric_to_resolve
+                for metric_to_resolve in metrics_to_resolve
+                if metric_to_resolve.id not in resolved_metrics
+            ]
+
+        metric_fn_bundle = []
+        unbundled_metrics = []
+        for metric_to_resolve in metrics_to_resolve:
+            metric_class, metric_fn = get_metric_provider(
+                metric_name=metric_to_resolve.metric_name, execution_engine=self
+            )
+            column_bundle_fn = getattr(metric_fn, "column_bundle_fn", None)
+            if (
+                column_bundle_fn is None
+                or "column" not in metric_to_resolve.metric_domain_kwargs
+            ):
+                unbundled_metrics.append(metric_to_resolve)
+                continue
+
+            try:
+                metric_dependencies = {
+                    k: metrics[v.id]
+                    for k, v in metric_to_resolve.metric_dependencies.items()
+                }
+            except KeyError as e:
+                raise ge_exceptions.GreatExpectationsError(
+                    f"Missing metric dependency: {str(e)}"
+                )
+
+            compute_domain_kwargs = copy.deepcopy(
+                metric_to_resolve.metric_domain_kwargs
+            )
+            accessor_domain_kwargs = {"column": compute_domain_kwargs.pop("column")}
+            metric_provider_kwargs = {
+                "cls": metric_class,
+                "metric_value_kwargs": metric_to_resolve.metric_value_kwargs,
+                "metrics": metric_dependencies,
+            }
+            metric_fn_bundle.append(
+                (
+                    metric_to_resolve,
+                    # column_bundle_fn is a closure, which cannot be pickled to be resolved on a process pool; the
+                    # metric function can, and column_bundle_fn is looked up from it again when it is called
+                    partial(_call_column_bundle_fn, metric_fn),
+                    compute_domain_kwargs,
+                    accessor_domain_kwargs,
+                    metric_provider_kwargs,
+                )
+            )
+
+        resolved_metrics.update(
+            super()._compute_metrics(
+                metrics_to_resolve=unbundled_metrics,
+                metrics=metrics,
+                runtime_configuration=runtime_configuration,
+                metric_fn_bundle=metric_fn_bundle,
+            )
+        )
+
+        return resolved_metrics
+
+    def _split_metric_fn_bundle(self, metric_fn_bundle: list) -> List[list]:
+        # Metrics of different columns are resolved concurrently; their shared compute domain is materialized once
+        # and taken from the compute domain cache by the other tasks
+        bundles: Dict[Tuple[str, str], list] = dict()
+        for bundled_metric in metric_fn_bundle:
+            compute_domain_kwargs = bundled_metric[2]
+            if not isinstance(compute_domain_kwargs, IDDict):
+                compute_domain_kwargs = IDDict(compute_domain_kwargs)
+            key = (compute_domain_kwargs.to_id(), bundled_metric[3]["column"])
+            bundles.setdefault(key, []).append(bundled_metric)
+        return list(bundles.values())
+
+    def _get_domain_batch_data(self, domain_kwargs: dict) -> Optional[Any]:
+        batch_id = domain_kwargs.get("batch_id") or self.active_batch_data_id
+        return self.loaded_batch_data_dict.get(batch_id)
+
+    def _compute_chunked_metrics(
+        self,
+        metrics_to_resolve: List[MetricConfiguration],
+        metrics: Dict[Tuple, Any],
+        runtime_configuration: dict = None,
+    ) -> dict:
+        """Compute metrics on batches that are read in chunks (see pandas_chunked_metrics).
+
+        Row-local partial metrics are resolved to DeferredChunkMetric placeholders. Aggregated metrics are computed
+        on each chunk, together with the deferred metrics they depend on, in a single pass over each batch. Derived
+        metrics are then computed from their dependencies. Other metrics raise an ExecutionEngineError.
+        """
+        resolved_metrics = dict()
+        derived_metrics = []
+        aggregators_by_batch_id = dict()
+        for metric_to_resolve in metrics_to_resolve:
+            metric_name = metric_to_resolve.metric_name
+            _, metric_fn = get_metric_provider(
+                metric_name=metric_name, execution_engine=self
+            )
+            metric_fn_type = getattr(metric_fn, "metric_fn_type", None)
+            if (
+                metric_fn_type
+                in (
+                    MetricPartialFunctionTypes.MAP_SERIES,
+                    MetricPartialFunctionTypes.MAP_CONDITION_SERIES,
+                )
+                and not metric_name.startswith(tuple(WINDOW_CONDITION_METRIC_NAMES))
+            ):
+                resolved_metrics[metric_to_resolve.id] = DeferredChunkMetric(
+                    metric_to_resolve
+                )
+                continue
+            if metric_name in DERIVED_METRIC_NAMES:
+                derived_metrics.append(metric_to_resolve)
+                continue
+            aggregator = get_chunked_metric_aggregator(metric_to_resolve)
+            if aggregator is None:
+                raise ge_exceptions.ExecutionEngineError(
+                    message=f'The metric "{metric_name}" cannot be computed on a batch that is read in chunks.'
+                )
+            batch_id = (
+                metric_to_resolve.metric_domain_kwargs.get("batch_id")
+                or self.active_batch_data_id
+            )
+            aggregators_by_batch_id.setdefault(batch_id, []).append(
+                (metric_to_resolve, aggregator)
+            )
+
+        for batch_id, aggregators in aggregators_by_batch_id.items():
+            self._aggregate_chunked_metrics(
+                batch_id, aggregators, metrics, runtime_configuration
+            )
+            for metric_to_resolve, aggregator in aggregators:
+                resolved_metrics[metric_to_resolve.id] = aggregator.get_value()
+
+        if len(derived_metrics) > 0:
+            resolved_metrics.update(
+                super()._compute_metrics(
+                    metrics_to_resolve=derived_metrics,
+                    metrics=metrics,
+                    runtime_configuration=runtime_configuration,
+                )
+            )
+        return resolved_metrics
+
+    def _aggregate_chunked_metrics(
+        self,
+        batch_id: str,
+        aggregators: List[Tuple[MetricConfiguration, Any]],
+        metrics: Dict[Tuple, Any],
+        runtime_configuration: dict = None,
+    ) -> None:
+        """Read the batch once, loading each chunk in a separate engine to compute the deferred dependencies and the
+        values of the aggregated metrics on it, and add them to the aggregators."""
+        deferred_graph = ValidationGraph()
+        for metric_to_resolve, _ in aggregators:
+            _add_deferred_dependencies(deferred_graph, metric_to_resolve, metrics)
+        value_metrics = [
+            metric_to_resolve
+            for metric_to_resolve, aggregator in aggregators
+            if aggregator.requires_chunk_value
+        ]
+        resolved_metrics = {
+            metric_id: value
+            for metric_id, value in metrics.items()
+            if not isinstance(value, DeferredChunkMetric)
+        }
+
+        # Chunks are independent, so neither metric values nor compute domains are cached across them
+        chunk_engine = PandasExecutionEngine(caching=False)
+        for chunk in self.loaded_batch_data_dict[batch_id].iter_chunks():
+            chunk_engine.load_batch_data(batch_id, chunk)
+            chunk_metrics = dict(resolved_metrics)
+            for ready_metrics in deferred_graph.resolution_levels(chunk_metrics):
+                chunk_metrics.update(
+                    chunk_engine.resolve_metrics(
+                        ready_metrics, chunk_metrics, runtime_configuration
+                    )
+                )
+            chunk_values = chunk_engine.resolve_metrics(
+                value_metrics, chunk_metrics, runtime_configuration
+            )
+            for metric_to_resolve, aggregator in aggregators:
+                aggregator.add_chunk(
+                    chunk_values.get(metric_to_resolve.id), chunk_engine
+                )
+
+    def resolve_metric_bundle(
+        self,
+        metric_fn_bundle: Iterable[
+            Tuple[MetricConfiguration, Callable, dict, dict, dict]
+        ],
+    ) -> dict:
+        """Resolve a bundle of column metrics, materializing each distinct compute domain (e.g. a row_condition
+        filter) only once and computing every metric on that domain from the requested column.
+
+            Args:
+                metric_fn_bundle (Iterable[Tuple[MetricConfiguration, Callable, dict, dict, dict]]): \
+                    The MetricConfiguration of each metric to resolve, its column_bundle_fn, its compute and accessor
+                    domain kwargs, and the keyword arguments to pass to the column_bundle_fn.
+
+            Returns:
+                A dictionary of metric ids and their corresponding values.
+        """
+        resolved_metrics = dict()
+
+        domains: Dict[str, dict] = dict()
+        for (
+            metric_to_resolve,
+            column_bundle_fn,
+            compute_domain_kwargs,
+            accessor_domain_kwargs,
+            metric_provider_kwargs,
+        ) in metric_fn_bundle:
+            if not isinstance(compute_domain_kwargs, IDDict):
+                compute_domain_kwargs = IDDict(compute_domain_kwargs)
+            domain_id = compute_domain_kwargs.to_id()
+            if domain_id not in domains:
+                domains[domain_id] = {
+                    "domain_kwargs": compute_domain_kwargs,
+                    "metrics": [],
+                }
+            domains[domain_id]["metrics"].append(
+                (
+                    metric_to_resolve,
+                    column_bundle_fn,
+                    accessor_domain_kwargs,
+                    metric_provider_kwargs,
+                )
+            )
+
+        for domain in domains.values():
+            df, compute_domain_kwargs, _ = self.get_compute_domain(
+                domain["domain_kwargs"], domain_type="identity"
+            )
+            for (
+                metric_to_resolve,
+                column_bundle_fn,
+                accessor_domain_kwargs,
+                metric_provider_kwargs,
+            ) in domain["metrics"]:
+                column_name = accessor_domain_kwargs["column"]
+                if column_name not in df.columns:
+                    raise ge_exceptions.ExecutionEngineError(
+                        message=f'Error: The column "{column_name}" in BatchData does not exist.'
+                    )
+                resolved_metrics[metric_to_resolve.id] = column_bundle_fn(
+                    column=df[column_name],
+                    compute_domain_kwargs=copy.deepcopy(domain["domain_kwargs"]),
+                    accessor_domain_kwargs=accessor_domain_kwargs,
+                    **metric_provider_kwargs,
+                )
+            logger.debug(
+                f"PandasExecutionEngine computed {len(domain['metrics'])} metrics on domain_id "
+                f"{IDDict(compute_domain_kwargs).to_id()}"
+            )
+
+        return resolved_metrics
+
     def get_compute_domain(
         self,
         domain_kwargs: dict,
@@ -287,6 +1005,9 @@ Notes:
             accessor_keys (str iterable) - keys that are part of the compute domain but should be ignored when describing
              the domain and simply transferred with their associated values into accessor_domain_kwargs.
 
+        The returned DataFrame may share its values with the batch and with cached domains (see
+        _get_cached_compute_domain_data): metric functions must not modify its values in place.
+
         Returns:
             A tuple including:
               - a DataFrame (the data on which to compute)
@@ -301,6 +1022,7 @@ Notes:
         if batch_id is None:
             # We allow no batch id specified if there is only one batch
             if self.active_batch_data_id is not None:
+                batch_id = self.active_batch_data_id
                 data = self.active_batch_data.dataframe
             else:
                 raise ge_exceptions.ValidationError(
@@ -335,9 +1057,15 @@ Notes:
                 )
             else:
                 # Querying row condition
-                data = data.query(row_condition, parser=condition_parser).reset_index(
-                    drop=True
+                unfiltered_data = data
+                data = self._get_cached_compute_domain_data(
+                    cache_key=(batch_id, row_condition, condition_parser, None),
+                    compute_data_fn=lambda: unfiltered_data.query(
+                        row_condition, parser=condition_parser
+                    ).reset_index(drop=True),
                 )
+        else:
+            condition_parser = None
 
         # Warning user if accessor keys are in any domain that is not of type table, will be ignored
         if (
@@ -405,9 +1133,15 @@ Notes:
         # Filtering if identity
         elif domain_type == MetricDomainTypes.IDENTITY:
 
+            domain_data = data
+
             # If we would like our data to become a single column
             if "column" in compute_domain_kwargs:
-                data = pd.DataFrame(data[compute_domain_kwargs["column"]])
+                column = compute_domain_kwargs["column"]
+                data = self._get_cached_compute_domain_data(
+                    cache_key=(batch_id, row_condition, condition_parser, (column,)),
+                    compute_data_fn=lambda: pd.DataFrame(domain_data[column]),
+                )
 
             # If we would like our data to now become a column pair
             elif ("column_A" in compute_domain_kwargs) and (
@@ -419,14 +1153,34 @@ Notes:
                     compute_domain_kwargs["column_A"],
                     compute_domain_kwargs["column_B"],
                 )
-                data = pd.DataFrame(
-                    {column_a: data[column_a], column_b: data[column_b]}
+                data = self._get_cached_compute_domain_data(
+                    cache_key=(
+                        batch_id,
+                        row_condition,
+                        condition_parser,
+                        (column_a, column_b),
+                    ),
+                    compute_data_fn=lambda: pd.DataFrame(
+                        {
+                            column_a: domain_data[column_a],
+                            column_b: domain_data[column_b],
+                        }
+                    ),
                 )
 
             else:
                 # If we would like our data to become a multicolumn
                 if "columns" in compute_domain_kwargs:
-                    data = data[compute_domain_kwargs["columns"]]
+                    columns = compute_domain_kwargs["columns"]
+                    data = self._get_cached_compute_domain_data(
+                        cache_key=(
+                            batch_id,
+                            row_condition,
+                            condition_parser,
+                            tuple(columns),
+                        ),
+                        compute_data_fn=lambda: domain_data[columns],
+                    )
 
         return data, compute_domain_kwargs, accessor_domain_kwargs
 
@@ -454,11 +1208,26 @@ Notes:
         date_format_string: str = "%Y-%m-%d",
     ):
         """Convert the values in the named column to the given date_format, and split on that"""
-        stringified_datetime_series = df[column_name].map(
-            lambda x: x.strftime(date_format_string)
-        )
         matching_string = partition_definition[column_name]
-        return df[stringified_datetime_series == matching_string]
+        series: pd.Series = df[column_name]
+        if pd.api.types.is_datetime64_any_dtype(series.dtype):
+            if set(re.findall(r"%[-#]?(.)", date_format_string)) <= set(
+                DATE_FORMAT_DIRECTIVES
+            ):
+                # The format only depends on the date, so there are at most as many distinct values as days
+                series = series.dt.normalize()
+            matching_rows = _get_distinct_value_mask(
+                series,
+                lambda values: values.strftime(date_format_string) == matching_string,
+                lambda x: x.strftime(date_format_string) == matching_string,
+            )
+        else:
+            matching_rows = _get_distinct_value_mask(
+                series,
+                None,
+                lambda x: x.strftime(date_format_string) == matching_string,
+            )
+        return df[matching_rows]
 
     @staticmethod
     def _split_on_divided_integer(
@@ -470,9 +1239,11 @@ Notes:
         """Divide the values in the named column by `divisor`, and split on that"""
 
         matching_divisor = partition_definition[column_name]
-        matching_rows = df[column_name].map(
-            lambda x: int(x / divisor) == matching_divisor
-        )
+        # Truncated, like int(), rather than floored, so that negative values are divided as before
+        quotients: pd.Series = df[column_name] / divisor
+        if quotients.dtype == object:
+            quotients = quotients.astype(float)
+        matching_rows = np.trunc(quotients) == matching_divisor
 
         return df[matching_rows]
 
@@ -486,7 +1257,7 @@ Notes:
         """Divide the values in the named column by `divisor`, and split on that"""
 
         matching_mod_value = partition_definition[column_name]
-        matching_rows = df[column_name].map(lambda x: x % mod == matching_mod_value)
+        matching_rows = df[column_name] % mod == matching_mod_value
 
         return df[matching_rows]
 
@@ -498,7 +1269,7 @@ Notes:
     ):
         """Split on the joint values in the named columns"""
 
-        subset_df = df.copy()
+        matching_rows = np.ones(len(df), dtype=bool)
         for column_name in column_names:
             value = partition_definition.get(column_name)
             if not value:
@@ -507,8 +1278,11 @@ Notes:
                     f"all values in column_names must also exist in partition_definition. "
                     f"{column_name} was not found in partition_definition."
                 )
-            subset_df = subset_df[subset_df[column_name] == value]
-        return subset_df
+            # Comparisons on nullable dtypes (e.g. Int64, string) are NA where the value is missing
+            matching_rows &= (
+                (df[column_name] == value).fillna(False).to_numpy(dtype=bool)
+            )
+        return df[matching_rows]
 
     @staticmethod
     def _split_on_hashed_column(
@@ -528,9 +1302,11 @@ Notes:
                     Reference to {hash_function_name} cannot be found."""
                 )
             )
-        matching_rows = df[column_name].map(
+        matching_rows = _get_distinct_value_mask(
+            df[column_name],
+            None,
             lambda x: hash_method(str(x).encode()).hexdigest()[-1 * hash_digits :]
-            == partition_definition["hash_value"]
+            == partition_definition["hash_value"],
         )
         return df[matching_rows]
 
@@ -545,7 +1321,11 @@ Notes:
 
         Note: the Random function behaves differently on different dialects of SQL
         """
-        return df[df.index.map(lambda x: random.random() < p)]
+        # Drawn with the random module, one number per row in order, so that seeding it still selects the same rows
+        random_values = np.fromiter(
+            (random.random() for _ in range(len(df))), dtype=float, count=len(df)
+        )
+        return df[random_values < p]
 
     @staticmethod
     def _sample_using_mod(
@@ -555,7 +1335,7 @@ Notes:
         value: int,
     ):
         """Take the mod of named column, and only keep rows that match the given value"""
-        return df[df[column_name].map(lambda x: x % mod == value)]
+        return df[df[column_name] % mod == value]
 
     @staticmethod
     def _sample_using_a_list(
@@ -585,13 +1365,111 @@ Notes:
                 )
             )
 
-        matches = df[column_name].map(
+        matches = _get_distinct_value_mask(
+            df[column_name],
+            None,
             lambda x: hash_func(str(x).encode()).hexdigest()[-1 * hash_digits :]
-            == hash_value
+            == hash_value,
         )
         return df[matches]
 
 
+def _get_distinct_value_mask(
+    series: pd.Series,
+    distinct_values_predicate: Optional[Callable[[pd.Index], Any]],
+    value_predicate: Callable[[Any], bool],
+) -> np.ndarray:
+    """Evaluate a predicate once per distinct value of series, rather than once per row, and return the boolean mask
+    of the rows whose value satisfies it.
+
+    Args:
+        series: the values to test
+        distinct_values_predicate: a vectorized predicate, evaluated on an Index of the distinct values at once; if
+            None, value_predicate is evaluated on each distinct value
+        value_predicate: the predicate for a single value; missing values are always tested one row at a time, as
+            their distinct representations (None, NaN, NaT) are not kept apart
+    """
+    codes, distinct_values = series.factorize()
+    if distinct_values_predicate is not None:
+        distinct_value_matches = np.asarray(
+            distinct_values_predicate(distinct_values), dtype=bool
+        )
+    else:
+        distinct_value_matches = np.fromiter(
+            (value_predicate(value) for value in distinct_values),
+            dtype=bool,
+            count=len(distinct_values),
+        )
+    mask = np.zeros(len(series), dtype=bool)
+    is_present = codes != -1
+    mask[is_present] = distinct_value_matches[codes[is_present]]
+    if not is_present.all():
+        mask[~is_present] = (
+            series[~is_present].map(value_predicate).to_numpy(dtype=bool)
+        )
+    return mask
+
+
+def _add_deferred_dependencies(
+    graph: ValidationGraph, metric_configuration: MetricConfiguration, metrics: dict
+) -> None:
+    """Add the deferred (chunk-local) metrics that metric_configuration depends on, directly or through other
+    deferred metrics, to the graph."""
+    for dependency in metric_configuration.metric_dependencies.values():
+        if dependency.id in graph.metric_configurations or not isinstance(
+            metrics.get(dependency.id), DeferredChunkMetric
+        ):
+            continue
+        deferred_dependencies = [
+            deferred_dependency
+            for deferred_dependency in dependency.metric_dependencies.values()
+            if isinstance(metrics.get(deferred_dependency.id), DeferredChunkMetric)
+        ]
+        if len(deferred_dependencies) == 0:
+            graph.add(MetricEdge(dependency, None))
+        for deferred_dependency in deferred_dependencies:
+            graph.add(MetricEdge(dependency, deferred_dependency))
+        _add_deferred_dependencies(graph, dependency, metrics)
+
+
+def _get_metric_domain_columns(
+    metric_configuration: MetricConfiguration,
+) -> Optional[List]:
+    """Return the columns a metric needs, or None if it may need every column of the table."""
+    domain_kwargs: dict = metric_configuration.metric_domain_kwargs
+    if domain_kwargs.get("row_condition"):
+        return None
+    columns = []
+    for key, value in domain_kwargs.items():
+        if key in ("column", "column_A", "column_B"):
+            columns.append(value)
+        elif key == "column_list":
+            columns.extend(value)
+        elif key not in ("batch_id", "table", "condition_parser") and value is not None:
+            return None
+    if (
+        len(columns) == 0
+        and metric_configuration.metric_name
+        not in COLUMN_INDEPENDENT_TABLE_METRIC_NAMES
+    ):
+        return None
+    return columns
+
+
+def _call_column_bundle_fn(metric_fn: Callable, **kwargs):
+    return metric_fn.column_bundle_fn(**kwargs)
+
+
+def _read_parquet_chunks(
+    path: Union[str, BinaryIO], chunk_size: int, columns: Optional[List[str]] = None
+) -> Iterator[pd.DataFrame]:
+    parquet_file = pq.ParquetFile(path)
+    for record_batch in parquet_file.iter_batches(
+        batch_size=chunk_size, columns=columns
+    ):
+        yield record_batch.to_pandas()
+
+
 def hash_pandas_dataframe(df):
     try:
         obj = pd.util.hash_pandas_object(df, index=True).values
@@ -0,0 +1,132 @@
+import io
+import logging
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# The number of bytes fetched ahead of each read that is smaller than it, for formats read sequentially
+DEFAULT_S3_READ_AHEAD_BYTES = 8 * 1024 * 1024
+# The number of bytes at the end of Parquet files fetched on first access, which usually holds their whole footer
+DEFAULT_PARQUET_FOOTER_BYTES = 64 * 1024
+
+
+class S3ObjectRawFile(io.RawIOBase):
+    """A seekable, read-only raw file over an S3 object, reading each requested byte range with a ranged GET.
+
+    Reads are not buffered: use open_s3_object to get a buffered file that reads ahead. If footer_bytes is given, the
+    last footer_bytes bytes of the object are fetched on the first read that falls within them, and reads within them
+    are served from memory from then on (file formats such as Parquet read their footer first, in several small reads).
+
+    Args:
+        s3: a boto3 S3 client
+        bucket: the bucket of the object
+        key: the key of the object
+        footer_bytes: the number of bytes at the end of the object to keep in memory
+    """
+
+    def __init__(self, s3, bucket: str, key: str, footer_bytes: int = 0):
+        super().__init__()
+        self._s3 = s3
+        self._bucket = bucket
+        self._key = key
+        # Fetching the size first also raises for missing objects right away, as get_object did
+        self._size: int = s3.head_object(Bucket=bucket, Key=key)["ContentLength"]
+        self._position = 0
+        self._footer_start = max(self._size - footer_bytes, 0) if footer_bytes else None
+        self._footer: Optional[bytes] = None
+        self._num_requests = 0
+        self._num_bytes_fetched = 0
+
+    @property
+    def name(self) -> str:
+        return f"s3://{self._bucket}/{self._key}"
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def num_requests(self) -> int:
+        """The number of GET requests made to read the object so far."""
+        return self._num_requests
+
+    @property
+    def num_bytes_fetched(self) -> int:
+        """The number of bytes fetched from the object so far."""
+        return self._num_bytes_fetched
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self._size + offset
+        else:
+            raise ValueError(f"Invalid whence ({whence})")
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}")
+        self._position = position
+        return position
+
+    def readinto(self, buffer) -> int:
+        end = min(self._position + len(buffer), self._size)
+        if end <= self._position:
+            return 0
+        data = self._read_range(self._position, end)
+        buffer[: len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+    def readall(self) -> bytes:
+        if self._position >= self._size:
+            return b""
+        data = self._read_range(self._position, self._size)
+        self._position += len(data)
+        return data
+
+    def _read_range(self, start: int, end: int) -> bytes:
+        if self._footer_start is not None and start >= self._footer_start:
+            if self._footer is None:
+                self._footer = self._get_range(self._footer_start, self._size)
+            return self._footer[start - self._footer_start : end - self._footer_start]
+        return self._get_range(start, end)
+
+    def _get_range(self, start: int, end: int) -> bytes:
+        logger.debug(f"Fetching bytes {start}-{end - 1} of {self.name}")
+        self._num_requests += 1
+        response = self._s3.get_object(
+            Bucket=self._bucket, Key=self._key, Range=f"bytes={start}-{end - 1}"
+        )
+        data = response["Body"].read()
+        self._num_bytes_fetched += len(data)
+        return data
+
+
+def open_s3_object(
+    s3,
+    bucket: str,
+    key: str,
+    read_ahead_bytes: int = DEFAULT_S3_READ_AHEAD_BYTES,
+    footer_bytes: int = 0,
+) -> io.IOBase:
+    """Open an S3 object as a seekable binary file, which pandas readers can read from directly.
+
+    The object is fetched with ranged GETs as it is read, at least read_ahead_bytes at a time, so that it is never
+    held in memory as a whole; seeking within the bytes already fetched does not fetch them again. If read_ahead_bytes
+    is 0 the file is not buffered, which suits readers of random-access formats such as Parquet: they request exactly
+    the byte ranges they need (the footer and the chunks of the columns read), so only those ranges are fetched.
+    """
+    raw_file = S3ObjectRawFile(s3=s3, bucket=bucket, key=key, footer_bytes=footer_bytes)
+    if not read_ahead_bytes:
+        return raw_file
+    return io.BufferedReader(raw_file, buffer_size=read_ahead_bytes)
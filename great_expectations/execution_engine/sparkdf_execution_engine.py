@@ -2,7 +2,9 @@ import copy
 import datetime
 import hashlib
 import logging
+import threading
 import uuid
+from collections import OrderedDict
 from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
 
 from great_expectations.core.batch import BatchMarkers
@@ -29,9 +31,15 @@ from .sparkdf_batch_data import SparkDFBatchData
 
 logger = logging.getLogger(__name__)
 
+# The number of batches a SparkDFExecutionEngine keeps persisted at the same time, unless configured otherwise
+DEFAULT_MAX_PERSISTED_BATCHES = 4
+# The number of row_condition-filtered domains a SparkDFExecutionEngine keeps for reuse
+MAX_FILTERED_DOMAINS = 32
+
 try:
     import pyspark
     import pyspark.sql.functions as F
+    from pyspark import StorageLevel
     from pyspark.sql import DataFrame, SparkSession
     from pyspark.sql.types import (
         BooleanType,
@@ -46,6 +54,7 @@ try:
 
 except ImportError:
     pyspark = None
+    StorageLevel = None
     SparkSession = None
     DataFrame = None
     F = None
@@ -142,7 +151,28 @@ class SparkDFExecutionEngine(ExecutionEngine):
         "reader_options",
     }
 
-    def __init__(self, *args, persist=True, spark_config=None, **kwargs):
+    def __init__(
+        self,
+        *args,
+        persist=True,
+        spark_config=None,
+        persist_storage_level: Optional[str] = None,
+        max_persisted_batches: Optional[int] = None,
+        persist_filtered_domains_after: Optional[int] = None,
+        **kwargs,
+    ):
+        """
+        Args:
+            persist: whether to persist the DataFrames of loaded batches, so that metrics computed in separate Spark
+                jobs do not read the source of the batch again
+            spark_config: the configuration of the Spark session
+            persist_storage_level: the name of the pyspark StorageLevel that batches are persisted at (by default,
+                MEMORY_AND_DISK)
+            max_persisted_batches: the maximum number of batches persisted at the same time; the least recently used
+                batch is unpersisted to make room for another (by default, DEFAULT_MAX_PERSISTED_BATCHES)
+            persist_filtered_domains_after: if given, the DataFrame of a row_condition-filtered domain is persisted too,
+                once it has been requested this many times
+        """
         # Creation of the Spark DataFrame is done outside this class
         self._persist = persist
 
@@ -153,6 +183,32 @@ class SparkDFExecutionEngine(ExecutionEngine):
         self.spark = spark
         self._spark_config = spark_config
 
+        if persist_storage_level is None:
+            self._storage_level = StorageLevel.MEMORY_AND_DISK
+        else:
+            self._storage_level = getattr(StorageLevel, persist_storage_level, None)
+            if not isinstance(self._storage_level, StorageLevel):
+                raise ExecutionEngineError(
+                    f'Unknown persist_storage_level "{persist_storage_level}"; use the name of a pyspark StorageLevel, '
+                    f'e.g. "MEMORY_AND_DISK".'
+                )
+        if max_persisted_batches is None:
+            self._max_persisted_batches = DEFAULT_MAX_PERSISTED_BATCHES
+        else:
+            self._max_persisted_batches = max_persisted_batches
+        self._persist_filtered_domains_after = persist_filtered_domains_after
+        # DataFrames persisted by this engine, by batch_id, from the least to the most recently used
+        self._persisted_batches: "OrderedDict[str, DataFrame]" = OrderedDict()
+        # Filtered domains by (batch_id, row_condition, condition_parser), with the number of times they were requested,
+        # from the least to the most recently used
+        self._filtered_domains: "OrderedDict[tuple, list]" = OrderedDict()
+        self._persistence_statistics = {
+            "filtered_domain_hits": 0,
+            "filtered_domain_misses": 0,
+            "unpersisted_batches": 0,
+        }
+        self._persistence_lock = threading.RLock()
+
         super().__init__(*args, **kwargs)
 
         self._config.update(
@@ -161,6 +217,24 @@ class SparkDFExecutionEngine(ExecutionEngine):
                 "spark_config": spark_config,
             }
         )
+        for key, value in (
+            ("persist_storage_level", persist_storage_level),
+            ("max_persisted_batches", max_persisted_batches),
+            ("persist_filtered_domains_after", persist_filtered_domains_after),
+        ):
+            if value is not None:
+                self._config[key] = value
+
+    def __copy__(self):
+        execution_engine = super().__copy__()
+        # The copy only unpersists what it persisted itself
+        execution_engine._persisted_batches = OrderedDict()
+        execution_engine._filtered_domains = OrderedDict()
+        execution_engine._persistence_statistics = {
+            key: 0 for key in self._persistence_statistics
+        }
+        execution_engine._persistence_lock = threading.RLock()
+        return execution_engine
 
     @property
     def dataframe(self):
@@ -181,7 +255,76 @@ class SparkDFExecutionEngine(ExecutionEngine):
             raise GreatExpectationsError(
                 "SparkDFExecutionEngine requires batch data that is either a DataFrame or a SparkDFBatchData object"
             )
-        super().load_batch_data(batch_id=batch_id, batch_data=batch_data)
+        with self._persistence_lock:
+            previous_batch_data = self.loaded_batch_data_dict.get(batch_id)
+            if (
+                previous_batch_data is not None
+                and previous_batch_data.dataframe is not batch_data.dataframe
+            ):
+                # The data previously loaded under this batch_id is evicted
+                self.unpersist(batch_id=batch_id)
+            super().load_batch_data(batch_id=batch_id, batch_data=batch_data)
+            self._persist_batch(batch_id=batch_id, df=batch_data.dataframe)
+
+    def _persist_batch(self, batch_id: str, df: DataFrame) -> None:
+        """Persist the DataFrame of a batch (if persist is enabled), and mark it as the most recently used batch."""
+        if not self._persist:
+            return
+        with self._persistence_lock:
+            if batch_id in self._persisted_batches:
+                self._persisted_batches.move_to_end(batch_id)
+                return
+            if df.is_cached:
+                # The DataFrame was persisted by its owner, who decides when to unpersist it
+                return
+            df.persist(self._storage_level)
+            self._persisted_batches[batch_id] = df
+            while len(self._persisted_batches) > self._max_persisted_batches:
+                least_recently_used_batch_id = next(iter(self._persisted_batches))
+                self.unpersist(batch_id=least_recently_used_batch_id)
+
+    def unpersist(self, batch_id: Optional[str] = None) -> None:
+        """Unpersist the data that this engine persisted for a batch (for all batches, if batch_id is None): the
+        DataFrame of the batch and its filtered domains.
+
+        The batch stays loaded: it is read from its source again, and persisted again, if it is validated again.
+        """
+        with self._persistence_lock:
+            if batch_id is None:
+                batch_ids = list(self._persisted_batches.keys())
+            else:
+                batch_ids = [batch_id]
+            for unpersisted_batch_id in batch_ids:
+                df = self._persisted_batches.pop(unpersisted_batch_id, None)
+                if df is not None:
+                    df.unpersist()
+                    self._persistence_statistics["unpersisted_batches"] += 1
+            for domain_key in list(self._filtered_domains.keys()):
+                if batch_id is None or domain_key[0] == batch_id:
+                    self._discard_filtered_domain(domain_key)
+
+    def _discard_filtered_domain(self, domain_key: tuple) -> None:
+        filtered_df, _ = self._filtered_domains.pop(domain_key)
+        if filtered_df.is_cached:
+            filtered_df.unpersist()
+
+    def release_batch_data(self, batch_id: str) -> None:
+        self.unpersist(batch_id=batch_id)
+
+    @property
+    def persistence_statistics(self) -> dict:
+        """The batches and filtered domains currently persisted by this engine, and how often they were used."""
+        with self._persistence_lock:
+            return {
+                "storage_level": str(self._storage_level),
+                "persisted_batch_ids": list(self._persisted_batches.keys()),
+                "persisted_filtered_domains": sum(
+                    1
+                    for filtered_df, _ in self._filtered_domains.values()
+                    if filtered_df.is_cached
+                ),
+                **self._persistence_statistics,
+            }
 
     def get_batch_data_and_markers(
         self, batch_spec: BatchSpec
@@ -329,6 +472,7 @@ class SparkDFExecutionEngine(ExecutionEngine):
         if batch_id is None:
             # We allow no batch id specified if there is only one batch
             if self.active_batch_data:
+                batch_id = self.active_batch_data_id
                 data = self.active_batch_data.dataframe
             else:
                 raise ValidationError(
@@ -339,6 +483,8 @@ class SparkDFExecutionEngine(ExecutionEngine):
                 data = self.loaded_batch_data_dict[batch_id].dataframe
             else:
                 raise ValidationError(f"Unable to find batch with batch_id {batch_id}")
+        # A batch that was unpersisted (e.g. by release_batch_data) is persisted again when it is used again
+        self._persist_batch(batch_id=batch_id, df=data)
 
         compute_domain_kwargs = copy.deepcopy(domain_kwargs)
         accessor_domain_kwargs = dict()
@@ -351,15 +497,12 @@ class SparkDFExecutionEngine(ExecutionEngine):
         row_condition = domain_kwargs.get("row_condition", None)
         if row_condition:
             condition_parser = domain_kwargs.get("condition_parser", None)
-            if condition_parser == "spark":
-                data = data.filter(row_condition)
-            elif condition_parser == "great_expectations__experimental__":
-                parsed_condition = parse_condition_to_spark(row_condition)
-                data = data.filter(parsed_condition)
-            else:
-                raise GreatExpectationsError(
-                    f"unrecognized condition_parser {str(condition_parser)}for Spark execution engine"
-                )
+            data = self._get_filtered_domain(
+                batch_id=batch_id,
+                data=data,
+                row_condition=row_condition,
+                condition_parser=condition_parser,
+            )
 
         # Warning user if accessor keys are in any domain that is not of type table, will be ignored
         if (
@@ -445,6 +588,55 @@ class SparkDFExecutionEngine(ExecutionEngine):
 
         return data, compute_domain_kwargs, accessor_domain_kwargs
 
+    def _get_filtered_domain(
+        self,
+        batch_id: str,
+        data: DataFrame,
+        row_condition: str,
+        condition_parser: Optional[str],
+    ) -> DataFrame:
+        """Filter the DataFrame of a batch with a row_condition.
+
+        If persist_filtered_domains_after is set, filtered DataFrames are reused for the same row_condition, and
+        persisted once they have been requested persist_filtered_domains_after times. At most MAX_FILTERED_DOMAINS are
+        kept; the least recently used one is discarded to make room for another.
+        """
+        domain_key = (batch_id, row_condition, condition_parser)
+        if self._persist_filtered_domains_after is not None:
+            with self._persistence_lock:
+                filtered_domain = self._filtered_domains.get(domain_key)
+                if filtered_domain is not None:
+                    self._persistence_statistics["filtered_domain_hits"] += 1
+                    self._filtered_domains.move_to_end(domain_key)
+                    filtered_domain[1] += 1
+                    filtered_df, num_requests = filtered_domain
+                    if (
+                        num_requests >= self._persist_filtered_domains_after
+                        and not filtered_df.is_cached
+                    ):
+                        filtered_df.persist(self._storage_level)
+                    return filtered_df
+
+        if condition_parser == "spark":
+            filtered_df = data.filter(row_condition)
+        elif condition_parser == "great_expectations__experimental__":
+            parsed_condition = parse_condition_to_spark(row_condition)
+            filtered_df = data.filter(parsed_condition)
+        else:
+            raise GreatExpectationsError(
+                f"unrecognized condition_parser {str(condition_parser)}for Spark execution engine"
+            )
+
+        if self._persist_filtered_domains_after is not None:
+            with self._persistence_lock:
+                self._persistence_statistics["filtered_domain_misses"] += 1
+                self._filtered_domains[domain_key] = [filtered_df, 1]
+                if self._persist_filtered_domains_after <= 1:
+                    filtered_df.persist(self._storage_level)
+                while len(self._filtered_domains) > MAX_FILTERED_DOMAINS:
+                    self._discard_filtered_domain(next(iter(self._filtered_domains)))
+        return filtered_df
+
     def add_column_row_condition(
         self, domain_kwargs, column_name=None, filter_null=True, filter_nan=False
     ):
@@ -3,7 +3,7 @@ import datetime
 import logging
 import traceback
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
 from great_expectations.core import IDDict
@@ -20,6 +20,7 @@ from great_expectations.execution_engine.execution_engine import MetricDomainTyp
 from great_expectations.execution_engine.sqlalchemy_batch_data import (
     SqlAlchemyBatchData,
 )
+from great_expectations.expectations.registry import get_metric_provider
 from great_expectations.expectations.row_conditions import parse_condition_to_sqlalchemy
 from great_expectations.util import filter_properties_dict, import_library_module
 from great_expectations.validator.validation_graph import MetricConfiguration
@@ -126,6 +127,11 @@ def _get_dialect_type_module(dialect):
 
 
 class SqlAlchemyExecutionEngine(ExecutionEngine):
+    # Strategies for computing unexpected counts of window-style conditions:
+    # "subquery" aggregates over a derived table in a single query, "temp_table" materializes the condition first,
+    # and "auto" uses the subquery and falls back to the temp table if the dialect rejects the single query.
+    unexpected_count_strategies = ("auto", "subquery", "temp_table")
+
     def __init__(
         self,
         name=None,
@@ -136,6 +142,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         url=None,
         batch_data_dict=None,
         create_temp_table=True,
+        unexpected_count_strategy=None,
         **kwargs,  # These will be passed as optional parameters to the SQLAlchemy engine, **not** the ExecutionEngine
     ):
         """Builds a SqlAlchemyExecutionEngine, using a provided connection string/url/engine/credentials to access the
@@ -162,7 +169,21 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                     If neither the engines, the credentials, nor the connection_string have been provided,
                     a url can be used to access the data. This will be overridden by all other configuration
                     options if any are provided.
+                unexpected_count_strategy (string): \
+                    How unexpected counts of window-style conditions are computed: "subquery" (a single query over
+                    a derived table), "temp_table" (materialize the condition in a temporary table, then sum it), or
+                    "auto" (the default), which uses "subquery" and falls back to "temp_table" for dialects that
+                    reject the single query.
         """
+        if (
+            unexpected_count_strategy is not None
+            and unexpected_count_strategy not in self.unexpected_count_strategies
+        ):
+            raise InvalidConfigError(
+                f'Unknown unexpected_count_strategy "{unexpected_count_strategy}"; expected one of '
+                f"{', '.join(self.unexpected_count_strategies)}."
+            )
+
         super().__init__(name=name, batch_data_dict=batch_data_dict)
         self._name = name
 
@@ -170,6 +191,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         self._connection_string = connection_string
         self._url = url
         self._create_temp_table = create_temp_table
+        self._unexpected_count_strategy = unexpected_count_strategy or "auto"
 
         if engine is not None:
             if credentials is not None:
@@ -254,6 +276,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             "connection_string": connection_string,
             "url": url,
             "batch_data_dict": batch_data_dict,
+            "unexpected_count_strategy": unexpected_count_strategy,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -264,6 +287,10 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
     def credentials(self):
         return self._credentials
 
+    @property
+    def unexpected_count_strategy(self) -> str:
+        return self._unexpected_count_strategy
+
     @property
     def connection_string(self):
         return self._connection_string
@@ -558,6 +585,184 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         # Letting selectable fall through
         return selectable, compute_domain_kwargs, accessor_domain_kwargs
 
+    def _compute_metrics(
+        self,
+        metrics_to_resolve: Iterable[MetricConfiguration],
+        metrics: Dict[Tuple, Any] = None,
+        runtime_configuration: dict = None,
+    ) -> dict:
+        """Compute the provided metrics, compiling column value metrics that share a compute domain into one query.
+
+        Column metric value providers may expose a ``column_select_bundle_fn`` (e.g. column.quantile_values,
+        column.median and column.histogram), which returns the select expressions computing the metric for one column
+        and a function that builds the metric value from the resulting row. Such metrics are grouped by compute domain
+        and resolved by resolve_column_select_bundle with a single SELECT per domain; all other metrics are resolved by
+        the base ExecutionEngine.
+
+        Args:
+            metrics_to_resolve: the metrics to evaluate
+            metrics: already-computed metrics currently available to the engine
+            runtime_configuration: runtime configuration information
+
+        Returns:
+            resolved_metrics (Dict): a dictionary with the values for the metrics that have just been resolved.
+        """
+        if metrics is None:
+            metrics = dict()
+
+        column_select_bundle = []
+        unbundled_metrics = []
+        for metric_to_resolve in metrics_to_resolve:
+            metric_class, metric_fn = get_metric_provider(
+                metric_name=metric_to_resolve.metric_name, execution_engine=self
+            )
+            column_select_bundle_fn = getattr(
+                metric_fn, "column_select_bundle_fn", None
+            )
+            if (
+                column_select_bundle_fn is None
+                or "column" not in metric_to_resolve.metric_domain_kwargs
+            ):
+                unbundled_metrics.append(metric_to_resolve)
+                continue
+
+            try:
+                metric_dependencies = {
+                    k: metrics[v.id]
+                    for k, v in metric_to_resolve.metric_dependencies.items()
+                }
+            except KeyError as e:
+                raise GreatExpectationsError(f"Missing metric dependency: {str(e)}")
+
+            _, compute_domain_kwargs, accessor_domain_kwargs = self.get_compute_domain(
+                metric_to_resolve.metric_domain_kwargs,
+                domain_type=MetricDomainTypes.COLUMN,
+            )
+            column_select_bundle_spec = column_select_bundle_fn(
+                metric_class,
+                column=sa.column(accessor_domain_kwargs["column"]),
+                metric_value_kwargs=metric_to_resolve.metric_value_kwargs,
+                metrics=metric_dependencies,
+                dialect=self.engine.dialect,
+            )
+            if column_select_bundle_spec is None:
+                # The metric cannot be expressed as part of a shared SELECT for this dialect
+                unbundled_metrics.append(metric_to_resolve)
+                continue
+
+            selects, build_metric_value = column_select_bundle_spec
+            column_select_bundle.append(
+                (metric_to_resolve, selects, build_metric_value, compute_domain_kwargs)
+            )
+
+        resolved_metrics = super()._compute_metrics(
+            metrics_to_resolve=unbundled_metrics,
+            metrics=metrics,
+            runtime_configuration=runtime_configuration,
+        )
+        if len(column_select_bundle) > 0:
+            resolved_metrics.update(
+                self.resolve_column_select_bundle(
+                    column_select_bundle,
+                    metrics=metrics,
+                    runtime_configuration=runtime_configuration,
+                )
+            )
+
+        return resolved_metrics
+
+    def resolve_column_select_bundle(
+        self,
+        column_select_bundle: Iterable[
+            Tuple[MetricConfiguration, List[Any], Callable[[list], Any], dict]
+        ],
+        metrics: Dict[Tuple, Any] = None,
+        runtime_configuration: dict = None,
+    ) -> dict:
+        """Compiles the select expressions of every column value metric on the same compute domain into one query,
+        so that e.g. the quantiles, medians and histograms of all columns of a table are computed in a single scan.
+
+        If the database rejects a combined query, the metrics of that domain are resolved individually instead.
+
+            Args:
+                column_select_bundle (Iterable[Tuple[MetricConfiguration, List, Callable, dict]]): \
+                    The MetricConfiguration of each metric to resolve, the select expressions computing it, the function
+                    building the metric value from the values of those expressions, and its compute domain kwargs.
+                metrics (Dict[Tuple, Any]): \
+                    already-computed metrics, used when resolving metrics individually
+                runtime_configuration (dict): \
+                    runtime configuration information, used when resolving metrics individually
+
+            Returns:
+                A dictionary of metric ids and their corresponding values.
+        """
+        resolved_metrics = dict()
+
+        queries: Dict[str, dict] = dict()
+        for (
+            metric_to_resolve,
+            selects,
+            build_metric_value,
+            compute_domain_kwargs,
+        ) in column_select_bundle:
+            if not isinstance(compute_domain_kwargs, IDDict):
+                compute_domain_kwargs = IDDict(compute_domain_kwargs)
+            domain_id = compute_domain_kwargs.to_id()
+            if domain_id not in queries:
+                queries[domain_id] = {
+                    "select": [],
+                    "metrics": [],
+                    "domain_kwargs": compute_domain_kwargs,
+                }
+            query = queries[domain_id]
+            start = len(query["select"])
+            query["select"].extend(
+                select.label(f"bundle_{start + idx}")
+                for idx, select in enumerate(selects)
+            )
+            query["metrics"].append(
+                (metric_to_resolve, build_metric_value, start, len(query["select"]))
+            )
+
+        for query in queries.values():
+            selectable, _, _ = self.get_compute_domain(
+                query["domain_kwargs"], domain_type="identity"
+            )
+            try:
+                row = self.engine.execute(
+                    sa.select(query["select"]).select_from(selectable)
+                ).fetchone()
+            except sa.exc.DBAPIError as e:
+                logger.debug(
+                    f"SqlAlchemyExecutionEngine could not bundle {len(query['metrics'])} metrics on domain_id "
+                    f'{query["domain_kwargs"].to_id()} ({type(e).__name__}: "{str(e)}"); resolving them individually.'
+                )
+                resolved_metrics.update(
+                    super()._compute_metrics(
+                        metrics_to_resolve=[
+                            metric_to_resolve
+                            for metric_to_resolve, *_ in query["metrics"]
+                        ],
+                        metrics=metrics,
+                        runtime_configuration=runtime_configuration,
+                    )
+                )
+                continue
+
+            if row is None:
+                # Window-style selects return no rows on an empty domain
+                row = [None] * len(query["select"])
+            for metric_to_resolve, build_metric_value, start, end in query["metrics"]:
+                resolved_metrics[metric_to_resolve.id] = build_metric_value(
+                    list(row[start:end])
+                )
+            logger.debug(
+                f"SqlAlchemyExecutionEngine computed {len(query['metrics'])} column metrics in one query on "
+                f"domain_id {query['domain_kwargs'].to_id()}"
+            )
+
+        return resolved_metrics
+
     def resolve_metric_bundle(
         self,
         metric_fn_bundle: Iterable[Tuple[MetricConfiguration, Any, dict, dict]],
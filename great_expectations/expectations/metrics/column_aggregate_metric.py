@@ -2,6 +2,8 @@ import logging
 from functools import wraps
 from typing import Any, Callable, Dict, Tuple, Type
 
+import pandas as pd
+
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.execution_engine import ExecutionEngine, PandasExecutionEngine
 from great_expectations.execution_engine.execution_engine import (
@@ -80,6 +82,30 @@ def column_aggregate_value(
                         message=f'Error: The column "{column_name}" in BatchData does not exist.'
                     )
 
+            def column_bundle_fn(
+                cls,
+                column: pd.Series,
+                metric_value_kwargs: Dict,
+                metrics: Dict[Tuple, Any],
+                compute_domain_kwargs: Dict,
+                accessor_domain_kwargs: Dict,
+            ):
+                filter_column_isnull = kwargs.get(
+                    "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
+                )
+                if filter_column_isnull:
+                    column = column[column.notnull()]
+
+                return metric_fn(
+                    cls,
+                    column=column,
+                    **metric_value_kwargs,
+                    _metrics=metrics,
+                )
+
+            if MetricDomainTypes(domain_type) == MetricDomainTypes.COLUMN:
+                # Allows PandasExecutionEngine.resolve_metric_bundle to compute this metric on a shared compute domain
+                inner_func.column_bundle_fn = column_bundle_fn
             return inner_func
 
         return wrapper
@@ -14,6 +14,9 @@ from great_expectations.execution_engine.execution_engine import MetricDomainTyp
 from great_expectations.expectations.metrics.column_aggregate_metric import (
     ColumnMetricProvider,
 )
+from great_expectations.expectations.metrics.column_aggregate_metrics.column_quantile_values import (
+    PERCENTILE_WINDOW_DIALECTS,
+)
 from great_expectations.expectations.metrics.import_manager import Bucketizer, F, sa
 from great_expectations.expectations.metrics.metric_provider import metric_value
 from great_expectations.expectations.metrics.util import (
@@ -64,84 +67,7 @@ class ColumnHistogram(ColumnMetricProvider):
         )
         column = accessor_domain_kwargs["column"]
         bins = metric_value_kwargs["bins"]
-
-        case_conditions = []
-        idx = 0
-        if isinstance(bins, np.ndarray):
-            bins = bins.tolist()
-        else:
-            bins = list(bins)
-
-        # If we have an infinte lower bound, don't express that in sql
-        if (
-            bins[0]
-            == get_sql_dialect_floating_point_infinity_value(
-                schema="api_np", negative=True
-            )
-        ) or (
-            bins[0]
-            == get_sql_dialect_floating_point_infinity_value(
-                schema="api_cast", negative=True
-            )
-        ):
-            case_conditions.append(
-                sa.func.sum(
-                    sa.case([(sa.column(column) < bins[idx + 1], 1)], else_=0)
-                ).label("bin_" + str(idx))
-            )
-            idx += 1
-
-        for idx in range(idx, len(bins) - 2):
-            case_conditions.append(
-                sa.func.sum(
-                    sa.case(
-                        [
-                            (
-                                sa.and_(
-                                    bins[idx] <= sa.column(column),
-                                    sa.column(column) < bins[idx + 1],
-                                ),
-                                1,
-                            )
-                        ],
-                        else_=0,
-                    )
-                ).label("bin_" + str(idx))
-            )
-
-        if (
-            bins[-1]
-            == get_sql_dialect_floating_point_infinity_value(
-                schema="api_np", negative=False
-            )
-        ) or (
-            bins[-1]
-            == get_sql_dialect_floating_point_infinity_value(
-                schema="api_cast", negative=False
-            )
-        ):
-            case_conditions.append(
-                sa.func.sum(
-                    sa.case([(bins[-2] <= sa.column(column), 1)], else_=0)
-                ).label("bin_" + str(len(bins) - 1))
-            )
-        else:
-            case_conditions.append(
-                sa.func.sum(
-                    sa.case(
-                        [
-                            (
-                                sa.and_(
-                                    bins[-2] <= sa.column(column),
-                                    sa.column(column) <= bins[-1],
-                                ),
-                                1,
-                            )
-                        ],
-                        else_=0,
-                    )
-                ).label("bin_" + str(len(bins) - 1))
-            )
+        case_conditions = _get_column_histogram_selects(sa.column(column), bins)
 
         query = (
             sa.select(case_conditions)
@@ -157,6 +83,17 @@ class ColumnHistogram(ColumnMetricProvider):
         )
         return hist
 
+    def _sqlalchemy_column_select_bundle_fn(
+        cls, column, metric_value_kwargs: Dict, metrics: Dict[Tuple, Any], dialect
+    ):
+        if dialect.name.lower() in PERCENTILE_WINDOW_DIALECTS:
+            # Aggregates cannot share a SELECT with the window-function percentiles of these dialects
+            return None
+        selects = _get_column_histogram_selects(column, metric_value_kwargs["bins"])
+        return selects, convert_to_json_serializable
+
+    _sqlalchemy.column_select_bundle_fn = _sqlalchemy_column_select_bundle_fn
+
     @metric_value(engine=SparkDFExecutionEngine)
     def _spark(
         cls,
@@ -232,3 +169,86 @@ class ColumnHistogram(ColumnMetricProvider):
                 logger.warning("Discarding histogram values above highest bin.")
 
         return hist
+
+
+def _get_column_histogram_selects(column, bins) -> list:
+    """Build one SUM(CASE ...) select expression per histogram bin of the column.
+
+    Null values fall in no bin, so the expressions can share a SELECT with other metrics of the column's domain.
+    """
+    case_conditions = []
+    idx = 0
+    if isinstance(bins, np.ndarray):
+        bins = bins.tolist()
+    else:
+        bins = list(bins)
+
+    # If we have an infinte lower bound, don't express that in sql
+    if (
+        bins[0]
+        == get_sql_dialect_floating_point_infinity_value(schema="api_np", negative=True)
+    ) or (
+        bins[0]
+        == get_sql_dialect_floating_point_infinity_value(
+            schema="api_cast", negative=True
+        )
+    ):
+        case_conditions.append(
+            sa.func.sum(sa.case([(column < bins[idx + 1], 1)], else_=0)).label(
+                "bin_" + str(idx)
+            )
+        )
+        idx += 1
+
+    for idx in range(idx, len(bins) - 2):
+        case_conditions.append(
+            sa.func.sum(
+                sa.case(
+                    [
+                        (
+                            sa.and_(
+                                bins[idx] <= column,
+                                column < bins[idx + 1],
+                            ),
+                            1,
+                        )
+                    ],
+                    else_=0,
+                )
+            ).label("bin_" + str(idx))
+        )
+
+    if (
+        bins[-1]
+        == get_sql_dialect_floating_point_infinity_value(
+            schema="api_np", negative=False
+        )
+    ) or (
+        bins[-1]
+        == get_sql_dialect_floating_point_infinity_value(
+            schema="api_cast", negative=False
+        )
+    ):
+        case_conditions.append(
+            sa.func.sum(sa.case([(bins[-2] <= column, 1)], else_=0)).label(
+                "bin_" + str(len(bins) - 1)
+            )
+        )
+    else:
+        case_conditions.append(
+            sa.func.sum(
+                sa.case(
+                    [
+                        (
+                            sa.and_(
+                                bins[-2] <= column,
+                                column <= bins[-1],
+                            ),
+                            1,
+                        )
+                    ],
+                    else_=0,
+                )
+            ).label("bin_" + str(len(bins) - 1))
+        )
+    return case_conditions
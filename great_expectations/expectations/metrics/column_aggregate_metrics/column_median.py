@@ -16,6 +16,11 @@ from great_expectations.expectations.metrics.column_aggregate_metric import (
     ColumnMetricProvider,
     column_aggregate_value,
 )
+from great_expectations.expectations.metrics.column_aggregate_metrics.column_quantile_values import (
+    PERCENTILE_AGGREGATE_DIALECTS,
+    PERCENTILE_WINDOW_DIALECTS,
+    get_column_percentile_select,
+)
 from great_expectations.expectations.metrics.import_manager import F, sa
 from great_expectations.expectations.metrics.metric_provider import (
     MetricProvider,
@@ -87,6 +92,23 @@ class ColumnMedian(ColumnMetricProvider):
             column_median = column_values[1][0]  # True center value
         return column_median
 
+    def _sqlalchemy_column_select_bundle_fn(
+        cls, column, metric_value_kwargs: Dict, metrics: Dict[Tuple, Any], dialect
+    ):
+        dialect_name = dialect.name.lower()
+        if (
+            dialect_name
+            not in PERCENTILE_AGGREGATE_DIALECTS + PERCENTILE_WINDOW_DIALECTS
+        ):
+            return None
+        # percentile_cont(0.5) averages the two center values when there is an even number of values
+        selects = [
+            get_column_percentile_select("percentile_cont", column, 0.5, dialect_name)
+        ]
+        return selects, lambda values: values[0]
+
+    _sqlalchemy.column_select_bundle_fn = _sqlalchemy_column_select_bundle_fn
+
     @metric_value(engine=SparkDFExecutionEngine, metric_fn_type="value")
     def _spark(
         cls,
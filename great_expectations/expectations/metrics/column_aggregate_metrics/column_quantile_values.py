@@ -40,6 +40,11 @@ from great_expectations.expectations.metrics.util import attempt_allowing_relati
 
 logger = logging.getLogger(__name__)
 
+# Dialects for which percentiles of several columns can be compiled into a single SELECT (see
+# SqlAlchemyExecutionEngine.resolve_column_select_bundle). mssql and bigquery only offer percentiles as window functions.
+PERCENTILE_AGGREGATE_DIALECTS = ("postgresql", "snowflake", "oracle")
+PERCENTILE_WINDOW_DIALECTS = ("mssql", "bigquery")
+
 
 class ColumnQuantileValues(ColumnMetricProvider):
     metric_name = "column.quantile_values"
@@ -130,6 +135,29 @@ class ColumnQuantileValues(ColumnMetricProvider):
                 sqlalchemy_engine=sqlalchemy_engine,
             )
 
+    def _sqlalchemy_column_select_bundle_fn(
+        cls, column, metric_value_kwargs: Dict, metrics: Dict[Tuple, Any], dialect
+    ):
+        dialect_name = dialect.name.lower()
+        if (
+            dialect_name
+            not in PERCENTILE_AGGREGATE_DIALECTS + PERCENTILE_WINDOW_DIALECTS
+        ):
+            return None
+        quantiles = metric_value_kwargs["quantiles"]
+        if dialect_name == "snowflake":
+            # See the note on snowflake's percentile_disc precision in _sqlalchemy above
+            quantiles = [round(x, 10) for x in quantiles]
+        selects = [
+            get_column_percentile_select(
+                "percentile_disc", column, quantile, dialect_name
+            )
+            for quantile in quantiles
+        ]
+        return selects, list
+
+    _sqlalchemy.column_select_bundle_fn = _sqlalchemy_column_select_bundle_fn
+
     @metric_value(engine=SparkDFExecutionEngine)
     def _spark(
         cls,
@@ -162,6 +190,30 @@ class ColumnQuantileValues(ColumnMetricProvider):
         return df.approxQuantile(column, list(quantiles), allow_relative_error)
 
 
+def get_column_percentile_select(
+    percentile_fn_name: str, column, quantile: float, dialect_name: str
+):
+    """Build the percentile_disc or percentile_cont select expression of a column in the form the dialect supports.
+
+    Args:
+        percentile_fn_name: "percentile_disc" or "percentile_cont"
+        column: the sqlalchemy column
+        quantile: the quantile to compute, between 0 and 1
+        dialect_name: the lower-case name of the sqlalchemy dialect
+
+    Returns:
+        The select expression; for mssql and bigquery this is a window function over the whole domain.
+    """
+    percentile_fn = getattr(sa.func, percentile_fn_name)
+    if dialect_name == "mssql":
+        # mssql requires over(), so we add an empty over() clause
+        return percentile_fn(quantile).within_group(column.asc()).over()
+    elif dialect_name == "bigquery":
+        # BigQuery does not support "WITHIN"
+        return percentile_fn(column, quantile).over()
+    return percentile_fn(quantile).within_group(column.asc())
+
+
 def _get_column_quantiles_mssql(
     column, quantiles: Iterable, selectable, sqlalchemy_engine
 ) -> list:
@@ -5,6 +5,7 @@ from functools import wraps
 from typing import Any, Callable, Dict, List, Optional, Type, Union
 
 import numpy as np
+import pandas as pd
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.core import ExpectationConfiguration
@@ -109,6 +110,30 @@ def column_function_partial(
                         message=f'Error: The column "{column_name}" in BatchData does not exist.'
                     )
 
+            def column_bundle_fn(
+                cls,
+                column: pd.Series,
+                metric_value_kwargs: Dict,
+                metrics: Dict[str, Any],
+                compute_domain_kwargs: Dict,
+                accessor_domain_kwargs: Dict,
+            ):
+                filter_column_isnull = kwargs.get(
+                    "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
+                )
+                if filter_column_isnull:
+                    column = column[column.notnull()]
+
+                values = metric_fn(
+                    cls,
+                    column,
+                    **metric_value_kwargs,
+                    _metrics=metrics,
+                )
+                return values, compute_domain_kwargs, accessor_domain_kwargs
+
+            # Allows PandasExecutionEngine.resolve_metric_bundle to compute this metric on a shared compute domain
+            inner_func.column_bundle_fn = column_bundle_fn
             return inner_func
 
         return wrapper
@@ -324,6 +349,34 @@ def column_condition_partial(
                         message=f'Error: The column "{column_name}" in BatchData does not exist.'
                     )
 
+            def column_bundle_fn(
+                cls,
+                column: pd.Series,
+                metric_value_kwargs: Dict,
+                metrics: Dict[str, Any],
+                compute_domain_kwargs: Dict,
+                accessor_domain_kwargs: Dict,
+            ):
+                filter_column_isnull = kwargs.get(
+                    "filter_column_isnull", getattr(cls, "filter_column_isnull", True)
+                )
+                if filter_column_isnull:
+                    column = column[column.notnull()]
+
+                meets_expectation_series = metric_fn(
+                    cls,
+                    column,
+                    **metric_value_kwargs,
+                    _metrics=metrics,
+                )
+                return (
+                    ~meets_expectation_series,
+                    compute_domain_kwargs,
+                    accessor_domain_kwargs,
+                )
+
+            # Allows PandasExecutionEngine.resolve_metric_bundle to compute this metric on a shared compute domain
+            inner_func.column_bundle_fn = column_bundle_fn
             return inner_func
 
         return wrapper
@@ -815,6 +868,9 @@ def _sqlalchemy_map_condition_unexpected_count_value(
 ):
     """Returns unexpected count for MapExpectations. This is a *value* metric, which is useful for
     when the unexpected_condition is a window function.
+
+    The count is computed according to the execution engine's unexpected_count_strategy: either in a single query
+    that sums the condition over a derived table, or by first materializing the condition in a temporary table.
     """
     unexpected_condition, compute_domain_kwargs, accessor_domain_kwargs = metrics.get(
         "unexpected_condition"
@@ -822,55 +878,39 @@ def _sqlalchemy_map_condition_unexpected_count_value(
     (selectable, _, _,) = execution_engine.get_compute_domain(
         compute_domain_kwargs, domain_type="identity"
     )
-    temp_table_name: str = f"ge_tmp_{str(uuid.uuid4())[:8]}"
-    if execution_engine.dialect == "mssql":
-        # mssql expects all temporary table names to have a prefix '#'
-        temp_table_name = f"#{temp_table_name}"
+    count_case_statement: List[sa.sql.elements.Label] = [
+        sa.case(
+            [
+                (
+                    unexpected_condition,
+                    1,
+                )
+            ],
+            else_=0,
+        ).label("condition")
+    ]
 
+    strategy: str = execution_engine.unexpected_count_strategy
     try:
-        with execution_engine.engine.begin():
-            metadata: sa.MetaData = sa.MetaData(execution_engine.engine)
-            temp_table_obj: sa.Table = sa.Table(
-                temp_table_name,
-                metadata,
-                sa.Column("condition", sa.Integer, primary_key=False, nullable=False),
-            )
-            temp_table_obj.create(execution_engine.engine, checkfirst=True)
-
-            count_case_statement: List[sa.sql.elements.Label] = [
-                sa.case(
-                    [
-                        (
-                            unexpected_condition,
-                            1,
-                        )
-                    ],
-                    else_=0,
-                ).label("condition")
-            ]
-            inner_case_query: sa.sql.dml.Insert = temp_table_obj.insert().from_select(
-                count_case_statement,
-                sa.select(count_case_statement).select_from(selectable),
+        if strategy == "temp_table":
+            unexpected_count = _sqlalchemy_unexpected_count_with_temp_table(
+                execution_engine, selectable, count_case_statement
             )
-            execution_engine.engine.execute(inner_case_query)
-
-        unexpected_count_query: sa.Select = (
-            sa.select(
-                [
-                    sa.func.sum(sa.column("condition")).label("unexpected_count"),
-                ]
-            )
-            .select_from(temp_table_obj)
-            .alias("UnexpectedCountSubquery")
-        )
-
-        unexpected_count = execution_engine.engine.execute(
-            sa.select(
-                [
-                    unexpected_count_query.c.unexpected_count,
-                ]
-            )
-        ).scalar()
+        else:
+            try:
+                unexpected_count = _sqlalchemy_unexpected_count_with_subquery(
+                    execution_engine, selectable, count_case_statement
+                )
+            except sa.exc.DBAPIError as e:
+                if strategy != "auto" or not _is_unsupported_query_error(e):
+                    raise
+                logger.warning(
+                    f'The "{execution_engine.engine.dialect.name}" dialect could not compute the unexpected count in a '
+                    f'single query ({type(e).__name__}: "{str(e)}"); falling back to the "temp_table" strategy.'
+                )
+                unexpected_count = _sqlalchemy_unexpected_count_with_temp_table(
+                    execution_engine, selectable, count_case_statement
+                )
     except OperationalError as oe:
         exception_message: str = "An SQL execution Exception occurred.  "
         exception_traceback: str = traceback.format_exc()
@@ -883,6 +923,81 @@ def _sqlalchemy_map_condition_unexpected_count_value(
     return convert_to_json_serializable(unexpected_count)
 
 
+def _is_unsupported_query_error(e: "sa.exc.DBAPIError") -> bool:
+    """Whether the database rejected a query because its dialect does not support it (as opposed to, e.g., a lost
+    connection or a missing table), which is the only case in which another query strategy can succeed."""
+    return (
+        isinstance(e, (sa.exc.ProgrammingError, sa.exc.NotSupportedError))
+        and not e.connection_invalidated
+    )
+
+
+def _sqlalchemy_unexpected_count_with_subquery(
+    execution_engine: "SqlAlchemyExecutionEngine",
+    selectable,
+    count_case_statement: List["sa.sql.elements.Label"],
+):
+    """Sums the unexpected condition over a derived table in a single scan of the domain.
+
+    Summing over a derived table (rather than over the CASE expression directly) keeps the query valid for dialects,
+    such as mssql, that do not allow subqueries inside aggregate functions.
+    """
+    condition_subquery = (
+        sa.select(count_case_statement)
+        .select_from(selectable)
+        .alias("ConditionSubquery")
+    )
+    unexpected_count_query: sa.sql.Select = sa.select(
+        [sa.func.sum(condition_subquery.c.condition).label("unexpected_count")]
+    ).select_from(condition_subquery)
+    return execution_engine.engine.execute(unexpected_count_query).scalar()
+
+
+def _sqlalchemy_unexpected_count_with_temp_table(
+    execution_engine: "SqlAlchemyExecutionEngine",
+    selectable,
+    count_case_statement: List["sa.sql.elements.Label"],
+):
+    """Materializes the unexpected condition for every row in a temporary table, then sums it."""
+    temp_table_name: str = f"ge_tmp_{str(uuid.uuid4())[:8]}"
+    if execution_engine.engine.dialect.name.lower() == "mssql":
+        # mssql expects all temporary table names to have a prefix '#'
+        temp_table_name = f"#{temp_table_name}"
+
+    with execution_engine.engine.begin():
+        metadata: sa.MetaData = sa.MetaData(execution_engine.engine)
+        temp_table_obj: sa.Table = sa.Table(
+            temp_table_name,
+            metadata,
+            sa.Column("condition", sa.Integer, primary_key=False, nullable=False),
+        )
+        temp_table_obj.create(execution_engine.engine, checkfirst=True)
+
+        inner_case_query: sa.sql.dml.Insert = temp_table_obj.insert().from_select(
+            count_case_statement,
+            sa.select(count_case_statement).select_from(selectable),
+        )
+        execution_engine.engine.execute(inner_case_query)
+
+    unexpected_count_query: sa.Select = (
+        sa.select(
+            [
+                sa.func.sum(sa.column("condition")).label("unexpected_count"),
+            ]
+        )
+        .select_from(temp_table_obj)
+        .alias("UnexpectedCountSubquery")
+    )
+
+    return execution_engine.engine.execute(
+        sa.select(
+            [
+                unexpected_count_query.c.unexpected_count,
+            ]
+        )
+    ).scalar()
+
+
 def _sqlalchemy_column_map_condition_values(
     cls,
     execution_engine: "SqlAlchemyExecutionEngine",
@@ -1,9 +1,26 @@
+import datetime
+import hashlib
+import json
 import logging
+import math
 import os
+import pickle
 import traceback
 from collections import OrderedDict
+from concurrent.futures import (
+    BrokenExecutor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from functools import partial
+from typing import Optional
 
 import great_expectations.exceptions as exceptions
+from great_expectations import __version__ as ge_version
+from great_expectations.core.expectation_validation_result import (
+    ExpectationSuiteValidationResult,
+)
 from great_expectations.core.util import nested_update
 from great_expectations.data_context.store.html_site_store import (
     HtmlSiteStore,
@@ -59,6 +76,13 @@ class SiteBuilder:
                 bucket: data_docs.my_company.com
                 prefix: /data_docs/
 
+    With ``incremental_build: true``, the site keeps a manifest of the resources it rendered (see
+    SiteBuildManifest), and each build only renders the expectation suites and validation results that are new or
+    changed since the previous build; the index page is built from the information recorded in the manifest.
+
+    With ``concurrency`` (e.g. ``{"enabled": True, "executor": "process", "max_workers": 8}``), the pages of each
+    section are rendered in parallel (see DefaultSiteSectionBuilder).
+
 
     A more verbose configuration can also control individual sections and
     override renderers, views, and stores::
@@ -82,6 +106,8 @@ class SiteBuilder:
             #     view:
             #         module_name: great_expectations.render.view
             #         class_name: DefaultJinjaIndexPageView
+            #     # Split the index into pages of at most 1000 links each
+            #     index_page_size: 1000
 
             site_section_builders:
                 # Minimal specification
@@ -114,12 +140,15 @@ class SiteBuilder:
         show_how_to_buttons=True,
         site_section_builders=None,
         runtime_environment=None,
+        incremental_build=False,
+        concurrency=None,
         **kwargs,
     ):
         self.site_name = site_name
         self.data_context = data_context
         self.store_backend = store_backend
         self.show_how_to_buttons = show_how_to_buttons
+        self.incremental_build = incremental_build
 
         usage_statistics_config = data_context.anonymous_usage_statistics
         data_context_id = None
@@ -221,6 +250,7 @@ class SiteBuilder:
                     "custom_views_directory": custom_views_directory,
                     "data_context_id": self.data_context_id,
                     "show_how_to_buttons": self.show_how_to_buttons,
+                    "concurrency": concurrency,
                 },
                 config_defaults={"name": site_section_name, "module_name": module_name},
             )
@@ -289,12 +319,25 @@ class SiteBuilder:
         # copy static assets
         self.target_store.copy_static_assets()
 
+        # With incremental_build, the builders only render the resources that are new or changed since they were
+        # last rendered, according to the manifest kept in the target store
+        build_kwargs = {}
+        if self.incremental_build:
+            manifest = SiteBuildManifest(self.target_store.get_manifest())
+            build_kwargs["manifest"] = manifest
+
         for site_section, site_section_builder in self.site_section_builders.items():
-            site_section_builder.build(resource_identifiers=resource_identifiers)
+            site_section_builder.build(
+                resource_identifiers=resource_identifiers, **build_kwargs
+            )
 
         index_page_url, index_links_dict = self.site_index_builder.build(
-            build_index=build_index
+            build_index=build_index, **build_kwargs
         )
+
+        if self.incremental_build:
+            self.target_store.write_manifest(manifest.to_json_dict())
+
         return (
             self.get_resource_url(only_if_exists=False),
             index_links_dict,
@@ -332,6 +375,7 @@ class DefaultSiteSectionBuilder:
         renderer=None,
         view=None,
         data_context_id=None,
+        concurrency=None,
         **kwargs,
     ):
         self.name = name
@@ -341,6 +385,9 @@ class DefaultSiteSectionBuilder:
         self.validation_results_limit = validation_results_limit
         self.data_context_id = data_context_id
         self.show_how_to_buttons = show_how_to_buttons
+        self.concurrency = concurrency
+        self._custom_styles_directory = custom_styles_directory
+        self._custom_views_directory = custom_views_directory
 
         if renderer is None:
             raise exceptions.InvalidConfigError(
@@ -350,6 +397,7 @@ class DefaultSiteSectionBuilder:
         module_name = (
             renderer.get("module_name") or "great_expectations.render.renderer"
         )
+        self._renderer_config = {**renderer, "module_name": module_name}
         self.renderer_class = instantiate_class_from_config(
             config=renderer,
             runtime_environment={"data_context": data_context},
@@ -369,6 +417,7 @@ class DefaultSiteSectionBuilder:
                 "class_name": "DefaultJinjaPageView",
             }
         module_name = view.get("module_name") or module_name
+        self._view_config = {**view, "module_name": module_name}
         self.view_class = instantiate_class_from_config(
             config=view,
             runtime_environment={
@@ -384,13 +433,29 @@ class DefaultSiteSectionBuilder:
                 class_name=view["class_name"],
             )
 
-    def build(self, resource_identifiers=None):
+    def build(self, resource_identifiers=None, manifest=None):
+        """Render a page for every resource in the source store, or for the resources in resource_identifiers only.
+
+        :param resource_identifiers: if given, only these resources are rendered
+        :param manifest: a SiteBuildManifest; if given, resources whose serialized content did not change since they
+        were last rendered are skipped, and the manifest is updated with the resources that are rendered
+        """
+        if manifest is not None:
+            manifest.set_section_renderers(
+                self.name,
+                renderer=self.renderer_class.__class__.__name__,
+                view=self.view_class.__class__.__name__,
+            )
+
         source_store_keys = self.source_store.list_keys()
         if self.name == "validations" and self.validation_results_limit:
             source_store_keys = sorted(
                 source_store_keys, key=lambda x: x.run_id.run_time, reverse=True
             )[: self.validation_results_limit]
 
+        if resource_identifiers:
+            resource_identifiers = set(resource_identifiers)
+        resource_keys = []
         for resource_key in source_store_keys:
             # if no resource_identifiers are passed, the section
             # builder will build
@@ -405,72 +470,254 @@ class DefaultSiteSectionBuilder:
                     resource_key, self.run_name_filter
                 ):
                     continue
-            try:
-                resource = self.source_store.get(resource_key)
-            except exceptions.InvalidKeyError:
-                logger.warning(
-                    f"Object with Key: {str(resource_key)} could not be retrieved. Skipping..."
-                )
+            resource_keys.append(resource_key)
+
+        if (
+            self.concurrency
+            and self.concurrency.get("enabled", True)
+            and len(resource_keys) > 1
+        ):
+            self._build_concurrently(resource_keys, manifest)
+            return
+
+        for resource_key in resource_keys:
+            fetched_resource = self._fetch_resource(resource_key, manifest)
+            if fetched_resource is None:
                 continue
+            resource, content_hash = fetched_resource
 
-            if isinstance(resource_key, ExpectationSuiteIdentifier):
-                expectation_suite_name = resource_key.expectation_suite_name
-                logger.debug(
-                    "        Rendering expectation suite {}".format(
-                        expectation_suite_name
-                    )
+            self._log_rendering(resource_key)
+            try:
+                viewable_content = self._render_page(resource)
+                self._write_page(
+                    resource_key, resource, content_hash, viewable_content, manifest
                 )
-            elif isinstance(resource_key, ValidationResultIdentifier):
-                run_id = resource_key.run_id
-                run_name = run_id.run_name
-                run_time = run_id.run_time
-                expectation_suite_name = (
-                    resource_key.expectation_suite_identifier.expectation_suite_name
+            except Exception as e:
+                self._log_rendering_error(e)
+
+    def _build_concurrently(self, resource_keys, manifest):
+        """Render the pages of the given resources in parallel, as configured by the ``concurrency`` argument, e.g.::
+
+            {"enabled": True, "executor": "process", "max_workers": 8}
+
+        With the "process" executor (the default), pages are rendered in a pool of worker processes that instantiate
+        the section's renderer and view from their configuration (without a data context); with "thread", they are
+        rendered by the section's own renderer and view in a pool of threads. Source objects are fetched, and pages
+        written to the target store, by a pool of threads. Resources are processed in chunks, so that only a few
+        chunks of source objects and pages are held in memory at any time. Pages that the executor cannot render
+        (because its pool broke, or a page could not be pickled) are rendered serially instead.
+        """
+        max_workers = self.concurrency.get("max_workers") or os.cpu_count() or 1
+        chunk_size = self.concurrency.get("chunk_size") or 4 * max_workers
+
+        if self.concurrency.get("executor", "process") == "process":
+            render_executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_initialize_page_render_worker,
+                initargs=(
+                    self._renderer_config,
+                    self._view_config,
+                    self._custom_styles_directory,
+                    self._custom_views_directory,
+                ),
+            )
+            render_fn = partial(
+                _render_page_in_worker,
+                data_context_id=self.data_context_id,
+                show_how_to_buttons=self.show_how_to_buttons,
+            )
+            # Resources are pickled before they are submitted, so that a resource that cannot be pickled fails here
+            # rather than in the feeder thread of the pool
+            serialize_resource = partial(pickle.dumps, protocol=pickle.HIGHEST_PROTOCOL)
+        else:
+            render_executor = ThreadPoolExecutor(max_workers=max_workers)
+            render_fn = self._render_page
+            serialize_resource = None
+
+        # Once the pool of the render executor is broken (e.g. a worker process died), all remaining pages are
+        # rendered serially; a page that cannot be pickled to or from a worker is rendered serially on its own.
+        render_executor_broken = False
+        with render_executor, ThreadPoolExecutor(
+            max_workers=max_workers
+        ) as io_executor:
+            for chunk_start in range(0, len(resource_keys), chunk_size):
+                chunk_keys = resource_keys[chunk_start : chunk_start + chunk_size]
+                fetched_resources = io_executor.map(
+                    partial(self._fetch_resource, manifest=manifest), chunk_keys
                 )
-                if self.name == "profiling":
-                    logger.debug(
-                        "        Rendering profiling for batch {}".format(
-                            resource_key.batch_identifier
+
+                render_futures = {}
+                pages_to_render_serially = []
+                for resource_key, fetched_resource in zip(
+                    chunk_keys, fetched_resources
+                ):
+                    if fetched_resource is None:
+                        continue
+                    resource, content_hash = fetched_resource
+                    self._log_rendering(resource_key)
+                    page = (resource_key, resource, content_hash)
+                    if render_executor_broken:
+                        pages_to_render_serially.append(page)
+                        continue
+                    try:
+                        task = (
+                            resource
+                            if serialize_resource is None
+                            else serialize_resource(resource)
+                        )
+                    except Exception as e:
+                        self._log_render_executor_error(e)
+                        pages_to_render_serially.append(page)
+                        continue
+                    try:
+                        render_futures[render_executor.submit(render_fn, task)] = page
+                    except BrokenExecutor as e:
+                        render_executor_broken = True
+                        self._log_render_executor_error(e)
+                        pages_to_render_serially.append(page)
+
+                write_futures = []
+                for render_future in as_completed(render_futures):
+                    page = render_futures[render_future]
+                    try:
+                        viewable_content = render_future.result()
+                    except BrokenExecutor as e:
+                        if not render_executor_broken:
+                            render_executor_broken = True
+                            self._log_render_executor_error(e)
+                        pages_to_render_serially.append(page)
+                        continue
+                    except Exception as e:
+                        if _is_pickling_error(e):
+                            self._log_render_executor_error(e)
+                            pages_to_render_serially.append(page)
+                        else:
+                            self._log_rendering_error(e)
+                        continue
+                    write_futures.append(
+                        io_executor.submit(
+                            self._write_page, *page, viewable_content, manifest
                         )
                     )
-                else:
-
-                    logger.debug(
-                        "        Rendering validation: run name: {}, run time: {}, suite {} for batch {}".format(
-                            run_name,
-                            run_time,
-                            expectation_suite_name,
-                            resource_key.batch_identifier,
+
+                for page in pages_to_render_serially:
+                    resource_key, resource, content_hash = page
+                    try:
+                        viewable_content = self._render_page(resource)
+                    except Exception as e:
+                        self._log_rendering_error(e)
+                        continue
+                    write_futures.append(
+                        io_executor.submit(
+                            self._write_page, *page, viewable_content, manifest
                         )
                     )
 
-            try:
-                rendered_content = self.renderer_class.render(resource)
-                viewable_content = self.view_class.render(
-                    rendered_content,
-                    data_context_id=self.data_context_id,
-                    show_how_to_buttons=self.show_how_to_buttons,
+                for write_future in as_completed(write_futures):
+                    try:
+                        write_future.result()
+                    except Exception as e:
+                        self._log_rendering_error(e)
+
+    def _fetch_resource(self, resource_key, manifest=None):
+        """Return the resource and the hash of its serialized content (when building with a manifest), or None if
+        the resource cannot be retrieved or its page is up to date."""
+        content_hash = None
+        try:
+            if manifest is None:
+                resource = self.source_store.get(resource_key)
+            else:
+                serialized_resource = self.source_store.store_backend.get(
+                    self.source_store.key_to_tuple(resource_key)
                 )
+                content_hash = _get_content_hash(serialized_resource)
+                if manifest.is_up_to_date(self.name, resource_key, content_hash):
+                    return None
+                resource = self.source_store.deserialize(
+                    resource_key, serialized_resource
+                )
+        except exceptions.InvalidKeyError:
+            logger.warning(
+                f"Object with Key: {str(resource_key)} could not be retrieved. Skipping..."
+            )
+            return None
+        return resource, content_hash
+
+    def _log_rendering(self, resource_key):
+        if isinstance(resource_key, ExpectationSuiteIdentifier):
+            expectation_suite_name = resource_key.expectation_suite_name
+            logger.debug(
+                "        Rendering expectation suite {}".format(expectation_suite_name)
+            )
+        elif isinstance(resource_key, ValidationResultIdentifier):
+            run_id = resource_key.run_id
+            run_name = run_id.run_name
+            run_time = run_id.run_time
+            expectation_suite_name = (
+                resource_key.expectation_suite_identifier.expectation_suite_name
+            )
+            if self.name == "profiling":
+                logger.debug(
+                    "        Rendering profiling for batch {}".format(
+                        resource_key.batch_identifier
+                    )
+                )
+            else:
 
-                self.target_store.set(
-                    SiteSectionIdentifier(
-                        site_section_name=self.name,
-                        resource_identifier=resource_key,
-                    ),
-                    viewable_content,
+                logger.debug(
+                    "        Rendering validation: run name: {}, run time: {}, suite {} for batch {}".format(
+                        run_name,
+                        run_time,
+                        expectation_suite_name,
+                        resource_key.batch_identifier,
+                    )
                 )
-            except Exception as e:
-                exception_message = f"""\
+
+    def _render_page(self, resource):
+        rendered_content = self.renderer_class.render(resource)
+        return self.view_class.render(
+            rendered_content,
+            data_context_id=self.data_context_id,
+            show_how_to_buttons=self.show_how_to_buttons,
+        )
+
+    def _write_page(
+        self, resource_key, resource, content_hash, viewable_content, manifest=None
+    ):
+        self.target_store.set(
+            SiteSectionIdentifier(
+                site_section_name=self.name,
+                resource_identifier=resource_key,
+            ),
+            viewable_content,
+        )
+        if manifest is not None:
+            manifest.set_resource(
+                self.name,
+                resource_key,
+                content_hash=content_hash,
+                index_info=_get_index_info(resource),
+            )
+
+    @staticmethod
+    def _log_render_executor_error(e):
+        logger.warning(
+            f'A page could not be rendered by the render executor ({type(e).__name__}: "{str(e)}"); rendering it '
+            f"with the section's own renderer and view instead."
+        )
+
+    @staticmethod
+    def _log_rendering_error(e):
+        exception_message = f"""\
 An unexpected Exception occurred during data docs rendering.  Because of this error, certain parts of data docs will \
 not be rendered properly and/or may not appear altogether.  Please use the trace, included in this message, to \
 diagnose and repair the underlying issue.  Detailed information follows:
                 """
-                exception_traceback = traceback.format_exc()
-                exception_message += (
-                    f'{type(e).__name__}: "{str(e)}".  '
-                    f'Traceback: "{exception_traceback}".'
-                )
-                logger.error(exception_message)
+        exception_traceback = traceback.format_exc()
+        exception_message += (
+            f'{type(e).__name__}: "{str(e)}".  ' f'Traceback: "{exception_traceback}".'
+        )
+        logger.error(exception_message)
 
 
 class DefaultSiteIndexBuilder:
@@ -489,6 +736,7 @@ class DefaultSiteIndexBuilder:
         view=None,
         data_context_id=None,
         source_stores=None,
+        index_page_size=None,
         **kwargs,
     ):
         # NOTE: This method is almost identical to DefaultSiteSectionBuilder
@@ -501,6 +749,7 @@ class DefaultSiteIndexBuilder:
         self.show_how_to_buttons = show_how_to_buttons
         self.source_stores = source_stores or {}
         self.site_section_builders_config = site_section_builders_config or {}
+        self.index_page_size = index_page_size
 
         if renderer is None:
             renderer = {
@@ -688,12 +937,32 @@ class DefaultSiteIndexBuilder:
 
         return results
 
+    def _get_validation_index_info(self, section_name, validation_result_key, manifest):
+        """Return the information the index page shows about a validation (or profiling) result, from the manifest
+        when the result was rendered by an incremental build, or else from the result itself."""
+        if manifest is not None:
+            index_info = manifest.get_index_info(section_name, validation_result_key)
+            if index_info is not None:
+                return index_info
+
+        validation = self.data_context.get_validation_result(
+            batch_identifier=validation_result_key.batch_identifier,
+            expectation_suite_name=validation_result_key.expectation_suite_identifier.expectation_suite_name,
+            run_id=validation_result_key.run_id,
+            validations_store_name=self.source_stores.get(section_name),
+        )
+        return _get_index_info(validation)
+
     # TODO: deprecate dual batch api support
-    def build(self, skip_and_clean_missing=True, build_index: bool = True):
+    def build(
+        self, skip_and_clean_missing=True, build_index: bool = True, manifest=None
+    ):
         """
         :param skip_and_clean_missing: if True, target html store keys without corresponding source store keys will
         be skipped and removed from the target store
         :param build_index: a flag if False, skips building the index page
+        :param manifest: a SiteBuildManifest; if given, the links to validation and profiling results are built from
+        the information recorded in it when their pages were rendered, instead of reading every result again
         :return: tuple(index_page_url, index_links_dict)
         """
 
@@ -715,11 +984,13 @@ class DefaultSiteIndexBuilder:
             and self.site_section_builders_config.get("expectations", "None")
             not in FALSEY_YAML_STRINGS
         ):
-            expectation_suite_source_keys = self.data_context.stores[
-                self.site_section_builders_config["expectations"].get(
-                    "source_store_name"
-                )
-            ].list_keys()
+            expectation_suite_source_keys = set(
+                self.data_context.stores[
+                    self.site_section_builders_config["expectations"].get(
+                        "source_store_name"
+                    )
+                ].list_keys()
+            )
             expectation_suite_site_keys = [
                 ExpectationSuiteIdentifier.from_tuple(expectation_suite_tuple)
                 for expectation_suite_tuple in self.target_store.store_backends[
@@ -733,6 +1004,8 @@ class DefaultSiteIndexBuilder:
                         self.target_store.store_backends[
                             ExpectationSuiteIdentifier
                         ].remove_key(expectation_suite_site_key)
+                        if manifest is not None:
+                            manifest.remove_resource(expectation_suite_site_key)
                     else:
                         cleaned_keys.append(expectation_suite_site_key)
                 expectation_suite_site_keys = cleaned_keys
@@ -762,9 +1035,13 @@ class DefaultSiteIndexBuilder:
                 not in FALSEY_YAML_STRINGS
                 else "profiling"
             )
-            validation_and_profiling_result_source_keys = self.data_context.stores[
-                self.site_section_builders_config[source_store].get("source_store_name")
-            ].list_keys()
+            validation_and_profiling_result_source_keys = set(
+                self.data_context.stores[
+                    self.site_section_builders_config[source_store].get(
+                        "source_store_name"
+                    )
+                ].list_keys()
+            )
             validation_and_profiling_result_site_keys = [
                 ValidationResultIdentifier.from_tuple(validation_result_tuple)
                 for validation_result_tuple in self.target_store.store_backends[
@@ -783,6 +1060,8 @@ class DefaultSiteIndexBuilder:
                         self.target_store.store_backends[
                             ValidationResultIdentifier
                         ].remove_key(validation_result_site_key)
+                        if manifest is not None:
+                            manifest.remove_resource(validation_result_site_key)
                     else:
                         cleaned_keys.append(validation_result_site_key)
                 validation_and_profiling_result_site_keys = cleaned_keys
@@ -805,15 +1084,12 @@ class DefaultSiteIndexBuilder:
             ]
             for profiling_result_key in profiling_result_site_keys:
                 try:
-                    validation = self.data_context.get_validation_result(
-                        batch_identifier=profiling_result_key.batch_identifier,
-                        expectation_suite_name=profiling_result_key.expectation_suite_identifier.expectation_suite_name,
-                        run_id=profiling_result_key.run_id,
-                        validations_store_name=self.source_stores.get("profiling"),
+                    index_info = self._get_validation_index_info(
+                        "profiling", profiling_result_key, manifest
                     )
 
-                    batch_kwargs = validation.meta.get("batch_kwargs", {})
-                    batch_spec = validation.meta.get("batch_spec", {})
+                    batch_kwargs = index_info["batch_kwargs"]
+                    batch_spec = index_info["batch_spec"]
 
                     self.add_resource_info_to_index_links_dict(
                         index_links_dict=index_links_dict,
@@ -861,16 +1137,13 @@ class DefaultSiteIndexBuilder:
                 ]
             for validation_result_key in validation_result_site_keys:
                 try:
-                    validation = self.data_context.get_validation_result(
-                        batch_identifier=validation_result_key.batch_identifier,
-                        expectation_suite_name=validation_result_key.expectation_suite_identifier.expectation_suite_name,
-                        run_id=validation_result_key.run_id,
-                        validations_store_name=self.source_stores.get("validations"),
+                    index_info = self._get_validation_index_info(
+                        "validations", validation_result_key, manifest
                     )
 
-                    validation_success = validation.success
-                    batch_kwargs = validation.meta.get("batch_kwargs", {})
-                    batch_spec = validation.meta.get("batch_spec", {})
+                    validation_success = index_info["validation_success"]
+                    batch_kwargs = index_info["batch_kwargs"]
+                    batch_spec = index_info["batch_spec"]
 
                     self.add_resource_info_to_index_links_dict(
                         index_links_dict=index_links_dict,
@@ -892,29 +1165,206 @@ class DefaultSiteIndexBuilder:
                     )
                     logger.warning(error_msg)
 
-        try:
-            rendered_content = self.renderer_class.render(index_links_dict)
-            viewable_content = self.view_class.render(
-                rendered_content,
-                data_context_id=self.data_context_id,
-                show_how_to_buttons=self.show_how_to_buttons,
-            )
-        except Exception as e:
-            exception_message = f"""\
+        index_page_url = None
+        index_pages = self._get_index_pages(index_links_dict)
+        # Pages are rendered and written one at a time, so that only one page is held in memory
+        for page_number, index_page_links_dict in enumerate(index_pages, start=1):
+            try:
+                rendered_content = self.renderer_class.render(index_page_links_dict)
+                viewable_content = self.view_class.render(
+                    rendered_content,
+                    data_context_id=self.data_context_id,
+                    show_how_to_buttons=self.show_how_to_buttons,
+                )
+            except Exception as e:
+                exception_message = f"""\
 An unexpected Exception occurred during data docs rendering.  Because of this error, certain parts of data docs will \
 not be rendered properly and/or may not appear altogether.  Please use the trace, included in this message, to \
 diagnose and repair the underlying issue.  Detailed information follows:
-            """
-            exception_traceback = traceback.format_exc()
-            exception_message += (
-                f'{type(e).__name__}: "{str(e)}".  Traceback: "{exception_traceback}".'
-            )
-            logger.error(exception_message)
+                """
+                exception_traceback = traceback.format_exc()
+                exception_message += f'{type(e).__name__}: "{str(e)}".  Traceback: "{exception_traceback}".'
+                logger.error(exception_message)
+                continue
 
-        return (self.target_store.write_index_page(viewable_content), index_links_dict)
+            page_url = self.target_store.write_index_page(
+                viewable_content, page_number=page_number
+            )
+            if page_number == 1:
+                index_page_url = page_url
+        self.target_store.remove_index_pages(first_page_number=len(index_pages) + 1)
+
+        return index_page_url, index_links_dict
+
+    def _get_index_pages(self, index_links_dict):
+        """Split the links of the index into pages of at most index_page_size links of each kind, each page linking
+        to the others; without an index_page_size, or when the links fit on one page, the index is a single page."""
+        link_keys = [key for key in index_links_dict if key.endswith("_links")]
+        link_count = max(
+            [len(index_links_dict[link_key]) for link_key in link_keys], default=0
+        )
+        if not self.index_page_size or link_count <= self.index_page_size:
+            return [index_links_dict]
+
+        page_count = math.ceil(link_count / self.index_page_size)
+        # The renderer consumes the calls to action of each page it renders, as it does those of a single-page index
+        cta_object = index_links_dict.pop("cta_object", None)
+        index_pages = []
+        for page_number in range(1, page_count + 1):
+            start = (page_number - 1) * self.index_page_size
+            index_page_links_dict = OrderedDict(index_links_dict)
+            if cta_object is not None:
+                index_page_links_dict["cta_object"] = cta_object
+            for link_key in link_keys:
+                index_page_links_dict[link_key] = index_links_dict[link_key][
+                    start : start + self.index_page_size
+                ]
+            index_page_links_dict["index_pagination"] = {
+                "page_number": page_number,
+                "page_filepaths": [
+                    self.target_store.get_index_page_filepath(number)
+                    for number in range(1, page_count + 1)
+                ],
+            }
+            index_pages.append(index_page_links_dict)
+        return index_pages
 
 
 class CallToActionButton:
     def __init__(self, title, link):
         self.title = title
         self.link = link
+
+
+class SiteBuildManifest:
+    """Record of the resources rendered into a data docs site, kept in the site's HtmlSiteStore between incremental
+    builds.
+
+    For each site section, the manifest records the renderer and view the section was rendered with and, for each
+    rendered resource, the hash of its serialized content, when its page was rendered, and the information shown
+    about it on the index page. The manifest is discarded when the version of Great Expectations changes, and a
+    section's resources are forgotten when its renderer or view changes, so that all their pages are rendered again.
+    """
+
+    def __init__(self, manifest_dict: Optional[dict] = None):
+        if not manifest_dict or manifest_dict.get("ge_version") != ge_version:
+            manifest_dict = {"ge_version": ge_version, "sections": {}}
+        self._manifest_dict = manifest_dict
+
+    @staticmethod
+    def _get_resource_manifest_key(resource_key) -> str:
+        # Resource keys map to unique page paths, so their tuples can be joined the same way
+        return "/".join(resource_key.to_tuple())
+
+    def _get_section(self, section_name: str) -> dict:
+        return self._manifest_dict["sections"].setdefault(
+            section_name, {"renderer": None, "view": None, "resources": {}}
+        )
+
+    def set_section_renderers(self, section_name: str, renderer: str, view: str):
+        section = self._get_section(section_name)
+        if section["renderer"] != renderer or section["view"] != view:
+            section.update(renderer=renderer, view=view, resources={})
+
+    def is_up_to_date(self, section_name: str, resource_key, content_hash: str) -> bool:
+        resource = self._get_section(section_name)["resources"].get(
+            self._get_resource_manifest_key(resource_key)
+        )
+        return resource is not None and resource["content_hash"] == content_hash
+
+    def set_resource(
+        self,
+        section_name: str,
+        resource_key,
+        content_hash: str,
+        index_info: Optional[dict] = None,
+    ):
+        self._get_section(section_name)["resources"][
+            self._get_resource_manifest_key(resource_key)
+        ] = {
+            "content_hash": content_hash,
+            "rendered_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "index_info": index_info,
+        }
+
+    def get_index_info(self, section_name: str, resource_key) -> Optional[dict]:
+        resource = self._get_section(section_name)["resources"].get(
+            self._get_resource_manifest_key(resource_key)
+        )
+        if resource is None:
+            return None
+        return resource["index_info"]
+
+    def remove_resource(self, resource_key):
+        resource_manifest_key = self._get_resource_manifest_key(resource_key)
+        for section in self._manifest_dict["sections"].values():
+            section["resources"].pop(resource_manifest_key, None)
+
+    def to_json_dict(self) -> dict:
+        return self._manifest_dict
+
+
+# The renderer and view of a worker process that renders pages for DefaultSiteSectionBuilder
+_page_render_worker_renderer = None
+_page_render_worker_view = None
+
+
+def _initialize_page_render_worker(
+    renderer_config, view_config, custom_styles_directory, custom_views_directory
+):
+    global _page_render_worker_renderer, _page_render_worker_view
+    _page_render_worker_renderer = instantiate_class_from_config(
+        config=renderer_config, runtime_environment={}
+    )
+    _page_render_worker_view = instantiate_class_from_config(
+        config=view_config,
+        runtime_environment={
+            "custom_styles_directory": custom_styles_directory,
+            "custom_views_directory": custom_views_directory,
+        },
+    )
+
+
+def _render_page_in_worker(
+    serialized_resource: bytes, data_context_id=None, show_how_to_buttons=True
+):
+    try:
+        resource = pickle.loads(serialized_resource)
+    except Exception as e:
+        raise pickle.UnpicklingError(
+            f'The resource could not be unpickled ({type(e).__name__}: "{str(e)}")'
+        )
+    rendered_content = _page_render_worker_renderer.render(resource)
+    return _page_render_worker_view.render(
+        rendered_content,
+        data_context_id=data_context_id,
+        show_how_to_buttons=show_how_to_buttons,
+    )
+
+
+def _is_pickling_error(e: Exception) -> bool:
+    """Whether an exception raised by a process pool means that a task or its result could not be pickled."""
+    return isinstance(e, pickle.PickleError) or (
+        isinstance(e, (AttributeError, TypeError)) and "pickle" in str(e)
+    )
+
+
+def _get_content_hash(serialized_resource) -> str:
+    if isinstance(serialized_resource, str):
+        serialized_resource = serialized_resource.encode("utf-8")
+    elif not isinstance(serialized_resource, bytes):
+        serialized_resource = json.dumps(
+            serialized_resource, sort_keys=True, default=str
+        ).encode("utf-8")
+    return hashlib.md5(serialized_resource).hexdigest()
+
+
+def _get_index_info(resource) -> Optional[dict]:
+    """The information about a validation result that DefaultSiteIndexBuilder shows on the index page."""
+    if not isinstance(resource, ExpectationSuiteValidationResult):
+        return None
+    return {
+        "validation_success": resource.success,
+        "batch_kwargs": resource.meta.get("batch_kwargs", {}),
+        "batch_spec": resource.meta.get("batch_spec", {}),
+    }
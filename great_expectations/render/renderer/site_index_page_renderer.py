@@ -357,6 +357,32 @@ class SiteIndexPageRenderer(Renderer):
             }
         )
 
+    @classmethod
+    def _generate_pagination_block(cls, index_pagination):
+        page_filepaths = index_pagination["page_filepaths"]
+        params = {"pages_prefix": "Pages:"}
+        params_styling = {}
+        for page_number, page_filepath in enumerate(page_filepaths, start=1):
+            params[f"page_{page_number}"] = str(page_number)
+            if page_number == index_pagination["page_number"]:
+                params_styling[f"page_{page_number}"] = {"tag": "strong"}
+            else:
+                params_styling[f"page_{page_number}"] = {
+                    "tag": "a",
+                    "attributes": {"href": page_filepath},
+                }
+        return RenderedStringTemplateContent(
+            **{
+                "content_block_type": "string_template",
+                "string_template": {
+                    "template": " ".join(f"${param}" for param in params),
+                    "params": params,
+                    "styling": {"params": params_styling},
+                },
+                "styling": {"classes": ["col-12", "ge-index-page-pagination"]},
+            }
+        )
+
     @classmethod
     def render(cls, index_links_dict):
         sections = []
@@ -391,6 +417,11 @@ class SiteIndexPageRenderer(Renderer):
             )
             content_blocks.append(site_name_header_block)
 
+            if index_links_dict.get("index_pagination"):
+                content_blocks.append(
+                    cls._generate_pagination_block(index_links_dict["index_pagination"])
+                )
+
             tabs = []
 
             if index_links_dict.get("validations_links"):
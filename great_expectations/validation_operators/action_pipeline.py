@@ -0,0 +1,177 @@
+import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Tuple
+
+from great_expectations.checkpoint.actions import ValidationAction
+
+logger = logging.getLogger(__name__)
+
+
+class ActionPipeline:
+    """Run the actions of an ActionListValidationOperator asynchronously, so that validating the next batch does not
+    wait for the actions of the previous one.
+
+    Each action waits only for the actions it depends on: the actions listed before it whose class (or a base class)
+    is named in its ``run_after`` attribute, and those named in the optional ``depends_on`` key of its action config.
+    Independent actions run concurrently in a pool of worker threads, but each action runs on one validation result
+    at a time, in the order they were submitted (so that, for instance, a data docs site is never built twice at
+    once). Notification actions (``is_notification``) are dispatched to a separate queue, so that slow webhooks do not
+    hold up the other actions, and are retried with an exponential backoff when they raise.
+
+    The payload passed to an action contains the results of the actions it depends on, directly or transitively.
+
+    Args:
+        action_list: the action configs of the operator, in order
+        actions: the instantiated actions, by name
+        max_workers: the maximum number of actions run at the same time
+        notification_max_workers: the maximum number of notifications sent at the same time
+        notification_max_retries: the number of times a failing notification is retried
+        notification_retry_delay: the number of seconds before the first retry; doubled for every further retry
+    """
+
+    def __init__(
+        self,
+        action_list: List[dict],
+        actions: Dict[str, ValidationAction],
+        max_workers: Optional[int] = None,
+        notification_max_workers: Optional[int] = 1,
+        notification_max_retries: int = 3,
+        notification_retry_delay: float = 1.0,
+    ):
+        self._actions = actions
+        self._action_classes = {
+            action_config["name"]: action_config["action"]["class_name"]
+            for action_config in action_list
+        }
+        self._dependencies = self._get_action_dependencies(action_list, actions)
+        self._notification_max_retries = notification_max_retries
+        self._previous_futures: Dict[str, Future] = {}
+        self._notification_retry_delay = notification_retry_delay
+
+        # Dependencies are always submitted before their dependents and both executors dequeue tasks in order, so the
+        # earliest unfinished task can always run: workers blocked on dependencies can never deadlock.
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="validation-action"
+        )
+        self._notification_executor = ThreadPoolExecutor(
+            max_workers=notification_max_workers,
+            thread_name_prefix="validation-notification",
+        )
+
+    @staticmethod
+    def _get_action_dependencies(
+        action_list: List[dict], actions: Dict[str, ValidationAction]
+    ) -> Dict[str, List[str]]:
+        dependencies = {}
+        action_names = []
+        for action_config in action_list:
+            name = action_config["name"]
+            depends_on = action_config.get("depends_on") or []
+            unknown_dependencies = set(depends_on) - set(action_names)
+            if len(unknown_dependencies) > 0:
+                raise ValueError(
+                    f'Action "{name}" depends on {sorted(unknown_dependencies)}, which must be listed before it in '
+                    f"the action_list."
+                )
+            run_after = getattr(actions[name], "run_after", ())
+            dependencies[name] = [
+                earlier_name
+                for earlier_name in action_names
+                if earlier_name in depends_on
+                or any(
+                    action_class.__name__ in run_after
+                    for action_class in type(actions[earlier_name]).__mro__
+                )
+            ]
+            action_names.append(name)
+        return dependencies
+
+    def submit(
+        self, validation_result_suite_identifier, validation_result_suite, data_asset
+    ) -> Dict[str, Future]:
+        """Schedule all actions on one validation result.
+
+        Returns:
+            a future for the result of each action, by action name, in the order of the action list
+        """
+        futures = {}
+        for name, action in self._actions.items():
+            dependency_futures = {
+                dependency: futures[dependency]
+                for dependency in self._dependencies[name]
+            }
+            if getattr(action, "is_notification", False):
+                executor = self._notification_executor
+                max_retries = self._notification_max_retries
+            else:
+                executor = self._executor
+                max_retries = 0
+            futures[name] = executor.submit(
+                self._run_action,
+                name,
+                dependency_futures,
+                self._previous_futures.get(name),
+                max_retries,
+                validation_result_suite_identifier=validation_result_suite_identifier,
+                validation_result_suite=validation_result_suite,
+                data_asset=data_asset,
+            )
+        self._previous_futures.update(futures)
+        return futures
+
+    def _run_action(
+        self,
+        name: str,
+        dependency_futures: Dict[str, Future],
+        previous_future: Optional[Future],
+        max_retries: int,
+        **kwargs,
+    ) -> Tuple[dict, dict]:
+        if previous_future is not None:
+            # Failures are reported for the validation result they occurred on
+            wait([previous_future])
+        payload = {}
+        for dependency_future in dependency_futures.values():
+            # Each dependency's result carries the payload it was given, so the payload is transitive
+            dependency_payload, _ = dependency_future.result()
+            payload.update(dependency_payload)
+        for dependency, dependency_future in dependency_futures.items():
+            payload[dependency] = dependency_future.result()[1]
+        # Keep the payload in the order of the action list
+        payload = {
+            action_name: payload[action_name]
+            for action_name in self._actions
+            if action_name in payload
+        }
+
+        retry_delay = self._notification_retry_delay
+        for attempt in range(max_retries + 1):
+            logger.debug(f"Processing validation action with name {name}")
+            try:
+                action_result = self._actions[name].run(payload=dict(payload), **kwargs)
+                break
+            except Exception:
+                if attempt == max_retries:
+                    logger.exception(f"Error running action with name {name}")
+                    raise
+                logger.warning(
+                    f"Error running action with name {name}; retrying in {retry_delay} seconds",
+                    exc_info=True,
+                )
+                time.sleep(retry_delay)
+                retry_delay *= 2
+
+        action_result = {} if action_result is None else action_result
+        action_result["class"] = self._action_classes[name]
+        return payload, action_result
+
+    @staticmethod
+    def get_results(futures: Dict[str, Future]) -> dict:
+        """Wait for the actions scheduled by ``submit`` and return their results by action name, raising the error of
+        the first action (in the order of the action list) that failed."""
+        return {name: future.result()[1] for name, future in futures.items()}
+
+    def shutdown(self, wait: bool = True):
+        self._executor.shutdown(wait=wait)
+        self._notification_executor.shutdown(wait=wait)
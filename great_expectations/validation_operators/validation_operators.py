@@ -13,6 +13,7 @@ from great_expectations.data_context.types.resource_identifiers import (
     ValidationResultIdentifier,
 )
 from great_expectations.data_context.util import instantiate_class_from_config
+from great_expectations.validation_operators.action_pipeline import ActionPipeline
 from great_expectations.validation_operators.types.validation_operator_result import (
     ValidationOperatorResult,
 )
@@ -123,6 +124,26 @@ class ActionListValidationOperator(ValidationOperator):
               class_name: UpdateDataDocsAction
 
 
+    **Asynchronous actions**
+
+    By default, the actions are run one after the other once each batch is validated. With the ``concurrency``
+    argument (the ``action_concurrency`` key of a Checkpoint's runtime_configuration), the actions run in the
+    background through an :py:class:`ActionPipeline<great_expectations.validation_operators.action_pipeline.ActionPipeline>`
+    while the next batch is validated, and the operator waits for them before returning:
+
+    .. code-block:: yaml
+
+        concurrency:
+          enabled: true
+          max_workers: 4
+          notification_max_retries: 3
+          notification_retry_delay: 1.0
+
+    Independent actions run concurrently; an action runs after the actions named in the ``run_after`` attribute of
+    its class (e.g. ``UpdateDataDocsAction`` after ``StoreValidationResultAction``) and in the optional ``depends_on``
+    list of its action config. Notification actions are sent from a separate queue and retried when they fail.
+
+
     **Invocation**
 
     This is an example of invoking an instance of a Validation Operator from Python:
@@ -190,10 +211,12 @@ class ActionListValidationOperator(ValidationOperator):
         action_list,
         name,
         result_format={"result_format": "SUMMARY"},
+        concurrency=None,
     ):
         super().__init__()
         self.data_context = data_context
         self.name = name
+        self.concurrency = concurrency
 
         result_format = parse_result_format(result_format)
         assert result_format["result_format"] in [
@@ -209,9 +232,17 @@ class ActionListValidationOperator(ValidationOperator):
         for action_config in action_list:
             assert isinstance(action_config, dict)
             # NOTE: Eugene: 2019-09-23: need a better way to validate an action config:
-            if not set(action_config.keys()) == {"name", "action"}:
+            if (
+                not {"name", "action"}
+                <= set(action_config.keys())
+                <= {
+                    "name",
+                    "action",
+                    "depends_on",
+                }
+            ):
                 raise KeyError(
-                    'Action config keys must be ("name", "action"). Instead got {}'.format(
+                    'Action config keys must be ("name", "action") and optionally "depends_on". Instead got {}'.format(
                         action_config.keys()
                     )
                 )
@@ -243,8 +274,37 @@ class ActionListValidationOperator(ValidationOperator):
                     "result_format": self.result_format,
                 },
             }
+            if self.concurrency is not None:
+                self._validation_operator_config["kwargs"][
+                    "concurrency"
+                ] = self.concurrency
         return self._validation_operator_config
 
+    def _build_action_pipeline(self):
+        """Build the ActionPipeline that runs the actions asynchronously, or return None to run them synchronously
+        after each batch is validated.
+
+        The pipeline is driven by the ``concurrency`` argument of the operator, e.g.::
+
+            {"enabled": True, "max_workers": 4, "notification_max_retries": 3, "notification_retry_delay": 1.0}
+        """
+        if not self.concurrency or not self.concurrency.get("enabled", True):
+            return None
+        pipeline_kwargs = {
+            key: value
+            for key, value in self.concurrency.items()
+            if key
+            in (
+                "max_workers",
+                "notification_max_workers",
+                "notification_max_retries",
+                "notification_retry_delay",
+            )
+        }
+        return ActionPipeline(
+            action_list=self.action_list, actions=self.actions, **pipeline_kwargs
+        )
+
     def _build_batch_from_item(self, item):
         """Internal helper method to take an asset to validate, which can be either:
           (1) a DataAsset; or
@@ -305,40 +365,60 @@ class ActionListValidationOperator(ValidationOperator):
             run_id = RunIdentifier(run_name=run_name, run_time=run_time)
 
         run_results = {}
+        action_pipeline = self._build_action_pipeline()
+        pending_actions = {}
 
-        for item in assets_to_validate:
-            run_result_obj = {}
-            batch = self._build_batch_from_item(item)
-
-            if hasattr(batch, "active_batch_id"):
-                batch_identifier = batch.active_batch_id
-            else:
-                batch_identifier = batch.batch_id
+        try:
+            for item in assets_to_validate:
+                run_result_obj = {}
+                batch = self._build_batch_from_item(item)
 
-            expectation_suite_identifier = ExpectationSuiteIdentifier(
-                expectation_suite_name=batch._expectation_suite.expectation_suite_name
-            )
-            validation_result_id = ValidationResultIdentifier(
-                batch_identifier=batch_identifier,
-                expectation_suite_identifier=expectation_suite_identifier,
-                run_id=run_id,
-            )
-            batch_validation_result = batch.validate(
-                run_id=run_id,
-                result_format=result_format if result_format else self.result_format,
-                evaluation_parameters=evaluation_parameters,
-            )
-            run_result_obj["validation_result"] = batch_validation_result
-            batch_actions_results = self._run_actions(
-                batch,
-                expectation_suite_identifier,
-                batch._expectation_suite,
-                batch_validation_result,
-                run_id,
-            )
+                if hasattr(batch, "active_batch_id"):
+                    batch_identifier = batch.active_batch_id
+                else:
+                    batch_identifier = batch.batch_id
 
-            run_result_obj["actions_results"] = batch_actions_results
-            run_results[validation_result_id] = run_result_obj
+                expectation_suite_identifier = ExpectationSuiteIdentifier(
+                    expectation_suite_name=batch._expectation_suite.expectation_suite_name
+                )
+                validation_result_id = ValidationResultIdentifier(
+                    batch_identifier=batch_identifier,
+                    expectation_suite_identifier=expectation_suite_identifier,
+                    run_id=run_id,
+                )
+                batch_validation_result = batch.validate(
+                    run_id=run_id,
+                    result_format=result_format
+                    if result_format
+                    else self.result_format,
+                    evaluation_parameters=evaluation_parameters,
+                )
+                run_result_obj["validation_result"] = batch_validation_result
+                if action_pipeline is None:
+                    batch_actions_results = self._run_actions(
+                        batch,
+                        expectation_suite_identifier,
+                        batch._expectation_suite,
+                        batch_validation_result,
+                        run_id,
+                    )
+                    run_result_obj["actions_results"] = batch_actions_results
+                else:
+                    # The actions run in the background while the next batch is validated
+                    pending_actions[validation_result_id] = action_pipeline.submit(
+                        validation_result_suite_identifier=validation_result_id,
+                        validation_result_suite=batch_validation_result,
+                        data_asset=batch,
+                    )
+                run_results[validation_result_id] = run_result_obj
+
+            for validation_result_id, action_futures in pending_actions.items():
+                run_results[validation_result_id][
+                    "actions_results"
+                ] = action_pipeline.get_results(action_futures)
+        finally:
+            if action_pipeline is not None:
+                action_pipeline.shutdown()
 
         return ValidationOperatorResult(
             run_id=run_id,
@@ -1,5 +1,4 @@
-import copy
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from great_expectations.core.id_dict import IDDict
 
@@ -47,10 +46,11 @@ class MetricConfiguration:
 
     @property
     def id(self) -> Tuple[str, str, str]:
+        # The kwargs ids are memoized by IDDict, so this is cheap enough to call on every graph operation
         return (
-            self.metric_name,
-            self.metric_domain_kwargs_id,
-            self.metric_value_kwargs_id,
+            self._metric_name,
+            self._metric_domain_kwargs.to_id(),
+            self._metric_value_kwargs.to_id(),
         )
 
 
@@ -75,19 +75,149 @@ class MetricEdge:
 
 
 class ValidationGraph:
+    """A directed graph of metric dependencies, indexed by MetricConfiguration id.
+
+    Each edge points from a metric (left) to one of the metrics it depends on (right). Alongside the edge list,
+    the graph maintains adjacency sets in both directions so that ready metrics can be scheduled level by level
+    without rescanning (or copying) the edges.
+    """
+
     def __init__(self, edges: Optional[List[MetricEdge]] = None):
-        if edges:
-            self._edges = edges
-        else:
-            self._edges = []
+        self._edges = []
+        self._edge_ids = set()
+        self._metric_configurations = dict()
+        self._dependencies = dict()
+        self._dependents = dict()
 
-        self._edge_ids = {edge.id for edge in self._edges}
+        if edges:
+            for edge in edges:
+                self.add(edge)
 
     def add(self, edge: MetricEdge):
-        if edge.id not in self._edge_ids:
-            self._edges.append(edge)
-            self._edge_ids.add(edge.id)
+        edge_id = edge.id
+        if edge_id in self._edge_ids:
+            return
+
+        self._edges.append(edge)
+        self._edge_ids.add(edge_id)
+
+        left_id = edge.left.id
+        self._add_metric_configuration(left_id, edge.left)
+        if edge.right is not None:
+            right_id = edge.right.id
+            self._add_metric_configuration(right_id, edge.right)
+            self._dependencies[left_id].add(right_id)
+            self._dependents[right_id].add(left_id)
+
+    def _add_metric_configuration(
+        self, metric_id: Tuple[str, str, str], metric_configuration: MetricConfiguration
+    ):
+        if metric_id not in self._metric_configurations:
+            self._metric_configurations[metric_id] = metric_configuration
+            self._dependencies[metric_id] = set()
+            self._dependents[metric_id] = set()
 
     @property
     def edges(self):
-        return copy.deepcopy(self._edges)
+        return list(self._edges)
+
+    @property
+    def metric_configurations(self) -> Dict[Tuple[str, str, str], MetricConfiguration]:
+        return dict(self._metric_configurations)
+
+    def get_dependency_ids(self, metric_id: Tuple[str, str, str]) -> Set[Tuple]:
+        return set(self._dependencies.get(metric_id, ()))
+
+    def get_dependent_ids(self, metric_id: Tuple[str, str, str]) -> Set[Tuple]:
+        return set(self._dependents.get(metric_id, ()))
+
+    def get_unresolved_metric_ids(self, metrics) -> Set[Tuple]:
+        """Return the ids of all metrics in the graph that are not present in ``metrics``."""
+        return {
+            metric_id
+            for metric_id in self._metric_configurations
+            if metric_id not in metrics
+        }
+
+    def get_required_metric_ids(
+        self, target_metric_ids: Iterable[Tuple], metrics
+    ) -> Set[Tuple]:
+        """Return the ids of the unresolved metrics needed to resolve the target metrics.
+
+        Dependencies are followed from the target metrics, stopping at metrics that are already present in
+        ``metrics``; unresolved metrics that are only needed by resolved metrics are therefore not required.
+        """
+        required_metric_ids = set()
+        stack = [
+            metric_id
+            for metric_id in target_metric_ids
+            if metric_id in self._metric_configurations
+        ]
+        while stack:
+            metric_id = stack.pop()
+            if metric_id in metrics or metric_id in required_metric_ids:
+                continue
+            required_metric_ids.add(metric_id)
+            stack.extend(self._dependencies[metric_id])
+        return required_metric_ids
+
+    def subgraph(self, metric_ids: Iterable[Tuple]) -> "ValidationGraph":
+        """Return a new ValidationGraph restricted to the given metrics and the dependencies among them."""
+        metric_ids = set(metric_ids)
+        graph = ValidationGraph()
+        for metric_id in metric_ids:
+            metric_configuration = self._metric_configurations[metric_id]
+            dependency_ids = self._dependencies[metric_id] & metric_ids
+            if not dependency_ids:
+                graph.add(MetricEdge(metric_configuration, None))
+            for dependency_id in dependency_ids:
+                graph.add(
+                    MetricEdge(
+                        metric_configuration,
+                        self._metric_configurations[dependency_id],
+                    )
+                )
+        return graph
+
+    def resolution_levels(self, metrics) -> Iterator[List[MetricConfiguration]]:
+        """Topologically schedule the unresolved metrics of the graph.
+
+        Yields lists of metric configurations whose dependencies are all available in ``metrics``. The caller is
+        expected to add the resolved values of each yielded level to ``metrics`` before advancing the iterator; the
+        next level then contains the metrics whose last outstanding dependency was just resolved. Metrics that are
+        never resolved (or that participate in a dependency cycle) block their dependents, which are not yielded.
+
+        Args:
+            metrics: a mapping (or other container) of already-resolved metric ids
+
+        Returns:
+            an iterator over lists of ready MetricConfiguration objects
+        """
+        unresolved_dependency_counts = dict()
+        ready_ids = []
+        for metric_id, dependency_ids in self._dependencies.items():
+            if metric_id in metrics:
+                continue
+            num_unresolved = sum(
+                1 for dependency_id in dependency_ids if dependency_id not in metrics
+            )
+            if num_unresolved == 0:
+                ready_ids.append(metric_id)
+            else:
+                unresolved_dependency_counts[metric_id] = num_unresolved
+
+        while ready_ids:
+            yield [self._metric_configurations[metric_id] for metric_id in ready_ids]
+
+            next_ready_ids = []
+            for metric_id in ready_ids:
+                if metric_id not in metrics:
+                    continue
+                for dependent_id in self._dependents[metric_id]:
+                    if dependent_id not in unresolved_dependency_counts:
+                        continue
+                    unresolved_dependency_counts[dependent_id] -= 1
+                    if unresolved_dependency_counts[dependent_id] == 0:
+                        del unresolved_dependency_counts[dependent_id]
+                        next_ready_ids.append(dependent_id)
+            ready_ids = next_ready_ids
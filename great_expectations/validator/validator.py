@@ -3,12 +3,15 @@ import datetime
 import inspect
 import json
 import logging
+import math
+import time
 import traceback
 import warnings
 from collections import defaultdict, namedtuple
 from collections.abc import Hashable
 from typing import Any, Dict, Iterable, List, Optional
 
+import numpy as np
 import pandas as pd
 from dateutil.parser import parse
 
@@ -23,7 +26,10 @@ from great_expectations.core.expectation_validation_result import (
     ExpectationSuiteValidationResult,
     ExpectationValidationResult,
 )
+from great_expectations.core.id_dict import IDDict
+from great_expectations.core.metric import BatchMetricIdentifier
 from great_expectations.core.run_identifier import RunIdentifier
+from great_expectations.core.util import convert_to_json_serializable
 from great_expectations.data_asset.util import recursively_convert_to_json_serializable
 from great_expectations.dataset import PandasDataset, SparkDFDataset, SqlAlchemyDataset
 from great_expectations.dataset.sqlalchemy_dataset import SqlAlchemyBatchReference
@@ -60,6 +66,7 @@ class Validator:
         expectation_suite_name=None,
         data_context=None,
         batches=None,
+        batch_metric_store=None,
         **kwargs,
     ):
         """
@@ -74,10 +81,14 @@ class Validator:
         *args, **kwargs, and a named kwarg...so we use the inelegant solution of popping from kwargs, leaving the
         support for the profiler parameter not obvious from the signature.
 
+        :param batch_metric_store (BatchMetricStore) = None: an optional store in which resolved metrics are persisted
+            by batch fingerprint, so that validating identical data again does not recompute them.
+
         """
 
         self._data_context = data_context
         self._execution_engine = execution_engine
+        self._batch_metric_store = batch_metric_store
         self._expose_dataframe_methods = False
         self._validator_config = {}
 
@@ -108,6 +119,7 @@ class Validator:
         # This special state variable tracks whether a validation run is going on, which will disable
         # saving expectation config objects
         self._active_validation = False
+        self._last_resolution_statistics = []
         if self._data_context and hasattr(
             self._data_context, "_expectation_explorer_manager"
         ):
@@ -319,6 +331,11 @@ class Validator:
                 execution_engine=self._execution_engine,
                 runtime_configuration=None,
             )
+        graph = self._load_batch_metrics(
+            graph,
+            resolved_metrics,
+            [metric_configuration.id for metric_configuration in metrics.values()],
+        )
         self.resolve_validation_graph(graph, resolved_metrics)
         return {
             metric_name: resolved_metrics[metric_configuration.id]
@@ -419,6 +436,7 @@ class Validator:
             catch_exceptions = False
 
         processed_configurations = []
+        target_metric_ids = []
         evrs = []
         for configuration in configurations:
             # Validating
@@ -444,6 +462,9 @@ class Validator:
                         runtime_configuration=runtime_configuration,
                     )
                 processed_configurations.append(configuration)
+                target_metric_ids.extend(
+                    metric.id for metric in validation_dependencies.values()
+                )
             except Exception as err:
                 if catch_exceptions:
                     raised_exception = True
@@ -463,6 +484,7 @@ class Validator:
         if metrics is None:
             metrics = dict()
 
+        graph = self._load_batch_metrics(graph, metrics, target_metric_ids)
         metrics = self.resolve_validation_graph(graph, metrics, runtime_configuration)
         for configuration in processed_configurations:
             try:
@@ -491,42 +513,202 @@ class Validator:
         return evrs
 
     def resolve_validation_graph(self, graph, metrics, runtime_configuration=None):
-        done: bool = False
-        while not done:
-            ready_metrics, needed_metrics = self._parse_validation_graph(graph, metrics)
-            metrics.update(
-                self._resolve_metrics(
-                    execution_engine=self._execution_engine,
-                    metrics_to_resolve=ready_metrics,
-                    metrics=metrics,
-                    runtime_configuration=runtime_configuration,
+        """Resolve all metrics in the validation graph, one topological level at a time.
+
+        Each level contains the metrics whose dependencies have all been resolved, and is handed to the execution
+        engine in a single call to resolve_metrics. Timing for every level is recorded in
+        ``last_resolution_statistics``.
+
+        Args:
+            graph (ValidationGraph): the graph of metric dependencies to resolve
+            metrics (dict): already-resolved metrics; updated in place with newly resolved values
+            runtime_configuration (dict): runtime keyword arguments passed through to the execution engine
+
+        Returns:
+            the updated metrics dictionary
+        """
+        self._execution_engine.prepare_batch_data_for_metrics(
+            [
+                metric_configuration
+                for metric_id, metric_configuration in graph.metric_configurations.items()
+                if metric_id not in metrics
+            ]
+        )
+        resolution_statistics = []
+        for level, ready_metrics in enumerate(graph.resolution_levels(metrics)):
+            start_time = time.perf_counter()
+            resolved_metrics = self._resolve_metrics(
+                execution_engine=self._execution_engine,
+                metrics_to_resolve=ready_metrics,
+                metrics=metrics,
+                runtime_configuration=runtime_configuration,
+            )
+            metrics.update(resolved_metrics)
+            self._persist_batch_metrics(ready_metrics, resolved_metrics)
+            elapsed_time = time.perf_counter() - start_time
+            resolution_statistics.append(
+                MetricResolutionLevelStatistics(
+                    level=level,
+                    num_metrics=len(ready_metrics),
+                    elapsed_time=elapsed_time,
                 )
             )
-            if len(ready_metrics) + len(needed_metrics) == 0:
-                done = True
+            logger.debug(
+                f"Resolved {len(ready_metrics)} metrics in validation graph level {level} in {elapsed_time:.6f}s"
+            )
+        self._last_resolution_statistics = resolution_statistics
+
+        unresolved_metric_ids = graph.get_unresolved_metric_ids(metrics)
+        if len(unresolved_metric_ids) > 0:
+            logger.warning(
+                f"Unable to resolve {len(unresolved_metric_ids)} metrics in the validation graph; their dependencies "
+                f"could not be resolved or form a cycle: {str(sorted(unresolved_metric_ids))}"
+            )
 
         return metrics
 
+    @property
+    def batch_metric_store(self):
+        """The BatchMetricStore in which resolved metrics are persisted across runs, or None if persistence is off"""
+        return self._batch_metric_store
+
+    def _get_batch_fingerprint(self, batch_id) -> Optional[str]:
+        """Return a fingerprint identifying the data of a batch, or None if the batch cannot be fingerprinted.
+
+        The pandas data fingerprint recorded in the batch markers is used when the data was hashed at load time;
+        otherwise only a fingerprint supplied explicitly as "batch_fingerprint" in the BatchSpec (e.g. through
+        batch_spec_passthrough) is trusted. A BatchSpec by itself says where the data was read from, not what it
+        contained, so batches without either fingerprint are not read from or written to the batch metric store.
+        """
+        batch = self._batches.get(batch_id)
+        if batch is None:
+            return None
+
+        batch_markers = batch.batch_markers or {}
+        if batch_markers.get("pandas_data_fingerprint"):
+            return batch_markers["pandas_data_fingerprint"]
+
+        batch_spec = batch.batch_spec or {}
+        if batch_spec.get("batch_fingerprint"):
+            return str(batch_spec["batch_fingerprint"])
+        return None
+
+    def _get_batch_metric_identifier(
+        self, metric_configuration: MetricConfiguration, batch_fingerprints: dict
+    ) -> Optional[BatchMetricIdentifier]:
+        """Return the key under which a metric is persisted in the batch metric store, or None if it cannot be
+        persisted"""
+        batch_id = (
+            metric_configuration.metric_domain_kwargs.get("batch_id")
+            or self.active_batch_id
+        )
+        if batch_id not in batch_fingerprints:
+            batch_fingerprints[batch_id] = self._get_batch_fingerprint(batch_id)
+        batch_fingerprint = batch_fingerprints[batch_id]
+        if batch_fingerprint is None:
+            return None
+
+        # batch_id is replaced by the batch fingerprint, so that the key does not depend on how the batch was named
+        metric_domain_kwargs = {
+            key: value
+            for key, value in metric_configuration.metric_domain_kwargs.items()
+            if key != "batch_id"
+        }
+        try:
+            metric_kwargs_id = IDDict(
+                {
+                    "metric_domain_kwargs": metric_domain_kwargs,
+                    "metric_value_kwargs": metric_configuration.metric_value_kwargs,
+                }
+            ).to_id()
+        except TypeError:
+            return None
+
+        return BatchMetricIdentifier(
+            batch_fingerprint=batch_fingerprint,
+            metric_name=metric_configuration.metric_name,
+            metric_kwargs_id=metric_kwargs_id,
+        )
+
+    def _load_batch_metrics(
+        self, graph: ValidationGraph, metrics: dict, target_metric_ids: List[tuple]
+    ) -> ValidationGraph:
+        """Add the metrics of the graph that are available in the batch metric store to ``metrics``, and return the
+        graph restricted to the metrics that still have to be computed to resolve the target metrics."""
+        if self._batch_metric_store is None:
+            return graph
+
+        batch_fingerprints = {}
+        num_loaded_metrics = 0
+        for metric_id, metric_configuration in graph.metric_configurations.items():
+            if metric_id in metrics:
+                continue
+            key = self._get_batch_metric_identifier(
+                metric_configuration, batch_fingerprints
+            )
+            if key is None or not self._batch_metric_store.has_key(key):
+                continue
+            metrics[metric_id] = self._batch_metric_store.get(key)
+            num_loaded_metrics += 1
+
+        if num_loaded_metrics == 0:
+            return graph
+
+        logger.debug(f"Loaded {num_loaded_metrics} metrics from the batch metric store")
+        return graph.subgraph(graph.get_required_metric_ids(target_metric_ids, metrics))
+
+    def _persist_batch_metrics(
+        self, metric_configurations: Iterable[MetricConfiguration], metrics: dict
+    ) -> None:
+        """Save newly resolved metrics whose values are plain JSON data to the batch metric store"""
+        if self._batch_metric_store is None:
+            return
+
+        batch_fingerprints = {}
+        for metric_configuration in metric_configurations:
+            if metric_configuration.id not in metrics:
+                continue
+            value = metrics[metric_configuration.id]
+            # Only values that survive a JSON round trip unchanged are persisted; partial metric functions, data
+            # frames, and tuples are skipped.
+            if not _is_json_native(value):
+                continue
+            key = self._get_batch_metric_identifier(
+                metric_configuration, batch_fingerprints
+            )
+            if key is None:
+                continue
+            self._batch_metric_store.set(key, convert_to_json_serializable(value))
+
+    @property
+    def last_resolution_statistics(self) -> List["MetricResolutionLevelStatistics"]:
+        """Per-level statistics (level, number of metrics, elapsed seconds) from the most recent graph resolution.
+
+        The number of entries is the number of round trips made to the execution engine.
+        """
+        return list(self._last_resolution_statistics)
+
     def _parse_validation_graph(self, validation_graph, metrics):
-        """Given validation graph, returns the ready and needed metrics necessary for validation using a traversal of
-        validation graph (a graph structure of metric ids) edges"""
-        unmet_dependency_ids = set()
-        unmet_dependency = set()
-        maybe_ready_ids = set()
-        maybe_ready = set()
-
-        for edge in validation_graph.edges:
-            if edge.left.id not in metrics:
-                if edge.right is None or edge.right.id in metrics:
-                    if edge.left.id not in maybe_ready_ids:
-                        maybe_ready_ids.add(edge.left.id)
-                        maybe_ready.add(edge.left)
-                else:
-                    if edge.left.id not in unmet_dependency_ids:
-                        unmet_dependency_ids.add(edge.left.id)
-                        unmet_dependency.add(edge.left)
+        """Given validation graph, returns the ready and needed metrics necessary for validation using the graph's
+        dependency index (a mapping of metric ids to the ids of the metrics they depend on)"""
+        ready_metrics = set()
+        needed_metrics = set()
+
+        for (
+            metric_id,
+            metric_configuration,
+        ) in validation_graph.metric_configurations.items():
+            if metric_id in metrics:
+                continue
+            if all(
+                dependency_id in metrics
+                for dependency_id in validation_graph.get_dependency_ids(metric_id)
+            ):
+                ready_metrics.add(metric_configuration)
+            else:
+                needed_metrics.add(metric_configuration)
 
-        return maybe_ready - unmet_dependency, unmet_dependency
+        return ready_metrics, needed_metrics
 
     def _resolve_metrics(
         self,
@@ -1154,12 +1336,20 @@ class Validator:
             for col in columns:
                 expectations_to_evaluate.extend(columns[col])
 
+            runtime_configuration = {
+                "catch_exceptions": catch_exceptions,
+                "result_format": result_format,
+            }
+            # Metric resolution concurrency is configured on the validator, e.g.
+            # validator.set_config_value("concurrency", {"enabled": True, "max_workers": 8})
+            if self.get_config_value("concurrency") is not None:
+                runtime_configuration["concurrency"] = self.get_config_value(
+                    "concurrency"
+                )
+
             results = self.graph_validate(
                 expectations_to_evaluate,
-                runtime_configuration={
-                    "catch_exceptions": catch_exceptions,
-                    "result_format": result_format,
-                },
+                runtime_configuration=runtime_configuration,
             )
             statistics = _calc_validation_statistics(results)
 
@@ -1205,6 +1395,7 @@ class Validator:
             raise
         finally:
             self._active_validation = False
+            self._release_batch_data()
 
         if getattr(data_context, "_usage_statistics_handler", None):
             handler = data_context._usage_statistics_handler
@@ -1215,6 +1406,17 @@ class Validator:
             )
         return result
 
+    def _release_batch_data(self) -> None:
+        """Let the execution engine release the resources (e.g. persisted data) it holds for the batches of this
+        validator once their validation is finished. A released batch stays loaded."""
+        for batch_id in self._batches:
+            try:
+                self._execution_engine.release_batch_data(batch_id=batch_id)
+            except Exception as e:
+                logger.warning(
+                    f'Unable to release the data of batch "{batch_id}" after validation: {e}'
+                )
+
     def get_evaluation_parameter(self, parameter_name, default_value=None):
         """
         Get an evaluation parameter value that has been stored in meta.
@@ -1302,6 +1504,16 @@ class Validator:
         return new_function(self, *args, **kwargs)
 
 
+MetricResolutionLevelStatistics = namedtuple(
+    "MetricResolutionLevelStatistics",
+    [
+        "level",
+        "num_metrics",
+        "elapsed_time",
+    ],
+)
+
+
 ValidationStatistics = namedtuple(
     "ValidationStatistics",
     [
@@ -1314,6 +1526,23 @@ ValidationStatistics = namedtuple(
 )
 
 
+def _is_json_native(value) -> bool:
+    """Return True if the value can be stored as JSON and read back as an equal value of the same type."""
+    if isinstance(value, (float, np.floating)) and not math.isfinite(value):
+        # NaN and infinities are not valid JSON, and are serialized as None
+        return False
+    if value is None or isinstance(value, (bool, int, float, str, np.generic)):
+        return not isinstance(value, (np.datetime64, np.timedelta64, np.void))
+    if isinstance(value, list):
+        return all(_is_json_native(element) for element in value)
+    if isinstance(value, dict):
+        return all(
+            isinstance(key, str) and _is_json_native(element)
+            for key, element in value.items()
+        )
+    return False
+
+
 def _calc_validation_statistics(validation_results):
     """
     Calculate summary statistics for the validation results and
@@ -0,0 +1,256 @@
+import threading
+
+import pandas as pd
+import pytest
+
+import great_expectations as ge
+from great_expectations.checkpoint.actions import (
+    StoreValidationResultAction,
+    ValidationAction,
+)
+from great_expectations.validation_operators.action_pipeline import ActionPipeline
+from great_expectations.validation_operators.validation_operators import (
+    ActionListValidationOperator,
+)
+
+
+class RecordingAction(ValidationAction):
+    def __init__(self, data_context, label, barrier=None):
+        super().__init__(data_context)
+        self.label = label
+        self.barrier = barrier
+        self.payloads = []
+
+    def _run(
+        self,
+        validation_result_suite,
+        validation_result_suite_identifier,
+        data_asset,
+        payload=None,
+    ):
+        if self.barrier is not None:
+            # Only returns once every party of the barrier is running at the same time
+            self.barrier.wait(timeout=5)
+        self.payloads.append(payload)
+        return {"label": self.label}
+
+
+class RecordingStoreAction(RecordingAction, StoreValidationResultAction):
+    pass
+
+
+class RecordingDocsAction(RecordingAction):
+    run_after = ("StoreValidationResultAction",)
+
+
+class FlakyNotificationAction(RecordingAction):
+    is_notification = True
+
+    def __init__(self, data_context, label, failures):
+        super().__init__(data_context, label)
+        self.failures = failures
+        self.attempts = 0
+
+    def _run(
+        self,
+        validation_result_suite,
+        validation_result_suite_identifier,
+        data_asset,
+        payload=None,
+    ):
+        self.attempts += 1
+        if self.attempts <= self.failures:
+            raise ConnectionError("webhook unavailable")
+        return super()._run(
+            validation_result_suite,
+            validation_result_suite_identifier,
+            data_asset,
+            payload=payload,
+        )
+
+
+def _action_config(name, class_name, **kwargs):
+    return {
+        "name": name,
+        "action": {"class_name": class_name, "module_name": __name__, **kwargs},
+    }
+
+
+def _build_pipeline(data_context, action_list, **kwargs):
+    operator = ActionListValidationOperator(
+        data_context=data_context, action_list=action_list, name="test_operator"
+    )
+    return (
+        ActionPipeline(action_list=action_list, actions=operator.actions, **kwargs),
+        operator.actions,
+    )
+
+
+def test_action_pipeline_dependencies(
+    basic_in_memory_data_context_for_validation_operator,
+):
+    action_list = [
+        _action_config("store", "RecordingStoreAction", label="store"),
+        _action_config("metrics", "RecordingAction", label="metrics"),
+        _action_config("docs", "RecordingDocsAction", label="docs"),
+        dict(
+            _action_config("notify", "RecordingAction", label="notify"),
+            depends_on=["docs"],
+        ),
+    ]
+    pipeline, _ = _build_pipeline(
+        basic_in_memory_data_context_for_validation_operator, action_list
+    )
+    assert pipeline._dependencies == {
+        "store": [],
+        "metrics": [],
+        "docs": ["store"],
+        "notify": ["docs"],
+    }
+    pipeline.shutdown()
+
+
+def test_action_pipeline_depends_on_must_be_listed_first(
+    basic_in_memory_data_context_for_validation_operator,
+):
+    action_list = [
+        dict(
+            _action_config("notify", "RecordingAction", label="notify"),
+            depends_on=["docs"],
+        ),
+        _action_config("docs", "RecordingDocsAction", label="docs"),
+    ]
+    with pytest.raises(ValueError, match="must be listed before it"):
+        _build_pipeline(
+            basic_in_memory_data_context_for_validation_operator, action_list
+        )
+
+
+def test_action_pipeline_runs_independent_actions_concurrently(
+    basic_in_memory_data_context_for_validation_operator,
+    validation_result_suite,
+    validation_result_suite_id,
+):
+    action_list = [
+        _action_config("store", "RecordingStoreAction", label="store"),
+        _action_config("metrics", "RecordingAction", label="metrics"),
+        _action_config("docs", "RecordingDocsAction", label="docs"),
+        dict(
+            _action_config("notify", "RecordingAction", label="notify"),
+            depends_on=["docs"],
+        ),
+    ]
+    pipeline, actions = _build_pipeline(
+        basic_in_memory_data_context_for_validation_operator,
+        action_list,
+        max_workers=2,
+    )
+    # "store" and "metrics" do not depend on each other, so they must be running at the same time to pass the barrier
+    barrier = threading.Barrier(2)
+    actions["store"].barrier = barrier
+    actions["metrics"].barrier = barrier
+
+    futures = pipeline.submit(
+        validation_result_suite_identifier=validation_result_suite_id,
+        validation_result_suite=validation_result_suite,
+        data_asset=None,
+    )
+    results = pipeline.get_results(futures)
+    pipeline.shutdown()
+
+    assert list(results.keys()) == ["store", "metrics", "docs", "notify"]
+    assert results["docs"] == {"label": "docs", "class": "RecordingDocsAction"}
+    # The payload holds the results of the dependencies of an action, transitively
+    assert actions["docs"].payloads == [
+        {"store": {"label": "store", "class": "RecordingStoreAction"}}
+    ]
+    assert actions["notify"].payloads == [
+        {
+            "store": {"label": "store", "class": "RecordingStoreAction"},
+            "docs": {"label": "docs", "class": "RecordingDocsAction"},
+        }
+    ]
+
+
+def test_action_pipeline_retries_notifications(
+    basic_in_memory_data_context_for_validation_operator,
+    validation_result_suite,
+    validation_result_suite_id,
+):
+    action_list = [
+        _action_config(
+            "notify_eventually", "FlakyNotificationAction", label="n1", failures=2
+        ),
+        _action_config(
+            "notify_never", "FlakyNotificationAction", label="n2", failures=5
+        ),
+    ]
+    pipeline, actions = _build_pipeline(
+        basic_in_memory_data_context_for_validation_operator,
+        action_list,
+        notification_max_retries=2,
+        notification_retry_delay=0,
+    )
+    futures = pipeline.submit(
+        validation_result_suite_identifier=validation_result_suite_id,
+        validation_result_suite=validation_result_suite,
+        data_asset=None,
+    )
+    assert futures["notify_eventually"].result()[1] == {
+        "label": "n1",
+        "class": "FlakyNotificationAction",
+    }
+    assert actions["notify_eventually"].attempts == 3
+    with pytest.raises(ConnectionError):
+        pipeline.get_results(futures)
+    assert actions["notify_never"].attempts == 3
+    pipeline.shutdown()
+
+
+def test_action_list_validation_operator_with_concurrency(
+    basic_in_memory_data_context_for_validation_operator,
+):
+    context = basic_in_memory_data_context_for_validation_operator
+    action_list = [
+        _action_config(
+            "store_validation_result",
+            "StoreValidationResultAction",
+            target_store_name="validation_result_store",
+        ),
+        _action_config("docs", "RecordingDocsAction", label="docs"),
+    ]
+    action_list[0]["action"]["module_name"] = "great_expectations.validation_operators"
+    assets_to_validate = [
+        ge.dataset.PandasDataset(
+            pd.DataFrame({"x": [1, 2, 3]}),
+            batch_kwargs={"ge_batch_id": f"82a8de83-e063-11e9-8226-acde4800112{i}"},
+        )
+        for i in range(3)
+    ]
+    operator = ActionListValidationOperator(
+        data_context=context,
+        action_list=action_list,
+        name="concurrent_operator",
+        concurrency={"enabled": True, "max_workers": 2},
+    )
+    result = operator.run(assets_to_validate=assets_to_validate, run_name="test")
+
+    assert operator.validation_operator_config["kwargs"]["concurrency"] == {
+        "enabled": True,
+        "max_workers": 2,
+    }
+    assert [
+        identifier.batch_identifier for identifier in result.run_results.keys()
+    ] == [asset.batch_id for asset in assets_to_validate]
+    for run_result in result.run_results.values():
+        assert run_result["actions_results"] == {
+            "store_validation_result": {"class": "StoreValidationResultAction"},
+            "docs": {"label": "docs", "class": "RecordingDocsAction"},
+        }
+    # Each action runs on one validation result at a time, in order
+    assert len(operator.actions["docs"].payloads) == 3
+    assert all(
+        key.run_id.run_name == "test"
+        for key in context.validations_store.list_keys()
+        if key.batch_identifier in [asset.batch_id for asset in assets_to_validate]
+    )
@@ -1,4 +1,5 @@
 import logging
+import time
 import unittest.mock as mock
 from typing import Union
 
@@ -11,6 +12,7 @@ import great_expectations as ge
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.checkpoint.checkpoint import Checkpoint, LegacyCheckpoint
 from great_expectations.checkpoint.types.checkpoint_result import CheckpointResult
+from great_expectations.core.batch import BatchRequest
 from great_expectations.data_context.data_context import DataContext
 from great_expectations.data_context.types.base import CheckpointConfig
 from great_expectations.data_context.types.resource_identifiers import (
@@ -20,6 +22,7 @@ from great_expectations.util import filter_properties_dict
 from great_expectations.validation_operators.types.validation_operator_result import (
     ValidationOperatorResult,
 )
+from great_expectations.validator.validation_graph import MetricConfiguration
 
 yaml = YAML()
 
@@ -1558,3 +1561,166 @@ def test_newstyle_checkpoint_config_substitution_nested(
         substituted_config_template_and_runtime_kwargs.to_json_dict()
         == expected_nested_checkpoint_config_template_and_runtime_template_name.to_json_dict()
     )
+
+
+def _build_checkpoint_with_validations_of_titanic_assets(
+    context, runtime_configuration
+):
+    checkpoint_config = CheckpointConfig(
+        name="my_concurrent_checkpoint",
+        config_version=1,
+        run_name_template="%Y-%M-foo-bar-template",
+        expectation_suite_name="my_expectation_suite",
+        action_list=[
+            {
+                "name": "store_validation_result",
+                "action": {
+                    "class_name": "StoreValidationResultAction",
+                },
+            },
+        ],
+        runtime_configuration=runtime_configuration,
+        validations=[
+            {
+                "batch_request": {
+                    "datasource_name": "my_datasource",
+                    "data_connector_name": "my_basic_data_connector",
+                    "data_asset_name": data_asset_name,
+                }
+            }
+            for data_asset_name in ["Titanic_1911", "Titanic_1912", "Titanic_1911"]
+        ],
+    )
+    checkpoint_config_key = ConfigurationIdentifier(
+        configuration_key=checkpoint_config.name
+    )
+    context.checkpoint_store.set(key=checkpoint_config_key, value=checkpoint_config)
+    context.create_expectation_suite("my_expectation_suite")
+    return context.get_checkpoint(checkpoint_config.name)
+
+
+def test_newstyle_checkpoint_runs_validations_concurrently(
+    titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store_stats_enabled,
+):
+    context: DataContext = titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store_stats_enabled
+    checkpoint = _build_checkpoint_with_validations_of_titanic_assets(
+        context,
+        runtime_configuration={"concurrency": {"enabled": True, "max_workers": 2}},
+    )
+
+    with mock.patch(
+        "great_expectations.checkpoint.checkpoint.Checkpoint._run_validations_concurrently",
+        wraps=checkpoint._run_validations_concurrently,
+    ) as mock_run_validations_concurrently:
+        concurrent_result: CheckpointResult = checkpoint.run(run_name="concurrent")
+    assert mock_run_validations_concurrently.call_count == 1
+    assert mock_run_validations_concurrently.call_args[1]["max_workers"] == 2
+
+    serial_result: CheckpointResult = checkpoint.run(
+        run_name="serial", runtime_configuration={"concurrency": {"enabled": False}}
+    )
+
+    assert concurrent_result.success
+    # Results are merged in the order of the validations
+    assert [
+        identifier.batch_identifier
+        for identifier in concurrent_result.run_results.keys()
+    ] == [
+        identifier.batch_identifier for identifier in serial_result.run_results.keys()
+    ]
+    assert len(context.validations_store.list_keys()) == 4
+
+
+def test_newstyle_checkpoint_concurrent_validators_do_not_share_engine_state(
+    titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store_stats_enabled,
+):
+    context: DataContext = titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store_stats_enabled
+    checkpoint = _build_checkpoint_with_validations_of_titanic_assets(
+        context, runtime_configuration={}
+    )
+    execution_engine = context.datasources["my_datasource"].execution_engine
+
+    validators = [
+        checkpoint._get_validator_with_own_execution_engine(
+            batch_request=BatchRequest(
+                datasource_name="my_datasource",
+                data_connector_name="my_basic_data_connector",
+                data_asset_name=data_asset_name,
+            ),
+            expectation_suite_name="my_expectation_suite",
+        )
+        for data_asset_name in ["Titanic_1911", "Titanic_1912"]
+    ]
+    engines = [execution_engine] + [
+        validator.execution_engine for validator in validators
+    ]
+    assert len({id(engine) for engine in engines}) == 3
+    assert len({id(engine.loaded_batch_data_dict) for engine in engines}) == 3
+    assert len({id(engine._metric_cache) for engine in engines}) == 3
+
+    row_count = MetricConfiguration("table.row_count", dict(), dict())
+    for validator in validators:
+        validator.get_metric(row_count)
+    # Each validator resolved its metric on its own batch, into its own cache
+    for validator in validators:
+        cache_key = (validator.active_batch_id, row_count.id)
+        assert validator.execution_engine.active_batch_data_id == (
+            validator.active_batch_id
+        )
+        assert cache_key in validator.execution_engine._metric_cache
+        assert cache_key not in execution_engine._metric_cache
+
+
+def test_newstyle_checkpoint_releases_batch_data_after_each_validation(
+    titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store_stats_enabled,
+):
+    context: DataContext = titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store_stats_enabled
+    checkpoint = _build_checkpoint_with_validations_of_titanic_assets(
+        context, runtime_configuration={}
+    )
+    execution_engine = context.datasources["my_datasource"].execution_engine
+
+    with mock.patch.object(
+        execution_engine,
+        "release_batch_data",
+        wraps=execution_engine.release_batch_data,
+    ) as mock_release_batch_data:
+        result: CheckpointResult = checkpoint.run()
+
+    assert result.success
+    # The batch of each of the three validations is released as soon as it is validated (Titanic_1911 twice)
+    released_batch_ids = [
+        call[1]["batch_id"] for call in mock_release_batch_data.call_args_list
+    ]
+    assert len(released_batch_ids) == 3
+    assert released_batch_ids[0] == released_batch_ids[2]
+    assert set(released_batch_ids) == {
+        identifier.batch_identifier for identifier in result.run_results.keys()
+    }
+
+
+def test_newstyle_checkpoint_concurrent_validation_timeout(
+    titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store_stats_enabled,
+):
+    context: DataContext = titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store_stats_enabled
+    checkpoint = _build_checkpoint_with_validations_of_titanic_assets(
+        context,
+        runtime_configuration={
+            "concurrency": {"enabled": True, "max_workers": 3, "timeout": 0.2}
+        },
+    )
+    run_validation = checkpoint._run_validation
+
+    def slow_run_validation(*args, **kwargs):
+        if kwargs["idx"] == 1:
+            time.sleep(1)
+        return run_validation(*args, **kwargs)
+
+    with mock.patch.object(
+        checkpoint, "_run_validation", side_effect=slow_run_validation
+    ):
+        with pytest.raises(
+            ge_exceptions.CheckpointError,
+            match=r"Validation\[1\] of checkpoint 'my_concurrent_checkpoint' did not finish within 0.2 seconds",
+        ):
+            checkpoint.run()
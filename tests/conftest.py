@@ -87,6 +87,10 @@ def pytest_configure(config):
         "markers",
         "aws_integration: runs aws integration test that may be very slow and requires credentials",
     )
+    config.addinivalue_line(
+        "markers",
+        "benchmark: measures and reports performance; slow and only run when requested",
+    )
 
 
 def pytest_addoption(parser):
@@ -120,6 +124,11 @@ def pytest_addoption(parser):
         action="store_true",
         help="If set, run aws integration tests",
     )
+    parser.addoption(
+        "--benchmark",
+        action="store_true",
+        help="If set, run benchmark tests",
+    )
 
 
 def build_test_backends_list(metafunc):
@@ -271,15 +280,20 @@ def pytest_generate_tests(metafunc):
 
 
 def pytest_collection_modifyitems(config, items):
-    if config.getoption("--aws-integration"):
-        # --aws-integration given in cli: do not skip aws-integration tests
-        return
-    skip_aws_integration = pytest.mark.skip(
-        reason="need --aws-integration option to run"
-    )
+    skip_markers = {}
+    if not config.getoption("--aws-integration"):
+        # --aws-integration not given in cli: skip aws-integration tests
+        skip_markers["aws_integration"] = pytest.mark.skip(
+            reason="need --aws-integration option to run"
+        )
+    if not config.getoption("--benchmark"):
+        skip_markers["benchmark"] = pytest.mark.skip(
+            reason="need --benchmark option to run"
+        )
     for item in items:
-        if "aws_integration" in item.keywords:
-            item.add_marker(skip_aws_integration)
+        for keyword, skip_marker in skip_markers.items():
+            if keyword in item.keywords:
+                item.add_marker(skip_marker)
 
 
 @pytest.fixture(autouse=True)
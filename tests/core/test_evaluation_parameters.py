@@ -1,9 +1,11 @@
+from concurrent.futures import ThreadPoolExecutor
 from timeit import timeit
 
 import pytest
 
 from great_expectations.core.evaluation_parameters import (
     _deduplicate_evaluation_parameter_dependencies,
+    compile_evaluation_parameter,
     find_evaluation_parameter_dependencies,
     parse_evaluation_parameter,
 )
@@ -112,6 +114,34 @@ def test_parser_timing():
     )
 
 
+def test_compiled_evaluation_parameter_is_cached_and_reusable():
+    compiled_expression = compile_evaluation_parameter("trunc(a * 1.5) + b")
+    assert compile_evaluation_parameter("trunc(a * 1.5) + b") is compiled_expression
+
+    # The compiled expression is not modified by evaluating it
+    assert compiled_expression.evaluate({"a": 3, "b": 1}) == 5
+    assert compiled_expression.evaluate({"a": 10, "b": -1}) == 14
+    assert parse_evaluation_parameter("trunc(a * 1.5) + b", {"a": 2, "b": 0}) == 3
+
+    # Parse failures are compiled too, and raise when evaluated
+    compiled_failure = compile_evaluation_parameter("urn:ieee:not_ge * 10")
+    assert compiled_failure.parse_error is not None
+    with pytest.raises(EvaluationParameterError) as err:
+        compiled_failure.evaluate({"urn:ieee:not_ge": 1})
+    assert "Parse Failure" in str(err.value)
+
+
+def test_compiled_evaluation_parameter_evaluates_concurrently():
+    expressions = [f"a * {i} + b" for i in range(50)]
+
+    def evaluate(i):
+        return parse_evaluation_parameter(expressions[i % 50], {"a": i, "b": 1})
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(evaluate, range(1000)))
+    assert results == [i * (i % 50) + 1 for i in range(1000)]
+
+
 def test_find_evaluation_parameter_dependencies():
     parameter_expression = "(-3 * urn:great_expectations:validations:profile:expect_column_stdev_to_be_between.result.observed_value:column=norm) + urn:great_expectations:validations:profile:expect_column_mean_to_be_between.result.observed_value:column=norm"
     dependencies = find_evaluation_parameter_dependencies(parameter_expression)
@@ -1,3 +1,4 @@
+import pickle
 from copy import copy, deepcopy
 
 import pytest
@@ -282,6 +283,16 @@ def test_expectation_suite_deepcopy(baseline_suite):
     assert baseline_suite.expectations[0].meta["notes"] == "This is an expectation."
 
 
+def test_expectation_suite_pickle_round_trip(baseline_suite, exp2):
+    suite_round_trip = pickle.loads(pickle.dumps(baseline_suite))
+    assert suite_round_trip == baseline_suite
+    assert suite_round_trip.expectations == baseline_suite.expectations
+
+    # The expectation index of the unpickled suite is kept up to date
+    suite_round_trip.expectations.append(exp2)
+    assert suite_round_trip.find_expectation_indexes(exp2) == [1, 2]
+
+
 def test_suite_without_metadata_includes_ge_version_metadata_if_none_is_provided():
     suite = ExpectationSuite("foo")
     assert "great_expectations_version" in suite.meta.keys()
@@ -1,3 +1,5 @@
+from copy import deepcopy
+
 import pytest
 
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
@@ -428,3 +430,70 @@ def test_remove_all_expectations_of_type(
     assert suite_with_table_and_column_expectations.isEquivalentTo(
         suite_with_column_pair_and_table_expectations
     )
+
+
+def _find_expectation_indexes_by_scanning(suite, expectation_configuration, match_type):
+    return [
+        idx
+        for idx, expectation in enumerate(suite.expectations)
+        if expectation.isEquivalentTo(expectation_configuration, match_type)
+    ]
+
+
+def test_find_expectation_indexes_uses_an_up_to_date_index(
+    exp1,
+    exp2,
+    exp3,
+    exp4,
+    exp5,
+    exp6,
+    table_exp1,
+    table_exp2,
+    column_pair_expectation,
+    empty_suite,
+):
+    expectation_configurations = [
+        exp1,
+        exp2,
+        exp3,
+        exp4,
+        exp5,
+        exp6,
+        table_exp1,
+        table_exp2,
+        column_pair_expectation,
+    ]
+
+    def assert_index_matches_scan(suite):
+        for expectation_configuration in expectation_configurations:
+            for match_type in ["domain", "success", "runtime"]:
+                assert suite.find_expectation_indexes(
+                    expectation_configuration, match_type
+                ) == _find_expectation_indexes_by_scanning(
+                    suite, expectation_configuration, match_type
+                )
+
+    for expectation_configuration in [exp1, exp2, table_exp1, column_pair_expectation]:
+        empty_suite.add_expectation(deepcopy(expectation_configuration))
+    empty_suite.append_expectation(exp3)
+    assert_index_matches_scan(empty_suite)
+
+    # Modifications through the methods of the suite update the index
+    empty_suite.patch_expectation(
+        exp1, op="replace", path="/column", value="c", match_type="runtime"
+    )
+    assert empty_suite.find_expectation_indexes(exp1, "domain") == []
+    assert_index_matches_scan(empty_suite)
+    empty_suite.add_expectation(exp5, match_type="runtime")
+    empty_suite.remove_expectation(exp4, remove_multiple_matches=True)
+    assert_index_matches_scan(empty_suite)
+
+    # Direct modifications of the list of expectations are picked up too
+    empty_suite.expectations.insert(0, exp6)
+    empty_suite.expectations[1] = table_exp2
+    assert_index_matches_scan(empty_suite)
+    empty_suite.expectations.pop(0)
+    assert_index_matches_scan(empty_suite)
+    empty_suite.expectations = [exp4, exp1]
+    assert empty_suite.find_expectation_indexes(exp2, "domain") == [0]
+    assert_index_matches_scan(empty_suite)
@@ -0,0 +1,61 @@
+import copy
+import operator
+import pickle
+
+from great_expectations.core.id_dict import BatchSpec, IDDict
+
+
+def test_id_dict_memoizes_id(monkeypatch):
+    id_dict = IDDict({"column": "a", "row_condition": 'b=="x"'})
+    expected_id = id_dict.to_id()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("the id should not be recomputed")
+
+    monkeypatch.setattr(IDDict, "_compute_id", fail)
+    assert id_dict.to_id() == expected_id
+
+
+def test_id_dict_id_is_recomputed_after_modification():
+    id_dict = IDDict({"column": "a", "row_condition": 'b=="x"'})
+    original_id = id_dict.to_id()
+
+    id_dict["row_condition"] = 'b=="y"'
+    assert id_dict.to_id() == IDDict(id_dict).to_id()
+    assert id_dict.to_id() != original_id
+
+    for modify in [
+        lambda d: d.update({"condition_parser": "pandas"}),
+        lambda d: d.setdefault("batch_id", "1234"),
+        lambda d: operator.ior(d, {"batch_id": "5678"}),
+        lambda d: d.pop("condition_parser"),
+        lambda d: d.__delitem__("batch_id"),
+        lambda d: d.popitem(),
+        lambda d: d.clear(),
+    ]:
+        previous_id = id_dict.to_id()
+        modify(id_dict)
+        assert id_dict.to_id() == IDDict(id_dict).to_id()
+        assert id_dict.to_id() != previous_id
+
+
+def test_id_dict_explicit_id_keys_are_not_memoized():
+    id_dict = IDDict({"column": "a", "batch_id": "1234"})
+    assert id_dict.to_id(id_keys=["column"]) == "column=a"
+    assert id_dict.to_id(id_ignore_keys=["column"]) == "batch_id=1234"
+    assert id_dict.to_id() not in ("column=a", "batch_id=1234")
+
+
+def test_id_dict_copies_keep_a_consistent_id():
+    batch_spec = BatchSpec({"path": "data.csv", "reader_method": "read_csv"})
+    original_id = batch_spec.to_id()
+
+    for copied_batch_spec in [
+        copy.copy(batch_spec),
+        copy.deepcopy(batch_spec),
+        pickle.loads(pickle.dumps(batch_spec)),
+    ]:
+        assert copied_batch_spec.to_id() == original_id
+        copied_batch_spec["reader_method"] = "read_parquet"
+        assert copied_batch_spec.to_id() != original_id
+        assert batch_spec.to_id() == original_id
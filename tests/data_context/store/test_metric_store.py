@@ -2,7 +2,10 @@ import os
 
 import pytest
 
+import great_expectations.exceptions as ge_exceptions
 import tests.test_utils as test_utils
+from great_expectations.core.metric import BatchMetricIdentifier
+from great_expectations.data_context.store import BatchMetricStore
 from great_expectations.data_context.util import instantiate_class_from_config
 
 
@@ -92,3 +95,38 @@ def test_metric_store_store_backend_id(in_memory_param_store):
     assert in_memory_param_store.store_backend_id is not None
     # Check that store_backend_id is a valid UUID
     assert test_utils.validate_uuid4(in_memory_param_store.store_backend_id)
+
+
+@pytest.mark.parametrize(
+    "store_backend",
+    [
+        None,
+        {"class_name": "DatabaseStoreBackend", "url": "sqlite://"},
+    ],
+)
+def test_batch_metric_store_round_trip(store_backend):
+    store = BatchMetricStore(store_backend=store_backend)
+    key = BatchMetricIdentifier(
+        batch_fingerprint="8c7e5f1b",
+        metric_name="column.max",
+        metric_kwargs_id="column=a",
+    )
+    assert not store.has_key(key)
+
+    store.set(key, 10)
+    assert store.has_key(key)
+    assert store.get(key) == 10
+    assert store.list_keys() == [key]
+
+
+def test_batch_metric_identifier_tuple_round_trip():
+    key = BatchMetricIdentifier(
+        batch_fingerprint="8c7e5f1b",
+        metric_name="table.row_count",
+        metric_kwargs_id=None,
+    )
+    assert key.to_tuple() == ("8c7e5f1b", "table.row_count", "__")
+    assert BatchMetricIdentifier.from_tuple(key.to_tuple()) == key
+
+    with pytest.raises(ge_exceptions.GreatExpectationsError):
+        BatchMetricIdentifier.from_tuple(("table.row_count", "__"))
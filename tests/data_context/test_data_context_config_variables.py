@@ -1,5 +1,6 @@
 import os
 from collections import OrderedDict
+from unittest import mock
 
 import pytest
 from ruamel.yaml import YAML, YAMLError
@@ -837,3 +838,56 @@ def test_create_data_context_and_config_vars_in_code(tmp_path_factory, monkeypat
 
     assert config_vars_file_contents["escaped"] == r"\$SOME_VAR"
     assert config_vars_file_contents["escaped_curly"] == r"\${SOME_VAR}"
+
+
+def test_project_config_with_variables_substituted_is_cached_until_its_inputs_change(
+    data_context_with_variables_in_config, monkeypatch
+):
+    context = data_context_with_variables_in_config
+    substitute_config_variables = mock.Mock(wraps=context._substitute_config_variables)
+    monkeypatch.setattr(
+        context, "_substitute_config_variables", substitute_config_variables
+    )
+
+    def _get_test_variable_sub1():
+        return context.project_config_with_variables_substituted.datasources[
+            "mydatasource"
+        ]["batch_kwargs_generators"]["mygenerator"]["reader_options"][
+            "test_variable_sub1"
+        ]
+
+    assert _get_test_variable_sub1() == {"n1": "v1"}
+    assert _get_test_variable_sub1() == {"n1": "v1"}
+    assert context.expectations_store_name == "expectations_store"
+    assert substitute_config_variables.call_count == 1
+
+    # Each access returns a new config, so that modifying it does not modify the cached one
+    config = context.project_config_with_variables_substituted
+    config.datasources["mydatasource"]["class_name"] = "SomethingElse"
+    assert (
+        context.project_config_with_variables_substituted.datasources["mydatasource"][
+            "class_name"
+        ]
+        == "PandasDatasource"
+    )
+    assert substitute_config_variables.call_count == 1
+
+    context.save_config_variable("replace_me", {"n1": "v2"})
+    assert _get_test_variable_sub1() == {"n1": "v2"}
+    assert substitute_config_variables.call_count == 2
+
+    monkeypatch.setenv("replace_me", "from_environment")
+    assert _get_test_variable_sub1() == "from_environment"
+    assert substitute_config_variables.call_count == 3
+
+    context.runtime_environment["replace_me"] = "from_runtime_environment"
+    assert _get_test_variable_sub1() == "from_runtime_environment"
+    assert substitute_config_variables.call_count == 4
+
+    context._project_config["datasources"]["mydatasource"]["batch_kwargs_generators"][
+        "mygenerator"
+    ]["reader_options"]["test_variable_sub1"] = "not_a_variable"
+    assert _get_test_variable_sub1() == "not_a_variable"
+    assert substitute_config_variables.call_count == 5
+    assert _get_test_variable_sub1() == "not_a_variable"
+    assert substitute_config_variables.call_count == 5
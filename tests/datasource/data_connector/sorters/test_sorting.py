@@ -11,6 +11,9 @@ from great_expectations.datasource.data_connector.sorter import (
     NumericSorter,
     Sorter,
 )
+from great_expectations.datasource.data_connector.sorter.sorter import (
+    sort_batch_definitions,
+)
 
 
 @pytest.fixture()
@@ -294,3 +297,64 @@ def test_example_file_list_sorters(example_batch_def_list):
             batch_definitions=batch_list
         )
     assert sorted_batch_list == [g, j, c, d, b, i, a, h, f, e]
+
+
+def test_sort_batch_definitions_matches_sorting_by_each_sorter(
+    example_batch_def_list,
+):
+    name_sorter = LexicographicSorter(name="name", orderby="asc")
+    timestamp_sorter = DateTimeSorter(
+        name="timestamp", datetime_format="%Y%m%d", orderby="desc"
+    )
+    price_sorter = NumericSorter(name="price", orderby="desc")
+    custom_sorter = CustomListSorter(
+        name="name",
+        orderby="desc",
+        reference_list=["alex", "will", "abe", "james", "eugene"],
+    )
+
+    for sorters_list in [
+        [],
+        [name_sorter],
+        [timestamp_sorter, name_sorter],
+        [name_sorter, timestamp_sorter],
+        [timestamp_sorter, price_sorter],
+        [custom_sorter, price_sorter, timestamp_sorter],
+        [price_sorter, timestamp_sorter, name_sorter],
+    ]:
+        expected_batch_list = example_batch_def_list
+        for sorter in reversed(sorters_list):
+            expected_batch_list = sorter.get_sorted_batch_definitions(
+                batch_definitions=expected_batch_list
+            )
+        assert (
+            sort_batch_definitions(
+                batch_definitions=example_batch_def_list, sorters=sorters_list
+            )
+            == expected_batch_list
+        )
+        for limit in [0, 1, 4, 10, 20]:
+            assert (
+                sort_batch_definitions(
+                    batch_definitions=example_batch_def_list,
+                    sorters=sorters_list,
+                    limit=limit,
+                )
+                == expected_batch_list[:limit]
+            )
+
+
+def test_sort_batch_definitions_raises_for_unsortable_batch_definitions(
+    example_batch_def_list,
+):
+    with pytest.raises(ge_exceptions.SorterError):
+        sort_batch_definitions(
+            batch_definitions=example_batch_def_list,
+            sorters=[NumericSorter(name="name")],
+        )
+    with pytest.raises(ge_exceptions.SorterError):
+        sort_batch_definitions(
+            batch_definitions=example_batch_def_list,
+            sorters=[LexicographicSorter(name="name")],
+            limit=-1,
+        )
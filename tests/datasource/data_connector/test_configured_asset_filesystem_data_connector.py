@@ -17,6 +17,12 @@ from great_expectations.data_context.util import instantiate_class_from_config
 from great_expectations.datasource.data_connector import (
     ConfiguredAssetFilesystemDataConnector,
 )
+from great_expectations.datasource.data_connector.partition_query import (
+    build_partition_query,
+)
+from great_expectations.datasource.data_connector.util import (
+    batch_definition_matches_batch_request,
+)
 from tests.test_utils import create_files_in_directory
 
 yaml = YAML()
@@ -1302,3 +1308,133 @@ def test_basic_instantiation_with_nested_directories(tmp_path_factory):
         "unmatched_data_reference_count": 1,
         "example_data_reference": {},
     }
+
+
+def test_batch_definition_lookups_match_linear_scan_of_cache(tmp_path_factory):
+    base_directory = str(
+        tmp_path_factory.mktemp(
+            "test_batch_definition_lookups_match_linear_scan_of_cache"
+        )
+    )
+    create_files_in_directory(
+        directory=base_directory,
+        file_name_list=[
+            f"{name}_2020{month:02d}{day:02d}_{price}.csv"
+            for name in ["abe", "alex", "eugene", "james", "will"]
+            for month in [7, 8]
+            for day in [1, 9, 11]
+            for price in [1000, 1500]
+        ],
+    )
+    my_data_connector_yaml = yaml.load(
+        f"""
+        class_name: ConfiguredAssetFilesystemDataConnector
+        datasource_name: test_environment
+        base_directory: {base_directory}
+        glob_directive: "*.csv"
+        assets:
+            TestFiles:
+            AbeFiles:
+                pattern: (abe)_(.+)_(.+)\\.csv
+        default_regex:
+            pattern: (.+)_(.+)_(.+)\\.csv
+            group_names:
+                - name
+                - timestamp
+                - price
+        sorters:
+            - orderby: asc
+              class_name: LexicographicSorter
+              name: name
+            - datetime_format: "%Y%m%d"
+              orderby: desc
+              class_name: DateTimeSorter
+              name: timestamp
+    """,
+    )
+    my_data_connector: ConfiguredAssetFilesystemDataConnector = (
+        instantiate_class_from_config(
+            config=my_data_connector_yaml,
+            runtime_environment={
+                "name": "general_filesystem_data_connector",
+                "datasource_name": "test_environment",
+            },
+            config_defaults={
+                "module_name": "great_expectations.datasource.data_connector"
+            },
+        )
+    )
+    my_data_connector._refresh_data_references_cache()
+
+    def linear_scan(batch_request):
+        batch_definition_list = [
+            batch_definition
+            for batch_definition in my_data_connector._get_batch_definition_list_from_cache()
+            if batch_definition_matches_batch_request(
+                batch_definition=batch_definition, batch_request=batch_request
+            )
+        ]
+        if batch_request.partition_request is not None:
+            batch_definition_list = build_partition_query(
+                partition_request_dict=batch_request.partition_request
+            ).select_from_partition_request(batch_definition_list=batch_definition_list)
+        return my_data_connector._sort_batch_definition_list(
+            batch_definition_list=batch_definition_list
+        )
+
+    for data_asset_name in [None, "TestFiles", "AbeFiles"]:
+        for partition_request in [
+            None,
+            {"batch_identifiers": {"name": "james"}},
+            {"batch_identifiers": {"timestamp": "20200809", "price": "1500"}},
+            {"batch_identifiers": {"name": "abe", "price": "1000"}, "index": -1},
+            {"batch_identifiers": {"name": "nobody"}},
+            {"batch_identifiers": {"unknown_key": "james"}},
+            {"batch_identifiers": {"timestamp": "20200811"}, "limit": 3},
+        ]:
+            batch_request = BatchRequestBase(
+                datasource_name="test_environment",
+                data_connector_name="general_filesystem_data_connector",
+                data_asset_name=data_asset_name,
+                partition_request=partition_request,
+            )
+            # Selecting the first batch definitions must not depend on whether the data asset was sorted before
+            for limit in [0, 2, 100]:
+                assert (
+                    my_data_connector._get_batch_definition_list_from_batch_request(
+                        batch_request=batch_request, limit=limit
+                    )
+                    == linear_scan(batch_request)[:limit]
+                )
+            assert my_data_connector._get_batch_definition_list_from_batch_request(
+                batch_request=batch_request
+            ) == linear_scan(batch_request)
+            assert (
+                my_data_connector.get_top_batch_definition_list_from_batch_request(
+                    batch_request=batch_request, limit=2
+                )
+                == linear_scan(batch_request)[:2]
+            )
+
+    # The index is rebuilt when the cache is refreshed
+    create_files_in_directory(
+        directory=base_directory, file_name_list=["zed_20200801_1000.csv"]
+    )
+    my_data_connector._refresh_data_references_cache()
+    assert my_data_connector._get_batch_definition_list_from_batch_request(
+        batch_request=BatchRequestBase(
+            datasource_name="test_environment",
+            data_connector_name="general_filesystem_data_connector",
+            data_asset_name="TestFiles",
+            partition_request={"batch_identifiers": {"name": "zed"}},
+        )
+    ) == [
+        BatchDefinition(
+            datasource_name="test_environment",
+            data_connector_name="general_filesystem_data_connector",
+            data_asset_name="TestFiles",
+            partition_definition=PartitionDefinition(
+                {"name": "zed", "timestamp": "20200801", "price": "1000"}
+            ),
+        )
+    ]
@@ -1,4 +1,5 @@
 from typing import List
+from unittest import mock
 
 import pytest
 from ruamel.yaml import YAML
@@ -13,6 +14,9 @@ from great_expectations.data_context.util import instantiate_class_from_config
 from great_expectations.datasource.data_connector import (
     InferredAssetFilesystemDataConnector,
 )
+from great_expectations.datasource.data_connector.util import (
+    get_filesystem_one_level_directory_glob_path_list,
+)
 from tests.test_utils import create_files_in_directory
 
 yaml = YAML()
@@ -903,3 +907,59 @@ def test_redundant_information_in_naming_convention_bucket_too_many_sorters(
                 },
             )
         )
+
+
+def test_listing_cache_globs_again_only_when_directories_change(tmp_path_factory):
+    base_directory = str(
+        tmp_path_factory.mktemp(
+            "test_listing_cache_globs_again_only_when_directories_change"
+        )
+    )
+    listing_cache_directory = str(tmp_path_factory.mktemp("listing_cache"))
+    create_files_in_directory(
+        directory=base_directory,
+        file_name_list=[
+            "2021/01/events_20210101.csv",
+            "2021/01/events_20210102.csv",
+        ],
+    )
+
+    def build_data_connector():
+        return InferredAssetFilesystemDataConnector(
+            name="my_data_connector",
+            datasource_name="FAKE_DATASOURCE_NAME",
+            default_regex={
+                "pattern": r"\d{4}/\d{2}/(.+)_(\d{8})\.csv",
+                "group_names": ["data_asset_name", "date"],
+            },
+            glob_directive="**/*.csv",
+            base_directory=base_directory,
+            listing_cache_directory=listing_cache_directory,
+        )
+
+    def refresh_and_count_globs(data_connector):
+        with mock.patch(
+            "great_expectations.datasource.data_connector.listing_cache.get_filesystem_one_level_directory_glob_path_list",
+            wraps=get_filesystem_one_level_directory_glob_path_list,
+        ) as glob_path_list:
+            # noinspection PyProtectedMember
+            data_connector._refresh_data_references_cache()
+        return glob_path_list.call_count
+
+    assert refresh_and_count_globs(build_data_connector()) == 1
+    # The listing is persisted, and reused while no directory changes
+    my_data_connector = build_data_connector()
+    assert refresh_and_count_globs(my_data_connector) == 0
+    assert my_data_connector.get_data_reference_list_count() == 2
+
+    # A new partition in a new directory
+    create_files_in_directory(
+        directory=base_directory, file_name_list=["2021/02/events_20210201.csv"]
+    )
+    assert refresh_and_count_globs(my_data_connector) == 1
+    assert sorted(my_data_connector._data_references_cache.keys()) == [
+        "2021/01/events_20210101.csv",
+        "2021/01/events_20210102.csv",
+        "2021/02/events_20210201.csv",
+    ]
+    assert refresh_and_count_globs(my_data_connector) == 0
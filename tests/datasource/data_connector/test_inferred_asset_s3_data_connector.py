@@ -992,3 +992,148 @@ def test_redundant_information_in_naming_convention_bucket_too_many_sorters():
 def test_bad_s3_regex_paths(path, expectation):
     with expectation:
         _check_valid_s3_path(path)
+
+
+@mock_s3
+def test_listing_cache_lists_only_new_keys(tmp_path_factory):
+    region_name: str = "us-east-1"
+    bucket: str = "test_bucket"
+    conn = boto3.resource("s3", region_name=region_name)
+    conn.create_bucket(Bucket=bucket)
+    client = boto3.client("s3", region_name=region_name)
+    listing_cache_directory = str(tmp_path_factory.mktemp("listing_cache"))
+
+    test_df: pd.DataFrame = pd.DataFrame(data={"col1": [1, 2], "col2": [3, 4]})
+
+    def put_objects(keys):
+        for key in keys:
+            client.put_object(
+                Bucket=bucket,
+                Body=test_df.to_csv(index=False).encode("utf-8"),
+                Key=key,
+            )
+
+    def build_data_connector():
+        return InferredAssetS3DataConnector(
+            name="my_data_connector",
+            datasource_name="FAKE_DATASOURCE_NAME",
+            default_regex={
+                "pattern": r"events/(\d{8})/(.+)\.csv",
+                "group_names": ["date", "part"],
+            },
+            bucket=bucket,
+            prefix="events",
+            listing_cache_directory=listing_cache_directory,
+        )
+
+    put_objects(
+        [
+            "events/20210101/part-0.csv",
+            "events/20210101/part-1.csv",
+            "events/20210102/part-0.csv",
+        ]
+    )
+    my_data_connector = build_data_connector()
+    # noinspection PyProtectedMember
+    my_data_connector._refresh_data_references_cache()
+    assert my_data_connector.get_data_reference_list_count() == 3
+
+    put_objects(["events/20210103/part-0.csv", "events/20210103/part-1.csv"])
+    list_objects_v2 = client.list_objects_v2
+    list_objects_v2_calls = []
+
+    def recording_list_objects_v2(**kwargs):
+        list_objects_v2_calls.append(kwargs)
+        return list_objects_v2(**kwargs)
+
+    # The listing is persisted: a new data connector only lists the keys added since
+    my_data_connector = build_data_connector()
+    my_data_connector._s3.list_objects_v2 = recording_list_objects_v2
+    my_data_connector._refresh_data_references_cache()
+    # The directories under the prefix are listed, then each known directory after its own watermark, and the new
+    # directory as a whole
+    assert [call.get("StartAfter") for call in list_objects_v2_calls] == [
+        None,
+        "events/20210101/part-1.csv",
+        "events/20210102/part-0.csv",
+        None,
+    ]
+    assert sorted(my_data_connector._data_references_cache.keys()) == [
+        "events/20210101/part-0.csv",
+        "events/20210101/part-1.csv",
+        "events/20210102/part-0.csv",
+        "events/20210103/part-0.csv",
+        "events/20210103/part-1.csv",
+    ]
+
+    # Nothing new
+    list_objects_v2_calls.clear()
+    my_data_connector._refresh_data_references_cache()
+    assert [call.get("StartAfter") for call in list_objects_v2_calls] == [
+        None,
+        "events/20210101/part-1.csv",
+        "events/20210102/part-0.csv",
+        "events/20210103/part-1.csv",
+    ]
+    assert my_data_connector.get_data_reference_list_count() == 5
+
+
+@mock_s3
+def test_listing_cache_lists_new_keys_of_every_directory_under_the_prefix(
+    tmp_path_factory,
+):
+    region_name: str = "us-east-1"
+    bucket: str = "test_bucket"
+    conn = boto3.resource("s3", region_name=region_name)
+    conn.create_bucket(Bucket=bucket)
+    client = boto3.client("s3", region_name=region_name)
+    listing_cache_directory = str(tmp_path_factory.mktemp("listing_cache"))
+
+    test_df: pd.DataFrame = pd.DataFrame(data={"col1": [1, 2], "col2": [3, 4]})
+
+    def put_objects(keys):
+        for key in keys:
+            client.put_object(
+                Bucket=bucket,
+                Body=test_df.to_csv(index=False).encode("utf-8"),
+                Key=key,
+            )
+
+    def build_data_connector():
+        return InferredAssetS3DataConnector(
+            name="my_data_connector",
+            datasource_name="FAKE_DATASOURCE_NAME",
+            default_regex={
+                "pattern": r"p/(.+)/(\d{4}-\d{2}-\d{2})\.csv",
+                "group_names": ["data_asset_name", "date"],
+            },
+            bucket=bucket,
+            prefix="p/",
+            listing_cache_directory=listing_cache_directory,
+        )
+
+    put_objects(["p/alpha/2020-01-01.csv", "p/beta/2020-01-01.csv"])
+    my_data_connector = build_data_connector()
+    # noinspection PyProtectedMember
+    my_data_connector._refresh_data_references_cache()
+    assert my_data_connector.get_data_reference_list_count() == 2
+
+    # A key added to the directory that sorts first, after keys of a later directory were listed
+    put_objects(["p/alpha/2020-01-02.csv"])
+    my_data_connector = build_data_connector()
+    my_data_connector._refresh_data_references_cache()
+    assert sorted(my_data_connector._data_references_cache.keys()) == [
+        "p/alpha/2020-01-01.csv",
+        "p/alpha/2020-01-02.csv",
+        "p/beta/2020-01-01.csv",
+    ]
+
+    # A new directory is listed as a whole; the keys of a deleted directory are dropped
+    put_objects(["p/gamma/2020-01-01.csv"])
+    client.delete_object(Bucket=bucket, Key="p/beta/2020-01-01.csv")
+    my_data_connector._refresh_data_references_cache()
+    assert sorted(my_data_connector._data_references_cache.keys()) == [
+        "p/alpha/2020-01-01.csv",
+        "p/alpha/2020-01-02.csv",
+        "p/gamma/2020-01-01.csv",
+    ]
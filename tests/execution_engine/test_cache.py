@@ -0,0 +1,89 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.execution_engine.cache import (
+    SizeBoundedCache,
+    estimate_size_bytes,
+)
+
+
+def test_estimate_size_bytes():
+    df = pd.DataFrame({"a": np.arange(1000, dtype="int64")})
+    assert estimate_size_bytes(df) >= 8000
+    assert estimate_size_bytes(df["a"]) >= 8000
+    assert estimate_size_bytes(np.zeros(100, dtype="int64")) == 800
+    assert estimate_size_bytes([np.zeros(100, dtype="int64")] * 2) > 1600
+
+
+def test_size_bounded_cache_evicts_least_recently_used():
+    cache = SizeBoundedCache(max_bytes=300, size_estimator=lambda value: 100)
+    for key in ["a", "b", "c"]:
+        cache.put(key, key)
+    assert cache.get("a") == "a"
+
+    cache.put("d", "d")
+
+    assert "b" not in cache
+    assert all(key in cache for key in ["a", "c", "d"])
+    assert cache.statistics == {
+        "entries": 3,
+        "current_bytes": 300,
+        "max_bytes": 300,
+        "hits": 1,
+        "misses": 0,
+        "evictions": 1,
+    }
+
+
+def test_size_bounded_cache_skips_values_larger_than_budget():
+    cache = SizeBoundedCache(max_bytes=10, size_estimator=len)
+    assert cache.put("small", "x" * 5) is True
+    assert cache.put("large", "x" * 50) is False
+    assert "large" not in cache
+    assert cache.get("large") is None
+    assert cache.statistics["misses"] == 1
+    assert cache.current_bytes == 5
+
+
+def test_size_bounded_cache_invalidate_and_pickle():
+    cache = SizeBoundedCache(max_bytes=None)
+    cache.put(("batch_1", "a"), 1)
+    cache.put(("batch_1", "b"), 2)
+    cache.put(("batch_2", "a"), 3)
+
+    assert cache.invalidate(lambda key: key[0] == "batch_1") == 2
+    assert len(cache) == 1
+    assert cache.current_bytes == estimate_size_bytes(3)
+
+    unpickled_cache = pickle.loads(pickle.dumps(cache))
+    assert unpickled_cache.get(("batch_2", "a")) == 3
+    unpickled_cache.put(("batch_2", "b"), 4)
+    assert len(unpickled_cache) == 2
+
+
+def test_size_bounded_cache_lfu_eviction_policy():
+    cache = SizeBoundedCache(
+        max_bytes=300, size_estimator=lambda value: 100, eviction_policy="lfu"
+    )
+    for key in ["a", "b", "c"]:
+        cache.put(key, key)
+    for key in ["a", "a", "b", "c", "b"]:
+        cache.get(key)
+
+    # "c" is the least frequently used entry, although "a" is the least recently used one
+    cache.put("d", "d")
+    assert "c" not in cache
+    assert all(key in cache for key in ["a", "b", "d"])
+
+    # "d" has not been used yet
+    cache.put("e", "e")
+    assert "d" not in cache
+    assert cache.statistics["evictions"] == 2
+
+
+def test_size_bounded_cache_unknown_eviction_policy():
+    with pytest.raises(ValueError):
+        SizeBoundedCache(max_bytes=10, eviction_policy="fifo")
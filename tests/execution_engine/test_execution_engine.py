@@ -1,3 +1,6 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest import mock
+
 import pandas as pd
 import pytest
 
@@ -167,3 +170,135 @@ def test_resolve_metrics_with_incomplete_metric_input():
     # Ensuring that incomplete metrics given raises a GreatExpectationsError
     with pytest.raises(GreatExpectationsError) as error:
         engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics={})
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_resolve_metrics_concurrently(executor):
+    df = pd.DataFrame({"a": [1, 2, 3, None], "b": [4, 5, 6, 7]})
+    desired_metrics = [
+        MetricConfiguration(
+            metric_name=metric_name,
+            metric_domain_kwargs={"column": column},
+            metric_value_kwargs=dict(),
+        )
+        for metric_name in ["column.mean", "column.max", "column.min"]
+        for column in ["a", "b"]
+    ]
+    sequential_metrics = PandasExecutionEngine(
+        batch_data_dict={"my_id": df}
+    ).resolve_metrics(metrics_to_resolve=desired_metrics)
+
+    # A fresh engine, so that no metric is taken from the metric cache of the sequential resolution
+    engine = PandasExecutionEngine(batch_data_dict={"my_id": df})
+    executor_class = (
+        ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+    )
+    with mock.patch.object(
+        executor_class, "submit", autospec=True, side_effect=executor_class.submit
+    ) as submit:
+        concurrent_metrics = engine.resolve_metrics(
+            metrics_to_resolve=desired_metrics,
+            runtime_configuration={
+                "concurrency": {
+                    "enabled": True,
+                    "executor": executor,
+                    "max_workers": 2,
+                }
+            },
+        )
+    assert concurrent_metrics == sequential_metrics
+    # The metrics of each column are resolved as one task
+    assert submit.call_count == 2
+    assert engine.metric_cache_statistics["hits"] == 0
+
+
+def test_resolve_metrics_concurrently_with_provided_executor():
+    df = pd.DataFrame({"a": [1, 2, 3, None]})
+    engine = PandasExecutionEngine(batch_data_dict={"my_id": df})
+    mean = MetricConfiguration(
+        metric_name="column.mean",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=dict(),
+    )
+    stdev = MetricConfiguration(
+        metric_name="column.standard_deviation",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=dict(),
+    )
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        metrics = engine.resolve_metrics(
+            metrics_to_resolve=(mean, stdev),
+            runtime_configuration={"concurrency": {"executor": executor}},
+        )
+        # The engine must not shut down an executor it does not own
+        assert executor.submit(lambda: 1).result() == 1
+    assert metrics == {mean.id: 2.0, stdev.id: 1.0}
+
+
+def test_resolve_metrics_concurrency_disabled():
+    df = pd.DataFrame({"a": [1, 2, 3, None]})
+    engine = PandasExecutionEngine(batch_data_dict={"my_id": df})
+    assert engine._get_metric_resolution_executor(
+        runtime_configuration={"concurrency": {"enabled": False}}, num_tasks=4
+    ) == (None, False)
+    assert engine._get_metric_resolution_executor(
+        runtime_configuration={"concurrency": {"enabled": True}}, num_tasks=1
+    ) == (None, False)
+
+
+def test_resolve_metrics_uses_metric_cache():
+    df = pd.DataFrame({"a": [1, 2, 3, None]})
+    engine = PandasExecutionEngine(batch_data_dict={"my_id": df})
+    mean = MetricConfiguration(
+        metric_name="column.mean",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=dict(),
+    )
+    assert engine.resolve_metrics(metrics_to_resolve=(mean,)) == {mean.id: 2.0}
+    assert engine.resolve_metrics(metrics_to_resolve=(mean,)) == {mean.id: 2.0}
+    statistics = engine.metric_cache_statistics
+    assert statistics["hits"] == 1
+    assert statistics["misses"] == 1
+    assert statistics["entries"] == 1
+
+    # Replacing the batch invalidates the metrics computed on it
+    engine.load_batch_data("my_id", pd.DataFrame({"a": [4, 6]}))
+    assert engine.metric_cache_statistics["entries"] == 0
+    assert engine.resolve_metrics(metrics_to_resolve=(mean,)) == {mean.id: 5.0}
+
+
+def test_resolve_metrics_keys_metric_cache_by_batch():
+    engine = PandasExecutionEngine()
+    engine.load_batch_data("batch_1", pd.DataFrame({"a": [1, 2, 3]}))
+    engine.load_batch_data("batch_2", pd.DataFrame({"a": [4, 5, 6]}))
+    max_by_batch = {
+        batch_id: MetricConfiguration(
+            metric_name="column.max",
+            metric_domain_kwargs={"column": "a", "batch_id": batch_id},
+            metric_value_kwargs=dict(),
+        )
+        for batch_id in ["batch_1", "batch_2"]
+    }
+    metrics = engine.resolve_metrics(metrics_to_resolve=max_by_batch.values())
+    assert metrics == {
+        max_by_batch["batch_1"].id: 3,
+        max_by_batch["batch_2"].id: 6,
+    }
+
+    engine.load_batch_data("batch_1", pd.DataFrame({"a": [7, 8, 9]}))
+    metrics = engine.resolve_metrics(metrics_to_resolve=max_by_batch.values())
+    assert metrics == {
+        max_by_batch["batch_1"].id: 9,
+        max_by_batch["batch_2"].id: 6,
+    }
+    assert engine.metric_cache_statistics["hits"] == 1
+
+
+@pytest.mark.parametrize(
+    "engine_kwargs", [{"metric_cache_max_bytes": 0}, {"caching": False}]
+)
+def test_metric_cache_can_be_disabled(engine_kwargs):
+    engine = PandasExecutionEngine(
+        batch_data_dict={"my_id": pd.DataFrame({"a": [1, 2, 3]})}, **engine_kwargs
+    )
+    assert engine.metric_cache_statistics is None
@@ -0,0 +1,198 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import great_expectations.exceptions.exceptions as ge_exceptions
+from great_expectations.core.batch import Batch
+from great_expectations.core.batch_spec import PathBatchSpec
+from great_expectations.core.expectation_configuration import ExpectationConfiguration
+from great_expectations.execution_engine.pandas_batch_data import ChunkedPandasBatchData
+from great_expectations.execution_engine.pandas_execution_engine import (
+    PandasExecutionEngine,
+)
+from great_expectations.validator.validator import Validator
+
+
+@pytest.fixture
+def chunked_test_df():
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame(
+        {
+            "a": rng.integers(0, 50, 103).astype(float),
+            "b": rng.choice(["x", "y", "z", None], 103),
+            "c": rng.normal(size=103),
+        }
+    )
+    df.loc[[3, 50, 77], "a"] = np.nan
+    return df
+
+
+@pytest.fixture
+def chunked_test_expectation_configurations():
+    return [
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_not_be_null",
+            kwargs={"column": "a", "result_format": "COMPLETE"},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_between",
+            kwargs={"column": "a", "min_value": 5, "max_value": 40},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_in_set",
+            kwargs={
+                "column": "b",
+                "value_set": ["x", "y"],
+                "row_condition": "a>10",
+                "condition_parser": "pandas",
+                "result_format": "COMPLETE",
+            },
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_min_to_be_between",
+            kwargs={"column": "a", "min_value": 0, "max_value": 100},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_max_to_be_between",
+            kwargs={"column": "a", "min_value": 0, "max_value": 100},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_sum_to_be_between",
+            kwargs={"column": "a", "min_value": 0, "max_value": 1e9},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_mean_to_be_between",
+            kwargs={"column": "c", "min_value": -1, "max_value": 1},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_stdev_to_be_between",
+            kwargs={"column": "c", "min_value": 0, "max_value": 3},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_median_to_be_between",
+            kwargs={"column": "a", "min_value": 0, "max_value": 100},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_quantile_values_to_be_between",
+            kwargs={
+                "column": "a",
+                "quantile_ranges": {
+                    "quantiles": [0.1, 0.5, 0.9],
+                    "value_ranges": [[0, 100], [0, 100], [0, 100]],
+                },
+            },
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_distinct_values_to_be_in_set",
+            kwargs={"column": "b", "value_set": ["x", "y"]},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_unique_value_count_to_be_between",
+            kwargs={"column": "b", "min_value": 1, "max_value": 10},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_proportion_of_unique_values_to_be_between",
+            kwargs={"column": "b", "min_value": 0, "max_value": 1},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_value_z_scores_to_be_less_than",
+            kwargs={"column": "c", "threshold": 2, "double_sided": True},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_table_row_count_to_be_between",
+            kwargs={"min_value": 1, "max_value": 1000},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_table_columns_to_match_ordered_list",
+            kwargs={"column_list": ["a", "b", "c"]},
+        ),
+    ]
+
+
+def _validate_batch(path, expectation_configurations, chunk_size=None):
+    engine = PandasExecutionEngine()
+    batch_data, _ = engine.get_batch_data_and_markers(
+        batch_spec=PathBatchSpec(path=path, chunk_size=chunk_size)
+    )
+    validator = Validator(execution_engine=engine, batches=[Batch(data=batch_data)])
+    return validator.graph_validate(expectation_configurations)
+
+
+def _assert_results_match(chunked_results, full_results):
+    assert len(chunked_results) == len(full_results)
+    for chunked_result, full_result in zip(chunked_results, full_results):
+        assert chunked_result.success == full_result.success
+        observed_value = full_result.result.get("observed_value")
+        if isinstance(observed_value, float):
+            assert chunked_result.result["observed_value"] == pytest.approx(
+                observed_value
+            )
+        else:
+            assert (
+                chunked_result.to_json_dict()["result"]
+                == full_result.to_json_dict()["result"]
+            )
+
+
+@pytest.mark.parametrize("extension", ["csv", "parquet"])
+def test_chunked_validation_matches_full_validation(
+    tmp_path, chunked_test_df, chunked_test_expectation_configurations, extension
+):
+    path = str(tmp_path / f"test.{extension}")
+    if extension == "csv":
+        chunked_test_df.to_csv(path, index=False)
+    else:
+        chunked_test_df.to_parquet(path)
+
+    full_results = _validate_batch(path, chunked_test_expectation_configurations)
+    chunked_results = _validate_batch(
+        path, chunked_test_expectation_configurations, chunk_size=10
+    )
+    _assert_results_match(chunked_results, full_results)
+
+
+def test_chunked_batch_data_is_read_in_chunks(tmp_path, chunked_test_df):
+    path = str(tmp_path / "test.csv")
+    chunked_test_df.to_csv(path, index=False)
+    engine = PandasExecutionEngine()
+    batch_data, batch_markers = engine.get_batch_data_and_markers(
+        batch_spec=PathBatchSpec(path=path, chunk_size=25)
+    )
+    assert isinstance(batch_data, ChunkedPandasBatchData)
+    assert "pandas_data_fingerprint" not in batch_markers
+
+    chunks = list(batch_data.iter_chunks())
+    assert [len(chunk) for chunk in chunks] == [25, 25, 25, 25, 3]
+    # Chunks are indexed by their row position in the whole batch
+    assert list(chunks[1].index) == list(range(25, 50))
+
+    with pytest.raises(ge_exceptions.ExecutionEngineError):
+        batch_data.dataframe
+
+
+def test_chunked_batch_raises_for_window_metrics(tmp_path, chunked_test_df):
+    path = str(tmp_path / "test.csv")
+    chunked_test_df.to_csv(path, index=False)
+    with pytest.raises(ge_exceptions.ExecutionEngineError) as e:
+        _validate_batch(
+            path,
+            [
+                ExpectationConfiguration(
+                    expectation_type="expect_column_values_to_be_unique",
+                    kwargs={"column": "a"},
+                )
+            ],
+            chunk_size=10,
+        )
+    assert "cannot be computed on a batch that is read in chunks" in str(e.value)
+
+
+def test_chunked_batch_raises_for_unsupported_reader_method(tmp_path):
+    path = str(tmp_path / "test.xlsx")
+    engine = PandasExecutionEngine()
+    with pytest.raises(ge_exceptions.BatchSpecError):
+        engine.get_batch_data_and_markers(
+            batch_spec=PathBatchSpec(
+                path=path, reader_method="read_excel", chunk_size=10
+            )
+        )
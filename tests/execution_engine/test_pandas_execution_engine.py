@@ -1,22 +1,27 @@
+import copy
 import datetime
+import hashlib
 import os
 import random
 from pathlib import Path
 from typing import List
+from unittest import mock
 
 import boto3
+import numpy as np
 import pandas as pd
 import pytest
 from botocore.errorfactory import ClientError
 from moto import mock_s3
 
 import great_expectations.exceptions.exceptions as ge_exceptions
-from great_expectations.core.batch import BatchDefinition
+from great_expectations.core.batch import Batch, BatchDefinition
 from great_expectations.core.batch_spec import (
     PathBatchSpec,
     RuntimeDataBatchSpec,
     S3BatchSpec,
 )
+from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.core.id_dict import PartitionDefinition
 from great_expectations.datasource.data_connector import ConfiguredAssetS3DataConnector
 from great_expectations.exceptions.metric_exceptions import MetricProviderError
@@ -25,6 +30,7 @@ from great_expectations.execution_engine.pandas_execution_engine import (
     PandasExecutionEngine,
 )
 from great_expectations.validator.validation_graph import MetricConfiguration
+from great_expectations.validator.validator import Validator
 
 
 def test_reader_fn():
@@ -202,6 +208,94 @@ def test_get_compute_domain_with_unmeetable_row_condition():
     assert accessor_kwargs == {}, "Accessor kwargs have been modified"
 
 
+def test_get_compute_domain_caches_row_condition_domains():
+    df = pd.DataFrame({"a": [1, 2, 3, 4], "b": [2, 3, 4, None]})
+    engine = PandasExecutionEngine(batch_data_dict={"my_id": df})
+    domain_kwargs = {"row_condition": "b>2", "condition_parser": "pandas"}
+
+    data, _, _ = engine.get_compute_domain(
+        {"column": "a", **domain_kwargs}, domain_type="column"
+    )
+    same_data, _, _ = engine.get_compute_domain(
+        {"column": "b", **domain_kwargs}, domain_type="column"
+    )
+    # The cached domain is shared, without being copied
+    assert np.shares_memory(same_data["a"].values, data["a"].values)
+    assert data.equals(df.query("b>2").reset_index(drop=True))
+
+    statistics = engine.compute_domain_cache_statistics
+    assert statistics["hits"] == 1 and statistics["misses"] == 1
+    assert statistics["entries"] == 1 and statistics["current_bytes"] > 0
+
+    # Projected identity domains are cached separately from the filtered domain
+    projected_data, _, _ = engine.get_compute_domain(
+        {"column": "a", **domain_kwargs}, domain_type="identity"
+    )
+    assert list(projected_data.columns) == ["a"]
+    assert engine.compute_domain_cache_statistics["entries"] == 2
+
+    # Replacing the batch invalidates its cached domains
+    engine.load_batch_data("my_id", pd.DataFrame({"a": [5, 6], "b": [7, 1]}))
+    assert engine.compute_domain_cache_statistics["entries"] == 0
+    data, _, _ = engine.get_compute_domain(
+        {"column": "a", **domain_kwargs}, domain_type="column"
+    )
+    assert data["a"].tolist() == [5]
+
+
+def test_get_compute_domain_returns_cached_domains_that_metrics_can_restructure():
+    df = pd.DataFrame({"a": [1, 2, 3, 4], "b": [2, 3, 4, None]})
+    engine = PandasExecutionEngine(batch_data_dict={"my_id": df})
+    domain_kwargs = {"row_condition": "b>2", "condition_parser": "pandas"}
+
+    data, _, _ = engine.get_compute_domain(domain_kwargs, domain_type="table")
+    # A metric function adding, dropping and renaming columns of its domain
+    data["c"] = data["a"] * 2
+    data.drop(columns=["b"], inplace=True)
+    data.rename(columns={"a": "renamed"}, inplace=True)
+
+    other_data, _, _ = engine.get_compute_domain(domain_kwargs, domain_type="table")
+    assert engine.compute_domain_cache_statistics["hits"] == 1
+    assert other_data.equals(df.query("b>2").reset_index(drop=True))
+
+
+def test_get_compute_domain_cache_can_be_disabled():
+    df = pd.DataFrame({"a": [1, 2, 3, 4], "b": [2, 3, 4, None]})
+    engine = PandasExecutionEngine(
+        batch_data_dict={"my_id": df}, compute_domain_cache_max_bytes=0
+    )
+    domain_kwargs = {"row_condition": "b>2", "condition_parser": "pandas"}
+    data, _, _ = engine.get_compute_domain(domain_kwargs, domain_type="table")
+    other_data, _, _ = engine.get_compute_domain(domain_kwargs, domain_type="table")
+    assert data is not other_data
+    assert engine.compute_domain_cache_statistics is None
+
+
+def test_copied_engine_has_its_own_batches_and_caches():
+    df = pd.DataFrame({"a": [1, 2, 3, 4], "b": [2, 3, 4, None]})
+    engine = PandasExecutionEngine(batch_data_dict={"my_id": df})
+    column_max = MetricConfiguration("column.max", dict(column="a"), dict())
+    engine.resolve_metrics(metrics_to_resolve=(column_max,))
+    engine.get_compute_domain(
+        {"row_condition": "b>2", "condition_parser": "pandas"}, domain_type="table"
+    )
+
+    engine_copy = copy.copy(engine)
+    assert engine_copy.active_batch_data is engine.active_batch_data
+    assert engine_copy.metric_cache_statistics["entries"] == 0
+    assert engine_copy.compute_domain_cache_statistics["entries"] == 0
+
+    # Loading a batch and resolving metrics on the copy leaves the original engine alone
+    engine_copy.load_batch_data("other_id", pd.DataFrame({"a": [7]}))
+    assert engine_copy.resolve_metrics(metrics_to_resolve=(column_max,)) == {
+        column_max.id: 7
+    }
+    assert list(engine.loaded_batch_data_dict.keys()) == ["my_id"]
+    assert engine.active_batch_data_id == "my_id"
+    assert engine.metric_cache_statistics["entries"] == 1
+    assert engine.compute_domain_cache_statistics["entries"] == 1
+
+
 # Just checking that the Pandas Execution Engine can perform these in sequence
 def test_resolve_metric_bundle():
     df = pd.DataFrame({"a": [1, 2, 3, None]})
@@ -230,6 +324,91 @@ def test_resolve_metric_bundle():
     )
 
 
+def test_resolve_metric_bundle_materializes_each_compute_domain_once():
+    df = pd.DataFrame({"a": [1, 2, 3, None, 5], "b": [10, 20, 30, 40, 50]})
+    engine = PandasExecutionEngine(batch_data_dict={"made-up-id": df})
+    domain_kwargs = {"row_condition": "b>15", "condition_parser": "pandas"}
+    desired_metrics = [
+        MetricConfiguration(
+            metric_name=metric_name,
+            metric_domain_kwargs={"column": column, **domain_kwargs},
+            metric_value_kwargs=dict(),
+        )
+        for metric_name in ["column.min", "column.max", "column.mean", "column.sum"]
+        for column in ["a", "b"]
+    ]
+
+    compute_domain_calls = []
+    get_compute_domain = engine.get_compute_domain
+
+    def spy_get_compute_domain(domain_kwargs, domain_type, **kwargs):
+        compute_domain_calls.append(domain_type)
+        return get_compute_domain(domain_kwargs, domain_type, **kwargs)
+
+    engine.get_compute_domain = spy_get_compute_domain
+    metrics = engine.resolve_metrics(metrics_to_resolve=desired_metrics)
+
+    assert compute_domain_calls == ["identity"]
+    results = {
+        (metric.metric_name, metric.metric_domain_kwargs["column"]): metrics[metric.id]
+        for metric in desired_metrics
+    }
+    assert results == {
+        ("column.min", "a"): 2.0,
+        ("column.min", "b"): 20,
+        ("column.max", "a"): 5.0,
+        ("column.max", "b"): 50,
+        ("column.mean", "a"): 10 / 3,
+        ("column.mean", "b"): 35.0,
+        ("column.sum", "a"): 10.0,
+        ("column.sum", "b"): 140,
+    }
+
+
+def test_resolve_metric_bundle_with_map_condition():
+    df = pd.DataFrame({"a": [1, 2, 3, None, 5]})
+    engine = PandasExecutionEngine(batch_data_dict={"made-up-id": df})
+    condition = MetricConfiguration(
+        metric_name="column_values.in_set.condition",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"value_set": [1, 2, 3]},
+    )
+    metrics = engine.resolve_metrics(metrics_to_resolve=(condition,))
+    unexpected_condition, compute_domain_kwargs, accessor_domain_kwargs = metrics[
+        condition.id
+    ]
+    assert list(unexpected_condition) == [False, False, False, True]
+    assert compute_domain_kwargs == {}
+    assert accessor_domain_kwargs == {"column": "a"}
+
+    unexpected_count = MetricConfiguration(
+        metric_name="column_values.in_set.unexpected_count",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"value_set": [1, 2, 3]},
+        metric_dependencies={"unexpected_condition": condition},
+    )
+    metrics.update(
+        engine.resolve_metrics(metrics_to_resolve=(unexpected_count,), metrics=metrics)
+    )
+    assert metrics[unexpected_count.id] == 1
+
+
+def test_resolve_metric_bundle_with_nonexistent_column():
+    df = pd.DataFrame({"a": [1, 2, 3, None]})
+    engine = PandasExecutionEngine(batch_data_dict={"made-up-id": df})
+    desired_metric = MetricConfiguration(
+        metric_name="column.max",
+        metric_domain_kwargs={"column": "non_existent_column"},
+        metric_value_kwargs=dict(),
+    )
+    with pytest.raises(ge_exceptions.ExecutionEngineError) as e:
+        engine.resolve_metrics(metrics_to_resolve=(desired_metric,))
+    assert (
+        str(e.value)
+        == 'Error: The column "non_existent_column" in BatchData does not exist.'
+    )
+
+
 # Ensuring that we can properly inform user when metric doesn't exist - should get a metric provider error
 def test_resolve_metric_bundle_with_nonexistent_metric():
     df = pd.DataFrame({"a": [1, 2, 3, None]})
@@ -467,6 +646,61 @@ def test_get_batch_s3_compressed_files(test_s3_files_compressed, test_df_small):
     assert df.dataframe.shape == test_df_small.shape
 
 
+@pytest.mark.parametrize("s3_read_ahead_bytes", [None, 4, 0])
+def test_get_batch_s3_with_s3_read_ahead_bytes(
+    test_s3_files, test_df_small, s3_read_ahead_bytes
+):
+    bucket, keys = test_s3_files
+    batch_spec = S3BatchSpec(
+        path=f"s3a://{os.path.join(bucket, keys[0])}", reader_method="read_csv"
+    )
+    engine = PandasExecutionEngine(s3_read_ahead_bytes=s3_read_ahead_bytes)
+    df = engine.get_batch_data(batch_spec=batch_spec)
+    assert df.dataframe.equals(test_df_small)
+
+
+@pytest.fixture
+def test_s3_parquet_file(s3, s3_bucket, tmp_path):
+    df = pd.DataFrame({f"col{i}": np.arange(40000) * i for i in range(10)})
+    path = tmp_path / "file.parquet"
+    df.to_parquet(path, row_group_size=10000)
+    s3.put_object(Bucket=s3_bucket, Body=path.read_bytes(), Key="file.parquet")
+    return f"s3a://{s3_bucket}/file.parquet", df
+
+
+def test_get_batch_s3_parquet_reads_only_requested_columns(test_s3_parquet_file):
+    path, df = test_s3_parquet_file
+    engine = PandasExecutionEngine()
+    get_object_ranges = []
+    get_object = engine._s3.get_object
+
+    def _get_object(**kwargs):
+        get_object_ranges.append(kwargs.get("Range"))
+        return get_object(**kwargs)
+
+    with mock.patch.object(engine._s3, "get_object", side_effect=_get_object):
+        batch_data = engine.get_batch_data(
+            batch_spec=S3BatchSpec(path=path, reader_options={"columns": ["col1"]})
+        )
+
+    assert batch_data.dataframe.equals(df[["col1"]])
+    # The footer and the column chunk of each row group are fetched, rather than the whole object
+    assert len(get_object_ranges) == 5
+    assert None not in get_object_ranges
+
+
+def test_get_batch_s3_parquet_in_chunks(test_s3_parquet_file):
+    path, df = test_s3_parquet_file
+    batch_data = PandasExecutionEngine().get_batch_data(
+        batch_spec=S3BatchSpec(
+            path=path, reader_options={"columns": ["col2"]}, chunk_size=12000
+        )
+    )
+    chunks = list(batch_data.iter_chunks())
+    assert [len(chunk) for chunk in chunks] == [12000, 12000, 12000, 4000]
+    assert pd.concat(chunks).equals(df[["col2"]])
+
+
 def test_get_batch_with_split_on_column_value(test_df):
     split_df = PandasExecutionEngine().get_batch_data(
         RuntimeDataBatchSpec(
@@ -577,6 +811,27 @@ def test_get_batch_with_split_on_multi_column_values(test_df):
         )
 
 
+def test_get_batch_with_split_on_multi_column_values_with_missing_values():
+    df = pd.DataFrame(
+        {
+            "id": [0, 1, 2, 3],
+            "a": pd.array([1, 1, pd.NA, 1], dtype="Int64"),
+            "b": pd.array(["x", pd.NA, "x", "x"], dtype="string"),
+        }
+    )
+    split_df = PandasExecutionEngine().get_batch_data(
+        RuntimeDataBatchSpec(
+            batch_data=df,
+            splitter_method="_split_on_multi_column_values",
+            splitter_kwargs={
+                "column_names": ["a", "b"],
+                "partition_definition": {"a": 1, "b": "x"},
+            },
+        )
+    )
+    assert split_df.dataframe.id.tolist() == [0, 3]
+
+
 def test_get_batch_with_split_on_hashed_column(test_df):
     with pytest.raises(ge_exceptions.ExecutionEngineError):
         split_df = PandasExecutionEngine().get_batch_data(
@@ -611,9 +866,77 @@ def test_get_batch_with_split_on_hashed_column(test_df):
     assert split_df.dataframe.shape == (8, 10)
 
 
-### Sampling methods ###
+def test_splitters_match_row_by_row_semantics():
+    df = pd.DataFrame(
+        {
+            "x": [-25, -5, 5, 25, 35],
+            "name": ["a", None, "b", float("nan"), "a"],
+            "ts": pd.to_datetime(
+                [
+                    "2020-01-01 10:00",
+                    "2020-01-01 23:30",
+                    "2020-01-02 10:00",
+                    "2020-01-02 10:30",
+                    "2020-01-01 10:00",
+                ]
+            ).tz_localize("US/Eastern"),
+        }
+    )
+    engine = PandasExecutionEngine()
+
+    # Quotients are truncated towards zero, as int() does
+    assert list(
+        engine._split_on_divided_integer(
+            df, column_name="x", divisor=10, partition_definition={"x": -2}
+        ).x
+    ) == [-25]
+    assert list(
+        engine._split_on_mod_integer(
+            df, column_name="x", mod=10, partition_definition={"x": 5}
+        ).x
+    ) == [-25, -5, 5, 25, 35]
+    # Missing values are hashed as they are printed
+    assert (
+        list(
+            engine._split_on_hashed_column(
+                df,
+                column_name="name",
+                hash_digits=32,
+                partition_definition={"hash_value": hashlib.md5(b"None").hexdigest()},
+            ).index
+        )
+        == [1]
+    )
+    assert (
+        list(
+            engine._sample_using_hash(
+                df,
+                column_name="name",
+                hash_digits=32,
+                hash_value=hashlib.md5(b"nan").hexdigest(),
+            ).index
+        )
+        == [3]
+    )
+    assert list(
+        engine._split_on_converted_datetime(
+            df, column_name="ts", partition_definition={"ts": "2020-01-01"}
+        ).index
+    ) == [0, 1, 4]
+    assert (
+        list(
+            engine._split_on_converted_datetime(
+                df,
+                column_name="ts",
+                partition_definition={"ts": "10:00"},
+                date_format_string="%H:%M",
+            ).index
+        )
+        == [0, 2, 4]
+    )
 
 
+### Sampling methods ###
 def test_sample_using_random(test_df):
     random.seed(1)
     sampled_df = PandasExecutionEngine().get_batch_data(
@@ -702,3 +1025,103 @@ def test_get_batch_with_split_on_divided_integer_and_sample_on_list(test_df):
     assert split_df.dataframe.shape == (2, 10)
     assert split_df.dataframe.id.min() == 54
     assert split_df.dataframe.id.max() == 59
+
+
+### Reader pushdown ###
+@pytest.mark.parametrize("extension", ["csv", "parquet"])
+def test_reader_pushdown_reads_only_the_columns_used_by_the_validation(
+    tmp_path, test_df, extension
+):
+    path = str(tmp_path / f"test.{extension}")
+    if extension == "csv":
+        test_df.to_csv(path, index=False)
+    else:
+        test_df.to_parquet(path)
+    expectation_configurations = [
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_not_be_null",
+            kwargs={"column": "id"},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_mean_to_be_between",
+            kwargs={"column": "batch_id", "min_value": 0, "max_value": 10},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_table_row_count_to_be_between",
+            kwargs={"min_value": 1, "max_value": 10000},
+        ),
+    ]
+    batch_spec = {
+        "path": path,
+        "splitter_method": "_split_on_column_value",
+        "splitter_kwargs": {
+            "column_name": "batch_id",
+            "partition_definition": {"batch_id": 2},
+        },
+    }
+
+    results = []
+    for reader_pushdown in [False, True]:
+        engine = PandasExecutionEngine(reader_pushdown=reader_pushdown)
+        batch_data = engine.get_batch_data(PathBatchSpec(batch_spec))
+        validator = Validator(execution_engine=engine, batches=[Batch(data=batch_data)])
+        results.append(validator.graph_validate(expectation_configurations))
+    full_results, pushdown_results = results
+
+    assert [result.to_json_dict() for result in pushdown_results] == [
+        result.to_json_dict() for result in full_results
+    ]
+    assert engine.config["reader_pushdown"] is True
+    assert batch_data.projected_columns == ["batch_id", "id"]
+    assert sorted(batch_data.dataframe.columns) == ["batch_id", "id"]
+
+    # A metric on the whole table widens the projection, and the batch is read again
+    assert validator.get_metric(
+        MetricConfiguration("table.columns", metric_domain_kwargs={})
+    ) == list(test_df.columns)
+    assert batch_data.projected_columns is None
+    assert len(batch_data.dataframe) == len(test_df[test_df.batch_id == 2])
+
+
+def test_reader_pushdown_filters_parquet_files_on_splitter_values(
+    tmp_path, test_df, monkeypatch
+):
+    path = str(tmp_path / "test.parquet")
+    test_df.to_parquet(path)
+    read_parquet_calls = []
+    read_parquet = pd.read_parquet
+
+    def recording_read_parquet(*args, **kwargs):
+        read_parquet_calls.append(kwargs)
+        return read_parquet(*args, **kwargs)
+
+    monkeypatch.setattr(pd, "read_parquet", recording_read_parquet)
+    batch_spec = PathBatchSpec(
+        path=path,
+        splitter_method="_split_on_multi_column_values",
+        splitter_kwargs={
+            "column_names": ["y", "m"],
+            "partition_definition": {"y": 2020, "m": 1},
+        },
+    )
+    batch_data = PandasExecutionEngine(reader_pushdown=True).get_batch_data(batch_spec)
+    batch_data.project_columns(["id"])
+    df = batch_data.dataframe
+
+    assert read_parquet_calls == [
+        {"columns": ["id", "y", "m"], "filters": [("y", "==", 2020), ("m", "==", 1)]}
+    ]
+    expected_df = PandasExecutionEngine().get_batch_data(batch_spec).dataframe
+    # Rows filtered out by the reader are not numbered
+    assert df.equals(expected_df[["id", "y", "m"]].reset_index(drop=True))
+
+
+def test_reader_pushdown_falls_back_to_reading_all_columns(tmp_path, test_df):
+    path = str(tmp_path / "test.csv")
+    test_df.to_csv(path, index=False)
+    batch_data = PandasExecutionEngine(reader_pushdown=True).get_batch_data(
+        PathBatchSpec(path=path)
+    )
+    batch_data.project_columns(["id", "not_a_column"])
+
+    assert batch_data.dataframe.equals(pd.read_csv(path))
@@ -0,0 +1,96 @@
+import io
+import os
+
+import boto3
+import numpy as np
+import pandas as pd
+import pytest
+from moto import mock_s3
+
+from great_expectations.execution_engine.s3_object_file import (
+    S3ObjectRawFile,
+    open_s3_object,
+)
+
+BUCKET = "test_bucket"
+
+
+@pytest.fixture
+def s3():
+    os.environ["AWS_ACCESS_KEY_ID"] = "testing"
+    os.environ["AWS_SECRET_ACCESS_KEY"] = "testing"
+    os.environ["AWS_SECURITY_TOKEN"] = "testing"
+    os.environ["AWS_SESSION_TOKEN"] = "testing"
+    with mock_s3():
+        s3 = boto3.client("s3", region_name="us-east-1")
+        s3.create_bucket(Bucket=BUCKET)
+        yield s3
+
+
+def test_s3_object_raw_file_reads_byte_ranges(s3):
+    s3.put_object(Bucket=BUCKET, Key="data.bin", Body=bytes(range(256)) * 4)
+    raw = S3ObjectRawFile(s3=s3, bucket=BUCKET, key="data.bin")
+
+    assert raw.size == 1024
+    assert raw.name == "s3://test_bucket/data.bin"
+    assert raw.read(4) == bytes([0, 1, 2, 3])
+    assert raw.seek(-2, io.SEEK_END) == 1022
+    assert raw.read(10) == bytes([254, 255])
+    assert raw.read(10) == b""
+    raw.seek(256)
+    assert raw.read() == bytes(range(256)) * 3
+    assert raw.num_requests == 3
+    assert raw.num_bytes_fetched == 4 + 2 + 768
+
+
+def test_s3_object_raw_file_keeps_the_footer_in_memory(s3):
+    s3.put_object(Bucket=BUCKET, Key="data.bin", Body=bytes(range(256)))
+    raw = S3ObjectRawFile(s3=s3, bucket=BUCKET, key="data.bin", footer_bytes=16)
+
+    raw.seek(-8, io.SEEK_END)
+    assert raw.read(8) == bytes(range(248, 256))
+    raw.seek(-16, io.SEEK_END)
+    assert raw.read(8) == bytes(range(240, 248))
+    assert raw.num_requests == 1
+    raw.seek(0)
+    assert raw.read(2) == bytes([0, 1])
+    assert raw.num_requests == 2
+
+
+def test_open_s3_object_reads_ahead(s3):
+    s3.put_object(Bucket=BUCKET, Key="data.bin", Body=bytes(range(256)) * 4)
+    with open_s3_object(
+        s3=s3, bucket=BUCKET, key="data.bin", read_ahead_bytes=512
+    ) as s3_file:
+        data = b"".join(iter(lambda: s3_file.read(16), b""))
+        assert s3_file.raw.num_requests == 2
+
+    assert data == bytes(range(256)) * 4
+
+
+def test_open_s3_object_for_pandas_readers(s3, tmp_path):
+    df = pd.DataFrame({f"column_{i}": np.arange(10000) * i for i in range(10)})
+    df.to_csv(tmp_path / "data.csv", index=False)
+    df.to_parquet(tmp_path / "data.parquet", row_group_size=2500)
+    for file_name in ["data.csv", "data.parquet"]:
+        s3.put_object(
+            Bucket=BUCKET,
+            Key=file_name,
+            Body=(tmp_path / file_name).read_bytes(),
+        )
+
+    with open_s3_object(
+        s3=s3, bucket=BUCKET, key="data.csv", read_ahead_bytes=64 * 1024
+    ) as s3_file:
+        assert pd.read_csv(s3_file).equals(df)
+
+    # Only the footer and the chunks of the requested column are fetched
+    with open_s3_object(
+        s3=s3,
+        bucket=BUCKET,
+        key="data.parquet",
+        read_ahead_bytes=0,
+        footer_bytes=64 * 1024,
+    ) as s3_file:
+        assert pd.read_parquet(s3_file, columns=["column_1"]).equals(df[["column_1"]])
+        assert s3_file.num_bytes_fetched < s3_file.size / 2
@@ -1,3 +1,4 @@
+import copy
 import datetime
 import logging
 import os
@@ -17,6 +18,10 @@ from great_expectations.exceptions import GreatExpectationsError
 from great_expectations.exceptions.metric_exceptions import MetricProviderError
 from great_expectations.execution_engine import SparkDFExecutionEngine
 from great_expectations.execution_engine.execution_engine import MetricDomainTypes
+from great_expectations.execution_engine.sparkdf_execution_engine import (
+    DEFAULT_MAX_PERSISTED_BATCHES,
+    MAX_FILTERED_DOMAINS,
+)
 from great_expectations.validator.validation_graph import MetricConfiguration
 from tests.test_utils import build_spark_engine
 
@@ -1216,3 +1221,145 @@ def test_dataframe_property_given_loaded_batch(
 
     # Ensuring Data not distorted
     assert engine.dataframe == df
+
+
+def _build_engine(spark_session, **kwargs):
+    spark_config = dict(spark_session.sparkContext.getConf().getAll())
+    return SparkDFExecutionEngine(spark_config=spark_config, **kwargs)
+
+
+def test_loaded_batches_are_persisted_and_unpersisted(spark_session):
+    df = spark_session.createDataFrame(pd.DataFrame({"a": [1, 2, 3]}))
+    engine = _build_engine(spark_session, persist_storage_level="MEMORY_ONLY")
+    engine.load_batch_data(batch_id="1234", batch_data=df)
+
+    assert df.is_cached
+    assert df.storageLevel == pyspark.StorageLevel.MEMORY_ONLY
+    assert engine.config["persist_storage_level"] == "MEMORY_ONLY"
+    assert engine.persistence_statistics["persisted_batch_ids"] == ["1234"]
+
+    # Loading other data under the same batch_id evicts the previous data
+    other_df = spark_session.createDataFrame(pd.DataFrame({"a": [4, 5, 6]}))
+    engine.load_batch_data(batch_id="1234", batch_data=other_df)
+    assert not df.is_cached
+    assert other_df.is_cached
+
+    # Released batches are persisted again when they are used again
+    engine.release_batch_data(batch_id="1234")
+    assert not other_df.is_cached
+    assert engine.persistence_statistics["persisted_batch_ids"] == []
+    engine.get_compute_domain(domain_kwargs={}, domain_type="table")
+    assert other_df.is_cached
+    assert engine.persistence_statistics["unpersisted_batches"] == 2
+
+
+def test_persisted_batches_are_bounded(spark_session):
+    engine = _build_engine(spark_session, max_persisted_batches=2)
+    dfs = [spark_session.createDataFrame(pd.DataFrame({"a": [i]})) for i in range(3)]
+    engine.load_batch_data(batch_id="0", batch_data=dfs[0])
+    engine.load_batch_data(batch_id="1", batch_data=dfs[1])
+    # Using batch "0" makes batch "1" the least recently used one
+    engine.get_compute_domain(domain_kwargs={"batch_id": "0"}, domain_type="table")
+    engine.load_batch_data(batch_id="2", batch_data=dfs[2])
+
+    assert [df.is_cached for df in dfs] == [True, False, True]
+    assert engine.persistence_statistics["persisted_batch_ids"] == ["0", "2"]
+
+
+def test_persisted_batches_are_bounded_by_default(spark_session):
+    engine = _build_engine(spark_session)
+    dfs = [
+        spark_session.createDataFrame(pd.DataFrame({"a": [i]}))
+        for i in range(DEFAULT_MAX_PERSISTED_BATCHES + 1)
+    ]
+    for i, df in enumerate(dfs):
+        engine.load_batch_data(batch_id=str(i), batch_data=df)
+
+    assert not dfs[0].is_cached
+    assert len(engine.persistence_statistics["persisted_batch_ids"]) == (
+        DEFAULT_MAX_PERSISTED_BATCHES
+    )
+
+
+def test_batches_persisted_by_their_owner_are_left_alone(spark_session):
+    df = spark_session.createDataFrame(pd.DataFrame({"a": [1, 2, 3]})).cache()
+    engine = _build_engine(spark_session)
+    engine.load_batch_data(batch_id="1234", batch_data=df)
+    engine.unpersist()
+
+    assert df.is_cached
+    assert engine.persistence_statistics["persisted_batch_ids"] == []
+
+
+def test_persist_can_be_disabled(spark_session):
+    df = spark_session.createDataFrame(pd.DataFrame({"a": [1, 2, 3]}))
+    engine = _build_engine(spark_session, persist=False)
+    engine.load_batch_data(batch_id="1234", batch_data=df)
+
+    assert not df.is_cached
+
+
+def test_reused_filtered_domains_are_persisted(spark_session):
+    df = spark_session.createDataFrame(pd.DataFrame({"a": [1, 2, 3, 4]}))
+    engine = _build_engine(spark_session, persist_filtered_domains_after=2)
+    engine.load_batch_data(batch_id="1234", batch_data=df)
+    domain_kwargs = {"row_condition": "a > 2", "condition_parser": "spark"}
+
+    first_data, _, _ = engine.get_compute_domain(domain_kwargs, domain_type="table")
+    assert not first_data.is_cached
+    second_data, _, _ = engine.get_compute_domain(domain_kwargs, domain_type="table")
+    assert second_data is first_data
+    assert second_data.is_cached
+    assert second_data.count() == 2
+    statistics = engine.persistence_statistics
+    assert statistics["persisted_filtered_domains"] == 1
+    assert statistics["filtered_domain_hits"] == 1
+    assert statistics["filtered_domain_misses"] == 1
+
+    engine.unpersist(batch_id="1234")
+    assert not second_data.is_cached
+    assert engine.persistence_statistics["persisted_filtered_domains"] == 0
+
+
+def test_filtered_domains_are_bounded(spark_session):
+    df = spark_session.createDataFrame(pd.DataFrame({"a": [1, 2, 3, 4]}))
+    engine = _build_engine(spark_session, persist_filtered_domains_after=1)
+    engine.load_batch_data(batch_id="1234", batch_data=df)
+    filtered_dfs = [
+        engine.get_compute_domain(
+            {"row_condition": f"a > {i}", "condition_parser": "spark"},
+            domain_type="table",
+        )[0]
+        for i in range(MAX_FILTERED_DOMAINS + 1)
+    ]
+
+    assert not filtered_dfs[0].is_cached
+    assert all(filtered_df.is_cached for filtered_df in filtered_dfs[1:])
+    assert (
+        engine.persistence_statistics["persisted_filtered_domains"]
+        == MAX_FILTERED_DOMAINS
+    )
+
+
+def test_copies_do_not_unpersist_batches_persisted_by_another_engine(spark_session):
+    df = spark_session.createDataFrame(pd.DataFrame({"a": [1, 2, 3, 4]}))
+    engine = _build_engine(spark_session, persist_filtered_domains_after=1)
+    engine.load_batch_data(batch_id="1234", batch_data=df)
+    domain_kwargs = {"row_condition": "a > 2", "condition_parser": "spark"}
+    filtered_df, _, _ = engine.get_compute_domain(domain_kwargs, domain_type="table")
+
+    engine_copy = copy.copy(engine)
+    assert engine_copy.persistence_statistics["persisted_batch_ids"] == []
+    assert engine_copy.persistence_statistics["filtered_domain_misses"] == 0
+    assert engine_copy._persistence_lock is not engine._persistence_lock
+    engine_copy.get_compute_domain(domain_kwargs, domain_type="table")
+    engine_copy.release_batch_data(batch_id="1234")
+
+    assert df.is_cached
+    assert filtered_df.is_cached
+    assert engine.persistence_statistics["persisted_batch_ids"] == ["1234"]
+
+
+def test_unknown_persist_storage_level_raises(spark_session):
+    with pytest.raises(ge_exceptions.ExecutionEngineError):
+        _build_engine(spark_session, persist_storage_level="NOWHERE")
@@ -1,12 +1,13 @@
 import logging
 import os
+from unittest import mock
 
 import pandas as pd
 import pytest
 
 from great_expectations.core.batch import Batch, BatchSpec
 from great_expectations.data_context.util import file_relative_path
-from great_expectations.exceptions import GreatExpectationsError
+from great_expectations.exceptions import ExecutionEngineError, GreatExpectationsError
 from great_expectations.exceptions.exceptions import InvalidConfigError
 from great_expectations.exceptions.metric_exceptions import MetricProviderError
 from great_expectations.execution_engine.execution_engine import MetricDomainTypes
@@ -505,3 +506,170 @@ def test_resolve_metric_bundle_with_nonexistent_metric(sa):
             )
         )
         print(e)
+
+
+def test_instantiation_with_unknown_unexpected_count_strategy(sa):
+    with pytest.raises(InvalidConfigError):
+        SqlAlchemyExecutionEngine(
+            engine=sa.create_engine("sqlite://"),
+            unexpected_count_strategy="not_a_strategy",
+        )
+
+
+@pytest.mark.parametrize("strategy", ["auto", "subquery", "temp_table"])
+def test_unexpected_count_strategies_for_window_conditions(sa, strategy):
+    engine = _build_sa_engine(
+        pd.DataFrame({"a": [1, 2, 3, 3, None], "b": [4, 4, 4, 4, 4]}), sa
+    )
+    engine._unexpected_count_strategy = strategy
+
+    condition_metric = MetricConfiguration(
+        metric_name="column_values.unique.condition",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=dict(),
+    )
+    metrics = engine.resolve_metrics(metrics_to_resolve=(condition_metric,))
+    desired_metric = MetricConfiguration(
+        metric_name="column_values.unique.unexpected_count",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=dict(),
+        metric_dependencies={"unexpected_condition": condition_metric},
+    )
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(desired_metric,), metrics=metrics
+    )
+    assert results[desired_metric.id] == 2
+
+    temp_tables = engine.engine.execute(
+        "SELECT name FROM sqlite_temp_master UNION ALL SELECT name FROM sqlite_master WHERE name LIKE 'ge_tmp_%'"
+    ).fetchall()
+    # Only the temp_table strategy should write the condition to the database
+    assert bool(temp_tables) == (strategy == "temp_table")
+
+
+def _resolve_window_condition_unexpected_count(engine):
+    condition_metric = MetricConfiguration(
+        metric_name="column_values.unique.condition",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=dict(),
+    )
+    metrics = engine.resolve_metrics(metrics_to_resolve=(condition_metric,))
+    desired_metric = MetricConfiguration(
+        metric_name="column_values.unique.unexpected_count",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=dict(),
+        metric_dependencies={"unexpected_condition": condition_metric},
+    )
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(desired_metric,), metrics=metrics
+    )
+    return results[desired_metric.id]
+
+
+def test_auto_unexpected_count_strategy_falls_back_for_unsupported_queries(sa):
+    engine = _build_sa_engine(
+        pd.DataFrame({"a": [1, 2, 3, 3, None], "b": [4, 4, 4, 4, 4]}), sa
+    )
+    unsupported = sa.exc.ProgrammingError("SELECT ...", {}, Exception("syntax"))
+    with mock.patch(
+        "great_expectations.expectations.metrics.map_metric._sqlalchemy_unexpected_count_with_subquery",
+        side_effect=unsupported,
+    ) as subquery:
+        assert _resolve_window_condition_unexpected_count(engine) == 2
+
+    subquery.assert_called_once()
+    # The fallback applies to this computation only; the engine's strategy is left alone
+    assert engine.unexpected_count_strategy == "auto"
+
+
+def test_auto_unexpected_count_strategy_does_not_fall_back_for_other_errors(sa):
+    engine = _build_sa_engine(
+        pd.DataFrame({"a": [1, 2, 3, 3, None], "b": [4, 4, 4, 4, 4]}), sa
+    )
+    lost_connection = sa.exc.OperationalError("SELECT ...", {}, Exception("gone"))
+    with mock.patch(
+        "great_expectations.expectations.metrics.map_metric._sqlalchemy_unexpected_count_with_subquery",
+        side_effect=lost_connection,
+    ), mock.patch(
+        "great_expectations.expectations.metrics.map_metric._sqlalchemy_unexpected_count_with_temp_table"
+    ) as temp_table:
+        with pytest.raises(ExecutionEngineError):
+            _resolve_window_condition_unexpected_count(engine)
+
+    temp_table.assert_not_called()
+    assert engine.unexpected_count_strategy == "auto"
+
+
+def test_resolve_metrics_bundles_column_histograms_into_one_query(sa):
+    engine = _build_sa_engine(
+        pd.DataFrame({"a": [1, 2, 3, 4, None], "b": [2, 3, 4, 5, 6]}), sa
+    )
+    histogram_metrics = [
+        MetricConfiguration(
+            metric_name="column.histogram",
+            metric_domain_kwargs={"column": column},
+            metric_value_kwargs={"bins": (1, 3, 6)},
+        )
+        for column in ["a", "b"]
+    ]
+
+    statements = []
+
+    def count_statements(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sa.event.listen(engine.engine, "before_cursor_execute", count_statements)
+    try:
+        results = engine.resolve_metrics(metrics_to_resolve=histogram_metrics)
+    finally:
+        sa.event.remove(engine.engine, "before_cursor_execute", count_statements)
+
+    assert len(statements) == 1
+    assert results[histogram_metrics[0].id] == [2, 2]
+    assert results[histogram_metrics[1].id] == [1, 4]
+
+
+def test_resolve_metrics_resolves_unbundleable_column_metrics_individually(sa):
+    engine = _build_sa_engine(pd.DataFrame({"a": [1, 2, 3, 4, None]}), sa)
+    nonnull_count = MetricConfiguration(
+        metric_name="column_values.nonnull.count",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=dict(),
+    )
+    metrics = {nonnull_count.id: 4}
+
+    # sqlite has no percentile functions, so the median is computed by its own query
+    median = MetricConfiguration(
+        metric_name="column.median",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=dict(),
+        metric_dependencies={"column_values.nonnull.count": nonnull_count},
+    )
+    results = engine.resolve_metrics(metrics_to_resolve=(median,), metrics=metrics)
+    assert results[median.id] == 2.5
+
+
+def test_column_percentile_select_compiles_per_dialect(sa):
+    from sqlalchemy.dialects import mssql, postgresql
+
+    from great_expectations.expectations.metrics.column_aggregate_metrics.column_quantile_values import (
+        get_column_percentile_select,
+    )
+
+    column = sa.column("a")
+    postgresql_select = str(
+        get_column_percentile_select(
+            "percentile_disc", column, 0.25, "postgresql"
+        ).compile(dialect=postgresql.dialect())
+    )
+    assert "percentile_disc" in postgresql_select
+    assert "WITHIN GROUP (ORDER BY a ASC)" in postgresql_select
+    assert "OVER" not in postgresql_select
+
+    mssql_select = str(
+        get_column_percentile_select("percentile_cont", column, 0.5, "mssql").compile(
+            dialect=mssql.dialect()
+        )
+    )
+    assert "percentile_cont" in mssql_select
+    assert mssql_select.endswith("OVER ()")
@@ -0,0 +1,68 @@
+import time
+
+import pytest
+
+from great_expectations.core.evaluation_parameters import (
+    _compile_evaluation_parameter,
+    _compile_evaluation_parameter_cached,
+    parse_evaluation_parameter,
+)
+
+NUM_EXPECTATIONS = 5000
+NUM_RUNS = 3
+
+
+def _build_parameter_expressions():
+    # As in a suite whose expectations compare each column to the metrics of an upstream suite
+    return [
+        f"urn:great_expectations:validations:upstream_suite:expect_column_max_to_be_between.result"
+        f".observed_value:column=column_{i % 500} * {1 + (i % 10) / 10}"
+        for i in range(NUM_EXPECTATIONS)
+    ]
+
+
+def _build_evaluation_parameters(run):
+    return {
+        f"urn:great_expectations:validations:upstream_suite:expect_column_max_to_be_between.result"
+        f".observed_value:column=column_{i}": i + run
+        for i in range(500)
+    }
+
+
+def _time_evaluations(parameter_expressions):
+    results = []
+    start_time = time.perf_counter()
+    for run in range(NUM_RUNS):
+        evaluation_parameters = _build_evaluation_parameters(run)
+        results.append(
+            [
+                parse_evaluation_parameter(parameter_expression, evaluation_parameters)
+                for parameter_expression in parameter_expressions
+            ]
+        )
+    return results, time.perf_counter() - start_time
+
+
+@pytest.mark.benchmark
+def test_benchmark_evaluation_parameters_for_5000_expectations(monkeypatch):
+    parameter_expressions = _build_parameter_expressions()
+
+    # Caching disabled: every evaluation parses its expression again
+    with monkeypatch.context() as m:
+        m.setattr(
+            "great_expectations.core.evaluation_parameters._compile_evaluation_parameter_cached",
+            _compile_evaluation_parameter,
+        )
+        uncached_results, uncached_time = _time_evaluations(parameter_expressions)
+
+    _compile_evaluation_parameter_cached.cache_clear()
+    cached_results, cached_time = _time_evaluations(parameter_expressions)
+
+    print(
+        f"\nEvaluation of {len(parameter_expressions)} $PARAMETER references in {NUM_RUNS} validation runs:\n"
+        f"  parsing every evaluation: {uncached_time:.3f}s\n"
+        f"  compiled and cached:      {cached_time:.3f}s "
+        f"({_compile_evaluation_parameter_cached.cache_info().misses} expressions parsed)"
+    )
+    assert cached_results == uncached_results
+    assert cached_time < uncached_time
@@ -0,0 +1,162 @@
+import hashlib
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.execution_engine import PandasExecutionEngine
+
+NUM_ROWS = 1_000_000
+
+
+# The row-by-row implementations that the vectorized splitters and samplers replaced
+def _split_on_converted_datetime(
+    df, column_name, partition_definition, date_format_string="%Y-%m-%d"
+):
+    stringified_datetime_series = df[column_name].map(
+        lambda x: x.strftime(date_format_string)
+    )
+    return df[stringified_datetime_series == partition_definition[column_name]]
+
+
+def _split_on_divided_integer(df, column_name, divisor, partition_definition):
+    matching_divisor = partition_definition[column_name]
+    return df[df[column_name].map(lambda x: int(x / divisor) == matching_divisor)]
+
+
+def _split_on_mod_integer(df, column_name, mod, partition_definition):
+    matching_mod_value = partition_definition[column_name]
+    return df[df[column_name].map(lambda x: x % mod == matching_mod_value)]
+
+
+def _split_on_multi_column_values(df, column_names, partition_definition):
+    subset_df = df.copy()
+    for column_name in column_names:
+        subset_df = subset_df[
+            subset_df[column_name] == partition_definition[column_name]
+        ]
+    return subset_df
+
+
+def _split_on_hashed_column(
+    df, column_name, hash_digits, partition_definition, hash_function_name="md5"
+):
+    hash_method = getattr(hashlib, hash_function_name)
+    return df[
+        df[column_name].map(
+            lambda x: hash_method(str(x).encode()).hexdigest()[-1 * hash_digits :]
+            == partition_definition["hash_value"]
+        )
+    ]
+
+
+def _sample_using_mod(df, column_name, mod, value):
+    return df[df[column_name].map(lambda x: x % mod == value)]
+
+
+def _sample_using_hash(
+    df, column_name, hash_digits=1, hash_value="f", hash_function_name="md5"
+):
+    hash_func = getattr(hashlib, hash_function_name)
+    return df[
+        df[column_name].map(
+            lambda x: hash_func(str(x).encode()).hexdigest()[-1 * hash_digits :]
+            == hash_value
+        )
+    ]
+
+
+BENCHMARK_CASES = [
+    (
+        "_split_on_converted_datetime",
+        _split_on_converted_datetime,
+        {
+            "column_name": "timestamp",
+            "partition_definition": {"timestamp": "2020-03-01"},
+        },
+    ),
+    (
+        "_split_on_divided_integer",
+        _split_on_divided_integer,
+        {"column_name": "id", "divisor": 1000, "partition_definition": {"id": 42}},
+    ),
+    (
+        "_split_on_mod_integer",
+        _split_on_mod_integer,
+        {"column_name": "id", "mod": 10, "partition_definition": {"id": 3}},
+    ),
+    (
+        "_split_on_multi_column_values",
+        _split_on_multi_column_values,
+        {
+            "column_names": ["y", "m"],
+            "partition_definition": {"y": 2020, "m": 3},
+        },
+    ),
+    (
+        "_split_on_hashed_column",
+        _split_on_hashed_column,
+        {
+            "column_name": "user_id",
+            "hash_digits": 1,
+            "partition_definition": {"hash_value": "a"},
+        },
+    ),
+    (
+        "_sample_using_mod",
+        _sample_using_mod,
+        {"column_name": "id", "mod": 10, "value": 3},
+    ),
+    (
+        "_sample_using_hash",
+        _sample_using_hash,
+        {"column_name": "user_id", "hash_digits": 1, "hash_value": "f"},
+    ),
+]
+
+
+@pytest.fixture(scope="module")
+def benchmark_df():
+    rng = np.random.RandomState(1)
+    timestamps = pd.Timestamp("2020-01-01") + pd.to_timedelta(
+        rng.randint(0, 365 * 24 * 3600, NUM_ROWS), unit="s"
+    )
+    return pd.DataFrame(
+        {
+            "id": np.arange(NUM_ROWS),
+            "timestamp": timestamps,
+            "y": timestamps.year,
+            "m": timestamps.month,
+            "user_id": rng.randint(0, 10000, NUM_ROWS),
+            "value": rng.random_sample(NUM_ROWS),
+        }
+    )
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize(
+    "method_name,row_by_row_method,method_kwargs",
+    BENCHMARK_CASES,
+    ids=[case[0] for case in BENCHMARK_CASES],
+)
+def test_benchmark_pandas_splitters_and_samplers(
+    benchmark_df, method_name, row_by_row_method, method_kwargs
+):
+    start_time = time.perf_counter()
+    row_by_row_df = row_by_row_method(benchmark_df, **method_kwargs)
+    row_by_row_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    vectorized_df = getattr(PandasExecutionEngine, method_name)(
+        benchmark_df, **method_kwargs
+    )
+    vectorized_time = time.perf_counter() - start_time
+
+    print(
+        f"\n{method_name} on {NUM_ROWS} rows ({len(vectorized_df)} rows kept):\n"
+        f"  row by row: {row_by_row_time:.3f}s\n"
+        f"  vectorized: {vectorized_time:.3f}s"
+    )
+    assert vectorized_df.equals(row_by_row_df)
+    assert vectorized_time < row_by_row_time
@@ -0,0 +1,124 @@
+import time
+
+import pandas as pd
+import pytest
+
+from great_expectations.core.batch import Batch
+from great_expectations.core.expectation_configuration import ExpectationConfiguration
+from great_expectations.core.id_dict import IDDict
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.expectations.registry import get_expectation_impl
+from great_expectations.validator.validation_graph import ValidationGraph
+from great_expectations.validator.validator import Validator
+
+NUM_COLUMNS = 200
+
+
+def _build_expectation_configurations(columns):
+    configurations = []
+    for column in columns:
+        configurations.extend(
+            [
+                ExpectationConfiguration(
+                    expectation_type="expect_column_values_to_not_be_null",
+                    kwargs={"column": column},
+                ),
+                ExpectationConfiguration(
+                    expectation_type="expect_column_values_to_be_between",
+                    kwargs={"column": column, "min_value": 0, "max_value": 100},
+                ),
+                ExpectationConfiguration(
+                    expectation_type="expect_column_values_to_be_in_set",
+                    kwargs={"column": column, "value_set": [1, 2, 3]},
+                ),
+                ExpectationConfiguration(
+                    expectation_type="expect_column_max_to_be_between",
+                    kwargs={"column": column, "min_value": 0, "max_value": 100},
+                ),
+                ExpectationConfiguration(
+                    expectation_type="expect_column_mean_to_be_between",
+                    kwargs={"column": column, "min_value": 0, "max_value": 100},
+                ),
+            ]
+        )
+    return configurations
+
+
+def _build_and_schedule_graph(validator, configurations):
+    graph = ValidationGraph()
+    for configuration in configurations:
+        expectation_impl = get_expectation_impl(configuration.expectation_type)
+        validation_dependencies = expectation_impl().get_validation_dependencies(
+            configuration, validator.execution_engine
+        )["metrics"]
+        for metric_configuration in validation_dependencies.values():
+            validator.build_metric_dependency_graph(
+                graph,
+                metric_configuration,
+                configuration,
+                validator.execution_engine,
+            )
+
+    # Walk the graph the way resolve_validation_graph does, without touching the data
+    metrics = {}
+    for ready_metrics in graph.resolution_levels(metrics):
+        metrics.update({metric.id: None for metric in ready_metrics})
+    return graph
+
+
+def _time_graph_build(validator, configurations, id_calls):
+    start_time = time.perf_counter()
+    graph = _build_and_schedule_graph(validator, configurations)
+    elapsed_time = time.perf_counter() - start_time
+    return graph, elapsed_time, id_calls[0]
+
+
+@pytest.mark.benchmark
+def test_benchmark_graph_build_for_1000_expectations(monkeypatch):
+    columns = [f"column_{i}" for i in range(NUM_COLUMNS)]
+    df = pd.DataFrame({column: [1, 2, 3] for column in columns})
+    validator = Validator(
+        execution_engine=PandasExecutionEngine(), batches=[Batch(data=df)]
+    )
+    configurations = _build_expectation_configurations(columns)
+    assert len(configurations) == 1000
+    # Warm up the metric and expectation registries before timing
+    _build_and_schedule_graph(validator, configurations)
+
+    compute_id = IDDict._compute_id
+    id_calls = [0]
+
+    def counting_compute_id(self, *args, **kwargs):
+        id_calls[0] += 1
+        return compute_id(self, *args, **kwargs)
+
+    monkeypatch.setattr(IDDict, "_compute_id", counting_compute_id)
+
+    # Memoization disabled: every access to an id hashes the kwargs again
+    with monkeypatch.context() as m:
+        m.setattr(
+            IDDict,
+            "to_id",
+            lambda self, id_keys=None, id_ignore_keys=None: self._compute_id(
+                id_keys=id_keys, id_ignore_keys=id_ignore_keys
+            ),
+        )
+        unmemoized_graph, unmemoized_time, unmemoized_calls = _time_graph_build(
+            validator, configurations, id_calls
+        )
+
+    id_calls[0] = 0
+    memoized_graph, memoized_time, memoized_calls = _time_graph_build(
+        validator, configurations, id_calls
+    )
+
+    print(
+        f"\nGraph build for {len(configurations)} expectations "
+        f"({len(memoized_graph.metric_configurations)} metrics):\n"
+        f"  without id memoization: {unmemoized_time:.3f}s, {unmemoized_calls} id computations\n"
+        f"  with id memoization:    {memoized_time:.3f}s, {memoized_calls} id computations"
+    )
+    assert set(memoized_graph.metric_configurations) == set(
+        unmemoized_graph.metric_configurations
+    )
+    assert memoized_calls < unmemoized_calls
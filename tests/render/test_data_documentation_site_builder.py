@@ -1,11 +1,16 @@
 import os
+import pickle
+import re
 import shutil
+from contextlib import ExitStack
 from typing import Dict
+from unittest import mock
 
 import pytest
 from freezegun import freeze_time
 
 from great_expectations import DataContext
+from great_expectations.core import ExpectationSuite, ExpectationSuiteValidationResult
 from great_expectations.core.run_identifier import RunIdentifier
 from great_expectations.data_context.store import ExpectationsStore, ValidationsStore
 from great_expectations.data_context.types.resource_identifiers import (
@@ -202,7 +207,7 @@ def test_configuration_driven_site_builder(
     site_builder = SiteBuilder(
         data_context=context,
         runtime_environment={"root_directory": context.root_directory},
-        **local_site_config
+        **local_site_config,
     )
     res = site_builder.build()
 
@@ -326,7 +331,7 @@ def test_configuration_driven_site_builder(
     team_site_builder = SiteBuilder(
         data_context=context,
         runtime_environment={"root_directory": context.root_directory},
-        **team_site_config
+        **team_site_config,
     )
     team_site_builder.clean_site()
     obs = [
@@ -350,7 +355,7 @@ def test_configuration_driven_site_builder(
     site_builder = SiteBuilder(
         data_context=context,
         runtime_environment={"root_directory": context.root_directory},
-        **local_site_config
+        **local_site_config,
     )
     res = site_builder.build()
 
@@ -433,7 +438,7 @@ def test_configuration_driven_site_builder_skip_and_clean_missing(
     site_builder = SiteBuilder(
         data_context=context,
         runtime_environment={"root_directory": context.root_directory},
-        **local_site_config
+        **local_site_config,
     )
     site_builder.build()
 
@@ -565,7 +570,7 @@ def test_configuration_driven_site_builder_without_how_to_buttons(
     site_builder = SiteBuilder(
         data_context=context,
         runtime_environment={"root_directory": context.root_directory},
-        **local_site_config
+        **local_site_config,
     )
     res = site_builder.build()
 
@@ -715,3 +720,269 @@ def test_site_builder_usage_statistics_disabled(
             page_contents = f.read()
             assert expected_logo_url in page_contents
             assert data_context_id not in page_contents
+
+
+def test_site_builder_incremental_build(
+    site_builder_data_context_with_html_store_titanic_random,
+):
+    context = site_builder_data_context_with_html_store_titanic_random
+    context.profile_datasource("titanic")
+
+    local_site_config = context._project_config.data_docs_sites["local_site"]
+    site_builder = SiteBuilder(
+        data_context=context,
+        runtime_environment={"root_directory": context.root_directory},
+        incremental_build=True,
+        **local_site_config,
+    )
+    expectation_suite_keys = context.stores["expectations_store"].list_keys()
+    validation_result_keys = context.stores["validations_store"].list_keys()
+
+    def build_and_count_renders():
+        render_calls = {}
+        patches = []
+        for section_name, section_builder in site_builder.site_section_builders.items():
+            render_calls[section_name] = mock.MagicMock(
+                wraps=section_builder.renderer_class.render
+            )
+            patches.append(
+                mock.patch.object(
+                    section_builder.renderer_class,
+                    "render",
+                    render_calls[section_name],
+                )
+            )
+        with ExitStack() as stack:
+            for patch in patches:
+                stack.enter_context(patch)
+            get_validation_result = stack.enter_context(
+                mock.patch.object(
+                    context,
+                    "get_validation_result",
+                    wraps=context.get_validation_result,
+                )
+            )
+            _, index_links_dict = site_builder.build()
+        return (
+            {name: calls.call_count for name, calls in render_calls.items()},
+            get_validation_result.call_count,
+            index_links_dict,
+        )
+
+    render_counts, validation_reads, first_index_links_dict = build_and_count_renders()
+    assert render_counts == {
+        "expectations": len(expectation_suite_keys),
+        "validations": 0,
+        "profiling": len(validation_result_keys),
+    }
+    # The index is built from what was recorded when the profiling results were rendered
+    assert validation_reads == 0
+
+    manifest = site_builder.target_store.get_manifest()
+    assert set(manifest["sections"]["profiling"]["resources"]) == {
+        "/".join(key.to_tuple()) for key in validation_result_keys
+    }
+
+    # Nothing changed: no page is rendered again
+    render_counts, validation_reads, index_links_dict = build_and_count_renders()
+    assert render_counts == {"expectations": 0, "validations": 0, "profiling": 0}
+    assert validation_reads == 0
+    assert index_links_dict == first_index_links_dict
+
+    # Only the changed expectation suite is rendered again
+    expectation_suite = context.get_expectation_suite(
+        expectation_suite_keys[0].expectation_suite_name
+    )
+    expectation_suite.meta["notes"] = "changed"
+    context.save_expectation_suite(expectation_suite)
+    render_counts, _, _ = build_and_count_renders()
+    assert render_counts == {"expectations": 1, "validations": 0, "profiling": 0}
+
+    # Pages of removed resources are cleaned up, and forgotten by the manifest
+    context.stores["validations_store"].store_backend.remove_key(
+        validation_result_keys[0].to_tuple()
+    )
+    build_and_count_renders()
+    assert validation_result_keys[0] not in {
+        ValidationResultIdentifier.from_tuple(result_tuple)
+        for result_tuple in site_builder.target_store.store_backends[
+            ValidationResultIdentifier
+        ].list_keys()
+    }
+    manifest = site_builder.target_store.get_manifest()
+    assert "/".join(validation_result_keys[0].to_tuple()) not in (
+        manifest["sections"]["profiling"]["resources"]
+    )
+
+    # Cleaning the site removes the manifest as well
+    site_builder.clean_site()
+    assert site_builder.target_store.get_manifest() is None
+
+
+@pytest.mark.parametrize("executor", ["process", "thread"])
+def test_site_builder_with_concurrency(
+    site_builder_data_context_with_html_store_titanic_random, executor
+):
+    context = site_builder_data_context_with_html_store_titanic_random
+    context.profile_datasource("titanic")
+    local_site_config = context._project_config.data_docs_sites["local_site"]
+    data_docs_directory = os.path.join(context.root_directory, "uncommitted/data_docs")
+
+    def build_pages(concurrency=None):
+        site_builder = SiteBuilder(
+            data_context=context,
+            runtime_environment={"root_directory": context.root_directory},
+            concurrency=concurrency,
+            **local_site_config,
+        )
+        site_builder.build()
+        pages = {}
+        for section_name in ["expectations", "validations"]:
+            section_directory = os.path.join(
+                data_docs_directory, "local_site", section_name
+            )
+            for root, _, filenames in os.walk(section_directory):
+                for filename in filenames:
+                    with open(os.path.join(root, filename)) as f:
+                        page = f.read()
+                    # Ignore the render time in the logo URL and the random ids of collapsible blocks
+                    page = re.sub(r"\?d=[0-9T.]+Z", "", page)
+                    page = re.sub(r"collapse-body-[0-9a-f-]{36}", "", page)
+                    pages[os.path.join(root, filename)] = page
+        shutil.rmtree(data_docs_directory)
+        return pages
+
+    serial_pages = build_pages()
+    with mock.patch(
+        "great_expectations.render.renderer.site_builder.DefaultSiteSectionBuilder._log_render_executor_error"
+    ) as log_render_executor_error:
+        concurrent_pages = build_pages(
+            {"enabled": True, "executor": executor, "max_workers": 2, "chunk_size": 3}
+        )
+    # Every page was rendered by the executor
+    log_render_executor_error.assert_not_called()
+    assert len(serial_pages) > 3
+    assert concurrent_pages == serial_pages
+
+
+def _exit_page_render_worker(serialized_resource, **kwargs):
+    os._exit(1)
+
+
+def _raise_pickling_error(*args):
+    raise pickle.PicklingError("not picklable")
+
+
+@pytest.mark.parametrize("failure", ["broken_pool", "unpicklable_resources"])
+def test_site_builder_with_concurrency_renders_serially_when_the_pool_fails(
+    site_builder_data_context_with_html_store_titanic_random, failure
+):
+    context = site_builder_data_context_with_html_store_titanic_random
+    context.profile_datasource("titanic")
+    local_site_config = context._project_config.data_docs_sites["local_site"]
+    site_builder = SiteBuilder(
+        data_context=context,
+        runtime_environment={"root_directory": context.root_directory},
+        concurrency={"enabled": True, "executor": "process", "max_workers": 2},
+        **local_site_config,
+    )
+
+    with ExitStack() as stack:
+        if failure == "broken_pool":
+            stack.enter_context(
+                mock.patch(
+                    "great_expectations.render.renderer.site_builder._render_page_in_worker",
+                    _exit_page_render_worker,
+                )
+            )
+        else:
+            for resource_class in [ExpectationSuite, ExpectationSuiteValidationResult]:
+                stack.enter_context(
+                    mock.patch.object(
+                        resource_class, "__reduce_ex__", _raise_pickling_error
+                    )
+                )
+        log_rendering_error = stack.enter_context(
+            mock.patch(
+                "great_expectations.render.renderer.site_builder.DefaultSiteSectionBuilder._log_rendering_error"
+            )
+        )
+        log_render_executor_error = stack.enter_context(
+            mock.patch(
+                "great_expectations.render.renderer.site_builder.DefaultSiteSectionBuilder._log_render_executor_error"
+            )
+        )
+        _, index_links_dict = site_builder.build()
+
+    assert log_render_executor_error.called
+    log_rendering_error.assert_not_called()
+    expectation_suite_filepaths = [
+        link["filepath"] for link in index_links_dict["expectations_links"]
+    ]
+    assert len(expectation_suite_filepaths) > 1
+    for filepath in expectation_suite_filepaths:
+        assert os.path.isfile(
+            os.path.join(
+                context.root_directory, "uncommitted/data_docs/local_site", filepath
+            )
+        )
+
+
+def test_site_builder_with_paginated_index(
+    site_builder_data_context_with_html_store_titanic_random,
+):
+    context = site_builder_data_context_with_html_store_titanic_random
+    context.profile_datasource("titanic")
+    local_site_config = context._project_config.data_docs_sites["local_site"]
+    site_directory = os.path.join(
+        context.root_directory, "uncommitted/data_docs/local_site"
+    )
+
+    def build_index(index_page_size=None):
+        site_builder = SiteBuilder(
+            data_context=context,
+            runtime_environment={"root_directory": context.root_directory},
+            **{
+                **local_site_config,
+                "site_index_builder": {
+                    "class_name": "DefaultSiteIndexBuilder",
+                    "index_page_size": index_page_size,
+                },
+            },
+        )
+        return site_builder.build()
+
+    _, index_links_dict = build_index()
+    expectation_suite_filepaths = [
+        link["filepath"] for link in index_links_dict["expectations_links"]
+    ]
+    assert len(expectation_suite_filepaths) > 1
+    assert not os.path.exists(os.path.join(site_directory, "index_page_2.html"))
+
+    # One link of each section per page
+    index_page_url, paginated_index_links_dict = build_index(index_page_size=1)
+    assert index_page_url.endswith("index.html")
+    assert paginated_index_links_dict == index_links_dict
+    page_count = max(
+        len(index_links_dict[links_key])
+        for links_key in ["expectations_links", "profiling_links"]
+    )
+    page_filenames = ["index.html"] + [
+        f"index_page_{page_number}.html" for page_number in range(2, page_count + 1)
+    ]
+    for page_filename, expectation_suite_filepath in zip(
+        page_filenames, expectation_suite_filepaths
+    ):
+        with open(os.path.join(site_directory, page_filename)) as f:
+            page = f.read()
+        assert expectation_suite_filepath in page
+        for other_page_filename in page_filenames:
+            if other_page_filename != page_filename:
+                assert f'href="{other_page_filename}"' in page
+    assert not os.path.exists(
+        os.path.join(site_directory, f"index_page_{page_count + 1}.html")
+    )
+
+    # Pages left over from a longer index are removed
+    build_index()
+    assert not os.path.exists(os.path.join(site_directory, "index_page_2.html"))
@@ -1,21 +1,30 @@
+from unittest import mock
+
+import numpy as np
 import pandas as pd
 import pytest
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.core import IDDict
 from great_expectations.core.batch import Batch, BatchRequest, PartitionRequest
+from great_expectations.core.batch_spec import BatchMarkers, BatchSpec
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.core.expectation_validation_result import (
     ExpectationValidationResult,
 )
+from great_expectations.data_context.store import BatchMetricStore
 from great_expectations.exceptions.metric_exceptions import MetricProviderError
 from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.execution_engine.pandas_execution_engine import (
+    hash_pandas_dataframe,
+)
 from great_expectations.expectations.core.expect_column_value_z_scores_to_be_less_than import (
     ExpectColumnValueZScoresToBeLessThan,
 )
 from great_expectations.expectations.registry import get_expectation_impl
 from great_expectations.validator.validation_graph import (
     MetricConfiguration,
+    MetricEdge,
     ValidationGraph,
 )
 from great_expectations.validator.validator import Validator
@@ -124,6 +133,81 @@ def test_populate_dependencies():
     assert len(graph.edges) == 10
 
 
+def test_validation_graph_resolution_levels():
+    table_columns = MetricConfiguration("table.columns", IDDict())
+    column_min = MetricConfiguration("column.min", IDDict({"column": "a"}))
+    column_max = MetricConfiguration("column.max", IDDict({"column": "a"}))
+    column_range = MetricConfiguration("column.range", IDDict({"column": "a"}))
+    graph = ValidationGraph(
+        edges=[
+            MetricEdge(table_columns, None),
+            MetricEdge(column_min, table_columns),
+            MetricEdge(column_max, table_columns),
+            MetricEdge(column_range, column_min),
+            MetricEdge(column_range, column_max),
+        ]
+    )
+    assert graph.get_dependency_ids(column_range.id) == {column_min.id, column_max.id}
+    assert graph.get_dependent_ids(table_columns.id) == {column_min.id, column_max.id}
+
+    metrics = dict()
+    levels = []
+    for ready_metrics in graph.resolution_levels(metrics):
+        levels.append({metric.id for metric in ready_metrics})
+        metrics.update({metric.id: None for metric in ready_metrics})
+
+    assert levels == [
+        {table_columns.id},
+        {column_min.id, column_max.id},
+        {column_range.id},
+    ]
+    assert graph.get_unresolved_metric_ids(metrics) == set()
+
+
+def test_validation_graph_resolution_levels_stops_at_unresolved_metrics():
+    table_columns = MetricConfiguration("table.columns", IDDict())
+    column_min = MetricConfiguration("column.min", IDDict({"column": "a"}))
+    graph = ValidationGraph(
+        edges=[MetricEdge(table_columns, None), MetricEdge(column_min, table_columns)]
+    )
+
+    levels = [
+        [metric.id for metric in ready_metrics]
+        for ready_metrics in graph.resolution_levels(dict())
+    ]
+    assert levels == [[table_columns.id]]
+    assert graph.get_unresolved_metric_ids(dict()) == {
+        table_columns.id,
+        column_min.id,
+    }
+
+    already_resolved = {table_columns.id: ["a"]}
+    levels = [
+        [metric.id for metric in ready_metrics]
+        for ready_metrics in graph.resolution_levels(already_resolved)
+    ]
+    assert levels == [[column_min.id]]
+
+
+def test_resolve_validation_graph_records_level_statistics():
+    df = pd.DataFrame({"a": [1, 5, None, 3, 5, 10], "b": [1, 2, 3, 4, 5, 6]})
+    engine = PandasExecutionEngine()
+    validator = Validator(execution_engine=engine, batches=[Batch(data=df)])
+
+    unexpected_count = validator.get_metric(
+        MetricConfiguration("column_values.nonnull.unexpected_count", dict(column="a"))
+    )
+    assert unexpected_count == 1
+
+    statistics = validator.last_resolution_statistics
+    assert len(statistics) == 2
+    assert [level_statistics.level for level_statistics in statistics] == list(
+        range(len(statistics))
+    )
+    assert all(level_statistics.num_metrics > 0 for level_statistics in statistics)
+    assert all(level_statistics.elapsed_time >= 0 for level_statistics in statistics)
+
+
 def test_populate_dependencies_with_incorrect_metric_name():
     df = pd.DataFrame({"a": [1, 5, 22, 3, 5, 10], "b": [1, 2, 3, 4, 5, 6]})
     expectationConfiguration = ExpectationConfiguration(
@@ -380,3 +464,177 @@ def test_validator_default_expectation_args__sql(
             batch_identifiers={"date": "2020-01-15"},
             expectation_suite="I_am_not_an_expectation_suite",
         )
+
+
+def test_validation_graph_subgraph_of_required_metrics():
+    table_columns = MetricConfiguration("table.columns", IDDict())
+    column_min = MetricConfiguration("column.min", IDDict({"column": "a"}))
+    column_max = MetricConfiguration("column.max", IDDict({"column": "a"}))
+    column_range = MetricConfiguration("column.range", IDDict({"column": "a"}))
+    graph = ValidationGraph(
+        edges=[
+            MetricEdge(table_columns, None),
+            MetricEdge(column_min, table_columns),
+            MetricEdge(column_max, table_columns),
+            MetricEdge(column_range, column_min),
+            MetricEdge(column_range, column_max),
+        ]
+    )
+
+    # column.min is already known, so table.columns is only needed for column.max
+    metrics = {column_min.id: 1}
+    required_metric_ids = graph.get_required_metric_ids([column_range.id], metrics)
+    assert required_metric_ids == {column_range.id, column_max.id, table_columns.id}
+
+    # once column.range itself is known, nothing else is needed
+    assert (
+        graph.get_required_metric_ids([column_range.id], {column_range.id: 9}) == set()
+    )
+
+    subgraph = graph.subgraph({column_range.id, column_max.id})
+    assert set(subgraph.metric_configurations) == {column_range.id, column_max.id}
+    assert subgraph.get_dependency_ids(column_range.id) == {column_max.id}
+    assert subgraph.get_dependency_ids(column_max.id) == set()
+
+
+def test_graph_validate_reuses_metrics_from_batch_metric_store():
+    df = pd.DataFrame({"a": [1, 5, 22, 3, 5, 10], "b": [1, 2, 3, 4, 5, None]})
+    batch_markers = BatchMarkers(
+        {
+            "ge_load_time": "20210101T000000.000000Z",
+            "pandas_data_fingerprint": hash_pandas_dataframe(df),
+        }
+    )
+    expectation_configuration = ExpectationConfiguration(
+        expectation_type="expect_column_values_to_be_between",
+        kwargs={"column": "a", "min_value": 0, "max_value": 20, "mostly": 0.5},
+    )
+    batch_metric_store = BatchMetricStore()
+
+    validator = Validator(
+        execution_engine=PandasExecutionEngine(),
+        batches=[Batch(data=df, batch_markers=batch_markers)],
+        batch_metric_store=batch_metric_store,
+    )
+    result = validator.graph_validate(configurations=[expectation_configuration])
+    assert len(validator.last_resolution_statistics) > 0
+    assert len(batch_metric_store.list_keys()) > 0
+
+    # Identical data loaded under another batch: every metric is read from the store
+    validator = Validator(
+        execution_engine=PandasExecutionEngine(),
+        batches=[Batch(data=df.copy(), batch_markers=batch_markers)],
+        batch_metric_store=batch_metric_store,
+    )
+    assert (
+        validator.graph_validate(configurations=[expectation_configuration]) == result
+    )
+    assert validator.last_resolution_statistics == []
+
+
+def test_graph_validate_recomputes_non_finite_metrics_instead_of_persisting_them():
+    df = pd.DataFrame({"a": [np.nan, np.nan, np.nan]})
+    batch_markers = BatchMarkers(
+        {
+            "ge_load_time": "20210101T000000.000000Z",
+            "pandas_data_fingerprint": hash_pandas_dataframe(df),
+        }
+    )
+    expectation_configurations = [
+        ExpectationConfiguration(
+            expectation_type="expect_column_mean_to_be_between",
+            kwargs={"column": "a", "min_value": 0, "max_value": 1},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_stdev_to_be_between",
+            kwargs={"column": "a", "min_value": 0, "max_value": 1},
+        ),
+    ]
+    batch_metric_store = BatchMetricStore()
+
+    def validate():
+        validator = Validator(
+            execution_engine=PandasExecutionEngine(),
+            batches=[Batch(data=df.copy(), batch_markers=batch_markers)],
+            batch_metric_store=batch_metric_store,
+        )
+        return validator.graph_validate(configurations=expectation_configurations)
+
+    first_results = validate()
+    second_results = validate()
+    # NaN would come back from the store as None
+    for first_result, second_result in zip(first_results, second_results):
+        assert np.isnan(first_result.result["observed_value"])
+        assert np.isnan(second_result.result["observed_value"])
+        assert first_result.success == second_result.success
+
+
+def test_graph_validate_does_not_persist_metrics_without_batch_fingerprint():
+    df = pd.DataFrame({"a": [1, 5, 22, 3, 5, 10]})
+    batch_metric_store = BatchMetricStore()
+    validator = Validator(
+        execution_engine=PandasExecutionEngine(),
+        batches=[Batch(data=df)],
+        batch_metric_store=batch_metric_store,
+    )
+    assert (
+        validator.get_metric(MetricConfiguration("column.max", dict(column="a"))) == 22
+    )
+    assert batch_metric_store.list_keys() == []
+
+
+def test_graph_validate_does_not_use_batch_spec_as_batch_fingerprint():
+    batch_spec = BatchSpec(path="/data/titanic.csv", reader_method="read_csv")
+    batch_metric_store = BatchMetricStore()
+    column_max = MetricConfiguration("column.max", dict(column="a"))
+
+    validator = Validator(
+        execution_engine=PandasExecutionEngine(),
+        batches=[Batch(data=pd.DataFrame({"a": [1, 22]}), batch_spec=batch_spec)],
+        batch_metric_store=batch_metric_store,
+    )
+    assert validator.get_metric(column_max) == 22
+    assert batch_metric_store.list_keys() == []
+
+    # The file behind the same BatchSpec has changed since: the new data is measured
+    validator = Validator(
+        execution_engine=PandasExecutionEngine(),
+        batches=[Batch(data=pd.DataFrame({"a": [1, 33]}), batch_spec=batch_spec)],
+        batch_metric_store=batch_metric_store,
+    )
+    assert validator.get_metric(column_max) == 33
+
+
+def test_graph_validate_persists_metrics_with_explicit_batch_fingerprint():
+    batch_spec = BatchSpec(path="/data/titanic.csv", batch_fingerprint="snapshot-1")
+    batch_metric_store = BatchMetricStore()
+    column_max = MetricConfiguration("column.max", dict(column="a"))
+
+    validator = Validator(
+        execution_engine=PandasExecutionEngine(),
+        batches=[Batch(data=pd.DataFrame({"a": [1, 22]}), batch_spec=batch_spec)],
+        batch_metric_store=batch_metric_store,
+    )
+    assert validator.get_metric(column_max) == 22
+    assert [key.batch_fingerprint for key in batch_metric_store.list_keys()] == [
+        "snapshot-1"
+    ]
+
+
+def test_validate_releases_batch_data_when_validation_finishes():
+    df = pd.DataFrame({"a": [1, 5, 22, 3, 5, 10]})
+    execution_engine = PandasExecutionEngine()
+    validator = Validator(
+        execution_engine=execution_engine,
+        batches=[Batch(data=df)],
+    )
+    validator.expect_column_max_to_be_between("a", min_value=0, max_value=30)
+
+    with mock.patch.object(execution_engine, "release_batch_data") as release:
+        assert validator.validate().success
+    release.assert_called_once_with(batch_id=validator.active_batch_id)
+
+    # The batch stays loaded, and is released again after the next validation
+    with mock.patch.object(execution_engine, "release_batch_data") as release:
+        assert validator.validate().success
+    release.assert_called_once_with(batch_id=validator.active_batch_id)